@@ -31,6 +31,11 @@ Configuration:
     Modify these variables below to export a different session:
         thread_id = "your-thread-id-here"
         file_path = "your_backup_file.json"
+
+To export or import several sessions at once without starting the
+application, use the sessions command instead:
+    gns3-copilot sessions export sessions.ndjson.gz
+    gns3-copilot sessions import sessions.ndjson.gz
 """
 
 from gns3_copilot.agent.checkpoint_utils import (
@@ -28,6 +28,9 @@ Requirements:
 Configuration:
     Modify the file_path variable below to import from a different file:
         file_path = "your_session_backup.json"
+
+To do this without starting the agent, use:
+    gns3-copilot sessions import session_backup.json
 """
 
 from gns3_copilot.agent.checkpoint_utils import (
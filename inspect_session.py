@@ -22,6 +22,9 @@ Requirements:
 - Must be run from project root directory
 - Requires GNS3 Copilot to be properly installed
 - Access to SQLite checkpoint database
+
+To do this without starting the agent, use:
+    gns3-copilot sessions inspect <thread-id> --verbose
 """
 
 import json
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Session Search Backfill
+
+Indexes the messages of sessions stored before the full-text search index
+existed. New messages are indexed automatically; this only needs to run once
+per existing checkpoint database. Threads that are already indexed are
+skipped, so it is safe to run again.
+
+The latest checkpoint of one thread is loaded at a time, so memory use does
+not depend on the size of the database.
+
+Usage:
+    python scripts/backfill_session_search.py
+    python scripts/backfill_session_search.py --db path/to/gns3_langgraph.db
+"""
+
+import argparse
+import time
+
+from gns3_copilot.agent.checkpoint_serde import create_checkpoint_serializer
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.session_search import backfill_session_search
+from gns3_copilot.utils import init_config
+
+
+def main() -> None:
+    """Parse arguments and backfill the search index."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--db",
+        default="gns3_langgraph.db",
+        help="Checkpoint database (default: gns3_langgraph.db)",
+    )
+    args = parser.parse_args()
+
+    # Compressed checkpoints are read with the configured serializer
+    init_config()
+    checkpointer = PooledSqliteSaver(args.db, serde=create_checkpoint_serializer())
+    checkpointer.setup()
+    if not checkpointer.search_enabled:
+        raise SystemExit("This SQLite build has no FTS5 support")
+
+    start = time.perf_counter()
+    added = backfill_session_search(checkpointer)
+    checkpointer.close()
+    print(f"Indexed {added} messages in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Checkpoint Store Benchmark
+
+Measures checkpoint put/get latency of the stock SqliteSaver (one shared
+connection, rollback journal, commit per statement) against PooledSqliteSaver
+(WAL, pooled readers, single writer) under N concurrent threads,
+with and without CompressedSerializer, and reports the resulting database size.
+
+Each thread simulates a conversation: every iteration is one super-step with
+a few intermediate writes followed by a checkpoint, then reads the latest
+checkpoint back as the UI does after a turn.
+
+Usage:
+    python scripts/benchmark_checkpoint_store.py
+    python scripts/benchmark_checkpoint_store.py --threads 16 --steps 100
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+
+from langgraph.checkpoint.base import BaseCheckpointSaver, empty_checkpoint
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from gns3_copilot.agent.checkpoint_serde import CompressedSerializer
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+
+
+def make_stock_saver(db_path: str) -> SqliteSaver:
+    """Create a SqliteSaver as it was used before PooledSqliteSaver."""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    saver = SqliteSaver(conn)
+    saver.setup()
+    # SqliteSaver.setup() enables WAL; measure the former rollback journal
+    conn.execute("PRAGMA journal_mode=DELETE")
+    return saver
+
+
+def make_compressed_saver(db_path: str) -> PooledSqliteSaver:
+    """Create a PooledSqliteSaver with compressed checkpoint blobs."""
+    return PooledSqliteSaver(db_path, serde=CompressedSerializer())
+
+
+def run_thread(
+    saver: BaseCheckpointSaver,
+    thread_index: int,
+    steps: int,
+    writes_per_step: int,
+    payload: str,
+    put_latencies: list[float],
+    get_latencies: list[float],
+    barrier: threading.Barrier,
+) -> None:
+    """Simulate one conversation thread writing and reading checkpoints."""
+    config = {
+        "configurable": {"thread_id": f"bench-{thread_index}", "checkpoint_ns": ""}
+    }
+    # Input checkpoint the first super-step's writes belong to
+    config = saver.put(config, empty_checkpoint(), {"step": -1}, {})
+    barrier.wait()
+    for step in range(steps):
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": payload, "step": step}
+
+        start = time.perf_counter()
+        for task in range(writes_per_step):
+            saver.put_writes(config, [("messages", payload)], f"task-{step}-{task}")
+        config = saver.put(config, checkpoint, {"step": step}, {})
+        put_latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        saver.get_tuple({"configurable": {"thread_id": f"bench-{thread_index}"}})
+        get_latencies.append(time.perf_counter() - start)
+
+
+def benchmark(
+    name: str,
+    factory: Callable[[str], BaseCheckpointSaver],
+    threads: int,
+    steps: int,
+    writes_per_step: int,
+    payload_size: int,
+) -> None:
+    """Run the benchmark for one saver and print latency percentiles."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        saver = factory(os.path.join(tmp_dir, "bench.db"))
+        put_latencies: list[float] = []
+        get_latencies: list[float] = []
+        barrier = threading.Barrier(threads)
+        # Repetitive CLI-like output, as produced by device commands
+        line = "GigabitEthernet0/1 is up, line protocol is up\n"
+        payload = (line * (payload_size // len(line) + 1))[:payload_size]
+
+        workers = [
+            threading.Thread(
+                target=run_thread,
+                args=(
+                    saver,
+                    index,
+                    steps,
+                    writes_per_step,
+                    payload,
+                    put_latencies,
+                    get_latencies,
+                    barrier,
+                ),
+            )
+            for index in range(threads)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        if isinstance(saver, PooledSqliteSaver):
+            saver.close()
+        else:
+            saver.conn.close()
+        db_size = sum(
+            os.path.getsize(os.path.join(tmp_dir, name))
+            for name in os.listdir(tmp_dir)
+            if name.startswith("bench.db")
+        )
+
+    def _fmt(values: list[float]) -> str:
+        quantiles = statistics.quantiles(values, n=100)
+        return (
+            f"p50={quantiles[49] * 1000:7.2f}ms "
+            f"p95={quantiles[94] * 1000:7.2f}ms "
+            f"max={max(values) * 1000:7.2f}ms"
+        )
+
+    print(f"{name}: {threads * steps / elapsed:8.1f} steps/s")
+    print(f"  put (super-step) {_fmt(put_latencies)}")
+    print(f"  get_tuple        {_fmt(get_latencies)}")
+    print(f"  database size    {db_size / 1024:9.1f} KiB")
+    if isinstance(saver.serde, CompressedSerializer):
+        print(f"  compression      ratio {saver.serde.stats().ratio:.2f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark for both savers."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--writes-per-step", type=int, default=3)
+    parser.add_argument("--payload-size", type=int, default=4000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.threads} threads x {args.steps} super-steps, "
+        f"{args.writes_per_step} writes/step, {args.payload_size} byte payload\n"
+    )
+    for name, factory in (
+        ("SqliteSaver", make_stock_saver),
+        ("PooledSqliteSaver", PooledSqliteSaver),
+        ("PooledSqliteSaver+compression", make_compressed_saver),
+    ):
+        benchmark(
+            name,
+            factory,
+            args.threads,
+            args.steps,
+            args.writes_per_step,
+            args.payload_size,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+
+Imports the application entry points in fresh interpreters with
+``python -X importtime`` and reports the total time and the most expensive
+modules of the fastest run. Heavy optional modules (device drivers, model
+provider SDKs, audio libraries) that were loaded are listed separately; they
+should only be imported when the feature using them runs.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py gns3_copilot.app --repeat 5 --top 30
+"""
+
+import argparse
+import tempfile
+
+from gns3_copilot.utils.import_time import measure_import
+
+DEFAULT_MODULES = [
+    "gns3_copilot.app",
+    "gns3_copilot.agent",
+    "gns3_copilot.agent.gns3_copilot",
+    "gns3_copilot.ui_model.utils",
+]
+
+# Loaded on first use only
+HEAVY_PACKAGES = [
+    "netmiko",
+    "paramiko",
+    "telnetlib3",
+    "nornir_netmiko",
+    "numpy",
+    "soundfile",
+    "openai",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_aws",
+    "langchain_google_genai",
+    "langchain_ollama",
+    "langchain_xai",
+    "langchain_deepseek",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module")
+    parser.add_argument("--top", type=int, default=15, help="modules listed")
+    args = parser.parse_args()
+
+    summary = []
+    # Importing the agent creates its database and logs in the working directory
+    with tempfile.TemporaryDirectory() as cwd:
+        for module in args.modules:
+            report = measure_import(module, repeat=args.repeat, cwd=cwd)
+            print(report.format(top=args.top))
+            heavy = sorted(
+                {name.split(".")[0] for name in report.loaded(*HEAVY_PACKAGES)}
+            )
+            print(f"heavy packages loaded: {', '.join(heavy) or 'none'}\n")
+            summary.append((module, report.total_ms, len(report.records)))
+
+    print(f"{'module':<40} {'total':>10} {'modules':>8}")
+    for module, total_ms, count in summary:
+        print(f"{module:<40} {total_ms:>8.1f}ms {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
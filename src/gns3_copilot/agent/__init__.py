@@ -2,8 +2,18 @@
 GNS3 Copilot Agent Package
 
 This package contains the main GNS3 Copilot agent implementation for network automation tasks.
+
+`agent` and `langgraph_checkpointer` are created on first access: building them
+imports Streamlit, which command-line tools working on the checkpoint database
+(e.g. session_cli, checkpoint_archive) must not pull in. The checkpointer lives
+in its own module, so the sidebar session list does not compile the graph with
+all tools and the chat model. The title generation helpers, which load the chat
+model providers, are imported on first access too.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .checkpoint_utils import (
     export_checkpoint_to_file,
     generate_thread_id,
@@ -11,7 +21,14 @@ from .checkpoint_utils import (
     list_thread_ids,
     validate_checkpoint_data,
 )
-from .gns3_copilot import agent, langgraph_checkpointer
+from .session_index import SessionEntry, count_sessions, get_session, list_sessions
+from .session_search import SearchHit, search_sessions
+from .topology_store import TopologyRef, load_topology
+
+if TYPE_CHECKING:
+    from .checkpointer import langgraph_checkpointer
+    from .gns3_copilot import agent
+    from .title_generation import schedule_title_generation, wait_for_title
 
 # Dynamic version management
 try:
@@ -25,12 +42,40 @@ __author__ = "Guobin Yue"
 __description__ = "AI-powered network automation assistant for GNS3"
 __url__ = "https://github.com/yueguobin/gns3-copilot"
 
+
+_LAZY_ATTRIBUTES = {
+    "agent": "gns3_copilot",
+    "langgraph_checkpointer": "checkpointer",
+    "schedule_title_generation": "title_generation",
+    "wait_for_title": "title_generation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the compiled agent, its checkpointer and title helpers on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
+
 __all__ = [
     "agent",
     "langgraph_checkpointer",
     "list_thread_ids",
+    "list_sessions",
+    "count_sessions",
+    "get_session",
+    "SessionEntry",
+    "search_sessions",
+    "SearchHit",
+    "load_topology",
+    "TopologyRef",
     "generate_thread_id",
     "validate_checkpoint_data",
     "export_checkpoint_to_file",
     "import_checkpoint_from_file",
+    "schedule_title_generation",
+    "wait_for_title",
 ]
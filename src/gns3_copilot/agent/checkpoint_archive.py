@@ -0,0 +1,353 @@
+"""
+GNS3 Copilot Checkpoint Archive
+
+Streaming export and import of sessions in a line-delimited JSON (NDJSON)
+archive. Unlike export_checkpoint_to_file / import_checkpoint_from_file, which
+handle one thread as a single JSON document, an archive holds any number of
+threads and is written and read one line at a time:
+
+    {"type": "header", "format": "gns3-copilot-archive", "version": 2, ...}
+    {"type": "thread", "thread_id": ..., "checkpoint": ..., "metadata": ...}
+    {"type": "message", "message": {...}}          (one line per message)
+    {"type": "artifact", "artifact_id": ..., "tool_name": ..., "content": ...}
+    {"type": "thread_end", "thread_id": ..., "messages": N, "artifacts": M}
+    ...
+    {"type": "footer", "threads": N}
+
+Artifact lines hold the full tool outputs the thread's messages refer to (see
+utils/tool_artifacts.py); they are restored under their original IDs, so
+read_tool_artifact handles keep working after an import. Version 1 archives
+have no artifact lines.
+
+Export loads the latest checkpoint of one thread at a time and one artifact
+at a time; import holds at most one thread's messages in memory. Paths
+ending in .gz are compressed.
+
+Legacy single-thread export files are accepted by import.
+
+The module does not import Streamlit; archives are written and read from the
+command line with `gns3-copilot sessions export|import` (see session_cli.py):
+
+    gns3-copilot sessions export sessions.ndjson.gz
+    gns3-copilot sessions export out.ndjson --thread <id> --since 2026-01-01
+    gns3-copilot sessions import sessions.ndjson.gz
+"""
+
+import gzip
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Any
+
+from gns3_copilot.agent.checkpoint_utils import (
+    deserialize_message,
+    generate_thread_id,
+    import_checkpoint_from_file,
+    serialize_message,
+)
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils.tool_artifacts import (
+    iter_thread_artifacts,
+    restore_artifact,
+)
+
+logger = setup_logger("checkpoint_archive")
+
+ARCHIVE_FORMAT = "gns3-copilot-archive"
+ARCHIVE_VERSION = 2
+
+# Default checkpoint database of the application
+DEFAULT_DB_PATH = "gns3_langgraph.db"
+
+
+@dataclass
+class ThreadFilter:
+    """
+    Selection of threads to export. Empty fields do not filter.
+
+    Attributes:
+        thread_ids: Only these threads
+        since: Only threads updated at or after this Unix timestamp
+        title: Only threads whose title contains this text (case-insensitive)
+    """
+
+    thread_ids: list[str] = field(default_factory=list)
+    since: float | None = None
+    title: str | None = None
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open an archive for text reading or writing, gzip for .gz paths."""
+    if path.endswith(".gz"):
+        return gzip.open(path, f"{mode}t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def _write_line(f: IO[str], record: dict[str, Any]) -> None:
+    f.write(json.dumps(record, ensure_ascii=False, default=str))
+    f.write("\n")
+
+
+def select_thread_ids(checkpointer: Any, thread_filter: ThreadFilter) -> list[str]:
+    """
+    Get the IDs of the threads selected by a filter, most recent first.
+
+    Title and time filters use the session index; threads missing from the
+    index only pass filters without those conditions.
+
+    Args:
+        checkpointer: LangGraph SqliteSaver (or PooledSqliteSaver) instance.
+        thread_filter: Thread selection.
+
+    Returns:
+        list: Thread IDs.
+    """
+    with checkpointer.cursor(transaction=False) as cur:
+        has_index = (
+            cur.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='session_index'"
+            ).fetchone()
+            is not None
+        )
+    conditions = ["c.checkpoint_ns = ''"]
+    params: list[Any] = []
+    if thread_filter.thread_ids:
+        conditions.append(
+            f"c.thread_id IN ({','.join('?' * len(thread_filter.thread_ids))})"
+        )
+        params.extend(thread_filter.thread_ids)
+    if has_index:
+        source = "checkpoints c LEFT JOIN session_index s ON s.thread_id = c.thread_id"
+        order = "MAX(s.updated_at) DESC, MAX(c.checkpoint_id) DESC"
+        if thread_filter.since is not None:
+            conditions.append("s.updated_at >= ?")
+            params.append(thread_filter.since)
+        if thread_filter.title:
+            conditions.append("s.title LIKE ?")
+            params.append(f"%{thread_filter.title}%")
+    else:
+        source = "checkpoints c"
+        order = "MAX(c.checkpoint_id) DESC"
+        if thread_filter.since is not None or thread_filter.title:
+            logger.warning("Session index missing, title/time filters match nothing")
+            return []
+
+    query = (
+        f"SELECT c.thread_id FROM {source} WHERE {' AND '.join(conditions)} "
+        f"GROUP BY c.thread_id ORDER BY {order}"
+    )
+    with checkpointer.cursor(transaction=False) as cur:
+        return [row[0] for row in cur.execute(query, params).fetchall()]
+
+
+def export_archive(
+    checkpointer: Any,
+    file_path: str,
+    thread_filter: ThreadFilter | None = None,
+) -> int:
+    """
+    Export the latest checkpoint and the tool artifacts of the selected
+    threads to an archive.
+
+    Args:
+        checkpointer: LangGraph SqliteSaver (or PooledSqliteSaver) instance.
+        file_path: Output path; .gz paths are gzip compressed.
+        thread_filter: Threads to export, defaults to all threads.
+
+    Returns:
+        int: Number of exported threads.
+    """
+    thread_filter = thread_filter or ThreadFilter()
+    # Artifacts are stored next to the checkpoints
+    db_path = getattr(checkpointer, "db_path", None)
+    exported = 0
+
+    with _open(file_path, "w") as f:
+        _write_line(
+            f,
+            {
+                "type": "header",
+                "format": ARCHIVE_FORMAT,
+                "version": ARCHIVE_VERSION,
+                "created_at": datetime.now().isoformat(),
+            },
+        )
+        for thread_id in select_thread_ids(checkpointer, thread_filter):
+            checkpoint_tuple = checkpointer.get_tuple(
+                {"configurable": {"thread_id": thread_id}}
+            )
+            if checkpoint_tuple is None:
+                continue
+
+            checkpoint = dict(checkpoint_tuple.checkpoint)
+            channel_values = dict(checkpoint.get("channel_values", {}))
+            messages = channel_values.pop("messages", [])
+            checkpoint["channel_values"] = channel_values
+
+            _write_line(
+                f,
+                {
+                    "type": "thread",
+                    "thread_id": thread_id,
+                    "checkpoint": checkpoint,
+                    "metadata": checkpoint_tuple.metadata,
+                },
+            )
+            for message in messages:
+                _write_line(
+                    f, {"type": "message", "message": serialize_message(message)}
+                )
+            artifacts = 0
+            for artifact in iter_thread_artifacts(thread_id, db_path=db_path):
+                _write_line(f, {"type": "artifact", **artifact})
+                artifacts += 1
+            _write_line(
+                f,
+                {
+                    "type": "thread_end",
+                    "thread_id": thread_id,
+                    "messages": len(messages),
+                    "artifacts": artifacts,
+                },
+            )
+            exported += 1
+            # Release the checkpoint before loading the next thread
+            del checkpoint_tuple, checkpoint, channel_values, messages
+
+        _write_line(f, {"type": "footer", "threads": exported})
+
+    logger.info("Exported %d threads to %s", exported, file_path)
+    return exported
+
+
+def _thread_exists(checkpointer: Any, thread_id: str) -> bool:
+    with checkpointer.cursor(transaction=False) as cur:
+        row = cur.execute(
+            "SELECT 1 FROM checkpoints WHERE thread_id = ? LIMIT 1", (thread_id,)
+        ).fetchone()
+    return row is not None
+
+
+def _target_thread_id(
+    checkpointer: Any, header: dict[str, Any], keep_ids: bool
+) -> str | None:
+    """Thread ID an archived thread is imported as, None if it is skipped."""
+    thread_id = str(header["thread_id"])
+    if not keep_ids:
+        return generate_thread_id()
+    if _thread_exists(checkpointer, thread_id):
+        logger.warning("Thread %s already exists, skipped", thread_id)
+        return None
+    return thread_id
+
+
+def _put_thread(
+    checkpointer: Any,
+    thread_id: str,
+    header: dict[str, Any],
+    messages: list[Any],
+) -> None:
+    """Store the checkpoint of one archived thread."""
+    checkpoint = dict(header["checkpoint"])
+    channel_values = dict(checkpoint.get("channel_values", {}))
+    channel_values["messages"] = messages
+    checkpoint["channel_values"] = channel_values
+    metadata = dict(header.get("metadata") or {})
+    metadata["source"] = "import"
+
+    checkpointer.put(
+        {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+        checkpoint,
+        metadata,
+        checkpoint.get("channel_versions", {}),
+    )
+
+
+def import_archive(
+    checkpointer: Any, file_path: str, keep_ids: bool = False
+) -> list[str]:
+    """
+    Import all threads of an archive.
+
+    Messages are deserialized line by line; only the thread being imported is
+    held in memory. Tool artifacts are restored under their archived IDs as
+    they are read. Legacy single-thread export files are imported with
+    import_checkpoint_from_file.
+
+    Args:
+        checkpointer: LangGraph checkpointer instance.
+        file_path: Archive path; .gz paths are read as gzip.
+        keep_ids: Keep the archived thread IDs (existing threads are skipped)
+                  instead of assigning new ones.
+
+    Returns:
+        list: Thread IDs of the imported threads.
+
+    Raises:
+        ValueError: If the archive is malformed.
+    """
+    imported: list[str] = []
+
+    with _open(file_path, "r") as f:
+        first_line = f.readline()
+        try:
+            header = json.loads(first_line)
+        except json.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != ARCHIVE_FORMAT:
+            logger.info("%s is not an archive, importing as single export", file_path)
+            success, result = import_checkpoint_from_file(checkpointer, file_path)
+            if not success:
+                raise ValueError(result)
+            return [result]
+        if header.get("version", 0) > ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version: {header.get('version')}")
+
+        db_path = getattr(checkpointer, "db_path", None)
+        current: dict[str, Any] | None = None
+        target: str | None = None
+        messages: list[Any] = []
+        for line_number, line in enumerate(f, start=2):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record_type = record.get("type")
+
+            if record_type == "thread":
+                if current is not None:
+                    raise ValueError(f"Line {line_number}: thread_end missing")
+                current, messages = record, []
+                target = _target_thread_id(checkpointer, record, keep_ids)
+            elif record_type == "message":
+                if current is None:
+                    raise ValueError(f"Line {line_number}: message outside thread")
+                messages.append(deserialize_message(record["message"]))
+            elif record_type == "artifact":
+                if current is None:
+                    raise ValueError(f"Line {line_number}: artifact outside thread")
+                if target is not None:
+                    restore_artifact(
+                        str(record["artifact_id"]),
+                        str(record["tool_name"]),
+                        str(record["content"]),
+                        thread_id=target,
+                        db_path=db_path,
+                    )
+            elif record_type == "thread_end":
+                if current is None:
+                    raise ValueError(f"Line {line_number}: thread_end outside thread")
+                if target is not None:
+                    _put_thread(checkpointer, target, current, messages)
+                    imported.append(target)
+                current, target, messages = None, None, []
+            elif record_type == "footer":
+                break
+            else:
+                raise ValueError(f"Line {line_number}: unknown record {record_type!r}")
+
+        if current is not None:
+            raise ValueError("Archive ends inside a thread")
+
+    logger.info("Imported %d threads from %s", len(imported), file_path)
+    return imported
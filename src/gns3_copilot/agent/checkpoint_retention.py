@@ -0,0 +1,474 @@
+"""
+GNS3 Copilot Checkpoint Retention
+
+LangGraph stores one checkpoint per super-step, so every tool round of every
+thread stays in the checkpoint database forever. This module implements a
+retention job that runs online, next to the running app, in small batches:
+
+- Keep only the latest N checkpoints per thread (older history is dropped; the
+  latest checkpoint always holds the complete conversation state)
+- Drop intermediate writes older than X days (writes of a thread's latest
+  checkpoint are kept, they are needed to resume an interrupted run), and
+  topology snapshots not stored again for X days
+- Archive threads idle for Y days to NDJSON archives (see
+  checkpoint_archive.py) and remove them from the database (restore them
+  with `gns3-copilot sessions import`)
+- Return freed pages to the file system with incremental vacuum
+
+Incremental vacuum needs auto_vacuum=INCREMENTAL. New databases are created
+with it (see checkpoint_store.configure_connection); older databases are
+converted with a full VACUUM only on request (`gns3-copilot sessions prune
+--vacuum`), as it rewrites the whole file under an exclusive lock. The
+background worker skips the vacuum on unconverted databases.
+
+Checkpoint IDs are time-ordered UUIDv6 values, so ages are derived from the IDs
+without deserializing any checkpoint.
+
+Functions:
+    load_retention_policy(): Build the policy from configuration
+    run_retention(checkpointer, policy=None, convert_vacuum=False): Run one
+        retention pass
+    start_retention_worker(checkpointer): Run retention periodically in a thread
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from gns3_copilot.agent.checkpoint_archive import ThreadFilter, export_archive
+from gns3_copilot.agent.topology_store import prune_topology_blobs
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils import get_config
+from gns3_copilot.utils.tool_artifacts import delete_thread_artifacts
+
+logger = setup_logger("checkpoint_retention")
+
+# Offset between the UUID epoch (1582-10-15) and the Unix epoch in 100ns units
+UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+# Rows deleted per transaction, so the app's writer is never blocked for long
+DELETE_BATCH_SIZE = 500
+
+# Pages released per incremental vacuum step and pause between steps
+VACUUM_PAGES_PER_STEP = 256
+VACUUM_PAUSE_SECONDS = 0.05
+
+# Delay before the first background pass, so it does not slow down startup
+RETENTION_START_DELAY_SECONDS = 300
+
+# How long the maintenance connection waits for the app's writer
+BUSY_TIMEOUT_MS = 10000
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    Checkpoint retention policy. A value of 0 disables the corresponding rule.
+
+    Attributes:
+        keep_latest: Checkpoints kept per thread
+        writes_max_age_days: Age after which intermediate writes are dropped
+        archive_idle_days: Idle time after which threads are archived
+        archive_dir: Directory receiving archived threads
+    """
+
+    keep_latest: int = 50
+    writes_max_age_days: float = 7
+    archive_idle_days: float = 0
+    archive_dir: str = "checkpoint_archive"
+
+
+def _float_config(key: str, default: float) -> float:
+    """Read a non-negative number from configuration."""
+    try:
+        return max(0.0, float(get_config(key)))
+    except (TypeError, ValueError):
+        return default
+
+
+def load_retention_policy() -> RetentionPolicy:
+    """
+    Build the retention policy from configuration.
+
+    Returns:
+        RetentionPolicy: Policy with values from the CHECKPOINT_* settings.
+    """
+    defaults = RetentionPolicy()
+    return RetentionPolicy(
+        keep_latest=int(_float_config("CHECKPOINT_KEEP_LATEST", defaults.keep_latest)),
+        writes_max_age_days=_float_config(
+            "CHECKPOINT_WRITES_MAX_AGE_DAYS", defaults.writes_max_age_days
+        ),
+        archive_idle_days=_float_config(
+            "CHECKPOINT_ARCHIVE_IDLE_DAYS", defaults.archive_idle_days
+        ),
+        archive_dir=get_config("CHECKPOINT_ARCHIVE_DIR") or defaults.archive_dir,
+    )
+
+
+def checkpoint_id_timestamp(checkpoint_id: str) -> float:
+    """
+    Get the creation time encoded in a UUIDv6 checkpoint ID.
+
+    Args:
+        checkpoint_id: Checkpoint ID.
+
+    Returns:
+        float: Unix timestamp in seconds.
+    """
+    value = uuid.UUID(checkpoint_id).int
+    ticks = ((value >> 80) << 12) | ((value >> 64) & 0x0FFF)
+    return (ticks - UUID_EPOCH_OFFSET) / 1e7
+
+
+def checkpoint_id_for_time(timestamp: float) -> str:
+    """
+    Build the smallest UUIDv6 checkpoint ID for a point in time.
+
+    Checkpoint IDs created before `timestamp` compare lower as strings.
+
+    Args:
+        timestamp: Unix timestamp in seconds.
+
+    Returns:
+        str: Checkpoint ID usable as a cutoff in SQL comparisons.
+    """
+    ticks = int(timestamp * 1e7) + UUID_EPOCH_OFFSET
+    value = ((ticks >> 12) << 80) | (0x6 << 76) | ((ticks & 0x0FFF) << 64)
+    return str(uuid.UUID(int=value))
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open the maintenance connection (autocommit, explicit transactions)."""
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    return conn
+
+
+def _storage_bytes(db_path: str) -> int:
+    """Size of the database file and its WAL on disk."""
+    return sum(
+        os.path.getsize(path)
+        for path in (db_path, f"{db_path}-wal")
+        if os.path.exists(path)
+    )
+
+
+def _delete_in_batches(
+    conn: sqlite3.Connection, table: str, rowid_query: str, params: tuple = ()
+) -> int:
+    """
+    Delete the rows selected by a rowid query in short transactions.
+
+    Args:
+        conn: Maintenance connection.
+        table: Table to delete from.
+        rowid_query: SELECT returning the rowids to delete.
+        params: Query parameters.
+
+    Returns:
+        int: Number of deleted rows.
+    """
+    deleted = 0
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                f"DELETE FROM {table} WHERE rowid IN "
+                f"(SELECT rowid FROM ({rowid_query}) LIMIT {DELETE_BATCH_SIZE})",
+                params,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        deleted += cursor.rowcount
+        if cursor.rowcount < DELETE_BATCH_SIZE:
+            return deleted
+
+
+def prune_checkpoints(conn: sqlite3.Connection, keep_latest: int) -> tuple[int, int]:
+    """
+    Keep only the latest checkpoints of every thread.
+
+    Args:
+        conn: Maintenance connection.
+        keep_latest: Checkpoints to keep per thread and namespace.
+
+    Returns:
+        tuple: (deleted checkpoints, deleted writes of those checkpoints)
+    """
+    checkpoints = _delete_in_batches(
+        conn,
+        "checkpoints",
+        """
+        SELECT rowid FROM (
+            SELECT rowid, ROW_NUMBER() OVER (
+                PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+            ) AS rn
+            FROM checkpoints
+        ) WHERE rn > ?
+        """,
+        (keep_latest,),
+    )
+    writes = _delete_in_batches(
+        conn,
+        "writes",
+        """
+        SELECT rowid FROM writes w WHERE NOT EXISTS (
+            SELECT 1 FROM checkpoints c
+            WHERE c.thread_id = w.thread_id
+              AND c.checkpoint_ns = w.checkpoint_ns
+              AND c.checkpoint_id = w.checkpoint_id
+        )
+        """,
+    )
+    return checkpoints, writes
+
+
+def drop_old_writes(conn: sqlite3.Connection, max_age_days: float) -> int:
+    """
+    Drop intermediate writes older than the given age.
+
+    Writes of each thread's latest checkpoint are kept.
+
+    Args:
+        conn: Maintenance connection.
+        max_age_days: Maximum age in days.
+
+    Returns:
+        int: Number of deleted writes.
+    """
+    cutoff = checkpoint_id_for_time(time.time() - max_age_days * 86400)
+    return _delete_in_batches(
+        conn,
+        "writes",
+        """
+        SELECT rowid FROM writes w
+        WHERE w.checkpoint_id < ?
+          AND w.checkpoint_id != (
+            SELECT MAX(c.checkpoint_id) FROM checkpoints c
+            WHERE c.thread_id = w.thread_id AND c.checkpoint_ns = w.checkpoint_ns
+          )
+        """,
+        (cutoff,),
+    )
+
+
+def find_idle_threads(conn: sqlite3.Connection, idle_days: float) -> list[str]:
+    """
+    Find threads without activity for the given number of days.
+
+    Args:
+        conn: Maintenance connection.
+        idle_days: Idle time in days.
+
+    Returns:
+        list: Thread IDs.
+    """
+    cutoff = checkpoint_id_for_time(time.time() - idle_days * 86400)
+    rows = conn.execute(
+        "SELECT thread_id FROM checkpoints GROUP BY thread_id "
+        "HAVING MAX(checkpoint_id) < ?",
+        (cutoff,),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def archive_thread(checkpointer: Any, thread_id: str, archive_dir: str) -> bool:
+    """
+    Export a thread to the archive directory and remove it from the database.
+
+    The thread and its tool artifacts are written as a compressed NDJSON
+    archive, which can be restored with `gns3-copilot sessions import
+    --keep-ids`; the artifacts are removed from the database only after the
+    archive was written.
+
+    Args:
+        checkpointer: LangGraph checkpointer instance.
+        thread_id: Thread to archive.
+        archive_dir: Directory receiving the archive file.
+
+    Returns:
+        bool: True if the thread was archived and removed.
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    file_path = os.path.join(archive_dir, f"{thread_id}.ndjson.gz")
+    try:
+        exported = export_archive(checkpointer, file_path, ThreadFilter([thread_id]))
+    except Exception as e:
+        logger.error("Failed to export thread %s: %s", thread_id, e)
+        exported = 0
+    if exported != 1:
+        logger.warning("Archiving failed, keeping thread %s", thread_id)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        return False
+
+    checkpointer.delete_thread(thread_id)
+    try:
+        delete_thread_artifacts(
+            thread_id, db_path=getattr(checkpointer, "db_path", None)
+        )
+    except Exception as e:
+        logger.warning("Failed to delete artifacts of %s: %s", thread_id, e)
+    logger.info("Archived idle thread %s to %s", thread_id, file_path)
+    return True
+
+
+def incremental_vacuum(conn: sqlite3.Connection, convert: bool = False) -> int:
+    """
+    Return free pages to the file system in small steps.
+
+    Databases created without auto_vacuum=INCREMENTAL are skipped, unless
+    `convert` is set: they are then converted once with a full VACUUM, which
+    blocks all writers until the file is rewritten.
+
+    Args:
+        conn: Maintenance connection.
+        convert: Convert a database without incremental auto_vacuum.
+
+    Returns:
+        int: Number of released pages.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        if not convert:
+            logger.info(
+                "Database has no incremental auto_vacuum, skipping vacuum "
+                "(convert it with `gns3-copilot sessions prune --vacuum`)"
+            )
+            return 0
+        logger.info("Enabling incremental auto_vacuum (one-time full VACUUM)")
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+        return 0
+
+    released = 0
+    while True:
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if free_pages == 0:
+            break
+        step = min(free_pages, VACUUM_PAGES_PER_STEP)
+        conn.execute(f"PRAGMA incremental_vacuum({step})").fetchall()
+        released += step
+        time.sleep(VACUUM_PAUSE_SECONDS)
+
+    # Shrink the WAL file written by the vacuum steps
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    return released
+
+
+def run_retention(
+    checkpointer: Any,
+    policy: RetentionPolicy | None = None,
+    db_path: str | None = None,
+    convert_vacuum: bool = False,
+) -> dict[str, int]:
+    """
+    Run one retention pass over the checkpoint database.
+
+    Args:
+        checkpointer: LangGraph checkpointer instance (used for archiving).
+        policy: Retention policy, defaults to load_retention_policy().
+        db_path: Database path, defaults to the checkpointer's db_path.
+        convert_vacuum: Convert a database without incremental auto_vacuum
+                        with a full VACUUM (offline use only).
+
+    Returns:
+        dict: Report with checkpoints_deleted, writes_deleted,
+              topology_blobs_deleted, threads_archived, pages_released and
+              bytes_reclaimed.
+    """
+    policy = policy or load_retention_policy()
+    db_path = db_path or checkpointer.db_path
+    report = {
+        "checkpoints_deleted": 0,
+        "writes_deleted": 0,
+        "topology_blobs_deleted": 0,
+        "threads_archived": 0,
+        "pages_released": 0,
+        "bytes_reclaimed": 0,
+    }
+    size_before = _storage_bytes(db_path)
+    start = time.perf_counter()
+
+    conn = _connect(db_path)
+    try:
+        tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        if "checkpoints" not in tables:
+            return report
+
+        if policy.archive_idle_days > 0:
+            for thread_id in find_idle_threads(conn, policy.archive_idle_days):
+                if archive_thread(checkpointer, thread_id, policy.archive_dir):
+                    report["threads_archived"] += 1
+
+        if policy.keep_latest > 0:
+            checkpoints, writes = prune_checkpoints(conn, policy.keep_latest)
+            report["checkpoints_deleted"] += checkpoints
+            report["writes_deleted"] += writes
+
+        if policy.writes_max_age_days > 0:
+            report["writes_deleted"] += drop_old_writes(
+                conn, policy.writes_max_age_days
+            )
+            report["topology_blobs_deleted"] = prune_topology_blobs(
+                conn, policy.writes_max_age_days
+            )
+
+        report["pages_released"] = incremental_vacuum(conn, convert_vacuum)
+    finally:
+        conn.close()
+
+    report["bytes_reclaimed"] = max(0, size_before - _storage_bytes(db_path))
+    logger.info(
+        "Checkpoint retention finished in %.1fs: %s",
+        time.perf_counter() - start,
+        report,
+    )
+    return report
+
+
+def start_retention_worker(
+    checkpointer: Any,
+    interval_hours: float | None = None,
+    start_delay: float = RETENTION_START_DELAY_SECONDS,
+) -> threading.Event:
+    """
+    Run retention periodically in a daemon thread.
+
+    Args:
+        checkpointer: LangGraph checkpointer instance.
+        interval_hours: Hours between passes, defaults to
+                        CHECKPOINT_RETENTION_INTERVAL_HOURS (0 disables).
+        start_delay: Seconds before the first pass.
+
+    Returns:
+        threading.Event: Set it to stop the worker.
+    """
+    if interval_hours is None:
+        interval_hours = _float_config("CHECKPOINT_RETENTION_INTERVAL_HOURS", 6)
+    stop_event = threading.Event()
+    if interval_hours <= 0:
+        logger.info("Checkpoint retention worker disabled")
+        return stop_event
+
+    def _loop() -> None:
+        delay = start_delay
+        while not stop_event.wait(delay):
+            try:
+                run_retention(checkpointer)
+            except Exception as e:
+                logger.error("Checkpoint retention failed: %s", e)
+            delay = interval_hours * 3600
+
+    threading.Thread(target=_loop, name="checkpoint-retention", daemon=True).start()
+    logger.info("Checkpoint retention worker started (every %.1fh)", interval_hours)
+    return stop_event
@@ -0,0 +1,216 @@
+"""
+GNS3 Copilot Checkpoint Serializer
+
+Checkpoints and pending writes contain long, highly repetitive payloads (CLI
+output, JSON topologies). CompressedSerializer wraps LangGraph's serializer and
+compresses blobs above a size threshold with zstd, or zlib when the optional
+`zstandard` package is not installed.
+
+The codec is appended to the stored type (e.g. "msgpack+zstd"), the same
+convention LangGraph's EncryptedSerializer uses. Rows without a codec suffix
+are passed to the wrapped serializer unchanged, so databases written before
+compression was enabled (or with it disabled) stay readable.
+
+Configuration:
+    CHECKPOINT_COMPRESSION: "True" to compress new blobs (default)
+    CHECKPOINT_COMPRESSION_MIN_BYTES: Smallest blob that is compressed
+
+Functions:
+    create_checkpoint_serializer(): Build the serializer from configuration
+"""
+
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils import get_config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+logger = setup_logger("checkpoint_serde")
+
+# Blobs smaller than this are stored uncompressed
+DEFAULT_MIN_BYTES = 1024
+
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+# Serialized blobs between compression statistics log messages
+STATS_LOG_INTERVAL = 1000
+
+
+@dataclass
+class CompressionStats:
+    """
+    Compression statistics of a serializer since it was created.
+
+    Attributes:
+        blobs: Serialized blobs
+        compressed_blobs: Blobs stored compressed
+        raw_bytes: Size of all blobs before compression
+        stored_bytes: Size of all blobs as stored
+    """
+
+    blobs: int = 0
+    compressed_blobs: int = 0
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Raw size divided by stored size (1.0 when nothing was stored)."""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+class CompressedSerializer(SerializerProtocol):
+    """
+    Serializer that compresses large blobs of a wrapped serializer.
+
+    Example:
+        serde = CompressedSerializer()
+        checkpointer = PooledSqliteSaver("gns3_langgraph.db", serde=serde)
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol | None = None,
+        min_bytes: int = DEFAULT_MIN_BYTES,
+        codec: str | None = None,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Initialize the serializer.
+
+        Args:
+            serde: Wrapped serializer, defaults to JsonPlusSerializer.
+            min_bytes: Smallest blob that is compressed.
+            codec: "zstd" or "zlib"; defaults to zstd when available.
+            enabled: Whether new blobs are compressed. Compressed blobs are
+                     always readable.
+
+        Raises:
+            ValueError: If the codec is unknown or zstd is not installed.
+        """
+        if codec is None:
+            codec = "zstd" if zstandard is not None else "zlib"
+        if codec not in ("zstd", "zlib"):
+            raise ValueError(f"Unsupported compression codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self.serde = serde or JsonPlusSerializer()
+        self.min_bytes = min_bytes
+        self.codec = codec
+        self.enabled = enabled
+        self._stats = CompressionStats()
+        self._stats_lock = threading.Lock()
+        # zstandard (de)compressor objects must not be shared between threads
+        self._local = threading.local()
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zlib":
+            return zlib.compress(data, ZLIB_LEVEL)
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+            self._local.compressor = compressor
+        return bytes(compressor.compress(data))
+
+    def _decompress(self, codec: str, data: bytes) -> bytes:
+        if codec == "zlib":
+            return zlib.decompress(data)
+        if zstandard is None:
+            raise ValueError(
+                "Checkpoint is zstd compressed, install the zstandard package"
+            )
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor()
+            self._local.decompressor = decompressor
+        return bytes(decompressor.decompress(data))
+
+    def _record(self, raw_size: int, stored_size: int, compressed: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats
+            stats.blobs += 1
+            stats.compressed_blobs += int(compressed)
+            stats.raw_bytes += raw_size
+            stats.stored_bytes += stored_size
+            if stats.blobs % STATS_LOG_INTERVAL == 0:
+                logger.info(
+                    "Checkpoint compression: %d/%d blobs compressed, "
+                    "%d -> %d bytes (ratio %.2f)",
+                    stats.compressed_blobs,
+                    stats.blobs,
+                    stats.raw_bytes,
+                    stats.stored_bytes,
+                    stats.ratio,
+                )
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        """Serialize an object and compress the bytes above the threshold."""
+        type_, data = self.serde.dumps_typed(obj)
+        if self.enabled and len(data) >= self.min_bytes:
+            compressed = self._compress(data)
+            # Incompressible payloads are stored as they are
+            if len(compressed) < len(data):
+                self._record(len(data), len(compressed), True)
+                return f"{type_}+{self.codec}", compressed
+        self._record(len(data), len(data), False)
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        """Deserialize a blob, decompressing it if it carries a codec suffix."""
+        stored_type, payload = data
+        type_, _, codec = stored_type.rpartition("+")
+        if type_ and codec in ("zstd", "zlib"):
+            return self.serde.loads_typed((type_, self._decompress(codec, payload)))
+        return self.serde.loads_typed(data)
+
+    def stats(self) -> CompressionStats:
+        """
+        Get a snapshot of the compression statistics.
+
+        Returns:
+            CompressionStats: Counters since the serializer was created.
+        """
+        with self._stats_lock:
+            return CompressionStats(**vars(self._stats))
+
+
+def create_checkpoint_serializer() -> CompressedSerializer:
+    """
+    Build the checkpoint serializer from configuration.
+
+    Returns:
+        CompressedSerializer: Serializer for the checkpoint store.
+    """
+    enabled = get_config("CHECKPOINT_COMPRESSION", "True").lower().strip() in (
+        "true",
+        "1",
+        "yes",
+        "on",
+    )
+    try:
+        min_bytes = int(
+            get_config("CHECKPOINT_COMPRESSION_MIN_BYTES", str(DEFAULT_MIN_BYTES))
+        )
+    except (TypeError, ValueError):
+        min_bytes = DEFAULT_MIN_BYTES
+
+    serde = CompressedSerializer(min_bytes=max(0, min_bytes), enabled=enabled)
+    logger.info(
+        "Checkpoint compression %s (codec=%s, min_bytes=%d)",
+        "enabled" if enabled else "disabled",
+        serde.codec,
+        serde.min_bytes,
+    )
+    return serde
@@ -0,0 +1,355 @@
+"""
+GNS3 Copilot Checkpoint Store
+
+A SqliteSaver tuned for many concurrent Streamlit sessions sharing one
+checkpoint database. The stock SqliteSaver funnels every read and write through
+a single connection guarded by one lock and commits after every statement, so
+concurrent sessions serialize on each other and readers wait for writers.
+
+PooledSqliteSaver keeps the SqliteSaver schema and queries but:
+- Uses WAL journaling with synchronous=NORMAL, so readers never block the writer
+- Serves reads (get_tuple, list and the pending writes they load) from a
+  small pool of reader connections, so they never see an uncommitted
+  transaction of the writer
+- Keeps a single writer connection; a checkpoint and the tables kept with it
+  are stored in one transaction, and the intermediate writes of each task in
+  another
+- Maintains the session_index table (see session_index.py) in the same
+  transaction as every root checkpoint, and the full-text search index (see
+  session_search.py) from the messages written by each step
+- Creates the content-addressed topology blob table (see topology_store.py)
+
+Every write is committed before the call returns, so no transaction stays
+open while a node runs (e.g. during LLM generation) and the write lock is
+only held for the statements themselves. Intermediate writes are committed
+before the checkpoint of their step exists, as LangGraph replays them after
+a crash. This costs one commit per task in addition to one per checkpoint.
+
+With synchronous=NORMAL a power loss can roll back the most recent
+transactions, but never corrupts the database; the checkpoint data is a
+conversation log, so this trade-off is acceptable.
+
+Use scripts/benchmark_checkpoint_store.py to compare put/get latency with the
+stock SqliteSaver under concurrent threads.
+"""
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.utils import search_where
+
+from gns3_copilot.agent.session_index import (
+    delete_session,
+    ensure_session_index,
+    upsert_session,
+)
+from gns3_copilot.agent.session_search import (
+    delete_thread_search,
+    ensure_session_search,
+    index_messages,
+)
+from gns3_copilot.agent.topology_store import ensure_topology_store
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("checkpoint_store")
+
+# Number of pooled reader connections
+DEFAULT_READER_POOL_SIZE = 4
+
+# How long a connection waits for a lock held by another process
+BUSY_TIMEOUT_MS = 5000
+
+# Seconds to wait for a free reader before opening an overflow connection
+READER_ACQUIRE_TIMEOUT = 2.0
+
+
+def configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+    """
+    Apply the concurrency pragmas to a checkpoint database connection.
+
+    New databases are created with incremental auto_vacuum, so the retention
+    job can release free pages without a full VACUUM (see
+    checkpoint_retention.py); existing databases are not changed.
+
+    Args:
+        conn: SQLite connection.
+        read_only: Whether the connection is only used for reads.
+    """
+    if not read_only:
+        # Only takes effect before the first table is created
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    if read_only:
+        conn.execute("PRAGMA query_only=ON")
+
+
+class PooledSqliteSaver(SqliteSaver):
+    """
+    SqliteSaver with WAL, pooled reader connections and one commit per call.
+
+    The database must be a file; in-memory databases cannot be shared between
+    connections.
+
+    Example:
+        checkpointer = PooledSqliteSaver("gns3_langgraph.db")
+        agent = agent_builder.compile(checkpointer=checkpointer)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        reader_pool_size: int = DEFAULT_READER_POOL_SIZE,
+        *,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        configure_connection(conn)
+        super().__init__(conn, serde=serde)
+        # Reentrant, so a transaction can span the cursors of one call
+        self.lock = threading.RLock()  # type: ignore[assignment]
+        self.db_path = db_path
+        self.reader_pool_size = max(1, reader_pool_size)
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+        self._transaction_depth = 0
+        self.search_enabled = False
+
+    def setup(self) -> None:
+        """Create the checkpoint tables and the tables kept alongside them."""
+        if self.is_setup:
+            return
+        super().setup()
+        ensure_session_index(self.conn)
+        ensure_topology_store(self.conn)
+        self.search_enabled = ensure_session_search(self.conn)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a new reader connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        configure_connection(conn, read_only=True)
+        return conn
+
+    def _acquire_reader(self) -> tuple[sqlite3.Connection, bool]:
+        """
+        Take a reader connection from the pool.
+
+        Returns:
+            tuple: (connection, pooled); overflow connections are not pooled
+                   and are closed after use.
+        """
+        try:
+            return self._readers.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            if self._reader_count < self.reader_pool_size:
+                self._reader_count += 1
+                return self._open_reader(), True
+
+        try:
+            return self._readers.get(timeout=READER_ACQUIRE_TIMEOUT), True
+        except queue.Empty:
+            # Readers held by abandoned iterators must not block new reads
+            logger.warning("Reader pool exhausted, opening overflow connection")
+            return self._open_reader(), False
+
+    def flush(self) -> None:
+        """Commit writes made through the writer connection outside a cursor."""
+        with self.lock:
+            if self._transaction_depth == 0 and self.conn.in_transaction:
+                self.conn.commit()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Run the write cursors of a call in one transaction on the writer.
+
+        The transaction is committed when the outermost block exits and
+        rolled back if it raises; other threads wait for the writer meanwhile.
+        """
+        with self.lock:
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0 and self.conn.in_transaction:
+                self.conn.commit()
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
+        """
+        Get a cursor for the checkpoint database.
+
+        Write cursors (transaction=True) use the single writer connection and
+        are committed when the enclosing call's transaction (or the cursor
+        itself) exits. Read cursors use a pooled reader connection.
+
+        Args:
+            transaction: Whether the cursor is used for writes.
+
+        Yields:
+            sqlite3.Cursor: A cursor for the database.
+        """
+        if transaction:
+            with self._transaction():
+                self.setup()
+                cur = self.conn.cursor()
+                try:
+                    yield cur
+                finally:
+                    cur.close()
+            return
+
+        with self.lock:
+            self.setup()
+
+        conn, pooled = self._acquire_reader()
+        cur = conn.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+            if pooled:
+                self._readers.put(conn)
+            else:
+                conn.close()
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints, newest first, reading only from reader connections.
+
+        SqliteSaver.list loads the pending writes of each checkpoint through
+        the writer connection, outside the lock, where it can see another
+        thread's uncommitted transaction. The matching checkpoints are
+        selected here and each one is loaded with get_tuple instead.
+
+        Args:
+            config: Config selecting the thread (and namespace) to list.
+            filter: Metadata fields the checkpoints must match.
+            before: Only list checkpoints before this checkpoint.
+            limit: Maximum number of checkpoints.
+
+        Yields:
+            CheckpointTuple: The matching checkpoints.
+        """
+        where, params = search_where(config, filter, before)
+        query = (
+            f"SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints "
+            f"{where} ORDER BY checkpoint_id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (*params, limit)
+        with self.cursor(transaction=False) as cur:
+            rows = cur.execute(query, params).fetchall()
+        for thread_id, checkpoint_ns, checkpoint_id in rows:
+            checkpoint_tuple = self.get_tuple(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                }
+            )
+            # Skipped if the thread was deleted meanwhile
+            if checkpoint_tuple is not None:
+                yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and its session index entry in one transaction."""
+        with self._transaction():
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+            if not config["configurable"].get("checkpoint_ns"):
+                with self.cursor() as cur:
+                    thread_id = str(config["configurable"]["thread_id"])
+                    upsert_session(cur, thread_id, dict(checkpoint))
+                    # Imported sessions have no writes to index; "import" is
+                    # not one of LangGraph's own metadata sources
+                    source = dict(metadata).get("source")
+                    if self.search_enabled and source == "import":
+                        index_messages(
+                            cur,
+                            thread_id,
+                            checkpoint["channel_values"].get("messages", []),
+                        )
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Store intermediate writes and index new messages for search.
+
+        The writes are committed before returning: LangGraph replays them
+        after a crash, before the checkpoint of the step exists.
+        """
+        with self._transaction():
+            super().put_writes(config, writes, task_id, task_path)
+            if not self.search_enabled or config["configurable"].get("checkpoint_ns"):
+                return
+            messages: list[Any] = []
+            for channel, value in writes:
+                if channel == "messages":
+                    messages.extend(value if isinstance(value, list) else [value])
+            if messages:
+                with self.cursor() as cur:
+                    thread_id = str(config["configurable"]["thread_id"])
+                    index_messages(cur, thread_id, messages)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread in one transaction."""
+        with self._transaction():
+            super().delete_thread(thread_id)
+            with self.cursor() as cur:
+                delete_session(cur, str(thread_id))
+                if self.search_enabled:
+                    delete_thread_search(cur, str(thread_id))
+
+    def close(self) -> None:
+        """Commit pending writes and close all connections."""
+        self.flush()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        self.conn.close()
@@ -8,11 +8,14 @@ and session inspection.
 
 import json
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain.messages import AIMessage, HumanMessage, ToolMessage
-from langgraph.pregel import Pregel
-from langgraph.types import RunnableConfig
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+if TYPE_CHECKING:
+    # Importing langgraph.pregel takes most of a second; only needed for typing
+    from langgraph.pregel import Pregel
 
 from gns3_copilot.log_config import setup_logger
 
@@ -394,8 +397,94 @@ def validate_messages_for_ui(messages: list) -> tuple[bool, str, list[str]]:
     return is_valid, error_message, validation_errors
 
 
+def _summarize_session(
+    thread_id: str, values: dict[str, Any], verbose: bool = False
+) -> dict[str, Any]:
+    """Build the message statistics and state fields of a session summary."""
+    messages = values.get("messages", [])
+    message_count = len(messages)
+
+    # Count message types
+    message_types = {"human": 0, "ai": 0, "tool": 0, "unknown": 0}
+    for msg in messages:
+        if isinstance(msg, HumanMessage):
+            message_types["human"] += 1
+        elif isinstance(msg, AIMessage):
+            message_types["ai"] += 1
+        elif isinstance(msg, ToolMessage):
+            message_types["tool"] += 1
+        else:
+            message_types["unknown"] += 1
+
+    # Get latest message content
+    latest_message = None
+    if messages:
+        latest_msg = messages[-1]
+        if hasattr(latest_msg, "content"):
+            if isinstance(latest_msg.content, str):
+                latest_message = latest_msg.content
+            elif isinstance(latest_msg.content, list) and latest_msg.content:
+                # Handle Gemini format (list with text field)
+                if isinstance(latest_msg.content[0], dict):
+                    latest_message = latest_msg.content[0].get(
+                        "text", str(latest_msg.content)
+                    )
+                else:
+                    latest_message = str(latest_msg.content)
+            else:
+                latest_message = str(latest_msg.content)
+
+    # Validate UI compatibility
+    is_valid, error_msg, validation_errors = validate_messages_for_ui(messages)
+
+    result = {
+        "thread_id": thread_id,
+        "message_count": message_count,
+        "message_types": message_types,
+        "latest_message": latest_message,
+        "conversation_title": values.get("conversation_title"),
+        "selected_project": values.get("selected_project"),
+        "topology_ref": values.get("topology_ref"),
+        "ui_compatible": is_valid,
+        "validation_error": error_msg,
+        "validation_errors": validation_errors,
+    }
+
+    # Add verbose details if requested
+    if verbose:
+        messages_preview = []
+        for idx, msg in enumerate(messages):
+            msg_preview = {
+                "index": idx,
+                "type": type(msg).__name__,
+            }
+            if hasattr(msg, "content"):
+                msg_preview["content"] = str(msg.content)[:200]  # Truncate long content
+            if (
+                isinstance(msg, AIMessage)
+                and hasattr(msg, "tool_calls")
+                and msg.tool_calls
+            ):
+                msg_preview["tool_calls_count"] = len(msg.tool_calls)
+            messages_preview.append(msg_preview)
+        result["messages_preview"] = messages_preview
+
+    return result
+
+
+def _inspect_error(thread_id: str, error: Exception) -> dict[str, Any]:
+    return {
+        "thread_id": thread_id,
+        "error": str(error),
+        "message_count": 0,
+        "message_types": {"human": 0, "ai": 0, "tool": 0, "unknown": 0},
+        "ui_compatible": False,
+        "validation_error": f"Failed to get state: {error}",
+    }
+
+
 def inspect_session(
-    thread_id: str, graph: Pregel, verbose: bool = False
+    thread_id: str, graph: "Pregel", verbose: bool = False
 ) -> dict[str, Any]:
     """
     Inspect and return human-readable session state using graph.get_state().
@@ -419,6 +508,7 @@ def inspect_session(
             - has_interrupts: Whether there are interrupts
             - conversation_title: Session title
             - selected_project: Currently selected GNS3 project
+            - topology_ref: Reference to the latest topology snapshot
             - ui_compatible: Whether messages are compatible with UI
             - validation_errors: List of validation errors (if any)
             - messages_preview: Preview of messages (if verbose=True)
@@ -428,95 +518,68 @@ def inspect_session(
     try:
         snapshot = graph.get_state(config)
 
-        # Extract message information
-        messages = snapshot.values.get("messages", [])
-        message_count = len(messages)
-
-        # Count message types
-        message_types = {"human": 0, "ai": 0, "tool": 0, "unknown": 0}
-        for msg in messages:
-            if isinstance(msg, HumanMessage):
-                message_types["human"] += 1
-            elif isinstance(msg, AIMessage):
-                message_types["ai"] += 1
-            elif isinstance(msg, ToolMessage):
-                message_types["tool"] += 1
-            else:
-                message_types["unknown"] += 1
-
-        # Get latest message content
-        latest_message = None
-        if messages:
-            latest_msg = messages[-1]
-            if hasattr(latest_msg, "content"):
-                if isinstance(latest_msg.content, str):
-                    latest_message = latest_msg.content
-                elif isinstance(latest_msg.content, list) and latest_msg.content:
-                    # Handle Gemini format (list with text field)
-                    if isinstance(latest_msg.content[0], dict):
-                        latest_message = latest_msg.content[0].get(
-                            "text", str(latest_msg.content)
-                        )
-                    else:
-                        latest_message = str(latest_msg.content)
-                else:
-                    latest_message = str(latest_msg.content)
+        result = _summarize_session(thread_id, snapshot.values, verbose)
+        result.update(
+            {
+                "next": snapshot.next,
+                "step": snapshot.metadata.get("step", "N/A")
+                if snapshot.metadata
+                else "N/A",
+                "pending_tasks": len(snapshot.tasks),
+                "has_interrupts": len(snapshot.interrupts) > 0,
+            }
+        )
+        return result
 
-        # Validate UI compatibility
-        is_valid, error_msg, validation_errors = validate_messages_for_ui(messages)
-
-        # Build result dictionary
-        result = {
-            "thread_id": thread_id,
-            "next": snapshot.next,
-            "message_count": message_count,
-            "message_types": message_types,
-            "latest_message": latest_message,
-            "step": snapshot.metadata.get("step", "N/A")
-            if snapshot.metadata
-            else "N/A",
-            "pending_tasks": len(snapshot.tasks),
-            "has_interrupts": len(snapshot.interrupts) > 0,
-            "conversation_title": snapshot.values.get("conversation_title"),
-            "selected_project": snapshot.values.get("selected_project"),
-            "ui_compatible": is_valid,
-            "validation_error": error_msg,
-            "validation_errors": validation_errors,
-        }
+    except Exception as e:
+        logger.error("Failed to inspect session %s: %s", thread_id, e)
+        return _inspect_error(thread_id, e)
 
-        # Add verbose details if requested
-        if verbose:
-            messages_preview = []
-            for idx, msg in enumerate(messages):
-                msg_preview = {
-                    "index": idx,
-                    "type": type(msg).__name__,
-                }
-                if hasattr(msg, "content"):
-                    msg_preview["content"] = str(msg.content)[
-                        :200
-                    ]  # Truncate long content
-                if (
-                    isinstance(msg, AIMessage)
-                    and hasattr(msg, "tool_calls")
-                    and msg.tool_calls
-                ):
-                    msg_preview["tool_calls_count"] = len(msg.tool_calls)
-                messages_preview.append(msg_preview)
-            result["messages_preview"] = messages_preview
 
+def inspect_checkpoint(
+    checkpointer: Any, thread_id: str, verbose: bool = False
+) -> dict[str, Any]:
+    """
+    Inspect a session from its latest checkpoint, without a compiled graph.
+
+    Returns the same information as inspect_session(), except that the next
+    nodes are unknown ("next" is None) and pending tasks are counted from the
+    pending writes of the checkpoint.
+
+    Args:
+        checkpointer: LangGraph checkpointer instance.
+        thread_id: Thread ID to inspect.
+        verbose: If True, include detailed message contents in output.
+
+    Returns:
+        dict: Human-readable session information, see inspect_session().
+    """
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+
+    try:
+        checkpoint_tuple = checkpointer.get_tuple(config)
+        if checkpoint_tuple is None:
+            raise ValueError("Thread not found")
+
+        pending_writes = checkpoint_tuple.pending_writes or []
+        result = _summarize_session(
+            thread_id, checkpoint_tuple.checkpoint["channel_values"], verbose
+        )
+        result.update(
+            {
+                "next": None,
+                "step": (checkpoint_tuple.metadata or {}).get("step", "N/A"),
+                "pending_tasks": len({task_id for task_id, _, _ in pending_writes}),
+                "has_interrupts": any(
+                    channel == "__interrupt__" for _, channel, _ in pending_writes
+                ),
+            }
+        )
         return result
 
     except Exception as e:
         logger.error("Failed to inspect session %s: %s", thread_id, e)
-        return {
-            "thread_id": thread_id,
-            "error": str(e),
-            "message_count": 0,
-            "message_types": {"human": 0, "ai": 0, "tool": 0, "unknown": 0},
-            "ui_compatible": False,
-            "validation_error": f"Failed to get state: {e}",
-        }
+        return _inspect_error(thread_id, e)
 
 
 def import_checkpoint_from_file(
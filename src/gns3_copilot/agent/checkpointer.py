@@ -0,0 +1,67 @@
+"""
+Shared Conversation Checkpointer for GNS3 Copilot.
+
+The checkpointer is created once per Streamlit process and shared by the
+compiled agent and the sidebar session list. It lives apart from the graph
+module so pages that only list, search or delete sessions do not compile the
+graph, which loads all tools and the chat model provider.
+
+Functions:
+    get_checkpointer(): Cached PooledSqliteSaver for the app lifetime
+    get_retention_worker(): Start the checkpoint retention worker once
+
+Constants:
+    LANGGRAPH_DB_PATH: Checkpoint database of the application
+"""
+
+import threading
+
+import streamlit as st
+
+from gns3_copilot.agent.checkpoint_retention import start_retention_worker
+from gns3_copilot.agent.checkpoint_serde import create_checkpoint_serializer
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.session_index import backfill_session_index
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("checkpointer")
+
+LANGGRAPH_DB_PATH = "gns3_langgraph.db"
+
+
+@st.cache_resource(show_spinner="Initializing conversation persistence...")
+def get_checkpointer() -> PooledSqliteSaver:
+    """
+    Create and cache a single checkpointer instance for the entire app lifetime.
+
+    Important notes:
+    - The returned checkpointer is automatically shared across all user sessions.
+    - PooledSqliteSaver uses WAL, pooled reader connections and a single writer
+      that commits each write call before it returns, so concurrent sessions
+      don't serialize and no transaction stays open while a node runs.
+    """
+    # PooledSqliteSaver will create the necessary tables on first use
+    checkpointer = PooledSqliteSaver(
+        LANGGRAPH_DB_PATH, serde=create_checkpoint_serializer()
+    )
+    # Threads stored before the session index existed are indexed once
+    try:
+        backfill_session_index(checkpointer)
+    except Exception as e:
+        logger.error("Failed to backfill session index: %s", e)
+    return checkpointer
+
+
+@st.cache_resource
+def get_retention_worker() -> threading.Event:
+    """
+    Start the checkpoint retention worker once for the app lifetime.
+
+    Returns:
+        threading.Event: Event that stops the worker when set.
+    """
+    return start_retention_worker(get_checkpointer())
+
+
+langgraph_checkpointer = get_checkpointer()  # Cached PooledSqliteSaver instance
+get_retention_worker()  # Prune old checkpoints in the background
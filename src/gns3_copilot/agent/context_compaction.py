@@ -0,0 +1,362 @@
+"""
+GNS3 Copilot Context Compaction
+
+This module keeps the conversation history sent to the LLM bounded. When the
+estimated token count of `MessagesState.messages` exceeds the configured
+budget, older turns are folded into a running summary stored in the
+`conversation_summary` state key and removed from the message list with
+`RemoveMessage`, so the compacted form is what gets persisted in the
+checkpoint.
+
+Recent turns are kept verbatim. Tool calls are never separated from their
+tool responses, and the current turn's user message and latest tool round
+are always kept, so unresolved tool context is never summarized away.
+
+If summarization fails, the history size is recorded in the
+`compaction_retry_tokens` state key and compaction is not attempted again
+until the history has grown by the verbatim window, so a failing summary
+model is not called on every step of the thread.
+"""
+
+import json
+from typing import Any
+
+from langchain.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from gns3_copilot.agent.model_factory import create_summary_model
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.prompts import SUMMARY_PROMPT
+from gns3_copilot.utils import get_config
+
+logger = setup_logger("context_compaction")
+
+# Rough characters-per-token ratio used for provider independent estimates
+CHARS_PER_TOKEN = 4
+
+# Fixed per-message overhead (role, separators) in tokens
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# Fallback values when the configuration database holds invalid numbers
+DEFAULT_CONTEXT_TOKEN_BUDGET = 24000
+DEFAULT_KEEP_RECENT_TOKENS = 8000
+
+# Maximum characters of a single message rendered into the summary request
+MAX_SUMMARY_INPUT_CHARS = 2000
+
+
+def _message_text(message: Any) -> str:
+    """
+    Extract the plain text content of a message.
+
+    Handles plain string content as well as the list format used by Gemini
+    (list of dicts with a "text" field).
+
+    Args:
+        message: LangChain message object.
+
+    Returns:
+        str: Text content of the message.
+    """
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, dict):
+                parts.append(str(part.get("text", "")))
+            else:
+                parts.append(str(part))
+        return "\n".join(parts)
+    return str(content)
+
+
+def estimate_message_tokens(message: Any) -> int:
+    """
+    Estimate the number of tokens a message occupies in the LLM context.
+
+    Args:
+        message: LangChain message object.
+
+    Returns:
+        int: Estimated token count, including tool call arguments.
+    """
+    chars = len(_message_text(message))
+    if isinstance(message, AIMessage) and message.tool_calls:
+        for tool_call in message.tool_calls:
+            chars += len(tool_call.get("name", ""))
+            chars += len(json.dumps(tool_call.get("args", {}), default=str))
+    return chars // CHARS_PER_TOKEN + MESSAGE_TOKEN_OVERHEAD
+
+
+def estimate_tokens(messages: list[AnyMessage]) -> int:
+    """
+    Estimate the total number of tokens of a message list.
+
+    Args:
+        messages: List of LangChain messages.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return sum(estimate_message_tokens(message) for message in messages)
+
+
+def _get_int_config(key: str, fallback: int) -> int:
+    """Read a positive integer configuration value with a safe fallback."""
+    try:
+        value = int(get_config(key))
+    except (TypeError, ValueError):
+        logger.warning("Invalid %s configuration, using %d", key, fallback)
+        return fallback
+    return value if value > 0 else fallback
+
+
+def get_compaction_budget() -> tuple[int, int]:
+    """
+    Get the compaction thresholds from configuration.
+
+    Returns:
+        tuple: (token_budget, keep_recent_tokens)
+               - token_budget: History size that triggers compaction
+               - keep_recent_tokens: Size of the recent history kept verbatim
+    """
+    token_budget = _get_int_config("CONTEXT_TOKEN_BUDGET", DEFAULT_CONTEXT_TOKEN_BUDGET)
+    keep_recent = _get_int_config(
+        "CONTEXT_KEEP_RECENT_TOKENS", DEFAULT_KEEP_RECENT_TOKENS
+    )
+    # Keeping more than the budget would trigger compaction on every step
+    return token_budget, min(keep_recent, token_budget // 2)
+
+
+def needs_compaction(messages: list[AnyMessage], token_budget: int) -> bool:
+    """
+    Check whether the message history exceeds the token budget.
+
+    Args:
+        messages: List of LangChain messages.
+        token_budget: Maximum estimated tokens before compaction is triggered.
+
+    Returns:
+        bool: True if the history should be compacted.
+    """
+    return estimate_tokens(messages) > token_budget
+
+
+def select_messages_to_compact(
+    messages: list[AnyMessage], keep_recent_tokens: int
+) -> list[AnyMessage]:
+    """
+    Select the older messages that can be folded into the summary.
+
+    Whole turns (starting at a HumanMessage) are kept from the end of the
+    history while they fit into `keep_recent_tokens`. The current turn is
+    always kept. If the current turn alone exceeds the limit, its completed
+    tool rounds are folded as well, but its HumanMessage and its latest
+    AIMessage with the following tool responses stay verbatim.
+
+    Args:
+        messages: List of LangChain messages in conversation order.
+        keep_recent_tokens: Token budget for the verbatim recent history.
+
+    Returns:
+        list: Messages to fold into the summary, in conversation order.
+    """
+    turn_starts = [
+        idx for idx, msg in enumerate(messages) if isinstance(msg, HumanMessage)
+    ]
+    if not turn_starts:
+        return []
+
+    # Earliest turn boundary whose tail still fits into the budget
+    boundary = turn_starts[-1]
+    for idx in reversed(turn_starts[:-1]):
+        if estimate_tokens(messages[idx:]) > keep_recent_tokens:
+            break
+        boundary = idx
+
+    to_compact = list(messages[:boundary])
+
+    if boundary != turn_starts[-1]:
+        return to_compact
+
+    # The current turn alone may be too large: fold its completed tool rounds
+    current_turn = messages[boundary + 1 :]
+    round_starts = [
+        idx for idx, msg in enumerate(current_turn) if isinstance(msg, AIMessage)
+    ]
+    if len(round_starts) < 2:
+        return to_compact
+
+    budget = keep_recent_tokens - estimate_message_tokens(messages[boundary])
+    keep_from = round_starts[-1]
+    for idx in reversed(round_starts[:-1]):
+        if estimate_tokens(current_turn[idx:]) > budget:
+            break
+        keep_from = idx
+
+    return to_compact + list(current_turn[:keep_from])
+
+
+def _render_for_summary(messages: list[AnyMessage]) -> str:
+    """
+    Render messages as plain text for the summarization request.
+
+    Long contents (typically raw device output) are clipped to keep the
+    summarization call itself bounded.
+
+    Args:
+        messages: Messages to render.
+
+    Returns:
+        str: Text transcript of the messages.
+    """
+    # ToolMessages of older checkpoints carry no name; use their tool call's
+    tool_names = {
+        tool_call.get("id"): tool_call.get("name", "")
+        for message in messages
+        if isinstance(message, AIMessage)
+        for tool_call in message.tool_calls or []
+    }
+    lines = []
+    for message in messages:
+        text = _message_text(message)
+        if len(text) > MAX_SUMMARY_INPUT_CHARS:
+            text = text[:MAX_SUMMARY_INPUT_CHARS] + " ...[truncated]"
+
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {text}")
+        elif isinstance(message, AIMessage):
+            if text.strip():
+                lines.append(f"Assistant: {text}")
+            for tool_call in message.tool_calls or []:
+                args = json.dumps(tool_call.get("args", {}), default=str)
+                if len(args) > MAX_SUMMARY_INPUT_CHARS:
+                    args = args[:MAX_SUMMARY_INPUT_CHARS] + " ...[truncated]"
+                lines.append(
+                    f"Assistant called tool {tool_call.get('name', '')}: {args}"
+                )
+        elif isinstance(message, ToolMessage):
+            name = message.name or tool_names.get(message.tool_call_id) or "tool"
+            lines.append(f"Tool result ({name}): {text}")
+        else:
+            lines.append(text)
+    return "\n".join(lines)
+
+
+def summarize_messages(
+    messages: list[AnyMessage], previous_summary: str | None = None
+) -> str:
+    """
+    Fold messages into a running summary using the summary model.
+
+    Args:
+        messages: Messages to fold into the summary.
+        previous_summary: Existing summary to merge with, if any.
+
+    Returns:
+        str: The updated summary.
+
+    Raises:
+        RuntimeError: If the summary model cannot be created or invoked.
+    """
+    records = _render_for_summary(messages)
+    if previous_summary:
+        records = f"Existing summary:\n{previous_summary}\n\nConversation:\n{records}"
+
+    summary_model = create_summary_model()
+    response = summary_model.invoke(
+        [SystemMessage(content=SUMMARY_PROMPT), HumanMessage(content=records)]
+    )
+    return _message_text(response).strip()
+
+
+def compact_context(state: dict) -> dict:
+    """
+    LangGraph node that folds older turns into the running summary.
+
+    Older messages are removed from the state with `RemoveMessage` and
+    replaced by an updated `conversation_summary`. If summarization fails the
+    history is left untouched so the conversation can continue, and further
+    attempts are postponed until the history has grown (see route_to_llm).
+
+    Args:
+        state: Current conversation state.
+
+    Returns:
+        dict: State update with removed messages and the new summary, the
+              postponed retry after a failure, or an empty dict if nothing
+              was compacted.
+    """
+    messages = state.get("messages", [])
+    token_budget, keep_recent = get_compaction_budget()
+
+    to_compact = [
+        msg
+        for msg in select_messages_to_compact(messages, keep_recent)
+        if getattr(msg, "id", None)
+    ]
+    if not to_compact:
+        logger.debug("Nothing to compact in %d messages", len(messages))
+        return {}
+
+    try:
+        summary = summarize_messages(to_compact, state.get("conversation_summary"))
+        if not summary:
+            logger.warning("Summary model returned empty output, skipping compaction")
+    except Exception as e:
+        logger.error("Context compaction failed, keeping full history: %s", e)
+        summary = ""
+
+    if not summary:
+        # Retry once the history has grown by the verbatim window
+        return {"compaction_retry_tokens": estimate_tokens(messages) + keep_recent}
+
+    logger.info(
+        "Compacted %d of %d messages (~%d tokens, budget %d)",
+        len(to_compact),
+        len(messages),
+        estimate_tokens(to_compact),
+        token_budget,
+    )
+    return {
+        "messages": [RemoveMessage(id=str(msg.id)) for msg in to_compact],
+        "conversation_summary": summary,
+        "compaction_retry_tokens": None,
+    }
+
+
+def route_to_llm(state: dict) -> str:
+    """
+    Route to the compaction node when the history exceeds the token budget.
+
+    Only routes to compaction when there is something that can be folded, so
+    an oversized current turn does not spend a graph step on every tool round,
+    and not before the history reached `compaction_retry_tokens` after a
+    failed attempt.
+
+    Args:
+        state: Current conversation state.
+
+    Returns:
+        str: "compact_context" if compaction is needed, "llm_call" otherwise.
+    """
+    messages = state.get("messages", [])
+    token_budget, keep_recent = get_compaction_budget()
+    # Postponed after a failed attempt
+    threshold = max(token_budget, state.get("compaction_retry_tokens") or 0)
+    if needs_compaction(messages, threshold) and select_messages_to_compact(
+        messages, keep_recent
+    ):
+        logger.info(
+            "History exceeds %d tokens → routing to 'compact_context'", token_budget
+        )
+        return "compact_context"
+    return "llm_call"
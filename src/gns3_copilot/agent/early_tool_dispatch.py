@@ -0,0 +1,243 @@
+"""
+GNS3 Copilot Early Tool Dispatch
+
+When the model emits several tool calls in one message, the arguments of the
+first call are complete long before the message ends. This module watches the
+streamed `tool_call_chunks` during the LLM call and dispatches read-only tools
+as soon as their argument JSON is complete, so tool latency overlaps with LLM
+generation. Mutating tools still wait for the full message and tool_node.
+
+Use stream_with_early_dispatch() in place of model.invoke(). Early results are
+kept in a process-wide registry keyed by tool call ID and picked up by
+invoke_tool_call() in the tool nodes. A result is only used if the final
+message contains the same call with the same arguments. Results that no tool
+node picks up (e.g. a run stopped by the recursion limit or a rerun of the
+page between the LLM call and the tool node) are dropped once they are older
+than EARLY_RESULT_MAX_AGE_SECONDS, the next time a call is dispatched.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    message_chunk_to_message,
+)
+
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("early_tool_dispatch")
+
+# Tools without side effects on the project or the devices
+READ_ONLY_TOOLS = frozenset(
+    {
+        "get_gns3_templates",
+        "gns3_topology_reader",
+        "execute_multiple_device_commands",
+        "read_tool_artifact",
+    }
+)
+
+# Upper bound on concurrently running early tool calls
+EARLY_DISPATCH_WORKERS = 4
+
+# Age after which an early result no tool node picked up is dropped; tool
+# calls of the same message run one after another, so allow for slow ones
+EARLY_RESULT_MAX_AGE_SECONDS = 900.0
+
+_executor: ThreadPoolExecutor | None = None
+# Format: {tool_call_id: (args, future, dispatched_at)}
+_pending: dict[str, tuple[dict[str, Any], Future, float]] = {}
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the shared executor on first use."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=EARLY_DISPATCH_WORKERS,
+                thread_name_prefix="early-tool",
+            )
+        return _executor
+
+
+def _parse_complete_args(args: str) -> dict[str, Any] | None:
+    """
+    Parse streamed tool arguments if they form a complete JSON object.
+
+    A JSON object that parses cannot be the prefix of a longer valid object,
+    so a successful parse means the arguments are complete.
+    """
+    if not args or not args.rstrip().endswith("}"):
+        return None
+    try:
+        parsed = json.loads(args)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+class EarlyToolDispatcher:
+    """
+    Dispatches read-only tool calls while the model is still streaming.
+
+    Usage:
+        dispatcher = EarlyToolDispatcher(tools_by_name)
+        for chunk in model.stream(messages):
+            dispatcher.feed(chunk)
+        dispatcher.finalize(final_message)
+    """
+
+    def __init__(self, tools_by_name: dict[str, Any]):
+        self.tools_by_name = tools_by_name
+        # Partial tool calls keyed by chunk index
+        self._calls: dict[Any, dict[str, str]] = {}
+        self._dispatched: dict[str, dict[str, Any]] = {}
+
+    def feed(self, chunk: AIMessageChunk) -> None:
+        """
+        Accumulate a streamed chunk and dispatch calls that became complete.
+
+        Args:
+            chunk: Streamed message chunk from the model.
+        """
+        for update in getattr(chunk, "tool_call_chunks", None) or []:
+            # Some providers send whole calls without an index
+            key = update.get("index")
+            if key is None:
+                key = update.get("id")
+            call = self._calls.setdefault(key, {"id": "", "name": "", "args": ""})
+            call["id"] = update.get("id") or call["id"]
+            call["name"] = update.get("name") or call["name"]
+            call["args"] += update.get("args") or ""
+            self._maybe_dispatch(call)
+
+    def _maybe_dispatch(self, call: dict[str, str]) -> None:
+        """Dispatch a read-only call once its arguments are complete."""
+        call_id, name = call["id"], call["name"]
+        if not call_id or call_id in self._dispatched:
+            return
+        if name not in READ_ONLY_TOOLS or name not in self.tools_by_name:
+            return
+
+        args = _parse_complete_args(call["args"])
+        if args is None:
+            return
+
+        future = _get_executor().submit(self.tools_by_name[name].invoke, args)
+        self._dispatched[call_id] = args
+        now = time.monotonic()
+        with _lock:
+            _sweep_abandoned(now)
+            _pending[call_id] = (args, future, now)
+        logger.info("Dispatched %s early (tool_call_id=%s)", name, call_id)
+
+    def discard_all(self) -> None:
+        """Drop all early calls, e.g. when the LLM call failed."""
+        for call_id in self._dispatched:
+            discard_early_result(call_id)
+
+    def finalize(self, message: AIMessage) -> None:
+        """
+        Drop early calls that did not end up in the final message unchanged.
+
+        Args:
+            message: The complete message produced by the model.
+        """
+        final_args = {call["id"]: call["args"] for call in message.tool_calls}
+        for call_id, args in self._dispatched.items():
+            if final_args.get(call_id) != args:
+                discard_early_result(call_id)
+
+
+def stream_with_early_dispatch(
+    model: Any, messages: list[BaseMessage], tools_by_name: dict[str, Any]
+) -> BaseMessage:
+    """
+    Stream a model response, dispatching read-only tool calls early.
+
+    Args:
+        model: Chat model with tools bound.
+        messages: Input messages.
+        tools_by_name: Tool instances keyed by tool name.
+
+    Returns:
+        BaseMessage: The complete response message.
+    """
+    dispatcher = EarlyToolDispatcher(tools_by_name)
+    response = None
+    try:
+        for chunk in model.stream(messages):
+            dispatcher.feed(chunk)
+            response = chunk if response is None else response + chunk
+    except Exception:
+        dispatcher.discard_all()
+        raise
+
+    if response is None:
+        # Providers without streaming support yield nothing
+        fallback: BaseMessage = model.invoke(messages)
+        return fallback
+
+    message = message_chunk_to_message(response)
+    if isinstance(message, AIMessage):
+        dispatcher.finalize(message)
+    return message
+
+
+def _sweep_abandoned(now: float) -> None:
+    """Drop early results of runs that never reached a tool node (lock held)."""
+    expired = [
+        call_id
+        for call_id, (_, _, dispatched_at) in _pending.items()
+        if now - dispatched_at > EARLY_RESULT_MAX_AGE_SECONDS
+    ]
+    for call_id in expired:
+        _pending.pop(call_id)[1].cancel()
+    if expired:
+        logger.info("Dropped %d abandoned early tool results", len(expired))
+
+
+def discard_early_result(call_id: str) -> None:
+    """
+    Remove an early result from the registry, cancelling it if not started.
+
+    Args:
+        call_id: Tool call ID.
+    """
+    with _lock:
+        entry = _pending.pop(call_id, None)
+    if entry is not None:
+        entry[1].cancel()
+        logger.debug("Discarded early result for tool_call_id=%s", call_id)
+
+
+def invoke_tool_call(tool_call: dict[str, Any], tools_by_name: dict[str, Any]) -> Any:
+    """
+    Run a tool call, reusing the early result if one was dispatched.
+
+    Args:
+        tool_call: Tool call from the final AIMessage.
+        tools_by_name: Tool instances keyed by tool name.
+
+    Returns:
+        Any: The tool observation.
+    """
+    with _lock:
+        entry = _pending.pop(tool_call["id"], None)
+
+    if entry is not None:
+        args, future, _ = entry
+        if args == tool_call["args"]:
+            logger.debug("Using early result for tool_call_id=%s", tool_call["id"])
+            return future.result()
+        future.cancel()
+
+    return tools_by_name[tool_call["name"]].invoke(tool_call["args"])
@@ -16,24 +16,38 @@ The assistant integrates with various tools to provide a complete network automa
 solution for GNS3 environments.
 """
 
-import operator
-import sqlite3
-from typing import Annotated, Literal
+from datetime import datetime
+from typing import Annotated, Any, Literal
 
 import streamlit as st
 from langchain.messages import AnyMessage, SystemMessage, ToolMessage
-from langgraph.checkpoint.sqlite import SqliteSaver
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
 from langgraph.managed.is_last_step import RemainingSteps
 from typing_extensions import TypedDict
 
-from gns3_copilot.agent.model_factory import (
-    create_base_model_with_tools,
-    create_title_model,
+from gns3_copilot.agent.checkpointer import get_checkpointer
+from gns3_copilot.agent.context_compaction import compact_context, route_to_llm
+from gns3_copilot.agent.early_tool_dispatch import (
+    invoke_tool_call,
+    stream_with_early_dispatch,
+)
+from gns3_copilot.agent.model_factory import create_base_model_with_tools
+from gns3_copilot.agent.plan_execute import (
+    PLAN_TOOL_NAME,
+    ExecutePlanTool,
+    execute_plan_call,
+    is_planner_enabled,
+)
+from gns3_copilot.agent.topology_store import (
+    TopologyRef,
+    load_topology,
+    store_topology,
 )
 from gns3_copilot.gns3_client import GNS3TopologyTool
 from gns3_copilot.log_config import setup_logger
-from gns3_copilot.prompts import TITLE_PROMPT, load_system_prompt
+from gns3_copilot.prompts import PLANNER_PROMPT, load_system_prompt
 from gns3_copilot.tools_v2 import (
     ExecuteMultipleDeviceCommands,
     ExecuteMultipleDeviceConfigCommands,
@@ -43,9 +57,10 @@ from gns3_copilot.tools_v2 import (
     GNS3StartNodeTool,
     GNS3TemplateTool,
     LinuxTelnetBatchTool,
+    ReadToolArtifactTool,
     VPCSMultiCommands,
 )
-from gns3_copilot.utils import get_config
+from gns3_copilot.utils import apply_output_budget, get_config, render_tool_output
 
 # Set up logger for GNS3 Copilot
 logger = setup_logger("gns3_copilot", log_file="gns3_copilot.log")
@@ -75,9 +90,12 @@ tools = [
     VPCSMultiCommands(),  # Execute VPCS commands on multiple devices
     LinuxTelnetBatchTool(),  # Execute Linux commands via Telnet on multiple devices
     GNS3CreateAreaDrawingTool(),  # Create area drawings in GNS3 topologies
+    ReadToolArtifactTool(),  # Page through oversized tool outputs
 ]
 # Augment the LLM with tools
 tools_by_name = {tool.name: tool for tool in tools}
+# Plan submission tool, bound only in plan-and-execute mode
+plan_tool = ExecutePlanTool(tools_by_name=tools_by_name)
 # Model with tools will be created dynamically by the factory when needed
 
 # Log application startup
@@ -94,14 +112,19 @@ class MessagesState(TypedDict):
     call counters, and session titles for comprehensive dialogue management.
 
     Attributes:
-        messages: List of conversation messages with cumulative updates using operator.add
+        messages: List of conversation messages merged with add_messages
+            (supports RemoveMessage for context compaction)
         llm_calls: Counter for tracking the number of LLM invocations
         remaining_steps: Is automatically managed by LangGraph's RemainingSteps to track and limit recursion depth.
         conversation_title: Optional conversation title for session identification and management
-        topology_info: Dictionary containing GNS3 project topology information
+        topology_ref: Reference (hash and capture time) to the latest GNS3 project
+            topology snapshot in the topology store, see topology_store.load_topology
+        conversation_summary: Running summary of older turns folded out of messages
+        compaction_retry_tokens: History size before which compaction is not
+            retried after a failed attempt
     """
 
-    messages: Annotated[list[AnyMessage], operator.add]
+    messages: Annotated[list[AnyMessage], add_messages]
 
     llm_calls: int
 
@@ -113,8 +136,39 @@ class MessagesState(TypedDict):
     # Store the complete tuple selected by the user
     selected_project: tuple[str, str, int, int, str] | None
 
-    # Store GNS3 topology information
-    topology_info: dict | None
+    # Reference to the GNS3 topology snapshot; the topology itself is stored
+    # once per content hash instead of in every checkpoint
+    topology_ref: TopologyRef | None
+
+    # Running summary of compacted conversation history
+    conversation_summary: str | None
+
+    # Set after a failed compaction, so it is not retried on every step
+    compaction_retry_tokens: int | None
+
+
+def _offline_project_context(
+    project_info: str, project_id: str, topology_ref: TopologyRef | None
+) -> SystemMessage:
+    """
+    Build the project context when the live topology cannot be fetched.
+
+    The last topology snapshot of the thread is resolved from the topology
+    store and passed as last known topology, if it belongs to the project.
+    """
+    topology = load_topology(get_checkpointer(), topology_ref)
+    if not topology_ref or not topology or topology.get("project_id") != project_id:
+        return SystemMessage(content=f"Current Context: {project_info}")
+
+    captured = datetime.fromtimestamp(topology_ref["captured_at"])
+    logger.info("Using topology snapshot captured at %s", captured)
+    return SystemMessage(
+        content=(
+            f"Current Context: {project_info}\n\n"
+            "Last known topology (the GNS3 server could not be reached, "
+            f"captured {captured:%Y-%m-%d %H:%M:%S}):\n{topology}"
+        )
+    )
 
 
 # Define llm call  node
@@ -129,7 +183,7 @@ def llm_call(state: dict):
 
     # Construct context messages
     context_messages = []
-    topology_info = None
+    topology_ref = state.get("topology_ref")
 
     if selected_p:
         # Convert tuple information to natural language to tell LLM which project user selected
@@ -149,7 +203,7 @@ def llm_call(state: dict):
             topology = topology_tool._run(project_id=selected_p[1])
 
             if topology and "error" not in topology:
-                topology_info = topology
+                topology_ref = store_topology(get_checkpointer(), topology)
                 logger.info(
                     "Successfully retrieved topology for project: %s", selected_p[0]
                 )
@@ -168,14 +222,29 @@ def llm_call(state: dict):
                     topology.get("error", "Unknown error"),
                 )
                 context_messages.append(
-                    SystemMessage(content=f"Current Context: {project_info}")
+                    _offline_project_context(project_info, selected_p[1], topology_ref)
                 )
         except Exception as e:
             logger.warning("Error retrieving topology: %s", e)
             context_messages.append(
-                SystemMessage(content=f"Current Context: {project_info}")
+                _offline_project_context(project_info, selected_p[1], topology_ref)
             )
 
+    # Add the running summary of compacted history, if any
+    conversation_summary = state.get("conversation_summary")
+    if conversation_summary:
+        context_messages.append(
+            SystemMessage(
+                content=f"Summary of earlier conversation:\n{conversation_summary}"
+            )
+        )
+
+    # In plan-and-execute mode the model may submit a whole plan at once
+    model_tools = tools
+    if is_planner_enabled():
+        context_messages.append(SystemMessage(content=PLANNER_PROMPT))
+        model_tools = tools + [plan_tool]
+
     # Merge message lists
     full_messages = (
         [SystemMessage(content=current_prompt)] + context_messages + state["messages"]
@@ -184,96 +253,100 @@ def llm_call(state: dict):
 
     # Create fresh model with tools for each LLM call
     # This ensures configuration changes in .env take effect immediately
-    model_with_tools = create_base_model_with_tools(tools)
+    model_with_tools = create_base_model_with_tools(model_tools)
 
     return {
-        "messages": [model_with_tools.invoke(full_messages)],
+        "messages": [
+            stream_with_early_dispatch(model_with_tools, full_messages, tools_by_name)
+        ],
         "llm_calls": state.get("llm_calls", 0) + 1,
-        "topology_info": topology_info,
+        "topology_ref": topology_ref,
     }
 
 
-# Define generate title node
-def generate_title(state: MessagesState) -> dict:
+def _budgeted_tool_message(
+    tool_call: dict, observation: Any, thread_id: str | None
+) -> ToolMessage:
     """
-    Generate a conversation title using a lightweight assistant LLM (title_model).
-    This node is only executed when no title has been set yet (first round only).
-    """
-
-    # Only generate a title if it hasn't been set yet
-    if state.get("conversation_title") in [None, "New Session"]:
-        messages = state["messages"]
-
-        # Build the prompt for title generation
-        title_prompt_messages = [
-            SystemMessage(content=TITLE_PROMPT),
-            messages[0],  # User's first message
-            messages[-1],  # Assistant's final response in this turn
-        ]
-        logger.debug("summary_messages for title generation: %s", title_prompt_messages)
-
-        # Call the title generation model (create fresh instance for each call)
-        try:
-            # Create fresh title model instance from current env configuration
-            title_model = create_title_model()
-            response = title_model.invoke(
-                title_prompt_messages, config={"configurable": {"foo_temperature": 1.0}}
-            )
-            logger.debug("generate_title: %s", response)
-            raw_content = response.content
-            logger.debug("Raw title output from model: %s", raw_content)
-
-            new_title = raw_content.strip()
+    Build the ToolMessage of a tool call with its output budget applied.
 
-            # Safety: truncate long titles and avoid line breaks
-            if len(new_title) > 40:  # Increased limit for better Chinese support
-                new_title = new_title[:38] + "..."
+    Lists and dicts (e.g. per-device results) are serialized first, so they
+    are budgeted like text outputs.
+    """
+    content = apply_output_budget(
+        render_tool_output(observation), tool_call["name"], thread_id
+    )
+    return ToolMessage(
+        content=content, tool_call_id=tool_call["id"], name=tool_call["name"]
+    )
 
-            # Remove unwanted characters
-            new_title = new_title.replace("\n", " ").replace('"', "").replace("'", "")
 
-            if not new_title:
-                new_title = "GNS3 Session"
+# Define tool node
+def tool_node(state: dict, config: RunnableConfig):
+    """
+    Performs the tool call.
 
-            logger.info("Generated new title: %s", new_title)
-            return {"conversation_title": new_title}
+    Tool outputs larger than their budget are stored as artifacts and replaced
+    by a head/tail preview, so device output cannot blow up the context.
+    """
 
-        except Exception as e:
-            logger.error("Title generation failed: %s", e)
-            return {"conversation_title": "Untitled Session"}
+    thread_id = config.get("configurable", {}).get("thread_id")
+    result = []
+    for tool_call in state["messages"][-1].tool_calls:
+        # Read-only tools may already have been started while streaming
+        observation = invoke_tool_call(tool_call, tools_by_name)
+        result.append(_budgeted_tool_message(tool_call, observation, thread_id))
+    return {"messages": result}
 
-    # Title already exists → no update needed
-    return {}
 
+# Define plan executor node
+def plan_executor(state: dict, config: RunnableConfig):
+    """
+    Executes a plan submitted through the execute_plan tool.
 
-# Define tool node
-def tool_node(state: dict):
-    """Performs the tool call"""
+    All plan steps run without consulting the LLM in between; independent
+    steps run concurrently. Other tool calls of the same message are executed
+    as in tool_node, so every tool call gets its ToolMessage.
+    """
 
+    thread_id = config.get("configurable", {}).get("thread_id")
     result = []
     for tool_call in state["messages"][-1].tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observation = tool.invoke(tool_call["args"])
-        result.append(ToolMessage(content=observation, tool_call_id=tool_call["id"]))
+        if tool_call["name"] == PLAN_TOOL_NAME:
+            # Step results are budgeted by the executor, the combined report
+            # once more as a whole
+            report = execute_plan_call(tool_call["args"], tools_by_name, thread_id)
+            result.append(_budgeted_tool_message(tool_call, report, thread_id))
+            continue
+
+        # Read-only tools may already have been started while streaming
+        observation = invoke_tool_call(tool_call, tools_by_name)
+        result.append(_budgeted_tool_message(tool_call, observation, thread_id))
     return {"messages": result}
 
 
 # Routing logic after the LLM node
 def should_continue(
     state: MessagesState,
-) -> Literal["tool_node", "title_generator_node", END]:
+) -> Literal["tool_node", "plan_executor", END]:
     """
     Determine the next step after the LLM has produced a response.
 
-    - If the LLM requested any tool calls → route to tool_node
-    - If this is the first complete turn (llm_calls == 1) and no title exists → generate a title
-    - Otherwise → conversation is complete, go to END
+    - If the LLM submitted a plan → route to plan_executor
+    - If the LLM requested any other tool calls → route to tool_node
+    - Otherwise → conversation turn is complete, go to END
+
+    The conversation title is generated in the background after the turn
+    (see title_generation), so it does not delay the response.
     """
     last_message = state["messages"][-1]
     llm_calls = state.get("llm_calls", 0)
-    current_title = state.get("conversation_title")
 
     # LLM requested one or more tool executions
+    if any(call["name"] == PLAN_TOOL_NAME for call in last_message.tool_calls):
+        logger.debug("LLM submitted a plan → routing to 'plan_executor'")
+        return "plan_executor"
+
     if last_message.tool_calls:
         logger.debug(
             "LLM requested %s tool call(s) → routing to 'tool_node'",
@@ -281,14 +354,7 @@ def should_continue(
         )
         return "tool_node"
 
-    # First full interaction completed and title not yet generated
-    if current_title in [None, "GNS3 Session"]:
-        logger.info(
-            "First turn finished, no title yet → routing to 'title_generator_node'"
-        )
-        return "title_generator_node"
-
-    # Normal completion (multi-turn conversation or title already exists)
+    # Normal completion
     logger.debug(
         "Conversation turn complete (llm_calls= %s ) → routing to END", llm_calls
     )
@@ -296,7 +362,9 @@ def should_continue(
 
 
 # Routing logic after the tool node, Check remaining_steps
-def recursion_limit_continue(state: MessagesState) -> Literal["llm_call", END]:
+def recursion_limit_continue(
+    state: MessagesState,
+) -> Literal["llm_call", "compact_context", END]:
     """
     Routing logic after tool execution to prevent infinite recursion.
 
@@ -307,17 +375,19 @@ def recursion_limit_continue(state: MessagesState) -> Literal["llm_call", END]:
         state: Current conversation state with messages and remaining steps
 
     Returns:
-        "llm_call" to continue processing, END to terminate conversation
+        "llm_call" to continue processing, "compact_context" to compact the
+        history before the next LLM call, END to terminate conversation
 
     Logic:
-        - If the last message is ToolMessage and steps >= 4: continue to LLM
+        - If the last message is ToolMessage and steps >= 4: continue to LLM,
+          compacting first when the history exceeds the token budget
         - Otherwise: end the conversation to prevent infinite loops
     """
     last_message = state["messages"][-1]
     if isinstance(last_message, ToolMessage):
         if state["remaining_steps"] < 4:
             return END
-        return "llm_call"
+        return route_to_llm(state)
 
     return END
 
@@ -329,18 +399,28 @@ agent_builder = StateGraph(MessagesState)
 # Add nodes
 agent_builder.add_node("llm_call", llm_call)
 agent_builder.add_node("tool_node", tool_node)
-agent_builder.add_node("title_generator_node", generate_title)
+agent_builder.add_node("plan_executor", plan_executor)
+agent_builder.add_node("compact_context", compact_context)
 
 # Add edges to connect nodes
-agent_builder.add_edge(START, "llm_call")
+# Compact the history first when it exceeds the token budget
+agent_builder.add_conditional_edges(
+    START,
+    route_to_llm,
+    {
+        "compact_context": "compact_context",  # Fold older turns into the summary
+        "llm_call": "llm_call",  # History fits into the budget
+    },
+)
+agent_builder.add_edge("compact_context", "llm_call")
 # Conditional routing after LLM response
-# Determines the next step based on whether LLM needs to call tools or generate title
+# Determines the next step based on whether LLM needs to call tools
 agent_builder.add_conditional_edges(
     "llm_call",
     should_continue,
     {
         "tool_node": "tool_node",  # Route to tool execution if LLM requested tools
-        "title_generator_node": "title_generator_node",  # Generate title on first interaction
+        "plan_executor": "plan_executor",  # Run a submitted plan without LLM round trips
         END: END,  # End conversation if no tools needed
     },
 )
@@ -351,28 +431,20 @@ agent_builder.add_conditional_edges(
     recursion_limit_continue,
     {
         "llm_call": "llm_call",  # Continue to LLM if tools executed and steps remain
+        "compact_context": "compact_context",  # Compact oversized history first
         END: END,  # End conversation to prevent infinite loops
     },
 )
-
-agent_builder.add_edge("title_generator_node", END)
-
-# Add checkpointing
-LANGGRAPH_DB_PATH = "gns3_langgraph.db"
-
-
-@st.cache_resource(show_spinner="Initializing conversation persistence...")
-def get_checkpointer() -> SqliteSaver:
-    """
-    Create and cache a single SqliteSaver instance for the entire app lifetime.
-
-    Important notes:
-    - `check_same_thread=False` is required because Streamlit runs in a multi-threaded environment.
-    - The returned checkpointer is automatically shared across all user sessions.
-    """
-    conn = sqlite3.connect(LANGGRAPH_DB_PATH, check_same_thread=False)
-    # SqliteSaver will create the necessary tables on first use
-    return SqliteSaver(conn)
+# The LLM is only called again once the whole plan has finished or failed
+agent_builder.add_conditional_edges(
+    "plan_executor",
+    recursion_limit_continue,
+    {
+        "llm_call": "llm_call",
+        "compact_context": "compact_context",
+        END: END,
+    },
+)
 
 
 # Compile the agent
@@ -390,7 +462,5 @@ def get_agent():
     )
 
 
-langgraph_checkpointer = get_checkpointer()  # Cached SqliteSaver instance
-
 # Streamlit UI use
 agent = get_agent()  # Cached compiled LangGraph agent (with persistence)
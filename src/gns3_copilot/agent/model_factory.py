@@ -4,18 +4,27 @@ Model Factory for GNS3 Copilot Agent
 This module provides factory functions to create fresh LLM model instances
 on-demand from SQLite configuration. This allows configuration changes
 to take effect without restarting the application.
+
+LangChain's chat model support is imported when the first model is created,
+so modules that only reference these factories (e.g. the notes editor) load
+quickly.
 """
 
 from typing import Any
 
-from langchain.chat_models import init_chat_model
-
 from gns3_copilot.log_config import setup_logger
 from gns3_copilot.utils import get_config
 
 logger = setup_logger("model_factory")
 
 
+def _init_chat_model(*args: Any, **kwargs: Any) -> Any:
+    """Call langchain's init_chat_model, importing it on first use."""
+    from langchain.chat_models import init_chat_model
+
+    return init_chat_model(*args, **kwargs)
+
+
 def _load_env_variables() -> dict[str, str]:
     """
     Load model configuration from SQLite database.
@@ -65,7 +74,7 @@ def create_base_model() -> Any:
         raise ValueError("MODE_PROVIDER environment variable is required")
 
     try:
-        model = init_chat_model(
+        model = _init_chat_model(
             env_vars["model_name"],
             model_provider=env_vars["model_provider"],
             api_key=env_vars["api_key"],
@@ -115,7 +124,7 @@ def create_title_model() -> Any:
         raise ValueError("MODE_PROVIDER environment variable is required")
 
     try:
-        model = init_chat_model(
+        model = _init_chat_model(
             env_vars["model_name"],
             model_provider=env_vars["model_provider"],
             api_key=env_vars["api_key"],
@@ -133,6 +142,56 @@ def create_title_model() -> Any:
         raise RuntimeError(f"Failed to create title model: {e}") from e
 
 
+def create_summary_model() -> Any:
+    """
+    Create a fresh model instance for conversation compaction.
+
+    This creates a model instance suitable for folding older conversation turns
+    into a running summary. It uses the same configuration as the base model
+    but with temperature 0 so that summaries stay factual and deterministic.
+
+    Returns:
+        Any: A new LLM model instance for summarization.
+              The actual type depends on the provider.
+
+    Raises:
+        ValueError: If required environment variables are missing or invalid.
+    """
+    env_vars = _load_env_variables()
+
+    logger.info(
+        "Creating summary model: name=%s, provider=%s, base_url=%s, temperature=0",
+        env_vars["model_name"],
+        env_vars["model_provider"],
+        env_vars["base_url"] if env_vars["base_url"] else "default",
+    )
+
+    # Validate required fields
+    if not env_vars["model_name"]:
+        raise ValueError("MODEL_NAME environment variable is required")
+
+    if not env_vars["model_provider"]:
+        raise ValueError("MODE_PROVIDER environment variable is required")
+
+    try:
+        model = _init_chat_model(
+            env_vars["model_name"],
+            model_provider=env_vars["model_provider"],
+            api_key=env_vars["api_key"],
+            base_url=env_vars["base_url"],
+            temperature="0",  # Deterministic output for factual summaries
+            configurable_fields="any",
+            config_prefix="foo",
+        )
+
+        logger.info("Summary model created successfully")
+        return model
+
+    except Exception as e:
+        logger.error("Failed to create summary model: %s", e)
+        raise RuntimeError(f"Failed to create summary model: {e}") from e
+
+
 def create_model_with_tools(
     model: Any,
     tools: list[Any],
@@ -191,7 +250,7 @@ def create_note_organizer_model() -> Any:
         raise ValueError("MODE_PROVIDER environment variable is required")
 
     try:
-        model = init_chat_model(
+        model = _init_chat_model(
             env_vars["model_name"],
             model_provider=env_vars["model_provider"],
             api_key=env_vars["api_key"],
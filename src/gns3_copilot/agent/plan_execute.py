@@ -0,0 +1,442 @@
+"""
+GNS3 Copilot Plan-and-Execute Mode
+
+In the default ReAct loop every tool round costs a full LLM call that re-sends
+the whole context. In plan-and-execute mode the model submits a complete,
+ordered plan of tool invocations once through the `execute_plan` tool, and the
+`plan_executor` node runs it without consulting the LLM between steps:
+
+- Steps are grouped into waves by their dependencies
+- Steps of the same wave run concurrently on a thread pool
+- Later steps can reference earlier results with `${step_id.path}`
+- Execution stops at the first failed wave, and the LLM is called again only
+  with the results (on failure or at the end)
+"""
+
+import json
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from langchain.tools import BaseTool
+from langchain_core.callbacks import CallbackManagerForToolRun
+from pydantic import Field
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils import apply_output_budget, get_config, render_tool_output
+
+logger = setup_logger("plan_execute")
+
+# Name of the tool the model calls to submit a plan
+PLAN_TOOL_NAME = "execute_plan"
+
+# Fallback worker count when PLANNER_MAX_WORKERS is not a valid number
+DEFAULT_MAX_WORKERS = 4
+
+# Reference to an earlier step result, e.g. ${s1.nodes.0.node_id}
+REFERENCE_PATTERN = re.compile(r"\$\{([A-Za-z0-9_\-]+)((?:\.[^.}]+)*)\}")
+
+
+def is_planner_enabled() -> bool:
+    """
+    Check whether plan-and-execute mode is enabled in configuration.
+
+    Returns:
+        bool: True if PLANNER_MODE is set to a truthy value.
+    """
+    return get_config("PLANNER_MODE", "False").lower().strip() in (
+        "true",
+        "1",
+        "yes",
+        "on",
+    )
+
+
+def get_max_workers() -> int:
+    """
+    Get the maximum number of concurrently executed plan steps.
+
+    Returns:
+        int: Worker count from PLANNER_MAX_WORKERS, at least 1.
+    """
+    try:
+        return max(1, int(get_config("PLANNER_MAX_WORKERS")))
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_WORKERS
+
+
+def find_references(value: Any) -> set[str]:
+    """
+    Find the step IDs referenced in a (nested) argument value.
+
+    Args:
+        value: Step arguments (str, dict, list or primitive).
+
+    Returns:
+        set: Referenced step IDs.
+    """
+    if isinstance(value, str):
+        return {match.group(1) for match in REFERENCE_PATTERN.finditer(value)}
+    if isinstance(value, dict):
+        return set().union(*(find_references(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(find_references(v) for v in value))
+    return set()
+
+
+def _lookup(result: Any, path: str) -> Any:
+    """
+    Follow a dot-separated path of keys and list indexes into a step result.
+
+    Results that are strings holding JSON or Python literals are parsed first.
+
+    Raises:
+        KeyError: If the path does not exist in the result.
+    """
+    from gns3_copilot.utils import parse_tool_content
+
+    value = result
+    for key in [part for part in path.split(".") if part]:
+        if isinstance(value, str):
+            value = parse_tool_content(value)
+        if isinstance(value, list) and key.lstrip("-").isdigit():
+            try:
+                value = value[int(key)]
+            except IndexError as e:
+                raise KeyError(f"index {key} out of range") from e
+        elif isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            raise KeyError(f"'{key}' not found")
+    return value
+
+
+def resolve_references(value: Any, results: dict[str, Any]) -> Any:
+    """
+    Replace `${step_id.path}` references with values from earlier results.
+
+    A string that consists of a single reference is replaced by the raw value.
+    A string holding a JSON object or array (such as a `tool_input`) is parsed,
+    resolved and serialized again, so substituted values are always encoded
+    correctly. References embedded in other strings are replaced by their
+    string or JSON representation.
+
+    Args:
+        value: Step arguments (str, dict, list or primitive).
+        results: Results of completed steps keyed by step ID.
+
+    Returns:
+        Any: Arguments with all references resolved.
+
+    Raises:
+        KeyError: If a reference cannot be resolved.
+    """
+    if isinstance(value, dict):
+        return {k: resolve_references(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(v, results) for v in value]
+    if not isinstance(value, str):
+        return value
+
+    def _resolve(match: re.Match) -> Any:
+        step_id, path = match.group(1), match.group(2)
+        if step_id not in results:
+            raise KeyError(f"Step '{step_id}' has no result")
+        try:
+            return _lookup(results[step_id], path)
+        except KeyError as e:
+            raise KeyError(f"Cannot resolve ${{{step_id}{path}}}: {e}") from e
+
+    full_match = REFERENCE_PATTERN.fullmatch(value)
+    if full_match:
+        return _resolve(full_match)
+    if not REFERENCE_PATTERN.search(value):
+        return value
+
+    # Quotes or newlines in command output must not break a JSON tool_input
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, (dict, list)):
+        return json.dumps(resolve_references(parsed, results))
+
+    def _substitute(match: re.Match) -> str:
+        resolved = _resolve(match)
+        return resolved if isinstance(resolved, str) else json.dumps(resolved)
+
+    return REFERENCE_PATTERN.sub(_substitute, value)
+
+
+def parse_plan(plan_input: Any, known_tools: set[str]) -> list[dict[str, Any]]:
+    """
+    Parse and validate a plan submitted by the model.
+
+    Args:
+        plan_input: JSON string or dict with a `steps` array.
+        known_tools: Names of the tools a step may call.
+
+    Returns:
+        list: Normalized steps with id, tool, args and depends_on
+              (explicit dependencies plus referenced steps).
+
+    Raises:
+        ValueError: If the plan is malformed, references unknown tools or
+                    steps, or contains a dependency cycle.
+    """
+    data = json.loads(plan_input) if isinstance(plan_input, str) else plan_input
+    if not isinstance(data, dict) or not isinstance(data.get("steps"), list):
+        raise ValueError("Plan must be a JSON object with a 'steps' array")
+    if not data["steps"]:
+        raise ValueError("Plan contains no steps")
+
+    steps: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for index, raw_step in enumerate(data["steps"]):
+        if not isinstance(raw_step, dict):
+            raise ValueError(f"Step {index} must be an object")
+        step_id = str(raw_step.get("id") or f"s{index + 1}")
+        if step_id in seen:
+            raise ValueError(f"Duplicate step id: {step_id}")
+        seen.add(step_id)
+
+        tool_name = raw_step.get("tool")
+        if tool_name not in known_tools:
+            raise ValueError(f"Step {step_id}: unknown tool '{tool_name}'")
+
+        args = raw_step.get("args", {})
+        if not isinstance(args, dict):
+            raise ValueError(f"Step {step_id}: args must be an object")
+
+        depends_on = raw_step.get("depends_on") or []
+        if not isinstance(depends_on, list):
+            raise ValueError(f"Step {step_id}: depends_on must be a list")
+
+        steps.append(
+            {
+                "id": step_id,
+                "tool": tool_name,
+                "args": args,
+                "depends_on": sorted(
+                    {str(dep) for dep in depends_on} | find_references(args)
+                ),
+            }
+        )
+
+    for step in steps:
+        unknown = [dep for dep in step["depends_on"] if dep not in seen]
+        if unknown:
+            raise ValueError(f"Step {step['id']}: unknown dependency {unknown[0]}")
+        if step["id"] in step["depends_on"]:
+            raise ValueError(f"Step {step['id']} depends on itself")
+
+    # Validates that the dependency graph is acyclic
+    plan_waves(steps)
+    return steps
+
+
+def plan_waves(steps: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """
+    Group steps into waves that can run concurrently.
+
+    Every step is placed in the first wave after all of its dependencies.
+    Steps keep their submitted order within a wave.
+
+    Args:
+        steps: Normalized plan steps.
+
+    Returns:
+        list: Waves of steps in execution order.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle.
+    """
+    done: set[str] = set()
+    remaining = list(steps)
+    waves = []
+    while remaining:
+        wave = [s for s in remaining if all(d in done for d in s["depends_on"])]
+        if not wave:
+            cycle = ", ".join(s["id"] for s in remaining)
+            raise ValueError(f"Dependency cycle between steps: {cycle}")
+        waves.append(wave)
+        done.update(s["id"] for s in wave)
+        remaining = [s for s in remaining if s["id"] not in done]
+    return waves
+
+
+def is_failed_result(result: Any) -> bool:
+    """
+    Check whether a tool result reports a failure.
+
+    Tools in this project report failures as a dict with an "error" key or
+    "status": "failed". Multi-device and link tools return a list of such
+    dicts; the list fails if any device failed.
+
+    Args:
+        result: Tool result.
+
+    Returns:
+        bool: True if the result is an error.
+    """
+    if isinstance(result, list):
+        return any(is_failed_result(item) for item in result)
+    return isinstance(result, dict) and (
+        "error" in result or result.get("status") == "failed"
+    )
+
+
+def _run_step(
+    step: dict[str, Any], tools_by_name: dict[str, Any], results: dict[str, Any]
+) -> Any:
+    """Resolve references and invoke the tool of one step."""
+    try:
+        args = resolve_references(step["args"], results)
+    except KeyError as e:
+        return {"error": str(e).strip("\"'")}
+
+    try:
+        return tools_by_name[step["tool"]].invoke(args)
+    except Exception as e:
+        logger.error("Plan step %s (%s) raised: %s", step["id"], step["tool"], e)
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def run_plan(
+    steps: list[dict[str, Any]],
+    tools_by_name: dict[str, Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    thread_id: str | None = None,
+    on_step_done: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Execute a validated plan wave by wave.
+
+    Args:
+        steps: Normalized plan steps from parse_plan().
+        tools_by_name: Tool instances keyed by tool name.
+        max_workers: Maximum number of concurrently executed steps.
+        thread_id: Conversation thread ID used for oversized result artifacts.
+        on_step_done: Optional callback receiving each step report.
+
+    Returns:
+        dict: Execution report with status ("completed" or "failed"),
+              failed_step (if any) and per-step results in plan order.
+              Skipped steps are reported with status "skipped".
+    """
+    results: dict[str, Any] = {}
+    reports: dict[str, dict[str, Any]] = {}
+    failed_step = None
+
+    for wave in plan_waves(steps):
+        workers = min(max_workers, len(wave))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (step, pool.submit(_run_step, step, tools_by_name, results))
+                for step in wave
+            ]
+            wave_results = [(step, future.result()) for step, future in futures]
+
+        for step, result in wave_results:
+            results[step["id"]] = result
+            failed = is_failed_result(result)
+            report = {
+                "id": step["id"],
+                "tool": step["tool"],
+                "status": "failed" if failed else "success",
+                "result": apply_output_budget(
+                    render_tool_output(result), step["tool"], thread_id
+                ),
+            }
+            reports[step["id"]] = report
+            if failed and failed_step is None:
+                failed_step = step["id"]
+            if on_step_done is not None:
+                on_step_done(report)
+
+        if failed_step is not None:
+            break
+
+    step_reports = [
+        reports.get(s["id"], {"id": s["id"], "tool": s["tool"], "status": "skipped"})
+        for s in steps
+    ]
+    logger.info(
+        "Plan finished: %d steps, %d executed, failed_step=%s",
+        len(steps),
+        len(reports),
+        failed_step,
+    )
+    return {
+        "status": "failed" if failed_step else "completed",
+        "failed_step": failed_step,
+        "steps": step_reports,
+    }
+
+
+def execute_plan_call(
+    plan_args: dict[str, Any],
+    tools_by_name: dict[str, Any],
+    thread_id: str | None = None,
+) -> dict[str, Any]:
+    """
+    Parse and run the arguments of an `execute_plan` tool call.
+
+    Args:
+        plan_args: Arguments of the tool call ({"tool_input": "<plan JSON>"}).
+        tools_by_name: Tool instances keyed by tool name.
+        thread_id: Conversation thread ID used for oversized result artifacts.
+
+    Returns:
+        dict: Execution report, or a dict with an "error" key if the plan is
+              invalid.
+    """
+    plan_input = plan_args.get("tool_input", plan_args)
+    try:
+        steps = parse_plan(plan_input, set(tools_by_name))
+    except (ValueError, TypeError) as e:
+        logger.error("Invalid plan: %s", e)
+        return {"error": f"Invalid plan: {e}"}
+
+    logger.info("Executing plan with %d steps", len(steps))
+    return run_plan(steps, tools_by_name, get_max_workers(), thread_id)
+
+
+class ExecutePlanTool(BaseTool):
+    """
+    A LangChain tool the model calls to submit a complete multi-step plan.
+
+    The agent graph routes calls of this tool to the `plan_executor` node;
+    running the tool directly executes the plan the same way.
+
+    **Input:**
+    A JSON object with a `steps` array:
+        {
+            "steps": [
+                {"id": "s1", "tool": "create_gns3_node", "args": {"tool_input": "..."}},
+                {"id": "s2", "tool": "start_gns3_node",
+                 "args": {"tool_input": "{\\"node_ids\\": [\\"${s1.nodes.0.node_id}\\"]}"}}
+            ]
+        }
+
+    **Output:**
+    An execution report with the status and per-step results.
+    """
+
+    name: str = PLAN_TOOL_NAME
+    description: str = """
+    Executes a complete, ordered plan of tool calls in one go.
+    Input: JSON with a `steps` array; each step has `id`, `tool`, `args` and an
+    optional `depends_on` list. Use ${step_id.path} inside args to reference a value
+    from an earlier step's result (e.g. ${s1.nodes.0.node_id}).
+    Independent steps run concurrently. Execution stops at the first failed step.
+    Returns: {"status": "completed"|"failed", "failed_step": ..., "steps": [...]}
+    """
+
+    tools_by_name: dict[str, Any] = Field(default_factory=dict, exclude=True)
+
+    def _run(
+        self, tool_input: str, run_manager: CallbackManagerForToolRun | None = None
+    ) -> dict[str, Any]:
+        return execute_plan_call({"tool_input": tool_input}, self.tools_by_name)
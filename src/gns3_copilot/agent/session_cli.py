@@ -0,0 +1,270 @@
+"""
+GNS3 Copilot Sessions Command
+
+`gns3-copilot sessions` works on the checkpoint database directly: it opens a
+PooledSqliteSaver and never imports Streamlit, the tools, the chat model
+providers or the compiled graph, so it starts in a fraction of a second.
+
+Commands:
+    list      Sessions from the session index, most recent first
+    inspect   Message statistics and state of one session
+    export    Write sessions to an NDJSON archive (see checkpoint_archive.py)
+    import    Read sessions from an archive or a legacy export file
+    prune     Run one checkpoint retention pass
+    search    Full-text search over all sessions
+
+Examples:
+    gns3-copilot sessions list --limit 20
+    gns3-copilot sessions inspect <thread-id> --verbose
+    gns3-copilot sessions export backup.ndjson.gz --since 2026-01-01
+    gns3-copilot sessions import backup.ndjson.gz
+    gns3-copilot sessions prune --keep-latest 20
+    gns3-copilot sessions prune --vacuum   (once for databases of older versions)
+    gns3-copilot sessions search "ospf neighbor"
+"""
+
+import argparse
+import json
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Any
+
+from gns3_copilot.agent.checkpoint_archive import (
+    DEFAULT_DB_PATH,
+    ThreadFilter,
+    export_archive,
+    import_archive,
+)
+from gns3_copilot.agent.checkpoint_retention import (
+    load_retention_policy,
+    run_retention,
+)
+from gns3_copilot.agent.checkpoint_serde import create_checkpoint_serializer
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.checkpoint_utils import inspect_checkpoint
+from gns3_copilot.agent.session_index import count_sessions, list_sessions
+from gns3_copilot.agent.session_search import search_sessions
+from gns3_copilot.utils import init_config
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def _parse_since(value: str) -> float:
+    """Parse an ISO date or datetime into a Unix timestamp."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {value}") from None
+
+
+def _print_json(data: Any) -> None:
+    print(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+
+
+def _cmd_list(checkpointer: Any, args: argparse.Namespace) -> int:
+    sessions = list_sessions(checkpointer, limit=args.limit, offset=args.offset)
+    if args.json:
+        _print_json([asdict(entry) for entry in sessions])
+        return 0
+
+    total = count_sessions(checkpointer)
+    for entry in sessions:
+        print(
+            f"{entry.thread_id}  {_format_time(entry.updated_at)}  "
+            f"{entry.message_count:>4} msgs  {entry.title or '(untitled)'}"
+            + (f"  [{entry.project_name}]" if entry.project_name else "")
+        )
+    print(f"{len(sessions)} of {total} sessions")
+    return 0
+
+
+def _cmd_inspect(checkpointer: Any, args: argparse.Namespace) -> int:
+    info = inspect_checkpoint(checkpointer, args.thread_id, verbose=args.verbose)
+    if args.json:
+        _print_json(info)
+        return 0 if "error" not in info else 1
+    if "error" in info:
+        print(f"Error: {info['error']}")
+        return 1
+
+    types = info["message_types"]
+    print(f"Thread ID:      {info['thread_id']}")
+    print(f"Title:          {info['conversation_title'] or '(untitled)'}")
+    print(f"Project:        {info['selected_project']}")
+    print(
+        f"Messages:       {info['message_count']} (human {types['human']}, "
+        f"ai {types['ai']}, tool {types['tool']}, unknown {types['unknown']})"
+    )
+    print(f"Step:           {info['step']}")
+    print(f"Pending tasks:  {info['pending_tasks']}")
+    print(f"UI compatible:  {info['ui_compatible']}")
+    if not info["ui_compatible"]:
+        print(f"Validation:     {info['validation_error']}")
+    if info["latest_message"]:
+        print(f"Latest message: {info['latest_message'][:100]}")
+    for preview in info.get("messages_preview", []):
+        print(f"  [{preview['index']}] {preview['type']}: {preview.get('content', '')}")
+    return 0
+
+
+def _cmd_export(checkpointer: Any, args: argparse.Namespace) -> int:
+    count = export_archive(
+        checkpointer, args.file, ThreadFilter(args.thread_ids, args.since, args.title)
+    )
+    print(f"Exported {count} sessions to {args.file}")
+    return 0
+
+
+def _cmd_import(checkpointer: Any, args: argparse.Namespace) -> int:
+    thread_ids = import_archive(checkpointer, args.file, args.keep_ids)
+    print(f"Imported {len(thread_ids)} sessions from {args.file}")
+    return 0
+
+
+def _cmd_prune(checkpointer: Any, args: argparse.Namespace) -> int:
+    policy = load_retention_policy()
+    overrides = {
+        key: value
+        for key, value in (
+            ("keep_latest", args.keep_latest),
+            ("writes_max_age_days", args.writes_max_age_days),
+            ("archive_idle_days", args.archive_idle_days),
+        )
+        if value is not None
+    }
+    report = run_retention(
+        checkpointer,
+        replace(policy, **overrides),
+        args.db,
+        convert_vacuum=args.vacuum,
+    )
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    return 0
+
+
+def _cmd_search(checkpointer: Any, args: argparse.Namespace) -> int:
+    hits = search_sessions(checkpointer, args.query, limit=args.limit)
+    if args.json:
+        _print_json([asdict(hit) for hit in hits])
+        return 0
+    for hit in hits:
+        print(f"{hit.thread_id}  {hit.title or '(untitled)'}")
+        print(f"    {hit.snippet}")
+    print(f"{len(hits)} matching sessions")
+    return 0
+
+
+def build_parser(prog: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the sessions command.
+
+    Args:
+        prog: Program name shown in usage messages.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="List, inspect, export, import, prune and search sessions",
+    )
+    parser.add_argument(
+        "--db",
+        default=DEFAULT_DB_PATH,
+        help=f"Checkpoint database (default: {DEFAULT_DB_PATH})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List sessions")
+    list_parser.add_argument("--limit", type=int, default=50)
+    list_parser.add_argument("--offset", type=int, default=0)
+    list_parser.add_argument("--json", action="store_true", help="Print JSON")
+    list_parser.set_defaults(handler=_cmd_list)
+
+    inspect_parser = commands.add_parser("inspect", help="Inspect a session")
+    inspect_parser.add_argument("thread_id")
+    inspect_parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Show message previews"
+    )
+    inspect_parser.add_argument("--json", action="store_true", help="Print JSON")
+    inspect_parser.set_defaults(handler=_cmd_inspect)
+
+    export_parser = commands.add_parser("export", help="Export sessions")
+    export_parser.add_argument("file", help="Archive path (.gz to compress)")
+    export_parser.add_argument(
+        "--thread",
+        action="append",
+        default=[],
+        dest="thread_ids",
+        help="Thread ID to export (repeatable)",
+    )
+    export_parser.add_argument(
+        "--since", type=_parse_since, help="Only sessions updated since this date"
+    )
+    export_parser.add_argument(
+        "--title", help="Only sessions whose title contains this"
+    )
+    export_parser.set_defaults(handler=_cmd_export)
+
+    import_parser = commands.add_parser("import", help="Import sessions")
+    import_parser.add_argument("file", help="Archive or legacy export file")
+    import_parser.add_argument(
+        "--keep-ids",
+        action="store_true",
+        help="Keep archived thread IDs instead of assigning new ones",
+    )
+    import_parser.set_defaults(handler=_cmd_import)
+
+    prune_parser = commands.add_parser(
+        "prune", help="Run checkpoint retention (defaults from configuration)"
+    )
+    prune_parser.add_argument("--keep-latest", type=int)
+    prune_parser.add_argument("--writes-max-age-days", type=float)
+    prune_parser.add_argument("--archive-idle-days", type=float)
+    prune_parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Convert an older database to incremental vacuum (full VACUUM; "
+        "stop the app first)",
+    )
+    prune_parser.set_defaults(handler=_cmd_prune)
+
+    search_parser = commands.add_parser("search", help="Search session messages")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--json", action="store_true", help="Print JSON")
+    search_parser.set_defaults(handler=_cmd_search)
+
+    return parser
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+    """
+    Run the sessions command.
+
+    Args:
+        argv: Arguments, defaults to sys.argv[1:].
+        prog: Program name shown in usage messages.
+
+    Returns:
+        int: Exit code.
+    """
+    args = build_parser(prog).parse_args(argv)
+    # Compression and retention settings are read from the configuration
+    init_config()
+
+    checkpointer = PooledSqliteSaver(args.db, serde=create_checkpoint_serializer())
+    try:
+        return int(args.handler(checkpointer, args))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        checkpointer.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,261 @@
+"""
+GNS3 Copilot Session Index
+
+The sidebar lists every conversation with its title. Reading the title from
+the checkpoints means loading and deserializing the latest checkpoint of every
+thread, messages included, on each Streamlit rerun.
+
+This module keeps a small `session_index` table next to the checkpoint tables
+with one row per thread (title, created/updated time, message count and
+project). PooledSqliteSaver updates the row in the same transaction as every
+root checkpoint it stores and removes it when a thread is deleted, so listing
+sessions is a single indexed query.
+
+Functions:
+    ensure_session_index(conn): Create the table and its index
+    upsert_session(cur, thread_id, checkpoint): Update a thread's row
+    list_sessions(checkpointer, limit, offset): Page through sessions
+    get_session(checkpointer, thread_id): Index row of one thread
+    count_sessions(checkpointer): Number of indexed sessions
+    backfill_session_index(checkpointer): Index threads stored before the table
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from gns3_copilot.agent.checkpoint_retention import checkpoint_id_timestamp
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("session_index")
+
+SESSION_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_index (
+    thread_id TEXT PRIMARY KEY,
+    title TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    project_name TEXT,
+    project_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_session_index_updated
+    ON session_index (updated_at DESC);
+"""
+
+# Columns not present in a checkpoint (e.g. the input checkpoint of a run) keep
+# their previous value
+UPSERT_SQL = """
+INSERT INTO session_index (
+    thread_id, title, created_at, updated_at, message_count, project_name, project_id
+) VALUES (?, ?, ?, ?, COALESCE(?, 0), ?, ?)
+ON CONFLICT(thread_id) DO UPDATE SET
+    title = COALESCE(excluded.title, session_index.title),
+    updated_at = MAX(excluded.updated_at, session_index.updated_at),
+    message_count = COALESCE(?, session_index.message_count),
+    project_name = COALESCE(excluded.project_name, session_index.project_name),
+    project_id = COALESCE(excluded.project_id, session_index.project_id)
+"""
+
+
+@dataclass
+class SessionEntry:
+    """
+    One row of the session index.
+
+    Attributes:
+        thread_id: Conversation thread ID
+        title: Conversation title, None until one is generated
+        created_at: Unix timestamp of the first checkpoint
+        updated_at: Unix timestamp of the latest checkpoint
+        message_count: Number of messages in the latest checkpoint
+        project_name: Name of the selected GNS3 project
+        project_id: ID of the selected GNS3 project
+    """
+
+    thread_id: str
+    title: str | None
+    created_at: float
+    updated_at: float
+    message_count: int
+    project_name: str | None
+    project_id: str | None
+
+
+def ensure_session_index(conn: sqlite3.Connection) -> None:
+    """
+    Create the session index table and its index if they do not exist.
+
+    Args:
+        conn: Writable connection to the checkpoint database.
+    """
+    conn.executescript(SESSION_INDEX_SCHEMA)
+
+
+def _checkpoint_time(checkpoint: dict[str, Any]) -> float:
+    """Unix timestamp of a checkpoint, from its ISO `ts` field."""
+    try:
+        return datetime.fromisoformat(checkpoint["ts"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return time.time()
+
+
+def upsert_session(
+    cur: sqlite3.Cursor, thread_id: str, checkpoint: dict[str, Any]
+) -> None:
+    """
+    Update the index row of a thread from one of its root checkpoints.
+
+    Args:
+        cur: Cursor on the writer connection; the caller commits.
+        thread_id: Thread the checkpoint belongs to.
+        checkpoint: Checkpoint being stored.
+    """
+    values = checkpoint.get("channel_values") or {}
+    messages = values.get("messages")
+    message_count = len(messages) if isinstance(messages, list) else None
+    project = values.get("selected_project")
+    project_name = project_id = None
+    if isinstance(project, (list, tuple)) and len(project) >= 2:
+        project_name, project_id = str(project[0]), str(project[1])
+    timestamp = _checkpoint_time(checkpoint)
+
+    cur.execute(
+        UPSERT_SQL,
+        (
+            thread_id,
+            values.get("conversation_title") or None,
+            timestamp,
+            timestamp,
+            message_count,
+            project_name,
+            project_id,
+            message_count,
+        ),
+    )
+
+
+def delete_session(cur: sqlite3.Cursor, thread_id: str) -> None:
+    """
+    Remove the index row of a thread.
+
+    Args:
+        cur: Cursor on the writer connection; the caller commits.
+        thread_id: Thread to remove.
+    """
+    cur.execute("DELETE FROM session_index WHERE thread_id = ?", (thread_id,))
+
+
+def list_sessions(
+    checkpointer: Any, limit: int = 50, offset: int = 0
+) -> list[SessionEntry]:
+    """
+    Get one page of sessions, most recently updated first.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+        limit: Maximum number of sessions to return.
+        offset: Number of sessions to skip.
+
+    Returns:
+        list: SessionEntry objects; empty on error.
+    """
+    try:
+        with checkpointer.cursor(transaction=False) as cur:
+            rows = cur.execute(
+                "SELECT thread_id, title, created_at, updated_at, message_count, "
+                "project_name, project_id FROM session_index "
+                "ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [SessionEntry(*row) for row in rows]
+    except Exception as e:
+        logger.debug("Error listing sessions (table may not exist): %s", e)
+        return []
+
+
+def get_session(checkpointer: Any, thread_id: str) -> SessionEntry | None:
+    """
+    Get the index row of one thread.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+        thread_id: Thread ID.
+
+    Returns:
+        SessionEntry | None: The row, or None if the thread is not indexed.
+    """
+    try:
+        with checkpointer.cursor(transaction=False) as cur:
+            row = cur.execute(
+                "SELECT thread_id, title, created_at, updated_at, message_count, "
+                "project_name, project_id FROM session_index WHERE thread_id = ?",
+                (thread_id,),
+            ).fetchone()
+        return SessionEntry(*row) if row else None
+    except Exception as e:
+        logger.debug("Error reading session %s: %s", thread_id, e)
+        return None
+
+
+def count_sessions(checkpointer: Any) -> int:
+    """
+    Get the number of indexed sessions.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+
+    Returns:
+        int: Number of sessions; 0 on error.
+    """
+    try:
+        with checkpointer.cursor(transaction=False) as cur:
+            return int(cur.execute("SELECT COUNT(*) FROM session_index").fetchone()[0])
+    except Exception as e:
+        logger.debug("Error counting sessions (table may not exist): %s", e)
+        return 0
+
+
+def backfill_session_index(checkpointer: Any) -> int:
+    """
+    Index threads whose checkpoints were stored before the session index existed.
+
+    Loads the latest checkpoint of each missing thread once; threads already in
+    the index are skipped, so this is cheap after the first run.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+
+    Returns:
+        int: Number of threads added to the index.
+    """
+    with checkpointer.cursor(transaction=False) as cur:
+        rows = cur.execute(
+            "SELECT thread_id, MIN(checkpoint_id) FROM checkpoints "
+            "WHERE checkpoint_ns = '' AND thread_id NOT IN "
+            "(SELECT thread_id FROM session_index) GROUP BY thread_id"
+        ).fetchall()
+    if not rows:
+        return 0
+
+    added = 0
+    for thread_id, first_checkpoint_id in rows:
+        latest = checkpointer.get_tuple({"configurable": {"thread_id": thread_id}})
+        if latest is None:
+            continue
+        with checkpointer.cursor() as cur:
+            upsert_session(cur, thread_id, latest.checkpoint)
+            try:
+                cur.execute(
+                    "UPDATE session_index SET created_at = ? WHERE thread_id = ?",
+                    (checkpoint_id_timestamp(first_checkpoint_id), thread_id),
+                )
+            except ValueError:
+                pass
+        added += 1
+    checkpointer.flush()
+
+    logger.info("Session index backfilled with %d threads", added)
+    return added
@@ -0,0 +1,292 @@
+"""
+GNS3 Copilot Session Search
+
+Full-text search across the message history of all sessions, backed by an
+SQLite FTS5 table in the checkpoint database.
+
+The index holds the text of human and AI messages plus the names of the tools
+the AI called. It is built incrementally: PooledSqliteSaver indexes the
+messages of every `messages` channel write as it is stored (imported sessions
+are indexed from their checkpoint), and removes a thread's entries when the
+thread is deleted. Tool outputs are not indexed; they are large and mostly
+device output.
+
+Databases created before the index existed are indexed with
+`backfill_session_search()` (see scripts/backfill_session_search.py), which
+streams the latest checkpoint of one thread at a time.
+
+Functions:
+    ensure_session_search(conn): Create the FTS5 table
+    index_messages(cur, thread_id, messages): Add messages to the index
+    delete_thread_search(cur, thread_id): Remove a thread from the index
+    search_sessions(checkpointer, query): Ranked thread IDs with snippets
+    backfill_session_search(checkpointer): Index existing threads in bulk
+"""
+
+import hashlib
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("session_search")
+
+# session_search_docs maps each indexed message to its FTS row, so repeated
+# writes of a message are indexed once and a thread can be removed by rowid
+SESSION_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS session_search USING fts5(
+    content,
+    tool_names,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS session_search_docs (
+    doc_key TEXT PRIMARY KEY,
+    thread_id TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_session_search_docs_thread
+    ON session_search_docs (thread_id);
+"""
+
+# Threads between backfill progress messages
+BACKFILL_LOG_INTERVAL = 100
+
+# Tokens around the match in result snippets
+SNIPPET_TOKENS = 12
+
+
+@dataclass
+class SearchHit:
+    """
+    One session matching a search query.
+
+    Attributes:
+        thread_id: Conversation thread ID
+        title: Conversation title from the session index, if any
+        snippet: Best matching message excerpt, matches wrapped in **
+        score: BM25 score of the best match (lower is better)
+    """
+
+    thread_id: str
+    title: str | None
+    snippet: str
+    score: float
+
+
+def ensure_session_search(conn: sqlite3.Connection) -> bool:
+    """
+    Create the full-text search tables if they do not exist.
+
+    Args:
+        conn: Writable connection to the checkpoint database.
+
+    Returns:
+        bool: False if this SQLite build has no FTS5 support.
+    """
+    try:
+        conn.executescript(SESSION_SEARCH_SCHEMA)
+        return True
+    except sqlite3.OperationalError as e:
+        logger.warning("Session search disabled, FTS5 is not available: %s", e)
+        return False
+
+
+def _message_text(content: Any) -> str:
+    """Plain text of a message content (string or list of content blocks)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = [
+            block if isinstance(block, str) else block.get("text", "")
+            for block in content
+            if isinstance(block, (str, dict))
+        ]
+        return "\n".join(part for part in parts if part)
+    return ""
+
+
+def _search_document(message: Any) -> tuple[str, str, str, str | None] | None:
+    """
+    Extract the searchable fields of a message.
+
+    Returns:
+        tuple: (role, text, tool names, message ID), or None if the message is
+               not indexed.
+    """
+    if isinstance(message, HumanMessage):
+        return "human", _message_text(message.content), "", message.id
+    if isinstance(message, AIMessage):
+        tool_names = " ".join(call["name"] for call in message.tool_calls)
+        return "ai", _message_text(message.content), tool_names, message.id
+    return None
+
+
+def index_messages(cur: sqlite3.Cursor, thread_id: str, messages: Iterable[Any]) -> int:
+    """
+    Add human and AI messages of a thread to the search index.
+
+    Messages already in the index are skipped. Messages without an ID are
+    identified by a hash of their content.
+
+    Args:
+        cur: Cursor on the writer connection; the caller commits.
+        thread_id: Thread the messages belong to.
+        messages: Messages; other objects are ignored.
+
+    Returns:
+        int: Number of newly indexed messages.
+    """
+    added = 0
+    for message in messages:
+        if not isinstance(message, BaseMessage):
+            continue
+        document = _search_document(message)
+        if document is None:
+            continue
+        role, text, tool_names, message_id = document
+        if not text.strip() and not tool_names:
+            continue
+        key = (
+            message_id
+            or hashlib.sha1(f"{role}\0{text}\0{tool_names}".encode()).hexdigest()
+        )
+
+        cur.execute(
+            "INSERT OR IGNORE INTO session_search_docs (doc_key, thread_id, role) "
+            "VALUES (?, ?, ?)",
+            (f"{thread_id}:{key}", thread_id, role),
+        )
+        if cur.rowcount:
+            cur.execute(
+                "INSERT INTO session_search (rowid, content, tool_names) "
+                "VALUES (?, ?, ?)",
+                (cur.lastrowid, text, tool_names),
+            )
+            added += 1
+    return added
+
+
+def delete_thread_search(cur: sqlite3.Cursor, thread_id: str) -> None:
+    """
+    Remove all indexed messages of a thread.
+
+    Args:
+        cur: Cursor on the writer connection; the caller commits.
+        thread_id: Thread to remove.
+    """
+    cur.execute(
+        "DELETE FROM session_search WHERE rowid IN "
+        "(SELECT rowid FROM session_search_docs WHERE thread_id = ?)",
+        (thread_id,),
+    )
+    cur.execute("DELETE FROM session_search_docs WHERE thread_id = ?", (thread_id,))
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn user input into an FTS5 query.
+
+    Every whitespace-separated term is quoted, so FTS5 operators and
+    punctuation (IP addresses, interface names) are matched literally, and
+    treated as a prefix. All terms must match.
+
+    Args:
+        query: Search box input.
+
+    Returns:
+        str: FTS5 MATCH expression, empty if the input has no terms.
+    """
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms if term.strip('"'))
+
+
+def search_sessions(checkpointer: Any, query: str, limit: int = 20) -> list[SearchHit]:
+    """
+    Find sessions whose messages match a query.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+        query: Search terms.
+        limit: Maximum number of sessions to return.
+
+    Returns:
+        list: SearchHit objects, best match first; empty on error.
+    """
+    match = build_match_query(query)
+    if not match:
+        return []
+    try:
+        with checkpointer.cursor(transaction=False) as cur:
+            rows = cur.execute(
+                f"""
+                WITH matches AS MATERIALIZED (
+                    SELECT rowid,
+                           bm25(session_search) AS score,
+                           snippet(session_search, -1, '**', '**', '…',
+                                   {SNIPPET_TOKENS}) AS snippet
+                    FROM session_search
+                    WHERE session_search MATCH ?
+                )
+                SELECT d.thread_id, s.title, m.snippet, MIN(m.score)
+                FROM matches m
+                JOIN session_search_docs d ON d.rowid = m.rowid
+                LEFT JOIN session_index s ON s.thread_id = d.thread_id
+                GROUP BY d.thread_id
+                ORDER BY MIN(m.score)
+                LIMIT ?
+                """,
+                (match, limit),
+            ).fetchall()
+        return [SearchHit(*row) for row in rows]
+    except Exception as e:
+        logger.debug("Session search failed for %r: %s", query, e)
+        return []
+
+
+def backfill_session_search(checkpointer: Any) -> int:
+    """
+    Index the messages of threads that are not in the search index yet.
+
+    Reads and indexes the latest checkpoint of one thread at a time, so memory
+    use does not grow with the size of the database.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+
+    Returns:
+        int: Number of indexed messages.
+    """
+    with checkpointer.cursor(transaction=False) as cur:
+        thread_ids = [
+            row[0]
+            for row in cur.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints "
+                "WHERE checkpoint_ns = '' AND thread_id NOT IN "
+                "(SELECT thread_id FROM session_search_docs)"
+            )
+        ]
+
+    added = 0
+    for position, thread_id in enumerate(thread_ids, start=1):
+        latest = checkpointer.get_tuple({"configurable": {"thread_id": thread_id}})
+        if latest is None:
+            continue
+        messages = latest.checkpoint.get("channel_values", {}).get("messages", [])
+        with checkpointer.cursor() as cur:
+            added += index_messages(cur, thread_id, messages)
+        if position % BACKFILL_LOG_INTERVAL == 0:
+            logger.info(
+                "Session search backfill: %d/%d threads", position, len(thread_ids)
+            )
+    checkpointer.flush()
+
+    logger.info(
+        "Session search backfilled %d messages from %d threads",
+        added,
+        len(thread_ids),
+    )
+    return added
@@ -0,0 +1,210 @@
+"""
+GNS3 Copilot Background Title Generation
+
+Generating a conversation title is a second LLM call. Running it as a graph
+node kept the UI stream open until the title model answered, so the first
+turn took two LLM round trips. This module generates the title after the turn
+has completed, in a background thread, and writes `conversation_title` into the
+checkpoint when ready.
+
+Title modes (TITLE_MODE config):
+- "llm": Generate the title with the title model, falling back to the local
+  heuristic if the model fails
+- "heuristic": Derive the title locally from the first user message only
+"""
+
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from langchain.messages import AIMessage, HumanMessage, SystemMessage
+
+from gns3_copilot.agent.model_factory import create_title_model
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.prompts import TITLE_PROMPT
+from gns3_copilot.utils import get_config
+
+logger = setup_logger("title_generation")
+
+# Titles that mean "no title generated yet"
+PLACEHOLDER_TITLES = (None, "", "New Session", "GNS3 Session")
+
+# Maximum title length in characters (long enough for Chinese titles)
+MAX_TITLE_LENGTH = 40
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="title")
+_pending: dict[str, Future] = {}
+_lock = threading.Lock()
+
+
+def _message_text(message: Any) -> str:
+    """Extract the plain text of a message (string or Gemini list content)."""
+    content = getattr(message, "content", "")
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return str(content)
+
+
+def clean_title(raw_title: str) -> str:
+    """
+    Normalize a generated title for display in the sidebar.
+
+    Args:
+        raw_title: Title text as produced by the model or heuristic.
+
+    Returns:
+        str: Single-line title without quotes, truncated to MAX_TITLE_LENGTH.
+    """
+    title = " ".join(raw_title.split())
+    title = title.replace('"', "").replace("'", "")
+    if len(title) > MAX_TITLE_LENGTH:
+        title = title[: MAX_TITLE_LENGTH - 2] + "..."
+    return title
+
+
+def heuristic_title(user_text: str) -> str:
+    """
+    Derive a title locally from the first user message.
+
+    Uses the first sentence of the message without trailing punctuation.
+
+    Args:
+        user_text: Text of the first user message.
+
+    Returns:
+        str: The title, "GNS3 Session" if the message is empty.
+    """
+    # Sentence ends are only split at when followed by whitespace, so IP
+    # addresses and interface names such as Gi0/0.10 stay intact
+    first_sentence = re.split(
+        r"[.!?](?:\s|$)|[。！？\n]", user_text.strip(), maxsplit=1
+    )[0]
+    title = clean_title(first_sentence.rstrip(".!? "))
+    return title or "GNS3 Session"
+
+
+def needs_title(values: dict[str, Any]) -> bool:
+    """
+    Check whether a conversation state still needs a title.
+
+    Args:
+        values: Conversation state values.
+
+    Returns:
+        bool: True if no title has been set and the first turn is complete.
+    """
+    messages = values.get("messages") or []
+    return (
+        values.get("conversation_title") in PLACEHOLDER_TITLES
+        and any(isinstance(m, HumanMessage) for m in messages)
+        and isinstance(messages[-1], AIMessage)
+    )
+
+
+def generate_title_text(messages: list[Any]) -> str:
+    """
+    Generate a title for a conversation.
+
+    Args:
+        messages: Conversation messages; the first user message and the final
+                  assistant response are used.
+
+    Returns:
+        str: The generated title. Falls back to the heuristic title if the
+             title model fails or TITLE_MODE is "heuristic".
+    """
+    first_user = next((m for m in messages if isinstance(m, HumanMessage)), None)
+    fallback = heuristic_title(_message_text(first_user)) if first_user else ""
+
+    if get_config("TITLE_MODE", "llm").lower().strip() == "heuristic":
+        return fallback or "GNS3 Session"
+
+    title_prompt_messages = [
+        SystemMessage(content=TITLE_PROMPT),
+        first_user or messages[0],  # User's first message
+        messages[-1],  # Assistant's final response in this turn
+    ]
+    try:
+        # Create fresh title model instance from current configuration
+        title_model = create_title_model()
+        response = title_model.invoke(title_prompt_messages)
+        new_title = clean_title(_message_text(response))
+        logger.debug("Raw title output from model: %s", response.content)
+    except Exception as e:
+        logger.error("Title generation failed, using heuristic title: %s", e)
+        new_title = ""
+
+    return new_title or fallback or "GNS3 Session"
+
+
+def _generate_and_store(agent: Any, config: dict[str, Any]) -> str | None:
+    """Generate the title and write it into the latest checkpoint."""
+    snapshot = agent.get_state(config)
+    if not needs_title(snapshot.values):
+        return None
+
+    title = generate_title_text(snapshot.values["messages"])
+    agent.update_state(config, {"conversation_title": title})
+    logger.info("Generated new title: %s", title)
+    return title
+
+
+def schedule_title_generation(agent: Any, config: dict[str, Any]) -> Future | None:
+    """
+    Generate the conversation title in the background if it is still missing.
+
+    Call this after a turn has finished streaming; it returns immediately.
+
+    Args:
+        agent: Compiled agent graph with a checkpointer.
+        config: Run configuration with the thread_id.
+
+    Returns:
+        Future: Future resolving to the new title (None if no title was
+                needed), or None if a generation is already running.
+    """
+    thread_id = config.get("configurable", {}).get("thread_id")
+    with _lock:
+        if thread_id in _pending and not _pending[thread_id].done():
+            return None
+        future = _executor.submit(_generate_and_store, agent, config)
+        _pending[thread_id] = future
+
+    def _done(finished: Future) -> None:
+        with _lock:
+            if _pending.get(thread_id) is finished:
+                del _pending[thread_id]
+        if finished.exception() is not None:
+            logger.error(
+                "Background title generation failed for thread_id %s: %s",
+                thread_id,
+                finished.exception(),
+            )
+
+    future.add_done_callback(_done)
+    return future
+
+
+def wait_for_title(thread_id: str, timeout: float | None = None) -> None:
+    """
+    Wait for a running title generation of a thread to finish.
+
+    Call this before starting a new turn on the same thread, so the title
+    update does not race with the checkpoints written by the new run.
+
+    Args:
+        thread_id: Conversation thread ID.
+        timeout: Maximum time to wait in seconds.
+    """
+    with _lock:
+        future = _pending.get(thread_id)
+    if future is None:
+        return
+    try:
+        future.result(timeout=timeout)
+    except Exception as e:
+        logger.warning("Title generation not finished for %s: %s", thread_id, e)
@@ -0,0 +1,207 @@
+"""
+GNS3 Copilot Topology Store
+
+llm_call fetches the topology of the selected project on every step. Keeping
+the topology dict in the graph state serializes it into every checkpoint of
+every thread, although it rarely changes between steps.
+
+Topology snapshots are instead stored once in a content-addressed blob table
+in the checkpoint database, keyed by the SHA-256 of their canonical JSON. The
+state only carries a small reference (hash and capture time), which is
+resolved lazily when the topology itself is needed: llm_call falls back to
+the thread's last snapshot when the GNS3 server cannot be reached. Blobs are
+immutable, so resolved snapshots are cached in memory.
+
+Storing a snapshot that was stored recently skips the write; last_seen is
+refreshed at most every TOPOLOGY_TOUCH_INTERVAL_SECONDS, which keeps the
+snapshot well clear of retention pruning. Writes are committed at once, so no
+write transaction is open while the model generates.
+
+Functions:
+    ensure_topology_store(conn): Create the blob table
+    store_topology(checkpointer, topology): Store a snapshot, return its reference
+    load_topology(checkpointer, topology_ref): Resolve a reference
+    prune_topology_blobs(conn, max_age_days): Drop snapshots not seen recently
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, TypedDict
+
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("topology_store")
+
+TOPOLOGY_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS topology_blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+"""
+
+# Resolved snapshots kept in memory
+TOPOLOGY_CACHE_SIZE = 32
+
+# Minimum time between two writes of the same snapshot
+TOPOLOGY_TOUCH_INTERVAL_SECONDS = 3600.0
+
+_cache: "OrderedDict[str, dict[str, Any]]" = OrderedDict()
+# Last write per snapshot. Format: {(db_path, hash): written_at}
+_written: "OrderedDict[tuple[str, str], float]" = OrderedDict()
+_cache_lock = Lock()
+
+
+class TopologyRef(TypedDict):
+    """
+    Reference to a stored topology snapshot, as carried in the graph state.
+
+    Attributes:
+        hash: SHA-256 of the snapshot's canonical JSON
+        captured_at: Unix timestamp of the fetch that produced the snapshot
+    """
+
+    hash: str
+    captured_at: float
+
+
+def ensure_topology_store(conn: sqlite3.Connection) -> None:
+    """
+    Create the topology blob table if it does not exist.
+
+    Args:
+        conn: Writable connection to the checkpoint database.
+    """
+    conn.executescript(TOPOLOGY_STORE_SCHEMA)
+
+
+def _encode(topology: dict[str, Any]) -> bytes:
+    """Canonical JSON encoding, identical for equal topologies."""
+    return json.dumps(
+        topology, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def _cache_put(topology_hash: str, topology: dict[str, Any]) -> None:
+    with _cache_lock:
+        _cache[topology_hash] = topology
+        _cache.move_to_end(topology_hash)
+        while len(_cache) > TOPOLOGY_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def store_topology(checkpointer: Any, topology: dict[str, Any]) -> TopologyRef:
+    """
+    Store a topology snapshot unless an identical one is already stored.
+
+    The blob is written and committed on the checkpointer's writer
+    connection. A snapshot written within TOPOLOGY_TOUCH_INTERVAL_SECONDS
+    is not written again.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+        topology: Topology dict returned by GNS3TopologyTool.
+
+    Returns:
+        TopologyRef: Reference to keep in the graph state.
+    """
+    data = _encode(topology)
+    topology_hash = hashlib.sha256(data).hexdigest()
+    now = time.time()
+    key = (str(getattr(checkpointer, "db_path", "")), topology_hash)
+
+    with _cache_lock:
+        written_at = _written.get(key)
+    if written_at is None or now - written_at >= TOPOLOGY_TOUCH_INTERVAL_SECONDS:
+        with checkpointer.cursor() as cur:
+            cur.execute(
+                "INSERT INTO topology_blobs (hash, data, size, created_at, last_seen) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET last_seen = excluded.last_seen",
+                (topology_hash, data, len(data), now, now),
+            )
+        with _cache_lock:
+            _written[key] = now
+            _written.move_to_end(key)
+            while len(_written) > TOPOLOGY_CACHE_SIZE:
+                _written.popitem(last=False)
+    _cache_put(topology_hash, topology)
+
+    return {"hash": topology_hash, "captured_at": now}
+
+
+def load_topology(
+    checkpointer: Any, topology_ref: TopologyRef | None
+) -> dict[str, Any] | None:
+    """
+    Resolve a topology reference to the stored snapshot.
+
+    Args:
+        checkpointer: PooledSqliteSaver instance.
+        topology_ref: Reference from the graph state, may be None.
+
+    Returns:
+        dict | None: The topology, or None if there is no reference or the
+                     snapshot has been pruned.
+    """
+    if not topology_ref:
+        return None
+    topology_hash = topology_ref["hash"]
+
+    with _cache_lock:
+        cached = _cache.get(topology_hash)
+        if cached is not None:
+            _cache.move_to_end(topology_hash)
+            return cached
+
+    try:
+        with checkpointer.cursor(transaction=False) as cur:
+            row = cur.execute(
+                "SELECT data FROM topology_blobs WHERE hash = ?", (topology_hash,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Failed to load topology %s: %s", topology_hash[:12], e)
+        return None
+    if row is None:
+        logger.debug("Topology %s not found", topology_hash[:12])
+        return None
+
+    topology: dict[str, Any] = json.loads(row[0])
+    _cache_put(topology_hash, topology)
+    return topology
+
+
+def prune_topology_blobs(conn: sqlite3.Connection, max_age_days: float) -> int:
+    """
+    Delete topology snapshots that have not been stored again for a while.
+
+    A pruned snapshot is simply fetched again from GNS3 on the next step of a
+    thread that still references it. Snapshots touched within twice the
+    touch interval are always kept, as store_topology skips writing them.
+
+    Args:
+        conn: Maintenance connection (autocommit).
+        max_age_days: Age in days of the last store after which a blob is deleted.
+
+    Returns:
+        int: Number of deleted blobs.
+    """
+    try:
+        cursor = conn.execute(
+            "DELETE FROM topology_blobs WHERE last_seen < ?",
+            (
+                time.time()
+                - max(max_age_days * 86400, 2 * TOPOLOGY_TOUCH_INTERVAL_SECONDS),
+            ),
+        )
+    except sqlite3.OperationalError as e:
+        # Table does not exist yet
+        logger.debug("Topology blobs not pruned: %s", e)
+        return 0
+    return cursor.rowcount
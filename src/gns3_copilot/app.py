@@ -16,6 +16,7 @@ from gns3_copilot.ui_model.utils import (
     inject_chat_styles,
     load_config,
     render_startup_update_result,
+    start_warmup,
 )
 
 NAV_PAGES = [
@@ -38,13 +39,17 @@ def main() -> None:
     # This ensures all pages have access to the configuration
     load_config()
 
+    # Open the database, compile the agent and connect to GNS3 in the
+    # background (once per process), so the first message is not slowed down
+    start_warmup()
+
     # Apply centralized CSS styles
     st.markdown(get_styles(), unsafe_allow_html=True)
 
     # Inject chat-specific styles
     inject_chat_styles()
 
-    # Check for updates on startup (blocking, runs once)
+    # Check for updates on startup (in the background, result cached on disk)
     check_startup_updates()
 
     # Prevent the app from crashing if a page path is missing
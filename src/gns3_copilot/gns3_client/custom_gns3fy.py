@@ -12,6 +12,7 @@ Note: This file is adapted - not the untouched upstream source. See repository R
 """
 
 import os
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import field
@@ -69,6 +70,29 @@ CONSOLE_TYPES = [
 
 LINK_TYPES = ["ethernet", "serial"]
 
+# JWT tokens of the v3 API shared by all connectors of the process, so that
+# connectors created per tool call do not authenticate again.
+# Format: {(base_url, user, cred): access_token}
+_TOKEN_CACHE: dict[tuple[str, str, str], str] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_expired(token: str | None) -> bool:
+    """
+    Check whether a JWT token is missing or expired (signature not verified).
+    """
+    if not token:
+        return True
+
+    try:
+        decoded: dict[str, Any] = jwt.decode(token, options={"verify_signature": False})
+        exp = decoded.get("exp")
+        if exp is not None:
+            return time.time() > float(exp)
+        return False
+    except (jwt.PyJWTError, ValueError, TypeError):
+        return True
+
 
 class Gns3Connector:
     """
@@ -172,6 +196,8 @@ class Gns3Connector:
                 self.access_token = auth_result["access_token"]
                 # Update session with new token
                 self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+                with _TOKEN_CACHE_LOCK:
+                    _TOKEN_CACHE[self._token_key()] = auth_result["access_token"]
                 # print(f"Successfully authenticated to v3 API, token obtained")
             else:
                 raise HTTPError(
@@ -184,21 +210,35 @@ class Gns3Connector:
         """
         Check if the JWT token is expired (basic implementation)
         """
-        token = self.access_token
-        if not token:
-            return True
+        return _token_expired(self.access_token)
 
-        try:
-            # Decode token without verification to check expiry
-            decoded: dict[str, Any] = jwt.decode(
-                token, options={"verify_signature": False}
-            )
-            exp = decoded.get("exp")
-            if exp is not None:
-                return time.time() > float(exp)
-            return False
-        except (jwt.PyJWTError, ValueError, TypeError):
-            return True
+    def _token_key(self) -> tuple[str, str, str]:
+        return (self.base_url, self.user or "", self.cred or "")
+
+    def authenticate(self) -> None:
+        """
+        Makes sure a v3 API connector holds a JWT token.
+
+        A token obtained by another connector for the same server and user is
+        reused while it is not expired; otherwise the connector authenticates.
+        Nothing is done for API v2, without credentials or with a token.
+        """
+        if (
+            self.auth_type != "jwt"
+            or self.access_token
+            or not self.user
+            or not self.cred
+        ):
+            return
+
+        with _TOKEN_CACHE_LOCK:
+            token = _TOKEN_CACHE.get(self._token_key())
+        if token and not _token_expired(token):
+            self.access_token = token
+            self.session.headers["Authorization"] = f"Bearer {token}"
+            return
+
+        self._authenticate_v3()
 
     def _refresh_token(self) -> None:
         """
@@ -221,13 +261,7 @@ class Gns3Connector:
         Executes HTTP operations and handles GNS3-specific error logic.
         """
         # Handle JWT authentication
-        if (
-            self.auth_type == "jwt"
-            and not self.access_token
-            and self.user
-            and self.cred
-        ):
-            self._authenticate_v3()
+        self.authenticate()
 
         # Get request function (e.g., session.get, session.post)
         caller = getattr(self.session, method.lower())
@@ -252,6 +286,11 @@ class Gns3Connector:
         try:
             _response.raise_for_status()
         except HTTPError as e:
+            if _response.status_code == 401 and self.auth_type == "jwt":
+                # The server no longer accepts the token (e.g. after a restart)
+                with _TOKEN_CACHE_LOCK:
+                    if _TOKEN_CACHE.get(self._token_key()) == self.access_token:
+                        del _TOKEN_CACHE[self._token_key()]
             # Throw enhanced error
             raise self._extract_gns3_error(e) from e
 
@@ -0,0 +1,118 @@
+"""
+Prefetched GNS3 Server Data
+
+The startup warm-up lists the templates and projects of the configured GNS3
+server before the first conversation turn. The results are kept here and
+handed to the first tool call or page render that needs them, so the first
+turn does not wait for those requests.
+
+A prefetched result is used at most once and only while it is recent; every
+later call asks the server again. The tools that create, open, close, update
+or delete a project drop the prefetched project list, and a list fetched
+before such a change is not stored, so a change is never hidden by a list
+prefetched before it.
+
+Functions:
+    store_prefetched(connector, name, value): Keep a prefetched result
+    take_prefetched(connector, name): Take a recent prefetched result
+    drop_prefetched(connector, name): Drop a result that is out of date
+
+Constants:
+    PREFETCH_MAX_AGE_SECONDS: Age after which a prefetched result is dropped
+"""
+
+import threading
+import time
+from typing import Any
+
+from gns3_copilot.gns3_client.custom_gns3fy import Gns3Connector
+
+# Prefetched lists are only used shortly after startup
+PREFETCH_MAX_AGE_SECONDS = 120.0
+
+# Format: {(base_url, user, name): (stored_at, value)}
+_prefetched: dict[tuple[str, str, str], tuple[float, Any]] = {}
+# Time of the last drop, so results fetched before it are not stored
+# Format: {(base_url, user, name): dropped_at}
+_dropped: dict[tuple[str, str, str], float] = {}
+_prefetched_lock = threading.Lock()
+
+
+def _key(connector: Gns3Connector, name: str) -> tuple[str, str, str]:
+    return (str(connector.base_url), str(connector.user or ""), name)
+
+
+def store_prefetched(
+    connector: Gns3Connector,
+    name: str,
+    value: Any,
+    fetched_at: float | None = None,
+    now: float | None = None,
+) -> None:
+    """
+    Keep a prefetched result for the next call.
+
+    Args:
+        connector: Connector the result was fetched with.
+        name: Kind of result, e.g. "templates" or "projects".
+        value: Fetched result.
+        fetched_at: Monotonic time the request was sent; the result is not
+                    kept if it was dropped since.
+        now: Current time (for tests).
+    """
+    stored_at = time.monotonic() if now is None else now
+    key = _key(connector, name)
+    with _prefetched_lock:
+        dropped_at = _dropped.get(key)
+        if dropped_at is not None and dropped_at >= (
+            stored_at if fetched_at is None else fetched_at
+        ):
+            return
+        _prefetched[key] = (stored_at, value)
+
+
+def take_prefetched(
+    connector: Gns3Connector,
+    name: str,
+    max_age: float = PREFETCH_MAX_AGE_SECONDS,
+    now: float | None = None,
+) -> Any | None:
+    """
+    Take a prefetched result of the same server and user.
+
+    Args:
+        connector: Connector of the caller.
+        name: Kind of result.
+        max_age: Maximum age of the result in seconds.
+        now: Current time (for tests).
+
+    Returns:
+        The prefetched result, or None if there is no recent one
+    """
+    with _prefetched_lock:
+        entry = _prefetched.pop(_key(connector, name), None)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if (time.monotonic() if now is None else now) - stored_at > max_age:
+        return None
+    return value
+
+
+def drop_prefetched(
+    connector: Gns3Connector, name: str, now: float | None = None
+) -> None:
+    """
+    Drop a prefetched result after a change made it out of date.
+
+    Results whose request was sent before the drop are not stored later.
+
+    Args:
+        connector: Connector of the caller.
+        name: Kind of result.
+        now: Current time (for tests).
+    """
+    key = _key(connector, name)
+    with _prefetched_lock:
+        _prefetched.pop(key, None)
+        _dropped[key] = time.monotonic() if now is None else now
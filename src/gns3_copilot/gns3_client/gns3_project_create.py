@@ -3,6 +3,7 @@ from typing import Any
 from langchain.tools import BaseTool
 
 from gns3_copilot.gns3_client import Project, get_gns3_connector
+from gns3_copilot.gns3_client.gns3_prefetch import drop_prefetched
 from gns3_copilot.log_config import setup_tool_logger
 
 # Configure logging
@@ -112,6 +113,7 @@ class GNS3ProjectCreate(BaseTool):
             project = Project(connector=server, **project_params)
 
             # Create the project
+            drop_prefetched(server, "projects")
             project.create()
 
             # Verify project was created successfully
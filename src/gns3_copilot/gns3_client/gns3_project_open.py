@@ -3,6 +3,7 @@ from typing import Any
 from langchain.tools import BaseTool
 
 from gns3_copilot.gns3_client import Project, get_gns3_connector
+from gns3_copilot.gns3_client.gns3_prefetch import drop_prefetched
 from gns3_copilot.log_config import setup_tool_logger
 
 # Configure logging
@@ -121,7 +122,9 @@ class GNS3ProjectOpen(BaseTool):
                     "error": f"Project with ID '{project_id}' not found",
                 }
 
-            # Perform the requested operation
+            # Perform the requested operation; the prefetched project list
+            # shows the old status
+            drop_prefetched(server, "projects")
             operation = None
             if should_open:
                 project.open()
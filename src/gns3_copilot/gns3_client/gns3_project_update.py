@@ -3,6 +3,7 @@ from typing import Any
 from langchain.tools import BaseTool
 
 from gns3_copilot.gns3_client import Project, get_gns3_connector
+from gns3_copilot.gns3_client.gns3_prefetch import drop_prefetched
 from gns3_copilot.log_config import setup_tool_logger
 
 # Configure logging
@@ -151,6 +152,7 @@ class GNS3ProjectUpdate(BaseTool):
                 old_values[field] = getattr(project, field, None)
 
             # Update the project
+            drop_prefetched(server, "projects")
             project.update(**update_params)
 
             # Collect updated fields
@@ -3,6 +3,7 @@ from typing import Any
 from langchain.tools import BaseTool
 
 from gns3_copilot.gns3_client import get_gns3_connector
+from gns3_copilot.gns3_client.gns3_prefetch import take_prefetched
 from gns3_copilot.log_config import setup_tool_logger
 
 # Configure logging
@@ -50,8 +51,11 @@ class GNS3ProjectList(BaseTool):
                     "error": "Failed to connect to GNS3 server. Please check your configuration."
                 }
 
-            # Return the projects data in a structured format
-            projects = server.projects_summary(is_print=False)
+            # Return the projects data in a structured format; the list
+            # prefetched at startup is used once
+            projects = take_prefetched(server, "projects")
+            if projects is None:
+                projects = server.projects_summary(is_print=False)
 
             # Prepare result
             result = {"projects": projects}
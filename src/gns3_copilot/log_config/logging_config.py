@@ -13,7 +13,19 @@ from logging.handlers import TimedRotatingFileHandler
 MODULE_PATH_MAPPING: dict[str, str] = {
     # Agent modules
     "gns3_copilot": "agent",
+    "checkpointer": "agent",
     "checkpoint_utils": "agent",
+    "context_compaction": "agent",
+    "plan_execute": "agent",
+    "early_tool_dispatch": "agent",
+    "title_generation": "agent",
+    "checkpoint_store": "agent",
+    "checkpoint_serde": "agent",
+    "checkpoint_retention": "agent",
+    "checkpoint_archive": "agent",
+    "session_index": "agent",
+    "session_search": "agent",
+    "topology_store": "agent",
     # GNS3 client modules
     "connector_factory": "gns3_client",
     "custom_gns3fy": "gns3_client",
@@ -40,6 +52,8 @@ MODULE_PATH_MAPPING: dict[str, str] = {
     "openai_stt": "public_model",
     "openai_tts": "public_model",
     "parse_tool_content": "public_model",
+    "tool_artifacts": "public_model",
+    "tts_cache": "public_model",
     # Prompts modules
     "base_prompt": "prompts",
     "drawing_prompt": "prompts",
@@ -50,6 +64,8 @@ MODULE_PATH_MAPPING: dict[str, str] = {
     "english_level_prompt_c1": "prompts",
     "english_level_prompt_c2": "prompts",
     "prompt_loader": "prompts",
+    "planner_prompt": "prompts",
+    "summary_prompt": "prompts",
     "title_prompt": "prompts",
     "voice_prompt_english_level_a1": "prompts",
     "voice_prompt_english_level_a2": "prompts",
@@ -67,21 +83,27 @@ MODULE_PATH_MAPPING: dict[str, str] = {
     "gns3_get_node_temp": "tools_v2",
     "gns3_start_node": "tools_v2",
     "linux_tools_nornir": "tools_v2",
+    "read_tool_artifact": "tools_v2",
     "vpcs_tools_telnetlib3": "tools_v2",
     # UI model modules
     "app_ui": "ui_model",
     "chat": "ui_model",
     "chat_helpers": "ui_model",
+    "chat_history": "ui_model",
+    "history_view": "ui_model",
+    "stream_renderer": "ui_model",
     "config_manager": "ui_model",
     "gns3_checker": "ui_model",
     "help": "ui_model",
     "llm_providers": "ui_model",
     "notes": "ui_model",
+    "notes_store": "ui_model",
     "project_manager_ui": "ui_model",
     "settings": "ui_model",
     "sidebar": "ui_model",
     "update_ui": "ui_model",
     "updater": "ui_model",
+    "warmup": "ui_model",
 }
 
 
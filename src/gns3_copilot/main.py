@@ -83,6 +83,7 @@ GNS3 Copilot - AI-powered network automation assistant for GNS3
 
 USAGE:
     gns3-copilot [STREAMLIT_OPTIONS]
+    gns3-copilot sessions COMMAND [OPTIONS]
 
 EXAMPLES:
     # Basic startup
@@ -103,6 +104,14 @@ EXAMPLES:
     # Disable usage statistics
     gns3-copilot --browser.gatherUsageStats false
 
+    # Manage saved sessions without starting the app
+    gns3-copilot sessions list
+    gns3-copilot sessions search "ospf neighbor"
+
+SESSIONS COMMANDS:
+    list, inspect, export, import, prune, search
+    Run "gns3-copilot sessions --help" for details.
+
 COMMON STREAMLIT OPTIONS:
     --server.port PORT           Port to run on (default: 8501)
     --server.address ADDRESS     Address to bind to (default: localhost)
@@ -132,6 +141,12 @@ def print_version() -> None:
 
 def main() -> int:
     """Main entry point."""
+    # The sessions command only needs the checkpoint database
+    if sys.argv[1:2] == ["sessions"]:
+        from gns3_copilot.agent.session_cli import main as sessions_main
+
+        return sessions_main(sys.argv[2:], prog="gns3-copilot sessions")
+
     parser = argparse.ArgumentParser(
         prog="gns3-copilot",
         description="GNS3 Copilot - AI-powered network automation assistant for GNS3",
@@ -7,7 +7,9 @@ levels and English language prompts.
 """
 
 from .linux_specialist_prompt import LINUX_SPECIALIST_PROMPT
+from .planner_prompt import PLANNER_PROMPT
 from .prompt_loader import load_system_prompt
+from .summary_prompt import SUMMARY_PROMPT
 from .title_prompt import TITLE_PROMPT
 
 # Dynamic version management
@@ -25,5 +27,7 @@ __url__ = "https://github.com/yueguobin/gns3-copilot"
 __all__ = [
     "load_system_prompt",
     "TITLE_PROMPT",
+    "SUMMARY_PROMPT",
+    "PLANNER_PROMPT",
     "LINUX_SPECIALIST_PROMPT",
 ]
@@ -0,0 +1,31 @@
+"""
+Prompt template for plan-and-execute mode.
+
+Instructs the model to submit multi-step work as one ordered plan through the
+`execute_plan` tool instead of calling tools one round-trip at a time.
+"""
+
+PLANNER_PROMPT = """
+Plan-and-execute mode is enabled.
+When a request needs two or more tool calls, call the `execute_plan` tool once
+with the complete plan instead of calling the tools one by one.
+The plan is executed without consulting you between steps: independent steps run
+concurrently, dependent steps run in order, and you receive all results at the
+end or as soon as a step fails.
+
+`execute_plan` input is a JSON object with a `steps` array. Each step has:
+- `id`: unique step identifier, e.g. "s1"
+- `tool`: name of the tool to call
+- `args`: the exact arguments for that tool (usually {"tool_input": "<JSON string>"})
+- `depends_on`: optional list of step ids that must finish first
+
+To use a value produced by an earlier step, write `${step_id.path}` inside the
+arguments, where path is a dot-separated list of keys and list indexes into that
+step's result, e.g. `${s1.nodes.0.node_id}`. Referenced steps are treated as
+dependencies automatically.
+
+Only include steps whose arguments you can fully determine now or derive from
+earlier step results. If a step needs your judgement on an earlier result, end the
+plan before it and plan the rest after you receive the results.
+For single tool calls, call the tool directly.
+"""
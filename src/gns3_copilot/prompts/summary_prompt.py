@@ -0,0 +1,19 @@
+"""
+Prompt template for compacting long conversation histories.
+
+Folds older turns into a running summary so that the agent keeps the facts it
+needs (devices, addresses, configuration already applied, open problems)
+without re-sending the full message history on every LLM call.
+"""
+
+SUMMARY_PROMPT = """
+You are compacting the history of a GNS3 network automation conversation.
+Merge the existing summary (if any) with the conversation records that follow
+into a single updated summary.
+Keep every fact that later steps may depend on: project and device names,
+interfaces, IP addresses, protocols, configuration that was applied,
+command results that matter, errors that occurred and unresolved requests.
+Drop greetings, repetition and verbose raw command output.
+Write the summary in the same language as the conversation.
+Only return the summary, do not include any additional explanations:
+"""
@@ -25,6 +25,7 @@ Main modules:
 - gns3_create_area_drawing: GNS3 area annotation creation tool (ellipse for 2 nodes)
 - gns3_drawing_utils: Drawing utility functions for calculating SVG parameters
 - linux_tools_nornir: Linux Telnet batch command execution tool using Nornir
+- read_tool_artifact: Pages through oversized tool outputs stored as artifacts
 
 Note: GNS3TopologyTool is now available from gns3_client package
 
@@ -40,6 +41,7 @@ from .gns3_create_node import GNS3CreateNodeTool
 from .gns3_get_node_temp import GNS3TemplateTool
 from .gns3_start_node import GNS3StartNodeTool
 from .linux_tools_nornir import LinuxTelnetBatchTool
+from .read_tool_artifact import ReadToolArtifactTool
 from .vpcs_tools_telnetlib3 import VPCSMultiCommands
 
 # Dynamic version management
@@ -65,6 +67,7 @@ __all__ = [
     "GNS3TemplateTool",
     "GNS3CreateAreaDrawingTool",
     "LinuxTelnetBatchTool",
+    "ReadToolArtifactTool",
 ]
 
 # Package initialization message
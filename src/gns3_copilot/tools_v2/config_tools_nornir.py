@@ -8,11 +8,9 @@ from typing import Any
 
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun
-from netmiko.exceptions import ReadTimeout
 from nornir import InitNornir
 from nornir.core import Nornir
 from nornir.core.task import AggregatedResult, Result, Task
-from nornir_netmiko.tasks import netmiko_send_config
 
 from gns3_copilot.log_config import setup_tool_logger
 from gns3_copilot.utils import (
@@ -156,6 +154,10 @@ class ExecuteMultipleDeviceConfigCommands(BaseTool):
         self, task: Task, device_configs_map: dict[str, list[str]]
     ) -> Result:
         """Execute configuration commands with single retry mechanism."""
+        # Netmiko is only loaded when commands are sent to devices
+        from netmiko.exceptions import ReadTimeout
+        from nornir_netmiko.tasks import netmiko_send_config
+
         device_name = task.host.name
         config_commands = device_configs_map.get(device_name, [])
 
@@ -9,11 +9,9 @@ from typing import Any
 
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun
-from netmiko.exceptions import ReadTimeout
 from nornir import InitNornir
 from nornir.core import Nornir
 from nornir.core.task import AggregatedResult, Result, Task
-from nornir_netmiko.tasks import netmiko_multiline
 
 from gns3_copilot.log_config import setup_tool_logger
 from gns3_copilot.utils import (
@@ -141,6 +139,10 @@ class ExecuteMultipleDeviceCommands(BaseTool):
         self, task: Task, device_configs_map: dict[str, list[str]]
     ) -> Result:
         """Execute display commands with single retry mechanism."""
+        # Netmiko is only loaded when commands are sent to devices
+        from netmiko.exceptions import ReadTimeout
+        from nornir_netmiko.tasks import netmiko_multiline
+
         device_name = task.host.name
         config_commands = device_configs_map.get(device_name, [])
 
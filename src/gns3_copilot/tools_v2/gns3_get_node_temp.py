@@ -13,6 +13,7 @@ from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun
 
 from gns3_copilot.gns3_client import get_gns3_connector
+from gns3_copilot.gns3_client.gns3_prefetch import take_prefetched
 from gns3_copilot.log_config import setup_tool_logger
 
 # Configure logging
@@ -82,8 +83,11 @@ class GNS3TemplateTool(BaseTool):
                     "error": "Failed to connect to GNS3 server. Please check your configuration."
                 }
 
-            # Retrieve all available templates
-            templates = gns3_server.get_templates()
+            # Retrieve all available templates; the list prefetched at
+            # startup is used once
+            templates = take_prefetched(gns3_server, "templates")
+            if templates is None:
+                templates = gns3_server.get_templates()
             # Extract name, template_id, and template_type
             template_info = [
                 {
@@ -13,7 +13,6 @@ from langchain_core.callbacks import CallbackManagerForToolRun
 from nornir import InitNornir
 from nornir.core import Nornir
 from nornir.core.task import AggregatedResult, Result, Task
-from nornir_netmiko.tasks import netmiko_send_command
 
 from gns3_copilot.log_config import setup_tool_logger
 from gns3_copilot.utils import (
@@ -251,6 +250,9 @@ class LinuxTelnetBatchTool(BaseTool):
         Execute commands one-by-one on a single device
         (optimized for generic_telnet + $ prompt).
         """
+        # Netmiko is only loaded when commands are sent to devices
+        from nornir_netmiko.tasks import netmiko_send_command
+
         device_name = task.host.name
         config_commands = device_configs_map.get(device_name, [])
 
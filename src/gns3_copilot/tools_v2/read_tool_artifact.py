@@ -0,0 +1,102 @@
+"""
+Tool artifact reader for paging through oversized tool outputs.
+
+Tool outputs larger than their budget are stored out of band and only a
+head/tail preview is sent to the model. This tool lets the model read the
+omitted part page by page when it actually needs it.
+"""
+
+import json
+from pprint import pprint
+from typing import Any
+
+from langchain.tools import BaseTool
+from langchain_core.callbacks import CallbackManagerForToolRun
+
+from gns3_copilot.log_config import setup_tool_logger
+from gns3_copilot.utils.tool_artifacts import DEFAULT_PAGE_CHARS, read_artifact
+
+# Configure logging
+logger = setup_tool_logger("read_tool_artifact")
+
+
+class ReadToolArtifactTool(BaseTool):
+    """
+    A LangChain tool to read a page of a stored tool output artifact.
+
+    **Input:**
+    A JSON object with the artifact ID and an optional page position.
+    Example:
+        {
+            "artifact_id": "art-1a2b3c4d5e6f",
+            "offset": 5600,
+            "length": 4000
+        }
+
+    **Output:**
+    A dictionary with the page content and the offset of the next page:
+        {
+            "artifact_id": "art-1a2b3c4d5e6f",
+            "tool_name": "execute_multiple_device_commands",
+            "offset": 5600,
+            "total_length": 48210,
+            "next_offset": 9600,
+            "content": "..."
+        }
+    If the artifact does not exist, returns a dictionary with an error message.
+    """
+
+    name: str = "read_tool_artifact"
+    description: str = """
+    Reads part of a large tool output that was truncated in an earlier tool result.
+    Only use it when the truncated result notice mentions an artifact and the
+    omitted part is needed to answer.
+    Input: JSON with artifact_id (required), offset (optional, default 0) and
+    length (optional, default 4000, max 8000).
+    Returns: A dictionary with the page content, total_length and next_offset
+    (null when the end of the artifact is reached).
+    """
+
+    def _run(
+        self, tool_input: str, run_manager: CallbackManagerForToolRun | None = None
+    ) -> dict[str, Any]:
+        logger.debug("Received input: %s", tool_input)
+        try:
+            input_data = json.loads(tool_input)
+            artifact_id = input_data.get("artifact_id")
+            if not artifact_id:
+                logger.error("Missing required field: artifact_id.")
+                return {"error": "Missing required field: artifact_id."}
+
+            page = read_artifact(
+                artifact_id,
+                offset=input_data.get("offset", 0),
+                length=input_data.get("length", DEFAULT_PAGE_CHARS),
+            )
+            if page is None:
+                return {"error": f"Artifact not found: {artifact_id}"}
+
+            logger.info(
+                "Read artifact %s: offset=%d, total_length=%d",
+                artifact_id,
+                page["offset"],
+                page["total_length"],
+            )
+            return page
+
+        except json.JSONDecodeError as e:
+            logger.error("Invalid JSON input: %s", e)
+            return {"error": f"Invalid JSON input: {e}"}
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.error("Invalid input: %s", e)
+            return {"error": f"Invalid input: {e}"}
+        except Exception as e:
+            logger.error("Failed to read artifact: %s", e)
+            return {"error": f"Failed to read artifact: {e}"}
+
+
+if __name__ == "__main__":
+    # Test's tool locally
+    tool = ReadToolArtifactTool()
+    result = tool._run(json.dumps({"artifact_id": "art-000000000000"}))
+    pprint(result)
@@ -11,7 +11,6 @@ from typing import Any
 
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun
-from telnetlib3 import Telnet
 
 from gns3_copilot.log_config import setup_tool_logger
 from gns3_copilot.utils import get_config, get_device_ports_from_topology
@@ -19,6 +18,17 @@ from gns3_copilot.utils import get_config, get_device_ports_from_topology
 logger = setup_tool_logger("vpcs_multi_commands")
 
 
+def Telnet() -> Any:
+    """
+    Create a telnetlib3 Telnet client.
+
+    telnetlib3 is imported on first use instead of with the tool module.
+    """
+    from telnetlib3 import Telnet as TelnetClient
+
+    return TelnetClient()
+
+
 class VPCSMultiCommands(BaseTool):
     """
     A tool to execute multiple command groups across multiple VPCS devices concurrently.
@@ -13,6 +13,7 @@ Features:
 - Message history and session state management
 - Support for multiple message types (Human, AI, Tool messages)
 - Interactive tool call and response visualization
+- Conversation and topology viewer as fragments that rerun independently
 
 The application leverages:
 - Streamlit for the web UI
@@ -28,31 +29,404 @@ Note: Requires proper configuration of GNS3 server and API credentials.
 """
 
 import json
+import logging
 import uuid
-from time import sleep
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import streamlit as st
 from langchain.messages import AIMessage, HumanMessage, ToolMessage
 
-from gns3_copilot.agent import agent
+from gns3_copilot.agent import agent, schedule_title_generation, wait_for_title
 from gns3_copilot.gns3_client import GNS3ProjectList
 from gns3_copilot.log_config import setup_logger
 from gns3_copilot.ui_model.utils import (
+    StreamedHistory,
+    StreamingMarkdown,
     build_topology_iframe_url,
     generate_topology_iframe_html,
+    get_history_view,
+    get_tool_response_cache,
+    load_message_content,
+    render_chat_history,
     render_create_project_form,
     render_project_cards,
+    session_memory_report,
 )
-from gns3_copilot.utils import (
-    format_tool_response,
-    get_duration,
-    speech_to_text,
-    text_to_speech_wav,
-)
+
+if TYPE_CHECKING:
+    from gns3_copilot.utils import SpeechPipeline
 
 logger = setup_logger("chat")
 
+
+def _play_ready_audio(speech: "SpeechPipeline") -> None:
+    """
+    Render the speech chunks that are ready to play, in order.
+
+    Args:
+        speech: Speech pipeline of the current answer.
+    """
+    while (audio_bytes := speech.next_audio()) is not None:
+        st.audio(audio_bytes, format="audio/wav", autoplay=True, width=200)
+
+
+# Session state keys of the chat input widget and of the prompt it submitted
+_PROMPT_KEY = "chat_prompt"
+_PENDING_PROMPT_KEY = "pending_prompt"
+
+# Session state key of the speech still playing after an answer, a dict
+# with the pipeline and the chunk currently playing
+_SPEECH_KEY = "pending_speech"
+
+# Interval for handing out the remaining speech chunks of an answer
+SPEECH_POLL_SECONDS = 0.5
+
+
+def _close_speech() -> None:
+    """Stop the speech of the previous answer and record its statistics."""
+    playback = st.session_state.pop(_SPEECH_KEY, None)
+    if playback is None:
+        return
+    speech = playback["speech"]
+    speech.close()
+    tts_stats = speech.stats()
+    st.session_state["tts_stats"] = tts_stats
+    if tts_stats.failures:
+        st.toast(
+            f"TTS Error: {tts_stats.failures} sentence(s) could not be synthesized"
+        )
+
+
+@st.fragment(run_every=SPEECH_POLL_SECONDS)
+def _play_remaining_speech() -> None:
+    """
+    Play the rest of a spoken answer after its stream ended.
+
+    The turn finishes without waiting for the audio; this fragment hands out
+    the remaining chunks as they become ready. The chunk playing is rendered
+    again on every run, so it is not interrupted.
+    """
+    playback = st.session_state.get(_SPEECH_KEY)
+    if playback is None:
+        return
+    speech = playback["speech"]
+    if speech.done:
+        _close_speech()
+        # A full rerun no longer renders this fragment and stops polling
+        st.rerun()
+    audio_bytes = speech.next_audio()
+    if audio_bytes is not None:
+        playback["audio"] = audio_bytes
+    if playback["audio"] is not None:
+        st.audio(playback["audio"], format="audio/wav", autoplay=True, width=200)
+
+
+def _submit_prompt() -> None:
+    """Hand the submitted prompt to the conversation and rerun only that."""
+    st.session_state[_PENDING_PROMPT_KEY] = st.session_state.get(_PROMPT_KEY)
+    st.rerun("conversation")
+
+
+def _run_agent_turn(
+    prompt: Any, config: dict[str, Any], selected_thread_id: str | None
+) -> None:
+    """
+    Run the agent for a submitted prompt and stream the answer.
+
+    Args:
+        prompt: Chat input value, a string or (in voice mode) an object with
+                .text and .audio.
+        config: LangGraph run configuration of the current session.
+        selected_thread_id: Thread ID of a saved session, None for a new one.
+    """
+    voice_enabled = st.session_state.get("VOICE", False)
+    user_text = ""
+    # A new prompt stops the speech of the previous answer
+    _close_speech()
+    if voice_enabled:
+        # The audio libraries are only loaded when voice mode is used
+        from gns3_copilot.utils import SpeechPipeline, transcribe_chunked
+
+        # Mode A: prompt is an object (containing .text and .audio)
+        if prompt.audio:
+            # Long recordings are transcribed in parallel chunks; show
+            # the transcript while the later chunks are still running
+            partial_transcript = st.empty()
+            user_text = transcribe_chunked(
+                prompt.audio,
+                on_partial=lambda text: partial_transcript.caption(text),
+            )
+            partial_transcript.empty()
+        # If voice is not converted to text, or user directly types
+        if not user_text:
+            user_text = prompt.text
+    else:
+        # Mode B: prompt is directly a string
+        user_text = prompt
+    # 3. Final check and run
+    if not user_text or user_text.strip() == "":
+        return
+
+    # Display user message in chat message container
+    with st.chat_message("user"):
+        st.markdown(user_text)
+
+    # Let a pending background title update land before the new run
+    wait_for_title(config["configurable"]["thread_id"], timeout=10)
+
+    # Migrate temp selected project to agent state for new sessions
+    if not selected_thread_id and st.session_state.get("temp_selected_project"):
+        temp_project = st.session_state["temp_selected_project"]
+        agent.update_state(config, {"selected_project": temp_project})
+        # Don't clear temp_selected_project immediately
+        # It will be cleared after rerun when selected_p is retrieved from agent state
+
+    thread_id = config["configurable"]["thread_id"]
+    # The history view is extended from the stream instead of being
+    # reloaded from the checkpoint after the run
+    user_message = HumanMessage(content=user_text, id=str(uuid.uuid4()))
+    history = get_history_view(agent, thread_id)
+    history.add_message(user_message)
+    streamed = StreamedHistory(history)
+
+    # Display assistant response in chat message container
+    with st.chat_message("assistant"):
+        # Renders the streamed text at a bounded rate; in voice
+        # mode the text is only collected for TTS
+        stream_text = StreamingMarkdown(st.empty(), enabled=not voice_enabled)
+        # Core aggregation state: only stores currently streaming tool information
+        # Structure: {'id': str, 'name': str, 'args_string': str} or None
+        current_tool_state = None
+        # Speaks the answer sentence by sentence while it streams
+        speech = SpeechPipeline() if voice_enabled else None
+        # Stream the agent response
+        for chunk in agent.stream(
+            {
+                "messages": [user_message],
+            },
+            config=config,
+            stream_mode="messages",
+        ):
+            streamed.add(chunk[0], chunk[1])
+            for msg in chunk:
+                # with open('log.txt', "a", encoding='utf-8') as f:
+                #    f.write(f"{msg}\n\n")
+                if isinstance(msg, AIMessage):
+                    # adapted for gemini
+                    # Check if content is a list and safely extract the first text element
+                    text_chunk = ""
+                    if (
+                        isinstance(msg.content, list)
+                        and msg.content
+                        and "text" in msg.content[0]
+                    ):
+                        # Now text_chunk is the clean text you need
+                        text_chunk = msg.content[0]["text"]
+                    elif isinstance(msg.content, str):
+                        text_chunk = str(msg.content)
+                    stream_text.append(text_chunk)
+                    if speech is not None:
+                        speech.feed(text_chunk)
+                    # Determine if text message (i.e., msg.content) reception is complete
+                    is_text_ending = (
+                        # Case 1: Tool call starts
+                        msg.tool_calls
+                        or
+                        # Case 2: End metadata received
+                        msg.response_metadata.get("finish_reason")
+                        in ["tool_calls", "stop"]
+                    )
+                    if is_text_ending:
+                        stream_text.flush()
+                        if speech is not None:
+                            # Speak the last, unfinished sentence
+                            speech.finish()
+                    # Get metadata (ID and name) from tool_calls
+                    if msg.tool_calls:
+                        for tool in msg.tool_calls:
+                            tool_id = tool.get("id")
+                            # Only when ID is not empty, consider it as the start of a new tool call
+                            if tool_id:
+                                # Initialize current tool state (this is the only time to get ID)
+                                # Note: only one tool can be called at a time
+                                current_tool_state = {
+                                    "id": tool_id,
+                                    "name": tool.get("name", "UNKNOWN_TOOL"),
+                                    "args_string": "",
+                                }
+                    # Concatenate parameter strings from tool_call_chunk
+                    if hasattr(msg, "tool_call_chunks") and msg.tool_call_chunks:
+                        if current_tool_state:
+                            tool_data = current_tool_state
+                            for chunk_update in msg.tool_call_chunks:
+                                args_chunk = chunk_update.get("args", "")
+                                # Core: string concatenation
+                                if isinstance(args_chunk, str):
+                                    tool_data["args_string"] += args_chunk
+                    # Determine if the tool_calls_chunks output is complete and
+                    # display the st.expander() for tool_calls
+                    if msg.response_metadata.get("finish_reason") == "tool_calls" or (
+                        msg.response_metadata.get("finish_reason") == "STOP"
+                        and current_tool_state is not None
+                    ):
+                        tool_data = current_tool_state
+                        # Parse complete parameter string
+                        parsed_args: dict[str, Any] = {}
+                        try:
+                            parsed_args = json.loads(tool_data["args_string"])
+                        except json.JSONDecodeError:
+                            parsed_args = {
+                                "error": "JSON parse failed after stream complete."
+                            }
+                        # Serialize the tool_input value in parsed_args to a JSON array
+                        # for expansion when using st.json
+                        try:
+                            command_list = json.loads(parsed_args["tool_input"])
+                            parsed_args["tool_input"] = command_list
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            pass
+                        # Build the final display structure that meets your requirements
+                        display_tool_call = {
+                            "name": tool_data["name"],
+                            "id": tool_data["id"],
+                            # Inject tool_input structure
+                            "tool_input": parsed_args.get("tool_input"),
+                            "type": tool_data.get(
+                                "type", "tool_call"
+                            ),  # Maintain completeness
+                        }
+                        # Update Call Expander, display final parameters (collapsed)
+                        with st.expander(
+                            f"**Tool Call:** `{tool_data['name']}`",
+                            expanded=False,
+                        ):
+                            # Use the final complete structure
+                            st.json(display_tool_call, expanded=False)
+                if isinstance(msg, ToolMessage):
+                    # Clear state after completion, ready to receive next tool call
+                    current_tool_state = None
+                    # Cached for the history rendering after the run
+                    response = get_tool_response_cache().get(msg.content, msg.id)
+                    with st.expander(
+                        "**Tool Response**",
+                        expanded=False,
+                    ):
+                        st.json(response.data, expanded=False)
+                    stream_text.restart(st.empty())
+            if speech is not None:
+                # Start the sentences synthesized so far without
+                # holding up the stream
+                _play_ready_audio(speech)
+        # Render any text still buffered when the stream ends
+        stream_text.flush()
+        stream_text.log_stats()
+        st.session_state["stream_render_stats"] = stream_text.stats
+        if speech is not None:
+            # The rest of the answer is played by _play_remaining_speech,
+            # so the turn ends without waiting for the audio
+            speech.finish()
+            _play_ready_audio(speech)
+            st.session_state[_SPEECH_KEY] = {"speech": speech, "audio": None}
+    streamed.finish()
+    # Generate the title after the answer, off the critical path
+    schedule_title_generation(agent, config)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Session state size (bytes): %s", session_memory_report())
+
+
+@st.fragment(key="conversation")
+def _render_conversation(
+    config: dict[str, Any], selected_thread_id: str | None
+) -> None:
+    """
+    Render the conversation history and answer a submitted prompt.
+
+    Submitting a prompt, loading earlier messages and opening tool payloads
+    rerun only this fragment, not project selection or the topology viewer.
+
+    Args:
+        config: LangGraph run configuration of the current session.
+        selected_thread_id: Thread ID of a saved session, None for a new one.
+    """
+    st.markdown(
+        """
+        <h3 style='text-align: left; font-size: 22px; font-weight: bold; margin-top: 20px;'>Workspace</h3>
+        """,
+        unsafe_allow_html=True,
+    )
+    thread_id = config["configurable"]["thread_id"]
+    # Compact view of the conversation; tool payloads stay in the checkpoint
+    history = get_history_view(agent, thread_id)
+
+    # Older turns folded out of messages by context compaction
+    if history.conversation_summary:
+        with st.expander("**Earlier conversation (summarized)**", expanded=False):
+            st.markdown(history.conversation_summary)
+
+    # Only the latest turns are rendered, tool payloads on demand
+    render_chat_history(
+        history.messages,
+        thread_id,
+        load_payload=lambda view: load_message_content(agent, thread_id, view.id),
+    )
+
+    prompt = st.session_state.pop(_PENDING_PROMPT_KEY, None)
+    if prompt:
+        _run_agent_turn(prompt, config, selected_thread_id)
+
+    if _SPEECH_KEY in st.session_state:
+        _play_remaining_speech()
+
+
+def _toggle_url_mode() -> None:
+    """Switch the topology iframe between the project and the login page."""
+    st.session_state.gns3_url_mode = (
+        "login" if st.session_state.gns3_url_mode == "project" else "project"
+    )
+
+
+@st.fragment(key="topology_viewer")
+def _render_topology_viewer(project_id: str) -> None:
+    """
+    Render the GNS3 topology iframe with its login/topology switch.
+
+    Switching the URL mode reruns only this fragment.
+
+    Args:
+        project_id: ID of the selected GNS3 project.
+    """
+    st.button(
+        "Login" if st.session_state.gns3_url_mode == "project" else "Topology",
+        icon=":material/login:"
+        if st.session_state.gns3_url_mode == "project"
+        else ":material/device_hub:",
+        help="If the page is not displayed, please click me. Need to perform GNS3 web login once.",
+        on_click=_toggle_url_mode,
+    )
+    # Build the topology iframe URL based on API version and URL mode
+    iframe_url = build_topology_iframe_url(project_id)
+
+    iframe_container = st.container(
+        height=st.session_state.CONTAINER_HEIGHT,
+        # horizontal_alignment="center",
+        vertical_alignment="center",
+        border=False,
+    )
+    with iframe_container:
+        # Set zoom scale (0.7 = 70%, 0.8 = 80%, 0.9 = 90%)
+        zoom_scale = (
+            st.session_state.zoom_scale_topology
+        )  # Scale to 80%, you can adjust between 0.7-0.9
+
+        iframe_html = generate_topology_iframe_html(
+            iframe_url=iframe_url,
+            zoom_scale=zoom_scale,
+            container_height=st.session_state.CONTAINER_HEIGHT,
+        )
+
+        st.markdown(iframe_html, unsafe_allow_html=True)
+
+
 # Initialize session state for thread ID
 if "thread_id" not in st.session_state:
     # If thread_id is not in session_state, create and save a new one
@@ -97,9 +471,10 @@ else:
 
 # --- Get current state ---
 if selected_thread_id:
-    # Historical session: get from agent state
-    snapshot = agent.get_state(config)
-    selected_p = snapshot.values.get("selected_project")
+    # Historical session: get from the session's history view
+    selected_p = get_history_view(
+        agent, config["configurable"]["thread_id"]
+    ).selected_project
 else:
     # New session: get from temp storage
     selected_p = st.session_state.get("temp_selected_project")
@@ -132,6 +507,7 @@ else:
     # Save current project to session_state for sidebar display
     st.session_state["current_project"] = selected_p
 
+
 # --- Main workspace (only visible when a project is selected) ---
 if selected_p:
     # Dynamic column layout based on iframe visibility
@@ -146,397 +522,53 @@ if selected_p:
             border=False,
         )
         with history_container:
-            st.markdown(
-                """
-                <h3 style='text-align: left; font-size: 22px; font-weight: bold; margin-top: 20px;'>Workspace</h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            # StateSnapshot state example test/langgraph_checkpoint.json file
-            # Display previous messages from state history
-            if st.session_state.get("state_history") is not None:
-                # StateSnapshot values dictionary
-                values_dict = st.session_state["state_history"].values
-                message_to_render = values_dict.get("messages", [])
-
-                # Track current open assistant message block
-                current_assistant_block = None
-
-                # StateSnapshot values messages list
-                for message_object in message_to_render:
-                    # Handle different message types
-                    if isinstance(message_object, HumanMessage):
-                        # Close any open assistant chat message block before starting a new user message
-                        if current_assistant_block is not None:
-                            current_assistant_block.__exit__(None, None, None)
-                            current_assistant_block = None
-                        # UserMessage
-                        with st.chat_message("user"):
-                            st.markdown(message_object.content)
-
-                    elif isinstance(message_object, (AIMessage, ToolMessage)):
-                        # Open a new assistant chat message block if none is open
-                        if current_assistant_block is None:
-                            current_assistant_block = st.chat_message("assistant")
-                            current_assistant_block.__enter__()
-
-                        # Handle AIMessage with tool_calls
-                        if isinstance(message_object, AIMessage):
-                            # AIMessage content
-                            # adapted for gemini
-                            # Check if content is a list and safely extract the first text element
-                            if (
-                                isinstance(message_object.content, list)
-                                and message_object.content
-                                and "text" in message_object.content[0]
-                            ):
-                                st.markdown(message_object.content[0]["text"])
-                            # Plain string content
-                            elif isinstance(message_object.content, str):
-                                st.markdown(message_object.content)
-                            # AIMessage tool_calls
-                            if (
-                                isinstance(message_object.tool_calls, list)
-                                and message_object.tool_calls
-                            ):
-                                for tool in message_object.tool_calls:
-                                    tool_id = tool.get("id", "UNKNOWN_ID")
-                                    tool_name = tool.get("name", "UNKNOWN_TOOL")
-                                    tool_args = tool.get("args", {})
-                                    # Display tool call details
-                                    with st.expander(
-                                        f"**Tool Call:** `{tool_name}`",
-                                        expanded=False,
-                                    ):
-                                        st.json(
-                                            {
-                                                # "name": tool_name,
-                                                # "id": tool_id,
-                                                "tool_input": tool_args.get(
-                                                    "tool_input"
-                                                ),
-                                                # "type": "tool_call",
-                                            },
-                                            expanded=True,
-                                        )
-                        # Handle ToolMessage
-                        if isinstance(message_object, ToolMessage):
-                            content_pretty = format_tool_response(
-                                message_object.content
-                            )
-                            with st.expander(
-                                "**Tool Response**",
-                                expanded=False,
-                            ):
-                                st.json(json.loads(content_pretty), expanded=2)
-
-                # Close any remaining open assistant chat message block
-                if current_assistant_block is not None:
-                    current_assistant_block.__exit__(None, None, None)
+            _render_conversation(config, selected_thread_id)
 
     # Only render layout_col2 content when show_iframe is True
     if st.session_state.show_iframe:
         with layout_col2:
-            # Extract project_id from the selected project
-            project_id = selected_p[
-                1
-            ]  # selected_p is a tuple: (name, p_id, dev_count, link_count, status)
-            # Build the topology iframe URL based on API version and URL mode
-            iframe_url = build_topology_iframe_url(project_id)
-
-            iframe_container = st.container(
-                height=st.session_state.CONTAINER_HEIGHT,
-                # horizontal_alignment="center",
-                vertical_alignment="center",
-                border=False,
-            )
-            with iframe_container:
-                # Set zoom scale (0.7 = 70%, 0.8 = 80%, 0.9 = 90%)
-                zoom_scale = (
-                    st.session_state.zoom_scale_topology
-                )  # Scale to 80%, you can adjust between 0.7-0.9
-
-                iframe_html = generate_topology_iframe_html(
-                    iframe_url=iframe_url,
-                    zoom_scale=zoom_scale,
-                    container_height=st.session_state.CONTAINER_HEIGHT,
-                )
-
-                st.markdown(iframe_html, unsafe_allow_html=True)
+            # selected_p is a tuple: (name, p_id, dev_count, link_count, status)
+            _render_topology_viewer(selected_p[1])
 
     # st.divider()
     # --- Chat Input Area ---
-    if st.session_state.show_iframe:
-        # When Show Topology: there are two buttons on the right, needs to be wider
-        # Left column is narrow, middle column is moderate, right column is wider
-        col_ratio = [0.2, 0.6, 0.4]
-    else:
-        # When Hide Topology: there is only one button on the right
-        # Left column is narrow, middle column is wide, right column is moderate
-        col_ratio = [0.2, 0.7, 0.3]
-
-    chat_input_left, chat_input_center, chat_input_right = st.columns(col_ratio)
+    # Left column is narrow, middle column is wide, right column is moderate
+    chat_input_left, chat_input_center, chat_input_right = st.columns([0.2, 0.7, 0.3])
 
     with chat_input_center:
         # Configure chat_input based on switch
         # Get voice enabled setting from session_state (loaded from .env file)
         voice_enabled = st.session_state.get("VOICE", False)
+        # Submitting hands the prompt to the conversation fragment
         if voice_enabled:
-            prompt = st.chat_input(
+            st.chat_input(
                 "Say or record something...",
                 accept_audio=True,
                 audio_sample_rate=24000,
+                key=_PROMPT_KEY,
+                on_submit=_submit_prompt,
                 # width=600,
             )
         else:
             # When voice is disabled, do not enable accept_audio attribute
-            prompt = st.chat_input(
+            st.chat_input(
                 "Type your message here...",
+                key=_PROMPT_KEY,
+                on_submit=_submit_prompt,
                 # width=600
             )
-        # Handle input
-        if prompt:
-            user_text = ""
-            if voice_enabled:
-                # Mode A: prompt is an object (containing .text and .audio)
-                if prompt.audio:
-                    user_text = speech_to_text(prompt.audio)
-                # If voice is not converted to text, or user directly types
-                if not user_text:
-                    user_text = prompt.text
-            else:
-                # Mode B: prompt is directly a string
-                user_text = prompt
-            # 3. Final check and run
-            if not user_text or user_text.strip() == "":
-                st.stop()
-
-            with history_container:
-                # Display user message in chat message container
-                with st.chat_message("user"):
-                    st.markdown(user_text)
-
-            # Migrate temp selected project to agent state for new sessions
-            if not selected_thread_id and st.session_state.get("temp_selected_project"):
-                temp_project = st.session_state["temp_selected_project"]
-                agent.update_state(config, {"selected_project": temp_project})
-                # Don't clear temp_selected_project immediately
-                # It will be cleared after rerun when selected_p is retrieved from agent state
-
-            with history_container:
-                # Display assistant response in chat message container
-                with st.chat_message("assistant"):
-                    active_text_placeholder = st.empty()
-                    current_text_chunk = ""
-                    # Core aggregation state: only stores currently streaming tool information
-                    # Structure: {'id': str, 'name': str, 'args_string': str} or None
-                    current_tool_state = None
-                    # TTS local switch for message control
-                    tts_played = False
-                    # Initialize audio_bytes variable
-                    audio_bytes = None
-                    # Stream the agent response
-                    for chunk in agent.stream(
-                        {
-                            "messages": [HumanMessage(content=user_text)],
-                        },
-                        config=config,
-                        stream_mode="messages",
-                    ):
-                        for msg in chunk:
-                            # with open('log.txt', "a", encoding='utf-8') as f:
-                            #    f.write(f"{msg}\n\n")
-                            if isinstance(msg, AIMessage):
-                                # adapted for gemini
-                                # Check if content is a list and safely extract the first text element
-                                if (
-                                    isinstance(msg.content, list)
-                                    and msg.content
-                                    and "text" in msg.content[0]
-                                ):
-                                    actual_text = msg.content[0]["text"]
-                                    # Now actual_text is the clean text you need
-                                    current_text_chunk += actual_text
-                                    # Only display text in non-voice mode
-                                    if not voice_enabled:
-                                        active_text_placeholder.markdown(
-                                            current_text_chunk, unsafe_allow_html=True
-                                        )
-                                elif isinstance(msg.content, str):
-                                    current_text_chunk += str(msg.content)
-                                    # Only display text in non-voice mode
-                                    if not voice_enabled:
-                                        active_text_placeholder.markdown(
-                                            current_text_chunk, unsafe_allow_html=True
-                                        )
-                                # Determine if text message (i.e., msg.content) reception is complete
-                                is_text_ending = (
-                                    # Case 1: Tool call starts
-                                    msg.tool_calls
-                                    or
-                                    # Case 2: End metadata received
-                                    msg.response_metadata.get("finish_reason")
-                                    in ["tool_calls", "stop"]
-                                )
-                                if (
-                                    is_text_ending
-                                    and not tts_played
-                                    and current_text_chunk.strip()
-                                    and voice_enabled
-                                ):
-                                    # Play once in a round of AIMessage/ToolMessage
-                                    tts_played = True
-                                    # Text_to_speech
-                                    try:
-                                        with st.spinner(
-                                            "Generating voice...", width=200
-                                        ):
-                                            audio_bytes = text_to_speech_wav(
-                                                current_text_chunk
-                                            )
-                                            st.audio(
-                                                audio_bytes,
-                                                format="audio/mp3",
-                                                autoplay=True,
-                                                width=200,
-                                            )
-                                            # Wait for audio playback to complete
-                                            duration = get_duration(audio_bytes)
-                                            logger.info(
-                                                "TTS audio duration: %.2f seconds",
-                                                duration,
-                                            )
-                                            sleep(duration)  # Extra buffer time
-                                    except Exception as e:
-                                        logger.error("TTS Error: %s", e)
-                                        st.error(f"TTS Error: {e}")
-                                # Get metadata (ID and name) from tool_calls
-                                if msg.tool_calls:
-                                    for tool in msg.tool_calls:
-                                        tool_id = tool.get("id")
-                                        # Only when ID is not empty, consider it as the start of a new tool call
-                                        if tool_id:
-                                            # Initialize current tool state (this is the only time to get ID)
-                                            # Note: only one tool can be called at a time
-                                            current_tool_state = {
-                                                "id": tool_id,
-                                                "name": tool.get(
-                                                    "name", "UNKNOWN_TOOL"
-                                                ),
-                                                "args_string": "",
-                                            }
-                                # Concatenate parameter strings from tool_call_chunk
-                                if (
-                                    hasattr(msg, "tool_call_chunks")
-                                    and msg.tool_call_chunks
-                                ):
-                                    if current_tool_state:
-                                        tool_data = current_tool_state
-                                        for chunk_update in msg.tool_call_chunks:
-                                            args_chunk = chunk_update.get("args", "")
-                                            # Core: string concatenation
-                                            if isinstance(args_chunk, str):
-                                                tool_data["args_string"] += args_chunk
-                                # Determine if the tool_calls_chunks output is complete and
-                                # display the st.expander() for tool_calls
-                                if msg.response_metadata.get(
-                                    "finish_reason"
-                                ) == "tool_calls" or (
-                                    msg.response_metadata.get("finish_reason") == "STOP"
-                                    and current_tool_state is not None
-                                ):
-                                    tool_data = current_tool_state
-                                    # Parse complete parameter string
-                                    parsed_args: dict[str, Any] = {}
-                                    try:
-                                        parsed_args = json.loads(
-                                            tool_data["args_string"]
-                                        )
-                                    except json.JSONDecodeError:
-                                        parsed_args = {
-                                            "error": "JSON parse failed after stream complete."
-                                        }
-                                    # Serialize the tool_input value in parsed_args to a JSON array
-                                    # for expansion when using st.json
-                                    try:
-                                        command_list = json.loads(
-                                            parsed_args["tool_input"]
-                                        )
-                                        parsed_args["tool_input"] = command_list
-                                    except (json.JSONDecodeError, KeyError, TypeError):
-                                        pass
-                                    # Build the final display structure that meets your requirements
-                                    display_tool_call = {
-                                        "name": tool_data["name"],
-                                        "id": tool_data["id"],
-                                        # Inject tool_input structure
-                                        "tool_input": parsed_args.get("tool_input"),
-                                        "type": tool_data.get(
-                                            "type", "tool_call"
-                                        ),  # Maintain completeness
-                                    }
-                                    # Update Call Expander, display final parameters (collapsed)
-                                    with st.expander(
-                                        f"**Tool Call:** `{tool_data['name']}`",
-                                        expanded=False,
-                                    ):
-                                        # Use the final complete structure
-                                        st.json(display_tool_call, expanded=False)
-                            if isinstance(msg, ToolMessage):
-                                # Clear state after completion, ready to receive next tool call
-                                current_tool_state = None
-                                content_pretty = format_tool_response(msg.content)
-                                with st.expander(
-                                    "**Tool Response**",
-                                    expanded=False,
-                                ):
-                                    st.json(json.loads(content_pretty), expanded=False)
-                                active_text_placeholder = st.empty()
-                                current_text_chunk = ""
-                                tts_played = False
-                # After the interaction, update the session state with the latest StateSnapshot
-                state_history = agent.get_state(config)
-                # Avoid updating if state_history is empty
-                if not state_history[0]:
-                    pass
-                else:
-                    # Update session state
-                    st.session_state["state_history"] = state_history
-                    # print(state_history)
-                # with open('state_history.txt', "a", encoding='utf-8') as f:
-                #    f.write(f"{state_history}\n\n")
 
     with chat_input_right:
-        # Create two sub-columns in the right column, arrange buttons left and right
-        btn_col1, btn_col2 = st.columns(2)
-        with btn_col1:
-            if st.button(
-                "Hide" if st.session_state.show_iframe else "Show",
-                icon=":material/visibility:"
-                if not st.session_state.show_iframe
-                else ":material/visibility_off:",
-                help="Show or hide the GNS3 project topology iframe",
-            ):
-                st.session_state.show_iframe = not st.session_state.show_iframe
-                st.rerun()
-
-        with btn_col2:
-            if st.session_state.show_iframe:
-                if st.button(
-                    "Login"
-                    if st.session_state.gns3_url_mode == "project"
-                    else "Topology",
-                    icon=":material/login:"
-                    if st.session_state.gns3_url_mode == "project"
-                    else ":material/device_hub:",
-                    help="If the page is not displayed, please click me. Need to perform GNS3 web login once.",
-                ):
-                    st.session_state.gns3_url_mode = (
-                        "login"
-                        if st.session_state.gns3_url_mode == "project"
-                        else "project"
-                    )
-                    st.rerun()
+        # Changes the page layout, so the whole page reruns
+        if st.button(
+            "Hide" if st.session_state.show_iframe else "Show",
+            icon=":material/visibility:"
+            if not st.session_state.show_iframe
+            else ":material/visibility_off:",
+            help="Show or hide the GNS3 project topology iframe",
+        ):
+            st.session_state.show_iframe = not st.session_state.show_iframe
+            st.rerun()
 
     with chat_input_left:
         st.empty()
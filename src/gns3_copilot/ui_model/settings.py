@@ -22,6 +22,7 @@ from gns3_copilot.ui_model.utils import (
     get_all_providers,
     get_provider_config,
     render_update_settings,
+    render_warmup_status,
     save_config,
 )
 
@@ -456,6 +457,66 @@ with st.container(width=800, horizontal_alignment="center", vertical_alignment="
                 "💡 Empty path detected. The default directory **'notes'** will be used."
             )
 
+    with st.expander("Agent Settings", expanded=True):
+        planner_mode = st.checkbox(
+            "Enable Plan-and-Execute Mode",
+            value=st.session_state.get("PLANNER_MODE", False),
+            help="""
+    Let the model submit multi-step work (e.g. create nodes, link them, start
+    them, configure them) as one plan that runs without an LLM round trip per
+    step. Independent steps run concurrently; the model is called again only
+    when the plan has finished or a step failed.
+            """,
+        )
+        st.session_state["PLANNER_MODE"] = planner_mode
+
+        if planner_mode:
+            max_workers = st.session_state.get("PLANNER_MAX_WORKERS", 4)
+            try:
+                max_workers = int(max_workers)
+            except (ValueError, TypeError):
+                max_workers = 4
+            max_workers = max(1, min(16, max_workers))
+            st.slider(
+                "Max Parallel Plan Steps",
+                min_value=1,
+                max_value=16,
+                value=max_workers,
+                step=1,
+                key="PLANNER_MAX_WORKERS",
+                help="""
+    Maximum number of independent plan steps executed at the same time.
+                """,
+            )
+
+        title_modes = ["llm", "heuristic"]
+        title_mode = st.session_state.get("TITLE_MODE", "llm")
+        st.selectbox(
+            "Conversation Title",
+            options=title_modes,
+            index=title_modes.index(title_mode) if title_mode in title_modes else 0,
+            key="TITLE_MODE",
+            help="""
+    How session titles are generated after the first answer (in the background):
+    - **llm**: Ask the model for a short title (falls back to heuristic on errors)
+    - **heuristic**: Use the first sentence of your first message, no extra LLM call
+            """,
+        )
+
+    with st.expander("Startup Warm-up", expanded=True):
+        startup_warmup = st.checkbox(
+            "Warm Up on Startup",
+            value=st.session_state.get("STARTUP_WARMUP", True),
+            help="""
+    After the app starts, connect to the GNS3 server, open the conversation
+    database, compile the agent and load the model provider in the
+    background, so the first message is answered as fast as later ones.
+            """,
+        )
+        st.session_state["STARTUP_WARMUP"] = startup_warmup
+
+        render_warmup_status()
+
     with st.expander("Other Settings", expanded=True):
         english_levels = ["Normal Prompt", "A1", "A2", "B1", "B2", "C1", "C2"]
         eng_level = st.session_state.get("ENGLISH_LEVEL", "Normal Prompt")
@@ -44,16 +44,29 @@ from typing import Any
 import streamlit as st
 
 from gns3_copilot import __version__
-from gns3_copilot.agent import agent, langgraph_checkpointer, list_thread_ids
+from gns3_copilot.agent import (
+    count_sessions,
+    get_session,
+    langgraph_checkpointer,
+    list_sessions,
+    search_sessions,
+)
 from gns3_copilot.agent.checkpoint_utils import (
     export_checkpoint_to_file,
     import_checkpoint_from_file,
 )
 from gns3_copilot.log_config import setup_logger
 from gns3_copilot.ui_model.utils import new_session, save_config
+from gns3_copilot.utils.tool_artifacts import delete_thread_artifacts
 
 logger = setup_logger("chat")
 
+# Sessions listed per page of the session history
+SESSION_PAGE_SIZE = 50
+
+# Sessions shown for a full-text search
+SEARCH_RESULT_LIMIT = 10
+
 
 def render_sidebar(
     current_page: str,
@@ -136,6 +149,39 @@ def render_sidebar(
         return selected_thread_id, title
 
 
+def _pick_search_hit(thread_id: str) -> None:
+    """Select a session found by search (button callback)."""
+    st.session_state["session_search_pick"] = thread_id
+    st.session_state["session_pinned_thread"] = thread_id
+
+
+def _render_session_search() -> None:
+    """Render the full-text session search box and its results."""
+    query = st.text_input(
+        ":material/search: Search Sessions",
+        key="session_search_query",
+        placeholder="e.g. ospf 10.0.0.1",
+        help="Search the messages of all sessions",
+    )
+    if not query.strip():
+        return
+
+    hits = search_sessions(langgraph_checkpointer, query, limit=SEARCH_RESULT_LIMIT)
+    if not hits:
+        st.caption("No matching sessions")
+        return
+
+    for hit in hits:
+        st.button(
+            f"{hit.title or 'New Session'} ({hit.thread_id[:6]})",
+            key=f"session_search_hit_{hit.thread_id}",
+            on_click=_pick_search_hit,
+            args=(hit.thread_id,),
+            use_container_width=True,
+        )
+        st.caption(hit.snippet)
+
+
 def _render_session_management() -> tuple[Any | None, str | None]:
     """
     Render session history and management controls.
@@ -143,24 +189,40 @@ def _render_session_management() -> tuple[Any | None, str | None]:
     Returns:
         Tuple of (selected_thread_id, title)
     """
-    thread_ids = list_thread_ids(langgraph_checkpointer)
+    _render_session_search()
+
+    # One indexed query on the session index instead of loading every checkpoint
+    session_limit = st.session_state.get("session_list_limit", SESSION_PAGE_SIZE)
+    sessions = list_sessions(langgraph_checkpointer, limit=session_limit)
+
+    # Keep a session picked from search results selectable beyond the page
+    pinned_thread = st.session_state.get("session_pinned_thread")
+    if pinned_thread and all(s.thread_id != pinned_thread for s in sessions):
+        pinned_session = get_session(langgraph_checkpointer, pinned_thread)
+        if pinned_session is not None:
+            sessions.append(pinned_session)
 
     # Display name/value are title and id
     # The first option is an empty/placeholder selection
     session_options: list[tuple[str, str | None]] = [("(Please select session)", None)]
 
-    for tid in thread_ids:
-        ckpt = langgraph_checkpointer.get({"configurable": {"thread_id": tid}})
-        title_value = (
-            ckpt.get("channel_values", {}).get("conversation_title") if ckpt else None
-        ) or "New Session"
+    for session in sessions:
+        title_value = session.title or "New Session"
         # Same title name caused to issue where selecting conversations always selected to same thread id.
         # Use part of thread_id to avoid same title name
-        unique_title = f"{title_value} ({tid[:6]})"
-        session_options.append((unique_title, tid))
+        unique_title = f"{title_value} ({session.thread_id[:6]})"
+        session_options.append((unique_title, session.thread_id))
 
     logger.debug("session_options : %s", session_options)
 
+    # Select the session picked from search results
+    search_pick = st.session_state.pop("session_search_pick", None)
+    if search_pick:
+        for option in session_options:
+            if option[1] == search_pick:
+                st.session_state["session_select"] = option
+                break
+
     selected = st.selectbox(
         ":material/history: Session History",
         options=session_options,
@@ -170,6 +232,19 @@ def _render_session_management() -> tuple[Any | None, str | None]:
 
     title, selected_thread_id = selected
 
+    # Load older sessions page by page
+    if len(sessions) >= session_limit:
+        total_sessions = count_sessions(langgraph_checkpointer)
+        if total_sessions > session_limit:
+            if st.button(
+                f":material/expand_more: Show more ({session_limit}/{total_sessions})",
+                key="session_show_more",
+            ):
+                st.session_state["session_list_limit"] = (
+                    session_limit + SESSION_PAGE_SIZE
+                )
+                st.rerun()
+
     logger.debug("selectbox selected : %s, %s", title, selected_thread_id)
 
     st.markdown(
@@ -197,6 +272,7 @@ def _render_session_management() -> tuple[Any | None, str | None]:
         if selected_thread_id is not None:
             if st.button(":material/delete:", help="Delete current selection session"):
                 langgraph_checkpointer.delete_thread(thread_id=selected_thread_id)
+                delete_thread_artifacts(selected_thread_id)
                 st.success(
                     f"_Delete Success_: {title} \n\n _Thread_id_: `{selected_thread_id}`"
                 )
@@ -352,13 +428,10 @@ def _render_session_management() -> tuple[Any | None, str | None]:
                 st.session_state["import_success"] = False
                 st.rerun()
 
-    # If a valid thread id is selected, load the historical messages
+    # If a valid thread id is selected, the chat page loads its history
     if selected_thread_id is not None:
         # Store the selected ID for use in the main interface
         st.session_state["current_thread_id"] = selected_thread_id
-        st.session_state["state_history"] = agent.get_state(
-            {"configurable": {"thread_id": selected_thread_id}}
-        )
 
     return selected_thread_id, title
 
@@ -8,11 +8,15 @@ GNS3 server connectivity checking, update management, and general UI rendering.
 Modules:
     app_ui: General UI rendering functions (sidebar, about page)
     chat_helpers: Chat session management helper functions
+    chat_history: Paginated chat history rendering with lazy tool payloads
     config_manager: Configuration loading and persistence to .env files
     gns3_checker: GNS3 server API connectivity validation
+    history_view: Compact per-session view of the chat history
     project_manager_ui: Project management UI components (create, select projects)
+    stream_renderer: Rate-limited rendering of streamed answer text
     update_ui: Application update checking and UI components
     updater: Core update logic (version checking, update execution)
+    warmup: Background warm-up of connectors, agent and model at startup
 
 Key Functions:
     - check_startup_updates(): Perform startup update checks
@@ -23,7 +27,10 @@ Key Functions:
     - save_config_to_env(): Save configuration to .env file
     - check_gns3_api(): Validate GNS3 server connectivity
     - new_session(): Create a new chat session with unique thread ID
+    - render_chat_history(): Render the latest turns of a conversation
+    - get_history_view(): Compact history of a thread kept in the session
     - render_sidebar_about(): Render sidebar about information
+    - start_warmup(): Warm up connectors, agent and model in the background
 
 Example:
     Import utility functions in UI modules:
@@ -34,6 +41,9 @@ Example:
         )
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from gns3_copilot.ui_model.utils.app_ui import (
     initialize_page_config,
     inject_chat_styles,
@@ -44,12 +54,25 @@ from gns3_copilot.ui_model.utils.chat_helpers import (
     generate_topology_iframe_html,
     new_session,
 )
+from gns3_copilot.ui_model.utils.chat_history import (
+    get_tool_response_cache,
+    render_chat_history,
+)
 from gns3_copilot.ui_model.utils.config_manager import (
     init_app_config,
     load_config,
     save_config,
 )
 from gns3_copilot.ui_model.utils.gns3_checker import check_gns3_api
+from gns3_copilot.ui_model.utils.history_view import (
+    HistoryView,
+    MessageView,
+    StreamedHistory,
+    clear_history_view,
+    get_history_view,
+    load_message_content,
+    session_memory_report,
+)
 from gns3_copilot.ui_model.utils.iframe_viewer import (
     render_iframe_viewer,
 )
@@ -60,15 +83,43 @@ from gns3_copilot.ui_model.utils.llm_providers import (
 from gns3_copilot.ui_model.utils.notes_manager import (  # type: ignore[attr-defined]
     render_notes_editor,
 )
-from gns3_copilot.ui_model.utils.project_manager_ui import (
-    render_create_project_form,
-    render_project_cards,
+from gns3_copilot.ui_model.utils.stream_renderer import (
+    StreamingMarkdown,
+    StreamRenderStats,
 )
 from gns3_copilot.ui_model.utils.update_ui import (
     check_startup_updates,
     render_startup_update_result,
     render_update_settings,
 )
+from gns3_copilot.ui_model.utils.warmup import (
+    get_warmup,
+    render_warmup_status,
+    start_warmup,
+)
+
+if TYPE_CHECKING:
+    from gns3_copilot.ui_model.utils.project_manager_ui import (
+        render_create_project_form,
+        render_project_cards,
+    )
+
+# The project cards import the GNS3 client and its LangChain tools, which
+# pages other than the chat page do not need; they are imported on first access.
+_LAZY_ATTRIBUTES = {
+    "render_create_project_form": "project_manager_ui",
+    "render_project_cards": "project_manager_ui",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the project management UI on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
 
 __all__ = [
     # Iframe Viewer
@@ -79,6 +130,10 @@ __all__ = [
     "check_startup_updates",
     "render_startup_update_result",
     "render_update_settings",
+    # Warm-up
+    "get_warmup",
+    "render_warmup_status",
+    "start_warmup",
     # Config Manager
     "init_app_config",
     "load_config",
@@ -92,6 +147,20 @@ __all__ = [
     "new_session",
     "build_topology_iframe_url",
     "generate_topology_iframe_html",
+    # Chat History
+    "render_chat_history",
+    "get_tool_response_cache",
+    # History View
+    "HistoryView",
+    "MessageView",
+    "StreamedHistory",
+    "clear_history_view",
+    "get_history_view",
+    "load_message_content",
+    "session_memory_report",
+    # Stream Renderer
+    "StreamingMarkdown",
+    "StreamRenderStats",
     # Project Manager UI
     "render_create_project_form",
     "render_project_cards",
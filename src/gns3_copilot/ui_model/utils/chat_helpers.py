@@ -21,6 +21,7 @@ import uuid
 import streamlit as st
 
 from gns3_copilot.log_config import setup_logger
+from gns3_copilot.ui_model.utils.history_view import clear_history_view
 
 logger = setup_logger("chat_helpers")
 
@@ -38,7 +39,7 @@ def new_session(session_options: list[tuple[str, str | None]]) -> None:
 
     Side Effects:
         - Updates st.session_state with new thread_id
-        - Clears current_thread_id, state_history, and temp_selected_project
+        - Clears current_thread_id, the history view, and temp_selected_project
         - Resets session_select to default option (session_options[0])
         - Logs session creation
     """
@@ -49,7 +50,7 @@ def new_session(session_options: list[tuple[str, str | None]]) -> None:
     st.session_state["temp_selected_project"] = None
     # Clear your own state
     st.session_state["current_thread_id"] = None
-    st.session_state["state_history"] = None
+    clear_history_view()
     # Reset the dropdown menu to the first option ("(Please select session)", None)
     st.session_state["session_select"] = session_options[0]
     logger.debug("New Session created with thread_id= %s", new_tid)
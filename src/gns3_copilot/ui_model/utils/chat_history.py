@@ -0,0 +1,270 @@
+"""
+Chat History Rendering for GNS3 Copilot.
+
+Streamlit reruns the chat page on every interaction, so rendering the whole
+message history makes each rerun slower as a session grows. This module keeps
+the rerun cost bounded:
+
+- Only the most recent turns are rendered; older turns are loaded one page at
+  a time with a "Load earlier messages" button.
+- Tool call and tool response expanders are lazy: their payload (including
+  the JSON formatting of tool responses) is only rendered while the expander
+  is open.
+- Formatted tool responses are cached per browser session (see
+  get_tool_response_cache), so an open expander is not formatted again on
+  every rerun.
+
+A turn starts with a user message and contains the assistant and tool
+messages that follow it. Messages are rendered from their compact views (see
+history_view); tool response payloads are loaded on demand.
+
+Functions:
+    split_turns(messages): Split a message list into turns
+    group_message_blocks(messages): Group messages into chat message blocks
+    render_chat_history(messages, thread_id, load_payload=None): Render the
+        visible turns
+    get_tool_response_cache(): Formatted tool responses of this session
+
+Example:
+    from gns3_copilot.ui_model.utils import render_chat_history
+
+    view = get_history_view(agent, thread_id)
+    render_chat_history(view.messages, thread_id, load_payload=...)
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import streamlit as st
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.ui_model.utils.history_view import MessageView, message_view
+from gns3_copilot.utils import ToolResponseCache
+
+logger = setup_logger("chat_history")
+
+# Turns rendered initially and added by each "Load earlier messages" click
+HISTORY_PAGE_TURNS = 10
+
+_VISIBLE_TURNS_KEY = "history_visible_turns"
+_VISIBLE_THREAD_KEY = "history_visible_thread"
+_TOOL_RESPONSE_CACHE_KEY = "tool_response_cache"
+
+HistoryMessage = BaseMessage | MessageView
+
+# Turns and blocks keep the message type they are built from
+M = TypeVar("M", bound=HistoryMessage)
+
+
+def _role(message: HistoryMessage) -> str | None:
+    """Chat role of a message: "user", "assistant", "tool" or None."""
+    if isinstance(message, MessageView):
+        return message.role
+    if isinstance(message, HumanMessage):
+        return "user"
+    if isinstance(message, AIMessage):
+        return "assistant"
+    if isinstance(message, ToolMessage):
+        return "tool"
+    return None
+
+
+def split_turns(messages: Sequence[M]) -> list[list[M]]:
+    """
+    Split a message list into turns, each starting with a user message.
+
+    Messages before the first user message form a turn of their own.
+
+    Args:
+        messages: Messages (or message views) of a conversation.
+
+    Returns:
+        list: Turns as lists of messages, in order.
+    """
+    turns: list[list[M]] = []
+    for message in messages:
+        if _role(message) == "user" or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def group_message_blocks(
+    messages: Sequence[M],
+) -> list[tuple[str, list[M]]]:
+    """
+    Group messages into chat message blocks.
+
+    Each user message is a block of its own; consecutive AI and tool messages
+    share one assistant block. Other message types are skipped.
+
+    Args:
+        messages: Messages (or message views) to group.
+
+    Returns:
+        list: (role, messages) tuples with role "user" or "assistant".
+    """
+    blocks: list[tuple[str, list[M]]] = []
+    for message in messages:
+        role = _role(message)
+        if role == "user":
+            blocks.append(("user", [message]))
+        elif role in ("assistant", "tool"):
+            if blocks and blocks[-1][0] == "assistant":
+                blocks[-1][1].append(message)
+            else:
+                blocks.append(("assistant", [message]))
+    return blocks
+
+
+def get_tool_response_cache() -> ToolResponseCache:
+    """
+    Get the tool response cache of the current browser session.
+
+    Returns:
+        ToolResponseCache: Cache kept in st.session_state across reruns.
+    """
+    cache = st.session_state.get(_TOOL_RESPONSE_CACHE_KEY)
+    if cache is None:
+        cache = ToolResponseCache()
+        st.session_state[_TOOL_RESPONSE_CACHE_KEY] = cache
+    return cache
+
+
+def _visible_turns(thread_id: str | None) -> int:
+    """Get the number of rendered turns, reset when the thread changes."""
+    if st.session_state.get(_VISIBLE_THREAD_KEY) != thread_id:
+        st.session_state[_VISIBLE_THREAD_KEY] = thread_id
+        st.session_state[_VISIBLE_TURNS_KEY] = HISTORY_PAGE_TURNS
+    return int(st.session_state.get(_VISIBLE_TURNS_KEY, HISTORY_PAGE_TURNS))
+
+
+def _load_earlier() -> None:
+    st.session_state[_VISIBLE_TURNS_KEY] = (
+        st.session_state.get(_VISIBLE_TURNS_KEY, HISTORY_PAGE_TURNS)
+        + HISTORY_PAGE_TURNS
+    )
+
+
+def _widget_key(kind: str, message: MessageView, suffix: Any) -> str:
+    return f"history_{kind}_{message.id}_{suffix}"
+
+
+def _render_ai_message(message: MessageView, position: int) -> None:
+    if message.text:
+        st.markdown(message.text)
+
+    for index, tool in enumerate(message.tool_calls):
+        expander = st.expander(
+            f"**Tool Call:** `{tool.name}`",
+            expanded=False,
+            key=_widget_key("tool_call", message, f"{position}_{index}"),
+            on_change="rerun",
+        )
+        if expander.open:
+            with expander:
+                st.json({"tool_input": tool.tool_input}, expanded=True)
+
+
+def _render_tool_message(
+    message: MessageView,
+    position: int,
+    load_payload: Callable[[MessageView], Any],
+) -> None:
+    expander = st.expander(
+        "**Tool Response**",
+        expanded=False,
+        key=_widget_key("tool_response", message, position),
+        on_change="rerun",
+    )
+    if expander.open:
+        with expander:
+            cache = get_tool_response_cache()
+            response = None
+            if message.payload_digest is not None:
+                response = cache.lookup(message.id, message.payload_digest)
+            if response is None:
+                content = load_payload(message)
+                if content is None:
+                    st.caption("This tool response is no longer stored.")
+                    return
+                response = cache.get(content, message.id)
+            st.json(response.data, expanded=2)
+
+
+def _as_views(
+    messages: Sequence[HistoryMessage],
+) -> tuple[list[MessageView], dict[int, Any]]:
+    """Convert messages to views, keeping the payloads of tool messages."""
+    views: list[MessageView] = []
+    payloads: dict[int, Any] = {}
+    for message in messages:
+        if isinstance(message, MessageView):
+            views.append(message)
+            continue
+        view = message_view(message)
+        if view is None:
+            continue
+        if isinstance(message, ToolMessage):
+            payloads[id(view)] = message.content
+        views.append(view)
+    return views, payloads
+
+
+def render_chat_history(
+    messages: Sequence[HistoryMessage],
+    thread_id: str | None,
+    load_payload: Callable[[MessageView], Any] | None = None,
+) -> None:
+    """
+    Render the most recent turns of a conversation.
+
+    Must be called inside the history container of the chat page.
+
+    Args:
+        messages: All messages of the conversation, as message views or
+                  LangChain messages.
+        thread_id: Thread ID; switching threads resets the number of
+                   rendered turns.
+        load_payload: Loads the payload of a tool response view when its
+                      expander is opened; payloads of LangChain messages
+                      passed in are used directly.
+    """
+    views, payloads = _as_views(messages)
+
+    def payload_of(view: MessageView) -> Any:
+        if id(view) in payloads:
+            return payloads[id(view)]
+        return load_payload(view) if load_payload is not None else None
+
+    turns = split_turns(views)
+    first_turn = max(0, len(turns) - _visible_turns(thread_id))
+    logger.debug("Rendering turns %d-%d of %d", first_turn + 1, len(turns), len(turns))
+
+    if first_turn:
+        st.button(
+            f"Load earlier messages ({first_turn} earlier turns)",
+            key="history_load_earlier",
+            on_click=_load_earlier,
+            type="tertiary",
+        )
+
+    # Message positions make widget keys unique for messages without an ID
+    offset = sum(len(turn) for turn in turns[:first_turn])
+    visible = [message for turn in turns[first_turn:] for message in turn]
+    positions = {id(message): offset + i for i, message in enumerate(visible)}
+
+    for turn in turns[first_turn:]:
+        for role, block in group_message_blocks(turn):
+            with st.chat_message(role):
+                for message in block:
+                    if message.role == "user":
+                        st.markdown(message.text)
+                    elif message.role == "assistant":
+                        _render_ai_message(message, positions[id(message)])
+                    elif message.role == "tool":
+                        _render_tool_message(
+                            message, positions[id(message)], payload_of
+                        )
@@ -21,6 +21,7 @@ Configuration Categories:
 
 Constants:
     CONFIG_MAP: Mapping between Streamlit widget keys and config keys
+    BOOLEAN_CONFIG_KEYS: Session state keys holding checkbox values
     MODEL_PROVIDERS: List of supported LLM model providers
     TTS_MODELS: Supported text-to-speech models
     TTS_VOICES: Available voice options for TTS
@@ -66,6 +67,11 @@ CONFIG_MAP = {
     "MODEL_API_KEY": "MODEL_API_KEY",
     "BASE_URL": "BASE_URL",
     "TEMPERATURE": "TEMPERATURE",
+    # Agent Configuration
+    "PLANNER_MODE": "PLANNER_MODE",
+    "PLANNER_MAX_WORKERS": "PLANNER_MAX_WORKERS",
+    "TITLE_MODE": "TITLE_MODE",
+    "STARTUP_WARMUP": "STARTUP_WARMUP",
     # Voice Configuration
     "VOICE": "VOICE",
     # Voice TTS Configuration
@@ -97,6 +103,9 @@ CONFIG_MAP = {
     "TTS_X_TITLE": "TTS_X_TITLE",
 }
 
+# Session state keys holding checkbox (boolean) values
+BOOLEAN_CONFIG_KEYS = ("VOICE", "PLANNER_MODE", "STARTUP_WARMUP")
+
 
 def init_app_config() -> None:
     """Initialize the application configuration database.
@@ -167,8 +176,8 @@ def load_config() -> None:
             st.session_state[st_key] = config_value
             continue
 
-        # Special handling for VOICE (boolean)
-        if st_key == "VOICE":
+        # Special handling for checkbox values (boolean)
+        if st_key in BOOLEAN_CONFIG_KEYS:
             voice_str = str(config_value).lower().strip()
             if voice_str not in (
                 "true",
@@ -182,7 +191,9 @@ def load_config() -> None:
                 "",
             ):
                 logger.debug(
-                    "Invalid VOICE value: %s, setting to default 'false'", config_value
+                    "Invalid %s value: %s, setting to default 'false'",
+                    st_key,
+                    config_value,
                 )
                 voice_str = "false"
             is_enabled: bool = voice_str in ("true", "1", "yes", "on")
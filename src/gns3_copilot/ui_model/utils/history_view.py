@@ -0,0 +1,369 @@
+"""
+Compact Chat History View for GNS3 Copilot.
+
+The chat page used to keep the full LangGraph StateSnapshot of the open
+session in st.session_state: every message including all tool payloads, and
+the selected project. It was held for every connected browser session and
+fetched again after every turn.
+
+HistoryView is what the page keeps instead: message IDs, roles and text,
+tool call metadata, and for tool responses only a short preview plus a
+digest referencing the payload. Payloads are loaded from the checkpoint when
+a tool response is opened. After a turn the view is extended from the
+streamed messages rather than fetched again; it is only reloaded when the
+stream shows that the stored history was rewritten (context compaction).
+
+Classes:
+    HistoryView: Compact history of one conversation thread
+    MessageView: One message of a HistoryView
+    ToolCallView: Tool call of an assistant message
+    StreamedHistory: Extends a HistoryView from agent.stream() messages
+
+Functions:
+    message_view(message): Compact view of a LangChain message
+    get_history_view(graph, thread_id): Session's view, loaded on demand
+    clear_history_view(): Drop the session's view
+    load_message_content(graph, thread_id, message_id): Load a payload
+    session_memory_report(): Estimated size of the session state entries
+
+Example:
+    view = get_history_view(agent, thread_id)
+    render_chat_history(view.messages, thread_id, load_payload=...)
+"""
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any
+
+import streamlit as st
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    ToolMessage,
+)
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils import content_digest
+
+logger = setup_logger("history_view")
+
+# Characters of a tool response kept in the view as preview
+PREVIEW_CHARS = 200
+
+# Graph nodes whose streamed messages rewrite the stored history
+_REWRITING_NODES = frozenset({"compact_context"})
+
+_HISTORY_VIEW_KEY = "history_view"
+
+
+@dataclass(frozen=True)
+class ToolCallView:
+    """
+    Tool call of an assistant message.
+
+    Attributes:
+        id: Tool call ID
+        name: Tool name
+        tool_input: The tool_input argument, as shown in the tool call expander
+    """
+
+    id: str | None
+    name: str
+    tool_input: Any = None
+
+
+@dataclass(frozen=True)
+class MessageView:
+    """
+    Compact view of one message.
+
+    Attributes:
+        id: Message ID
+        role: "user", "assistant" or "tool"
+        text: Message text; for tool responses a preview of the payload
+        tool_calls: Tool calls of an assistant message
+        tool_name: Tool that produced a tool response
+        payload_digest: Digest of the tool response payload (see
+                        content_digest), None for other messages
+        payload_size: Size of the tool response payload in bytes
+    """
+
+    id: str | None
+    role: str
+    text: str
+    tool_calls: tuple[ToolCallView, ...] = ()
+    tool_name: str | None = None
+    payload_digest: str | None = None
+    payload_size: int = 0
+
+
+def _text_of(content: Any) -> str:
+    """Text of message content; Gemini returns a list of parts."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list) and content:
+        first_part = content[0]
+        if isinstance(first_part, dict) and "text" in first_part:
+            return str(first_part["text"])
+    return ""
+
+
+def message_view(message: BaseMessage) -> MessageView | None:
+    """
+    Build the compact view of a message.
+
+    Args:
+        message: Message from the checkpoint or the agent stream.
+
+    Returns:
+        MessageView, or None for messages not shown in the chat (e.g. system
+        messages)
+    """
+    if isinstance(message, HumanMessage):
+        return MessageView(message.id, "user", _text_of(message.content))
+    if isinstance(message, AIMessage):
+        tool_calls = tuple(
+            ToolCallView(
+                call.get("id"),
+                call.get("name") or "UNKNOWN_TOOL",
+                (call.get("args") or {}).get("tool_input"),
+            )
+            for call in message.tool_calls or []
+        )
+        return MessageView(
+            message.id, "assistant", _text_of(message.content), tool_calls
+        )
+    if isinstance(message, ToolMessage):
+        digest, size = content_digest(message.content)
+        preview = message.content if isinstance(message.content, str) else ""
+        return MessageView(
+            message.id,
+            "tool",
+            preview[:PREVIEW_CHARS],
+            tool_name=message.name,
+            payload_digest=digest,
+            payload_size=size,
+        )
+    return None
+
+
+@dataclass
+class HistoryView:
+    """
+    Compact history of one conversation thread.
+
+    Attributes:
+        thread_id: Conversation thread
+        messages: Message views, oldest first
+        conversation_summary: Summary of turns folded out by context compaction
+        selected_project: Project tuple selected for the thread
+        stale: Whether the view no longer matches the checkpoint and has to be
+               loaded again
+    """
+
+    thread_id: str
+    messages: list[MessageView] = field(default_factory=list)
+    conversation_summary: str | None = None
+    selected_project: Any = None
+    stale: bool = False
+
+    @classmethod
+    def from_state(cls, thread_id: str, values: Mapping[str, Any]) -> "HistoryView":
+        """
+        Build the view of a checkpoint state.
+
+        Args:
+            thread_id: Conversation thread.
+            values: StateSnapshot values.
+
+        Returns:
+            HistoryView of the state
+        """
+        view = cls(
+            thread_id,
+            conversation_summary=values.get("conversation_summary"),
+            selected_project=values.get("selected_project"),
+        )
+        for message in values.get("messages", []):
+            view.add_message(message)
+        return view
+
+    def add_message(self, message: BaseMessage) -> None:
+        """
+        Append a message.
+
+        Args:
+            message: Complete message.
+        """
+        view = message_view(message)
+        if view is not None:
+            self.messages.append(view)
+
+    def payload_bytes(self) -> int:
+        """Total size of the tool payloads referenced (not held) by the view."""
+        return sum(message.payload_size for message in self.messages)
+
+
+class StreamedHistory:
+    """
+    Extends a HistoryView with the messages of an agent run.
+
+    Streamed AI message chunks are merged per message ID and appended once
+    the message is complete; tool responses are appended as they arrive.
+    The view is marked stale while the run is in progress, so an interrupted
+    run is reloaded from the checkpoint, and after a run that rewrote the
+    stored history.
+    """
+
+    def __init__(self, view: HistoryView) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            view: View to extend.
+        """
+        self.view = view
+        self.view.stale = True
+        self._chunk: AIMessageChunk | None = None
+        self._rewritten = False
+
+    def add(self, message: BaseMessage, metadata: Mapping[str, Any]) -> None:
+        """
+        Add a message from agent.stream(stream_mode="messages").
+
+        Args:
+            message: Streamed message or message chunk.
+            metadata: Stream metadata of the message.
+        """
+        if metadata.get("langgraph_node") in _REWRITING_NODES:
+            self._rewritten = True
+            return
+        if isinstance(message, AIMessageChunk):
+            if self._chunk is not None and self._chunk.id == message.id:
+                self._chunk = self._chunk + message
+                return
+            self._flush()
+            self._chunk = message
+            return
+        self._flush()
+        if isinstance(message, (AIMessage, ToolMessage)):
+            self.view.add_message(message)
+
+    def _flush(self) -> None:
+        if self._chunk is not None:
+            self.view.add_message(self._chunk)
+            self._chunk = None
+
+    def finish(self) -> None:
+        """Append the last streamed message after a completed run."""
+        self._flush()
+        self.view.stale = self._rewritten
+
+
+def get_history_view(graph: Any, thread_id: str) -> HistoryView:
+    """
+    Get the history view of the current browser session.
+
+    The view is loaded from the checkpoint when the thread changed, when it
+    is stale, or while no project is selected for the thread (the selection
+    is stored in the checkpoint by the project cards).
+
+    Args:
+        graph: Compiled LangGraph agent.
+        thread_id: Conversation thread.
+
+    Returns:
+        HistoryView of the thread
+    """
+    view = st.session_state.get(_HISTORY_VIEW_KEY)
+    if (
+        isinstance(view, HistoryView)
+        and view.thread_id == thread_id
+        and not view.stale
+        and view.selected_project
+    ):
+        return view
+    snapshot = graph.get_state({"configurable": {"thread_id": thread_id}})
+    view = HistoryView.from_state(thread_id, snapshot.values or {})
+    st.session_state[_HISTORY_VIEW_KEY] = view
+    logger.debug(
+        "Loaded history view of %s: %d messages, %d payload bytes not held",
+        thread_id,
+        len(view.messages),
+        view.payload_bytes(),
+    )
+    return view
+
+
+def clear_history_view() -> None:
+    """Drop the history view of the current browser session."""
+    st.session_state.pop(_HISTORY_VIEW_KEY, None)
+
+
+def load_message_content(graph: Any, thread_id: str, message_id: str | None) -> Any:
+    """
+    Load the content of a message from the latest checkpoint.
+
+    Args:
+        graph: Compiled LangGraph agent.
+        thread_id: Conversation thread.
+        message_id: Message ID.
+
+    Returns:
+        Message content, or None if the message is no longer stored
+    """
+    if message_id is None:
+        return None
+    snapshot = graph.get_state({"configurable": {"thread_id": thread_id}})
+    for message in (snapshot.values or {}).get("messages", []):
+        if message.id == message_id:
+            return message.content
+    return None
+
+
+def estimate_size(obj: Any, _seen: set[int] | None = None) -> int:
+    """
+    Estimate the memory held by an object and the objects it references.
+
+    Args:
+        obj: Object to measure.
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, Mapping):
+        return size + sum(
+            estimate_size(key, seen) + estimate_size(value, seen)
+            for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen) for item in obj)
+    if is_dataclass(obj):
+        return size + sum(
+            estimate_size(getattr(obj, f.name), seen) for f in fields(obj)
+        )
+    attributes = getattr(obj, "__dict__", None)
+    if isinstance(attributes, dict):
+        return size + estimate_size(attributes, seen)
+    return size
+
+
+def session_memory_report() -> dict[str, int]:
+    """
+    Estimate the memory held by each entry of the session state.
+
+    Returns:
+        Estimated bytes per session state key, largest first
+    """
+    report = {str(key): estimate_size(value) for key, value in st.session_state.items()}
+    return dict(sorted(report.items(), key=lambda item: item[1], reverse=True))
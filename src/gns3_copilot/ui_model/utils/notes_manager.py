@@ -3,7 +3,8 @@
 Notes management component for creating and managing markdown notes.
 
 This module provides a comprehensive notes management system with:
-- Note editor with auto-save functionality
+- Note editor with debounced write-behind auto-save (see notes_store),
+  rerunning independently of the page
 - Notes list with selection
 - Download and delete operations
 - Create new notes
@@ -16,10 +17,12 @@ from datetime import datetime
 
 import streamlit as st
 from langchain_core.messages import HumanMessage, SystemMessage
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from gns3_copilot.agent.model_factory import create_note_organizer_model
 from gns3_copilot.log_config import setup_logger
 from gns3_copilot.prompts.notes_prompt import SYSTEM_PROMPT
+from gns3_copilot.ui_model.utils.notes_store import get_notes_store
 
 logger = setup_logger("notes_manager")
 
@@ -34,6 +37,20 @@ if "new_note_name" not in st.session_state:
     st.session_state.new_note_name = ""
 
 
+def _rerun_notes() -> None:
+    """
+    Rerun the notes editor after a state change.
+
+    Only the editor fragment reruns when it is running on its own (e.g. after
+    a widget in it changed); during a full page run, where a fragment-scoped
+    rerun is not allowed, the page reruns.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.fragment_ids_this_run:
+        st.rerun(scope="fragment")
+    st.rerun()
+
+
 def get_notes_directory() -> str:
     """
     Get the notes directory path from session state or default.
@@ -76,24 +93,23 @@ def list_note_files() -> list[str]:
     """
     List all markdown note files in the notes directory.
 
+    The list comes from the directory index of the notes store, which is
+    only rescanned after the directory changed.
+
     Returns:
         A sorted list of markdown filenames.
     """
     notes_dir = ensure_notes_directory()
-    note_files = []
     try:
-        for filename in os.listdir(notes_dir):
-            if filename.endswith(".md"):
-                note_files.append(filename)
-        note_files.sort()  # Sort alphabetically
+        return get_notes_store(notes_dir).list_notes()
     except Exception as e:
         logger.error("Failed to list note files: %s", e)
-    return note_files
+        return []
 
 
 def load_note_content(filename: str) -> str:
     """
-    Load note content from file.
+    Load note content from file, including edits not yet auto-saved.
 
     Args:
         filename: The name of the note file to load.
@@ -102,10 +118,8 @@ def load_note_content(filename: str) -> str:
         The content of the note file, or empty string on error.
     """
     notes_dir = ensure_notes_directory()
-    filepath = os.path.join(notes_dir, filename)
     try:
-        with open(filepath, encoding="utf-8") as f:
-            content = f.read()
+        content = get_notes_store(notes_dir).load(filename)
         logger.debug("Loaded note: %s", filename)
         return content
     except Exception as e:
@@ -115,7 +129,7 @@ def load_note_content(filename: str) -> str:
 
 def save_note_content(filename: str, content: str) -> bool:
     """
-    Save note content to file.
+    Save note content to file now (atomically).
 
     Args:
         filename: The name of the note file to save.
@@ -125,10 +139,8 @@ def save_note_content(filename: str, content: str) -> bool:
         True if successful, False otherwise.
     """
     notes_dir = ensure_notes_directory()
-    filepath = os.path.join(notes_dir, filename)
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        get_notes_store(notes_dir).save(filename, content)
         logger.info("Saved note: %s", filename)
         return True
     except Exception as e:
@@ -147,9 +159,8 @@ def delete_note_file(filename: str) -> bool:
         True if successful, False otherwise.
     """
     notes_dir = ensure_notes_directory()
-    filepath = os.path.join(notes_dir, filename)
     try:
-        os.remove(filepath)
+        get_notes_store(notes_dir).delete(filename)
         logger.info("Deleted note: %s", filename)
         return True
     except Exception as e:
@@ -171,8 +182,8 @@ def _save_and_rerun_note(note_name: str, filepath: str, initial_content: str) ->
         filepath: Full path to the note file.
         initial_content: Initial content to write to the file.
     """
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(initial_content)
+    store = get_notes_store(os.path.dirname(filepath))
+    store.save(os.path.basename(filepath), initial_content)
     logger.info("Created new note: %s", note_name)
     # Clear the input field after successful creation and rerun to update UI
     st.session_state.new_note_name = ""
@@ -198,19 +209,14 @@ def create_new_note() -> None:
         note_name = note_name.replace(char, "_")
 
     notes_dir = ensure_notes_directory()
-    filepath = os.path.join(notes_dir, note_name)
-
-    # Check if file already exists
-    if os.path.exists(filepath):
-        st.error(f"Note '{note_name}' already exists.")
-        return
 
-    # Create empty note with header
+    # Create empty note with header, unless the file already exists
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         initial_content = f"# {note_name[:-3]}\n\nCreated: {timestamp}\n\n"
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(initial_content)
+        if not get_notes_store(notes_dir).create(note_name, initial_content):
+            st.error(f"Note '{note_name}' already exists.")
+            return
         logger.info("Created new note: %s", note_name)
         # Clear the input field and set flag to trigger rerun
         st.session_state.new_note_name = ""
@@ -317,7 +323,7 @@ def render_ai_organize_button() -> None:
     ):
         # Set a flag to show the organizer expander
         st.session_state.show_ai_organizer = True
-        st.rerun()
+        _rerun_notes()
 
     # Show AI Organizer expander if flag is set
     if st.session_state.get("show_ai_organizer", False):
@@ -379,7 +385,7 @@ def render_ai_organize_button() -> None:
                     if "organized_content" in st.session_state:
                         del st.session_state.organized_content
                         del st.session_state.original_content
-                    st.rerun()
+                    _rerun_notes()
             with col2:
                 if st.button(
                     "Confirm & Apply",
@@ -398,7 +404,7 @@ def render_ai_organize_button() -> None:
                         if "organized_content" in st.session_state:
                             del st.session_state.organized_content
                             del st.session_state.original_content
-                        st.rerun()
+                        _rerun_notes()
                     else:
                         st.error("Failed to save organized note")
 
@@ -413,11 +419,16 @@ def render_ai_organize_button() -> None:
                 if "organized_content" in st.session_state:
                     del st.session_state.organized_content
                     del st.session_state.original_content
-                st.rerun()
+                _rerun_notes()
 
 
 def auto_save_note() -> None:
-    """Auto-save note content on text area change."""
+    """
+    Auto-save note content on text area change.
+
+    The edit is journaled and written in the background once the note has
+    been idle for a moment, so consecutive edits cost one file write.
+    """
     if st.session_state.current_note_filename:
         # Get the current content from the text area
         editor_key = (
@@ -427,12 +438,24 @@ def auto_save_note() -> None:
         )
         current_content = st.session_state.get(editor_key, "")
 
-        # Save to file
-        if save_note_content(st.session_state.current_note_filename, current_content):
-            st.session_state.current_note_content = current_content
-            logger.debug("Auto-saved note: %s", st.session_state.current_note_filename)
+        try:
+            get_notes_store(ensure_notes_directory()).submit(
+                st.session_state.current_note_filename, current_content
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to auto-save note %s: %s",
+                st.session_state.current_note_filename,
+                e,
+            )
+            return
+        st.session_state.current_note_content = current_content
+        logger.debug(
+            "Queued auto-save of note: %s", st.session_state.current_note_filename
+        )
 
 
+@st.fragment
 def render_notes_editor(
     container_height: int | None = None,
     show_title: bool = True,
@@ -440,6 +463,9 @@ def render_notes_editor(
     """
     Render the notes editor component.
 
+    The editor is a fragment: typing, auto-save and note management rerun
+    only the editor, not the rest of the page (e.g. the ebook viewer).
+
     Args:
         container_height: Optional height for the editor. If None, will try to
                          get from session state with key "CONTAINER_HEIGHT".
@@ -456,7 +482,7 @@ def render_notes_editor(
     # Check rerun flag set by callback functions
     if st.session_state.get("rerun", False):
         st.session_state.rerun = False
-        st.rerun()
+        _rerun_notes()
 
     # Get container height
     if container_height is None:
@@ -554,7 +580,7 @@ def render_notes_editor(
                                 key="cancel_popover_btn",
                                 use_container_width=True,
                             ):
-                                st.rerun()
+                                _rerun_notes()
                         with col2:
                             if st.button(
                                 "Delete",
@@ -568,7 +594,7 @@ def render_notes_editor(
                                     st.success("Note deleted!")
                                     st.session_state.current_note_filename = None
                                     st.session_state.current_note_content = ""
-                                    st.rerun()
+                                    _rerun_notes()
 
                 # Load selected note if different from current
                 if selected_note != st.session_state.current_note_filename:
@@ -576,7 +602,7 @@ def render_notes_editor(
                     st.session_state.current_note_content = load_note_content(
                         selected_note
                     )
-                    st.rerun()
+                    _rerun_notes()
             else:
                 st.info("No notes found.")
                 st.session_state.current_note_filename = None
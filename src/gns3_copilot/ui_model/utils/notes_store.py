@@ -0,0 +1,533 @@
+"""
+Notes Store for the Reading Page.
+
+The notes editor used to list the notes directory on every render and
+rewrite the whole Markdown file on every edit. With hundreds of notes and
+long documents both made the reading page stutter. NotesStore keeps the
+notes of one directory behind three mechanisms:
+
+- Directory index: the note list is cached and only rescanned when the
+  modification time of the directory changes (files added, removed or
+  replaced). A directory modified within the timestamp granularity of the
+  last scan is rescanned again, so changes in the same tick are not missed.
+- Write-behind autosave: edits are kept in memory and written by a
+  background thread once the note has been idle for a short delay. Several
+  edits of the same note are coalesced into one write.
+- Journal: the latest autosaved edit of a note is kept in a journal file
+  in a hidden subdirectory (".journal/<note>.journal"), so journal writes
+  do not touch the mtime of the notes directory and invalidate the index.
+  The journal is rewritten at most once per journal interval while a note
+  is being edited and removed once the edit is written, so it never holds
+  more than one version per note. Edits that were not written when the
+  process died are restored from the journals the next time the store is
+  opened; at most the edits of the last interval are lost.
+
+Notes are always written atomically (temporary file, fsync, rename), so a
+note on disk is either the old or the new version, never a partial one.
+
+Classes:
+    NotesStore: Indexed, write-behind store of the notes of one directory
+    NotesStoreStats: Scan, write and recovery counters
+
+Functions:
+    write_atomic(path, content): Replace a file atomically
+    get_notes_store(directory): Process-wide store of a notes directory
+
+Constants:
+    NOTE_SUFFIX: File suffix of notes
+    JOURNAL_DIR: Subdirectory of the notes directory holding the journals
+    JOURNAL_SUFFIX: File suffix of the per-note journals
+    JOURNAL_INTERVAL_SECONDS: Minimum time between journal writes of a note
+    AUTOSAVE_DELAY_SECONDS: Idle time before an edit is written
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, replace
+
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("notes_store")
+
+NOTE_SUFFIX = ".md"
+JOURNAL_DIR = ".journal"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_INTERVAL_SECONDS = 2.0
+AUTOSAVE_DELAY_SECONDS = 1.0
+
+# Delay before a failed autosave is retried
+RETRY_DELAY_SECONDS = 10.0
+
+# Directory mtimes closer than this to the last scan may hide later changes
+# made within the same timestamp tick (coarse filesystem timestamps)
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def write_atomic(path: str, content: str) -> None:
+    """
+    Replace a file atomically with new text content.
+
+    Args:
+        path: File to write.
+        content: Text to store (UTF-8).
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@dataclass
+class NotesStoreStats:
+    """
+    Counters of a NotesStore.
+
+    Attributes:
+        scans: Directory scans for the note list
+        writes: Notes written to disk
+        coalesced: Autosaved edits replaced by a later edit before writing
+        recovered: Notes restored from the journal
+    """
+
+    scans: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    recovered: int = 0
+
+
+@dataclass
+class _PendingEdit:
+    content: str
+    due: float
+    seq: int
+
+
+class NotesStore:
+    """
+    Indexed, write-behind store of the Markdown notes of one directory.
+
+    All methods are safe to use from several threads (Streamlit sessions).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        delay: float = AUTOSAVE_DELAY_SECONDS,
+        journal_interval: float = JOURNAL_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Open the store and restore edits left in the journal.
+
+        Args:
+            directory: Notes directory, created if missing.
+            delay: Idle time in seconds before an autosaved edit is written.
+            journal_interval: Minimum time in seconds between two journal
+                writes of the same note.
+        """
+        self.directory = directory
+        self.delay = delay
+        self.journal_interval = journal_interval
+        self._journal_dir = os.path.join(directory, JOURNAL_DIR)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Condition()
+        # Orders journal writes and removals; held without the store lock
+        self._journal_lock = threading.Lock()
+        # Serializes note writes, so an older autosave never replaces a newer save
+        self._write_lock = threading.Lock()
+        self._names: list[str] | None = None
+        self._dir_mtime_ns = 0
+        self._scanned_ns = 0
+        self._pending: dict[str, _PendingEdit] = {}
+        self._seq = 0
+        # Monotonic time of the last journal write per note
+        self._journaled_at: dict[str, float] = {}
+        self._stats = NotesStoreStats()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._recover_journal()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _journal_path(self, name: str) -> str:
+        return os.path.join(self._journal_dir, f"{name}{JOURNAL_SUFFIX}")
+
+    # ----- Directory index -----
+
+    def list_notes(self) -> list[str]:
+        """
+        List the notes of the directory, rescanning only after a change.
+
+        Returns:
+            Sorted note file names
+        """
+        try:
+            dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            os.makedirs(self.directory, exist_ok=True)
+            dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+        with self._lock:
+            if (
+                self._names is not None
+                and dir_mtime_ns == self._dir_mtime_ns
+                and self._scanned_ns - dir_mtime_ns > _RACY_MTIME_NS
+            ):
+                return list(self._names)
+            scanned_ns = time.time_ns()
+            with os.scandir(self.directory) as it:
+                names = sorted(
+                    entry.name
+                    for entry in it
+                    if entry.name.endswith(NOTE_SUFFIX)
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                )
+            self._names = names
+            self._dir_mtime_ns = dir_mtime_ns
+            self._scanned_ns = scanned_ns
+            self._stats.scans += 1
+            return list(names)
+
+    # ----- Reading and writing -----
+
+    def load(self, name: str) -> str:
+        """
+        Load a note, including edits not yet written.
+
+        Args:
+            name: Note file name.
+
+        Returns:
+            Note content
+
+        Raises:
+            OSError: If the note cannot be read
+        """
+        with self._lock:
+            pending = self._pending.get(name)
+            if pending is not None:
+                return pending.content
+        with open(self._path(name), encoding="utf-8") as f:
+            return f.read()
+
+    def save(self, name: str, content: str) -> None:
+        """
+        Write a note now, replacing edits not yet written.
+
+        Args:
+            name: Note file name.
+            content: Note content.
+
+        Raises:
+            OSError: If the note cannot be written
+        """
+        with self._write_lock:
+            with self._lock:
+                self._pending.pop(name, None)
+            write_atomic(self._path(name), content)
+            self._written(name)
+
+    def create(self, name: str, content: str) -> bool:
+        """
+        Create a new note.
+
+        Args:
+            name: Note file name.
+            content: Initial content.
+
+        Returns:
+            False if a note with this name already exists
+
+        Raises:
+            OSError: If the note cannot be written
+        """
+        with self._write_lock:
+            if os.path.exists(self._path(name)):
+                return False
+            write_atomic(self._path(name), content)
+            self._written(name)
+            return True
+
+    def delete(self, name: str) -> None:
+        """
+        Delete a note and drop its edits not yet written.
+
+        Args:
+            name: Note file name.
+
+        Raises:
+            OSError: If the note cannot be removed
+        """
+        with self._write_lock:
+            with self._lock:
+                self._pending.pop(name, None)
+            os.remove(self._path(name))
+            self._written(name, count=False)
+
+    def _written(self, name: str, count: bool = True) -> None:
+        """Update the index and the journal after a change (write lock held)."""
+        with self._lock:
+            if count:
+                self._stats.writes += 1
+            self._names = None
+        self._remove_journal(name)
+
+    # ----- Write-behind autosave -----
+
+    def submit(self, name: str, content: str) -> None:
+        """
+        Record an edit; it is written once the note is idle for the delay.
+
+        The edit is journaled before this method returns, unless the note
+        was journaled less than the journal interval ago, or a later edit
+        or a write of the note superseded it meanwhile.
+
+        Args:
+            name: Note file name.
+            content: New note content.
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            if name in self._pending:
+                self._stats.coalesced += 1
+            now = time.monotonic()
+            self._pending[name] = _PendingEdit(content, now + self.delay, seq)
+            self._ensure_worker()
+            self._lock.notify_all()
+            journal = now - self._journaled_at.get(name, -self.journal_interval) >= (
+                self.journal_interval
+            )
+            if journal:
+                self._journaled_at[name] = now
+        if journal:
+            self._write_journal(name, content, seq)
+
+    def flush(self, name: str | None = None) -> None:
+        """
+        Write pending edits now.
+
+        Args:
+            name: Note to write, None for all notes.
+        """
+        with self._lock:
+            names = list(self._pending) if name is None else [name]
+            edits = [(n, self._pending[n]) for n in names if n in self._pending]
+        for note, edit in edits:
+            self._write_pending(note, edit)
+
+    def _write_pending(self, name: str, edit: _PendingEdit) -> None:
+        with self._write_lock:
+            with self._lock:
+                current = self._pending.get(name)
+                if current is None or current.seq != edit.seq:
+                    # Superseded by a later edit or an explicit save
+                    return
+            try:
+                write_atomic(self._path(name), edit.content)
+            except OSError as e:
+                logger.error("Failed to autosave note %s: %s", name, e)
+                with self._lock:
+                    if self._pending.get(name) is current:
+                        current.due = time.monotonic() + RETRY_DELAY_SECONDS
+                return
+            with self._lock:
+                if self._pending.get(name) is current:
+                    del self._pending[name]
+            self._written(name)
+            logger.debug("Autosaved note: %s", name)
+
+    def _ensure_worker(self) -> None:
+        """Start the autosave thread (lock held)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run_worker, name="notes-autosave", daemon=True
+            )
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed:
+                    now = time.monotonic()
+                    due = [
+                        (name, edit)
+                        for name, edit in self._pending.items()
+                        if edit.due <= now
+                    ]
+                    if due:
+                        break
+                    if not self._pending:
+                        # The next submit starts a new worker
+                        self._worker = None
+                        return
+                    next_due = min(edit.due for edit in self._pending.values())
+                    self._lock.wait(max(0.0, next_due - now))
+                if self._closed:
+                    return
+            for name, edit in due:
+                self._write_pending(name, edit)
+
+    def close(self) -> None:
+        """Write all pending edits and stop the autosave thread."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+
+    # ----- Journal -----
+
+    def _write_journal(self, name: str, content: str, seq: int) -> None:
+        """Replace the journal of a note with its latest edit."""
+        record = {"name": name, "content": content, "time": time.time()}
+        path = self._journal_path(name)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with self._journal_lock:
+            with self._lock:
+                current = self._pending.get(name)
+                if current is None or current.seq != seq:
+                    # Written or superseded by a later edit meanwhile
+                    return
+            try:
+                # Not synced: the journal only guards against a crash of the
+                # process, and the note itself is written atomically. The
+                # journal directory is created with the first journal only
+                os.makedirs(self._journal_dir, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(record, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Failed to journal edit of %s: %s", name, e)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _remove_journal(self, name: str) -> None:
+        """Remove the journal of a note that has no unwritten edit."""
+        with self._journal_lock:
+            with self._lock:
+                if name in self._pending:
+                    return
+                self._journaled_at.pop(name, None)
+            try:
+                os.remove(self._journal_path(name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Failed to remove journal of %s: %s", name, e)
+
+    def _recovery_path(self, name: str) -> str:
+        """Return an unused file name for a recovered version of a note."""
+        stem = name[: -len(NOTE_SUFFIX)]
+        path = self._path(f"{stem}.recovered{NOTE_SUFFIX}")
+        index = 1
+        while os.path.exists(path):
+            path = self._path(f"{stem}.recovered-{index}{NOTE_SUFFIX}")
+            index += 1
+        return path
+
+    def _recover_journal(self) -> None:
+        """Restore edits that were journaled but not written."""
+        try:
+            with os.scandir(self._journal_dir) as it:
+                journals = sorted(
+                    entry.name
+                    for entry in it
+                    if entry.name.endswith(NOTE_SUFFIX + JOURNAL_SUFFIX)
+                )
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error("Failed to list notes journals: %s", e)
+            return
+
+        for journal in journals:
+            name = journal[: -len(JOURNAL_SUFFIX)]
+            journal_path = os.path.join(self._journal_dir, journal)
+            try:
+                with open(journal_path, encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error("Failed to read journal of note %s: %s", name, e)
+                continue
+            if not isinstance(record, dict) or record.get("name") != name:
+                # Journals never name another note
+                continue
+            content = str(record.get("content", ""))
+            path = self._path(name)
+            try:
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as f:
+                        unchanged = f.read() == content
+                    if not unchanged and os.path.getmtime(path) > float(
+                        record.get("time", 0)
+                    ):
+                        # The note changed after the edit; keep both versions
+                        path = self._recovery_path(name)
+                else:
+                    unchanged = False
+                if not unchanged:
+                    write_atomic(path, content)
+                    self._stats.recovered += 1
+                    logger.info("Recovered unsaved edits of note %s", name)
+                os.remove(journal_path)
+            except OSError as e:
+                logger.error("Failed to recover note %s: %s", name, e)
+
+    def stats(self) -> NotesStoreStats:
+        """
+        Return a snapshot of the counters.
+
+        Returns:
+            Copy of the current NotesStoreStats
+        """
+        with self._lock:
+            return replace(self._stats)
+
+
+_stores: dict[str, NotesStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_notes_store(directory: str) -> NotesStore:
+    """
+    Return the process-wide store of a notes directory.
+
+    Args:
+        directory: Notes directory.
+
+    Returns:
+        The shared NotesStore of the directory
+    """
+    directory = os.path.abspath(directory)
+    with _stores_lock:
+        store = _stores.get(directory)
+        if store is None:
+            store = _stores[directory] = NotesStore(directory)
+        return store
+
+
+@atexit.register
+def _flush_all_stores() -> None:
+    """Write pending edits when the process exits normally."""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        try:
+            store.flush()
+        except Exception as e:
+            logger.error("Failed to flush notes of %s: %s", store.directory, e)
@@ -14,7 +14,6 @@ from typing import Any
 
 import streamlit as st
 
-from gns3_copilot.agent import agent
 from gns3_copilot.gns3_client import (
     GNS3ProjectCreate,
     GNS3ProjectDelete,
@@ -141,6 +140,8 @@ def render_project_cards(
                             ):
                                 if selected_thread_id:
                                     # Historical session: update agent state
+                                    from gns3_copilot.agent import agent
+
                                     agent.update_state(config, {"selected_project": p})
                                 else:
                                     # New session: store in temp storage
@@ -0,0 +1,135 @@
+"""
+Throttled Streaming Renderer for GNS3 Copilot.
+
+While an answer streams in, the chat page used to call
+placeholder.markdown() with the full accumulated text for every token chunk.
+Each call re-renders and re-sends the whole answer, so a long answer costs
+O(n^2) render work and websocket traffic.
+
+StreamingMarkdown buffers the chunks and renders at most once per flush
+interval, plus at paragraph boundaries; flush() renders whatever is pending
+and is called when the text of a message is complete. It counts chunks
+received and renders performed.
+
+Classes:
+    StreamingMarkdown: Buffered markdown placeholder
+    StreamRenderStats: Chunk and render counters
+
+Example:
+    stream = StreamingMarkdown(st.empty())
+    for chunk in chunks:
+        stream.append(chunk)
+    stream.flush()
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("stream_renderer")
+
+# Minimum seconds between two renders of the streaming text
+DEFAULT_FLUSH_INTERVAL = 0.075
+
+
+@dataclass
+class StreamRenderStats:
+    """
+    Counters of a StreamingMarkdown.
+
+    Attributes:
+        chunks: Text chunks received
+        renders: placeholder.markdown() calls performed
+        rendered_chars: Characters sent to the placeholder over all renders
+    """
+
+    chunks: int = 0
+    renders: int = 0
+    rendered_chars: int = 0
+
+
+class StreamingMarkdown:
+    """
+    Markdown placeholder that renders streamed text at a bounded rate.
+
+    Attributes:
+        text: Text received since the last restart
+        stats: Counters since the renderer was created
+    """
+
+    def __init__(
+        self,
+        placeholder: Any,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            placeholder: Streamlit element to render into (usually st.empty()).
+            flush_interval: Minimum seconds between renders.
+            enabled: Whether text is rendered at all; when False (voice mode)
+                     the text is only collected.
+            clock: Time source, for tests.
+        """
+        self.placeholder = placeholder
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self.text = ""
+        self.stats = StreamRenderStats()
+        self._clock = clock
+        self._last_render = 0.0
+        self._pending = False
+
+    def append(self, chunk: str) -> None:
+        """
+        Add a chunk and render if the flush interval has passed or the
+        chunk ends a paragraph.
+
+        Args:
+            chunk: Streamed text.
+        """
+        if not chunk:
+            return
+        self.text += chunk
+        self.stats.chunks += 1
+        self._pending = True
+        if "\n\n" in chunk or self._clock() - self._last_render >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Render the pending text now."""
+        if not self._pending or not self.enabled:
+            return
+        self.placeholder.markdown(self.text, unsafe_allow_html=True)
+        self._pending = False
+        self._last_render = self._clock()
+        self.stats.renders += 1
+        self.stats.rendered_chars += len(self.text)
+
+    def restart(self, placeholder: Any) -> None:
+        """
+        Flush the current text and continue with an empty text in a new
+        placeholder (e.g. below a tool response). Counters are kept.
+
+        Args:
+            placeholder: Streamlit element for the following text.
+        """
+        self.flush()
+        self.placeholder = placeholder
+        self.text = ""
+        self._pending = False
+
+    def log_stats(self) -> None:
+        """Log the chunk and render counters."""
+        logger.debug(
+            "Streamed %d chunks with %d renders (%d characters rendered)",
+            self.stats.chunks,
+            self.stats.renders,
+            self.stats.rendered_chars,
+        )
@@ -7,15 +7,15 @@ manual update requests from the Settings page.
 
 Key Functions:
     check_startup_updates(): Check for updates when application starts
-    check_and_display_updates(): Perform update check and store result in session state
-    render_startup_update_result(): Display update check result in sidebar/main area
+    check_and_display_updates(): Start a background update check or use the cached result
+    render_startup_update_result(): Display update check result once it is ready
     render_update_settings(): Render update configuration UI in Settings page
     check_and_prompt_update(): Check for updates and prompt user to update
     perform_update(): Execute the update process with progress feedback
 
 Internal Functions:
     _load_startup_setting(): Load the check_updates_on_startup setting from config file
-    perform_update_check(): Perform the actual update check synchronously
+    _await_update_check(): Poll for a running background update check
     load_settings(): Load settings from the settings file
     save_settings(): Save settings to the settings file
 
@@ -23,7 +23,6 @@ Configuration:
     SETTINGS_FILE: Path to settings.json file (~/.config/gns3-copilot/settings.json)
 
 Session State Keys:
-    - startup_update_checked: Flag to prevent duplicate checks in same session
     - startup_update_result: Dict containing update check result
     - check_updates: Flag to trigger manual update check
     - updating: Flag indicating update is in progress
@@ -54,13 +53,20 @@ import streamlit as st
 
 from gns3_copilot.ui_model.utils.updater import (
     is_update_available,
+    is_update_check_running,
     load_skipped_version,
+    load_update_check,
     run_update,
     save_skipped_version,
+    save_update_check,
+    start_update_check,
 )
 
 SETTINGS_FILE = Path.home() / ".config" / "gns3-copilot" / "settings.json"
 
+# Interval for polling a running background update check
+UPDATE_POLL_SECONDS = 2
+
 
 def _load_startup_setting() -> bool:
     """Load the check_updates_on_startup setting from config file."""
@@ -73,48 +79,53 @@ def _load_startup_setting() -> bool:
     return False
 
 
-def perform_update_check() -> dict[str, str]:
-    """Perform the actual update check synchronously."""
-    try:
-        available, current, latest = is_update_available()
-        if available:
-            return {"status": "available", "current": current, "latest": latest}
-        else:
-            return {"status": "up_to_date", "current": current, "latest": latest}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
-
-
 def check_and_display_updates() -> None:
-    """Check for updates and display results - runs once on startup."""
-    if not _load_startup_setting():
-        return
+    """
+    Start the startup update check without blocking the page.
 
-    # Skip if already checked in this session
-    if "startup_update_checked" in st.session_state:
+    A cached result from any session or process is used directly; otherwise
+    the check runs in a background thread and the result is picked up by
+    render_startup_update_result() when it is ready.
+    """
+    if not _load_startup_setting():
         return
 
     # Initialize skipped_update_version in session state
     if "skipped_update_version" not in st.session_state:
         st.session_state["skipped_update_version"] = load_skipped_version()
 
-    # Mark as checked immediately to prevent re-running
-    st.session_state["startup_update_checked"] = True
+    # Skip if the result is already known in this session
+    if "startup_update_result" in st.session_state:
+        return
 
-    # Perform the check with a spinner
-    with st.spinner("Checking for updates..."):
-        result = perform_update_check()
+    result = load_update_check()
+    if result is not None:
         st.session_state["startup_update_result"] = result
+        return
+
+    start_update_check()
 
-    # Force a rerun to display the result
+
+@st.fragment(run_every=UPDATE_POLL_SECONDS)
+def _await_update_check() -> None:
+    """Poll for the background update check and rerun once it finished."""
+    result = load_update_check()
+    if result is None and is_update_check_running():
+        st.caption("Checking for updates...")
+        return
+    if result is not None:
+        st.session_state["startup_update_result"] = result
+    # A full rerun renders the result and stops polling
     st.rerun()
 
 
 def render_startup_update_result() -> None:
-    """Display the startup update check result if available."""
+    """Display the startup update check result once it is available."""
     result = st.session_state.get("startup_update_result")
 
     if not result:
+        if is_update_check_running():
+            _await_update_check()
         return
 
     status = result.get("status")
@@ -225,6 +236,15 @@ def check_and_prompt_update() -> None:
             st.session_state.pop("check_updates", None)
             return
 
+    # Share the result with the startup check of other sessions
+    save_update_check(
+        {
+            "status": "available" if available else "up_to_date",
+            "current": current,
+            "latest": latest,
+        }
+    )
+
     if not available:
         st.info(f"You are running the latest version ({current}).")
         st.session_state.pop("check_updates", None)
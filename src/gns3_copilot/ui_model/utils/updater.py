@@ -8,14 +8,26 @@ update availability checking, and the update installation process.
 This module is platform-agnostic and doesn't depend on Streamlit, making it
 suitable for reuse in different contexts (CLI, web UI, automated scripts).
 
+The startup check runs in a background thread and its result is stored in
+a small JSON file with a TTL, so the check never delays rendering and is
+shared by all sessions and processes of the user. The last result is also
+kept in memory, so a read-only or missing ~/.config does not start a new
+check on every rerun.
+
 Key Functions:
     get_installed_version(): Retrieve the currently installed version
     get_latest_version(): Fetch the latest version from PyPI
     is_update_available(): Compare versions and check for updates
+    perform_update_check(): Check for updates and return a result dict
+    start_update_check(): Start a background check unless a result is cached
+    load_update_check(): Read the cached result of the last check
     run_update(): Execute the update process using pip
 
 Constants:
     PYPI_URL: PyPI API endpoint for version information
+    UPDATE_CHECK_FILE: Cached result of the last update check
+    UPDATE_CHECK_TTL_SECONDS: Lifetime of a successful check result
+    UPDATE_CHECK_ERROR_TTL_SECONDS: Lifetime of a failed check result
 
 Error Handling:
     - Network timeout: 5-second timeout for PyPI API requests
@@ -39,15 +51,29 @@ Example:
 """
 
 import json
+import os
 import subprocess
 import sys
+import threading
+import time
 import urllib.request
 from pathlib import Path
+from typing import Any
 
 from packaging.version import InvalidVersion, Version
 
+from gns3_copilot.log_config import setup_logger
+
+logger = setup_logger("updater")
+
 PYPI_URL = "https://pypi.org/pypi/gns3-copilot/json"
 SETTINGS_FILE = Path.home() / ".config" / "gns3-copilot" / "settings.json"
+UPDATE_CHECK_FILE = SETTINGS_FILE.parent / "update_check.json"
+
+# A release check is repeated at most once a day; failed checks (e.g. while
+# offline) are retried sooner
+UPDATE_CHECK_TTL_SECONDS = 24 * 60 * 60
+UPDATE_CHECK_ERROR_TTL_SECONDS = 60 * 60
 
 
 def get_installed_version() -> str:
@@ -77,6 +103,132 @@ def is_update_available() -> tuple[bool, str, str]:
         return False, current, latest
 
 
+def perform_update_check() -> dict[str, str]:
+    """Perform the actual update check synchronously."""
+    try:
+        available, current, latest = is_update_available()
+        if available:
+            return {"status": "available", "current": current, "latest": latest}
+        else:
+            return {"status": "up_to_date", "current": current, "latest": latest}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def _is_fresh(entry: Any, now: float) -> bool:
+    """Check whether a cached update check entry can still be used."""
+    if not isinstance(entry, dict):
+        return False
+    result = entry.get("result")
+    checked_at = entry.get("checked_at")
+    if not isinstance(result, dict) or not isinstance(checked_at, (int, float)):
+        return False
+    if result.get("status") == "error":
+        return 0 <= now - checked_at < UPDATE_CHECK_ERROR_TTL_SECONDS
+    # A result for another installed version is outdated after an update
+    return (
+        0 <= now - checked_at < UPDATE_CHECK_TTL_SECONDS
+        and result.get("current") == get_installed_version()
+    )
+
+
+# Last result saved by this process, used when the file cannot be read
+# Format: {"checked_at": ..., "result": {...}}
+_last_check: dict[str, Any] | None = None
+
+
+def load_update_check(now: float | None = None) -> dict[str, str] | None:
+    """
+    Load the result of the last update check if it has not expired.
+
+    The newer of the cached file and the last result of this process is
+    used, so a result is available even if the file cannot be written.
+
+    Args:
+        now: Current time (time.time()), for tests.
+
+    Returns:
+        Result dict as returned by perform_update_check(), or None
+    """
+    now = time.time() if now is None else now
+    try:
+        entry = json.loads(UPDATE_CHECK_FILE.read_text())
+    except (OSError, ValueError):
+        entry = None
+    fresh: list[dict[str, Any]] = [
+        e for e in (entry, _last_check) if e is not None and _is_fresh(e, now)
+    ]
+    if not fresh:
+        return None
+    result: dict[str, str] = max(fresh, key=lambda e: e["checked_at"])["result"]
+    return result
+
+
+def save_update_check(result: dict[str, str], now: float | None = None) -> None:
+    """
+    Store the result of an update check for all sessions and processes.
+
+    Args:
+        result: Result dict as returned by perform_update_check().
+        now: Check time (time.time()), for tests.
+    """
+    global _last_check
+    entry = {"checked_at": time.time() if now is None else now, "result": result}
+    _last_check = entry
+    tmp_file = UPDATE_CHECK_FILE.with_name(f".{UPDATE_CHECK_FILE.name}.{os.getpid()}")
+    try:
+        UPDATE_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Replace atomically so other processes never read a partial file
+        tmp_file.write_text(json.dumps(entry, indent=2))
+        os.replace(tmp_file, UPDATE_CHECK_FILE)
+    except OSError as e:
+        logger.warning("Failed to save update check result: %s", e)
+
+
+_check_lock = threading.Lock()
+_check_thread: threading.Thread | None = None
+
+
+def _run_update_check() -> None:
+    started = time.perf_counter()
+    result = perform_update_check()
+    save_update_check(result)
+    logger.info(
+        "Update check finished in %.2fs: %s",
+        time.perf_counter() - started,
+        result.get("status"),
+    )
+
+
+def start_update_check() -> bool:
+    """
+    Start an update check in a background thread.
+
+    Nothing is started while a check is running in this process or a
+    cached result has not expired.
+
+    Returns:
+        True if a check was started
+    """
+    global _check_thread
+    with _check_lock:
+        if _check_thread is not None and _check_thread.is_alive():
+            return False
+        if load_update_check() is not None:
+            return False
+        _check_thread = threading.Thread(
+            target=_run_update_check, name="update-check", daemon=True
+        )
+        _check_thread.start()
+        return True
+
+
+def is_update_check_running() -> bool:
+    """Return whether a background update check is running in this process."""
+    with _check_lock:
+        return _check_thread is not None and _check_thread.is_alive()
+
+
 def save_skipped_version(version: str) -> None:
     """Save the skipped update version to settings file."""
     SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
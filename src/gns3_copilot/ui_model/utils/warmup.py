@@ -0,0 +1,392 @@
+"""
+Startup Warm-up for GNS3 Copilot.
+
+The first message after a start used to pay for everything the app sets up
+lazily: opening the checkpoint database, compiling the agent graph, loading
+the chat model provider, authenticating against the GNS3 v3 API and listing
+templates and projects. The warm-up does this work in background threads
+right after the app starts, so the first turn runs like any later one:
+
+- GNS3: ping the server, authenticate (API v3; the token is shared by all
+  connectors of the process), prefetch templates and projects
+- Agent: open the checkpoint database, compile the agent graph (both cached
+  with st.cache_resource)
+- Model: build the chat model once, which loads the provider integration and
+  its HTTP client
+
+Steps of a chain run in order; a failed step skips the rest of its chain.
+The timing of every step is shown on the Settings page.
+
+Classes:
+    Warmup: Runs warm-up chains in background threads and records timings
+    WarmupStep: Status and timing of one step
+    WarmupSkipped: Raised by a step that does not apply to the configuration
+
+Functions:
+    start_warmup(force): Start the warm-up once per process
+    get_warmup(): Warm-up of this process, if started
+    render_warmup_status(): Render the step timings (Settings page)
+
+Example:
+    In app.py, after the configuration is loaded:
+        from gns3_copilot.ui_model.utils import start_warmup
+
+        start_warmup()
+"""
+
+import importlib
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import streamlit as st
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils import get_config
+
+logger = setup_logger("warmup")
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+
+# Interval for polling a running warm-up on the Settings page
+WARMUP_POLL_SECONDS = 1
+
+# Timeout of the GNS3 server ping
+PING_TIMEOUT_SECONDS = 5.0
+
+# A step returns an optional detail shown next to its timing
+StepFunction = Callable[[], str | None]
+Chain = Sequence[tuple[str, str, StepFunction]]
+
+
+class WarmupSkipped(Exception):
+    """Raised by a step that does not apply to the current configuration."""
+
+
+@dataclass
+class WarmupStep:
+    """
+    Status and timing of one warm-up step.
+
+    Attributes:
+        name: Step identifier
+        label: Step description shown in the UI
+        status: pending, running, done, skipped or failed
+        seconds: Duration of the step once it finished
+        detail: Result summary, skip reason or error message
+    """
+
+    name: str
+    label: str
+    status: str = STATUS_PENDING
+    seconds: float | None = None
+    detail: str = ""
+
+
+class Warmup:
+    """
+    Runs warm-up chains in background threads, one thread per chain.
+    """
+
+    def __init__(
+        self, chains: Sequence[Chain], clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        """
+        Initialize the warm-up.
+
+        Args:
+            chains: Chains of (name, label, function) steps. Chains run in
+                    parallel, the steps of a chain in order.
+            clock: Time source for the timings.
+        """
+        self._chains = chains
+        self._clock = clock
+        self._steps = {
+            name: WarmupStep(name, label)
+            for chain in chains
+            for name, label, _ in chain
+        }
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def start(self) -> None:
+        """Start one daemon thread per chain."""
+        self.started_at = self._clock()
+        self._threads = [
+            threading.Thread(
+                target=self._run_chain,
+                args=(chain,),
+                name=f"warmup-{index}",
+                daemon=True,
+            )
+            for index, chain in enumerate(self._chains)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _update(self, name: str, **changes: Any) -> None:
+        with self._lock:
+            self._steps[name] = replace(self._steps[name], **changes)
+
+    def _run_chain(self, chain: Chain) -> None:
+        failed = False
+        for name, _, function in chain:
+            if failed:
+                self._update(name, status=STATUS_SKIPPED, detail="Previous step failed")
+                continue
+            self._update(name, status=STATUS_RUNNING)
+            started = self._clock()
+            try:
+                detail = function() or ""
+                status = STATUS_DONE
+            except WarmupSkipped as e:
+                detail, status = str(e), STATUS_SKIPPED
+            except Exception as e:
+                logger.warning("Warm-up step %s failed: %s", name, e)
+                detail, status = str(e), STATUS_FAILED
+                failed = True
+            seconds = self._clock() - started
+            self._update(name, status=status, seconds=seconds, detail=detail)
+            logger.info("Warm-up step %s %s in %.2fs", name, status, seconds)
+        with self._lock:
+            if not self._is_running_locked():
+                self.finished_at = self._clock()
+
+    def _is_running_locked(self) -> bool:
+        return any(
+            step.status in (STATUS_PENDING, STATUS_RUNNING)
+            for step in self._steps.values()
+        )
+
+    def is_running(self) -> bool:
+        """Return whether steps are still pending or running."""
+        with self._lock:
+            return self._is_running_locked()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait for all chains to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds, None to wait forever.
+
+        Returns:
+            True if the warm-up finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            thread.join(None if remaining is None else max(0.0, remaining))
+        return not self.is_running()
+
+    def steps(self) -> list[WarmupStep]:
+        """
+        Return a snapshot of the steps in chain order.
+
+        Returns:
+            Copies of the WarmupStep records
+        """
+        with self._lock:
+            return [replace(step) for step in self._steps.values()]
+
+    @property
+    def elapsed(self) -> float | None:
+        """Wall time from start until the last chain finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+def _gns3_chain() -> Chain:
+    """Ping the GNS3 server, authenticate and prefetch templates and projects."""
+    state: dict[str, Any] = {}
+
+    def connector() -> Any:
+        if "connector" not in state:
+            raise WarmupSkipped("GNS3 server not configured")
+        return state["connector"]
+
+    def ping() -> str:
+        from gns3_copilot.gns3_client import get_gns3_connector
+
+        server = get_gns3_connector()
+        if server is None:
+            raise WarmupSkipped("GNS3 server not configured")
+        state["connector"] = server
+        # The version endpoint needs no authentication, so the ping is timed
+        # separately from the v3 login
+        response = server.session.get(
+            f"{server.base_url}/version",
+            verify=server.verify,
+            timeout=PING_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return f"GNS3 {response.json().get('version', 'unknown')}"
+
+    def authenticate() -> str:
+        server = connector()
+        if server.api_version != 3:
+            raise WarmupSkipped("Not required for API v2")
+        server.authenticate()
+        return "Token shared with tool calls"
+
+    def templates() -> str:
+        from gns3_copilot.gns3_client.gns3_prefetch import store_prefetched
+
+        server = connector()
+        result = server.get_templates()
+        store_prefetched(server, "templates", result)
+        return f"{len(result)} templates"
+
+    def projects() -> str:
+        from gns3_copilot.gns3_client.gns3_prefetch import store_prefetched
+
+        server = connector()
+        fetched_at = time.monotonic()
+        result = server.projects_summary(is_print=False) or []
+        # Not kept if a project was changed while the list was fetched
+        store_prefetched(server, "projects", result, fetched_at=fetched_at)
+        return f"{len(result)} projects"
+
+    return [
+        ("gns3_ping", "Ping GNS3 server", ping),
+        ("gns3_auth", "Authenticate (API v3)", authenticate),
+        ("gns3_templates", "Prefetch templates", templates),
+        ("gns3_projects", "Prefetch project list", projects),
+    ]
+
+
+def _agent_chain() -> Chain:
+    """Open the checkpoint database and compile the agent graph."""
+
+    def checkpointer() -> str:
+        module = importlib.import_module("gns3_copilot.agent.checkpointer")
+        return str(module.LANGGRAPH_DB_PATH)
+
+    def agent_graph() -> str:
+        module = importlib.import_module("gns3_copilot.agent.gns3_copilot")
+        return f"{len(module.agent.nodes)} nodes"
+
+    return [
+        ("checkpointer", "Open checkpoint database", checkpointer),
+        ("agent", "Compile agent graph", agent_graph),
+    ]
+
+
+def _model_chain() -> Chain:
+    """Build the chat model once to load the provider integration."""
+
+    def model_client() -> str:
+        provider = get_config("MODE_PROVIDER", "")
+        model_name = get_config("MODEL_NAME", "")
+        if not provider or not model_name:
+            raise WarmupSkipped("Model not configured")
+        from gns3_copilot.agent.model_factory import create_base_model
+
+        create_base_model()
+        return f"{provider}/{model_name}"
+
+    return [("model", "Build model client", model_client)]
+
+
+def default_warmup_chains() -> list[Chain]:
+    """
+    Return the warm-up chains of the application.
+
+    Returns:
+        GNS3, agent and model chains
+    """
+    return [_gns3_chain(), _agent_chain(), _model_chain()]
+
+
+def is_warmup_enabled() -> bool:
+    """Return whether STARTUP_WARMUP is set to a truthy value."""
+    return get_config("STARTUP_WARMUP", "True").lower().strip() in (
+        "true",
+        "1",
+        "yes",
+        "on",
+    )
+
+
+_warmup: Warmup | None = None
+_warmup_lock = threading.Lock()
+
+
+def start_warmup(force: bool = False) -> Warmup | None:
+    """
+    Start the warm-up once per process.
+
+    Args:
+        force: Run the warm-up again (e.g. after the settings changed),
+               unless it is still running.
+
+    Returns:
+        The warm-up of this process, or None if it is disabled
+    """
+    global _warmup
+    with _warmup_lock:
+        if _warmup is not None and (not force or _warmup.is_running()):
+            return _warmup
+        if not force and not is_warmup_enabled():
+            return None
+        _warmup = Warmup(default_warmup_chains())
+        _warmup.start()
+        logger.info("Started startup warm-up")
+        return _warmup
+
+
+def get_warmup() -> Warmup | None:
+    """Return the warm-up of this process, None if it was not started."""
+    with _warmup_lock:
+        return _warmup
+
+
+def _render_steps(warmup: Warmup) -> None:
+    rows = [
+        {
+            "Step": step.label,
+            "Status": step.status,
+            "Time (s)": f"{step.seconds:.2f}" if step.seconds is not None else "",
+            "Detail": step.detail,
+        }
+        for step in warmup.steps()
+    ]
+    st.dataframe(rows, hide_index=True, width="stretch")
+    if warmup.elapsed is not None:
+        st.caption(f"Warm-up finished in {warmup.elapsed:.2f}s")
+
+
+@st.fragment(run_every=WARMUP_POLL_SECONDS)
+def _await_warmup() -> None:
+    """Show the steps of the running warm-up and rerun once it finished."""
+    warmup = get_warmup()
+    if warmup is not None and warmup.is_running():
+        _render_steps(warmup)
+        return
+    # A full rerun renders the final timings and stops polling
+    st.rerun()
+
+
+def render_warmup_status() -> None:
+    """Render the timing of each warm-up step and a button to run it again."""
+    warmup = get_warmup()
+    if warmup is None:
+        st.caption("The warm-up has not run in this process.")
+    elif warmup.is_running():
+        _await_warmup()
+    else:
+        _render_steps(warmup)
+
+    running = warmup is not None and warmup.is_running()
+    if st.button("Run Warm-up Again", disabled=running):
+        start_warmup(force=True)
+        st.rerun()
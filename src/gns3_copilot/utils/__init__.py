@@ -7,10 +7,14 @@ It contains common functionality that can be shared across different tools and m
 Main modules:
 - get_gns3_device_port: Device port information retrieval from GNS3 topology
 - parse_tool_content: Tool execution result parsing and formatting utilities
+- tool_artifacts: Tool output budgeting with out-of-band artifact storage
 
 Author: Guobin Yue
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Import main utility functions
 from .app_config import (
     DEFAULT_CONFIG,
@@ -24,9 +28,29 @@ from .app_config import (
     set_config,
 )
 from .get_gns3_device_port import get_device_ports_from_topology
-from .openai_stt import get_stt_config, speech_to_text
-from .openai_tts import get_duration, get_tts_config, text_to_speech_wav
-from .parse_tool_content import format_tool_response, parse_tool_content
+from .parse_tool_content import (
+    FormattedToolResponse,
+    ToolResponseCache,
+    content_digest,
+    format_tool_response,
+    parse_tool_content,
+)
+from .tool_artifacts import (
+    apply_output_budget,
+    read_artifact,
+    render_tool_output,
+    save_artifact,
+)
+
+if TYPE_CHECKING:
+    from .openai_stt import get_stt_config, speech_to_text, transcribe_chunked
+    from .openai_tts import (
+        SpeechPipeline,
+        cached_text_to_speech_wav,
+        get_duration,
+        get_tts_config,
+        text_to_speech_wav,
+    )
 
 # Dynamic version management
 try:
@@ -40,6 +64,28 @@ __author__ = "Guobin Yue"
 __description__ = "AI-powered network automation assistant for GNS3"
 __url__ = "https://github.com/yueguobin/gns3-copilot"
 
+# The speech helpers import the OpenAI SDK, which command-line tools reading
+# only the configuration do not need; they are imported on first access.
+_LAZY_ATTRIBUTES = {
+    "get_stt_config": "openai_stt",
+    "speech_to_text": "openai_stt",
+    "transcribe_chunked": "openai_stt",
+    "get_duration": "openai_tts",
+    "get_tts_config": "openai_tts",
+    "text_to_speech_wav": "openai_tts",
+    "SpeechPipeline": "openai_tts",
+    "cached_text_to_speech_wav": "openai_tts",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the speech helpers on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
 
 # Export main utility functions
 __all__ = [
@@ -55,9 +101,19 @@ __all__ = [
     "get_device_ports_from_topology",
     "parse_tool_content",
     "format_tool_response",
+    "ToolResponseCache",
+    "content_digest",
+    "FormattedToolResponse",
     "text_to_speech_wav",
+    "SpeechPipeline",
+    "cached_text_to_speech_wav",
     "speech_to_text",
+    "transcribe_chunked",
     "get_duration",
     "get_tts_config",
     "get_stt_config",
+    "apply_output_budget",
+    "read_artifact",
+    "render_tool_output",
+    "save_artifact",
 ]
@@ -42,6 +42,23 @@ DEFAULT_CONFIG: dict[str, str] = {
     "MODEL_API_KEY": "",
     "BASE_URL": "",
     "TEMPERATURE": "0.0",
+    # Agent Context Configuration
+    "CONTEXT_TOKEN_BUDGET": "24000",
+    "CONTEXT_KEEP_RECENT_TOKENS": "8000",
+    "TOOL_OUTPUT_BUDGET_CHARS": "8000",
+    "PLANNER_MODE": "False",
+    "PLANNER_MAX_WORKERS": "4",
+    "TITLE_MODE": "llm",
+    "STARTUP_WARMUP": "True",
+    # Checkpoint Retention Configuration
+    "CHECKPOINT_KEEP_LATEST": "50",
+    "CHECKPOINT_WRITES_MAX_AGE_DAYS": "7",
+    "CHECKPOINT_ARCHIVE_IDLE_DAYS": "0",
+    "CHECKPOINT_ARCHIVE_DIR": "checkpoint_archive",
+    "CHECKPOINT_RETENTION_INTERVAL_HOURS": "6",
+    # Checkpoint Compression Configuration
+    "CHECKPOINT_COMPRESSION": "True",
+    "CHECKPOINT_COMPRESSION_MIN_BYTES": "1024",
     # Voice Configuration
     "VOICE": "False",
     # Voice TTS Configuration
@@ -50,6 +67,7 @@ DEFAULT_CONFIG: dict[str, str] = {
     "TTS_MODEL": "tts-1",
     "TTS_VOICE": "alloy",
     "TTS_SPEED": "1.0",
+    "TTS_CACHE_MAX_MB": "100",
     # Voice STT Configuration
     "STT_API_KEY": "",
     "STT_BASE_URL": "",
@@ -57,6 +75,7 @@ DEFAULT_CONFIG: dict[str, str] = {
     "STT_LANGUAGE": "en",
     "STT_TEMPERATURE": "0.0",
     "STT_RESPONSE_FORMAT": "json",
+    "STT_CHUNK_SECONDS": "30",
     # Linux Telnet Configuration
     "LINUX_TELNET_USERNAME": "",
     "LINUX_TELNET_PASSWORD": "",
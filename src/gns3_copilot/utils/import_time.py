@@ -0,0 +1,204 @@
+"""
+Import Time Profiling for GNS3 Copilot.
+
+Cold start of the app and of each Streamlit script run pays for every module
+imported on the way. This module measures an import in a fresh interpreter
+with ``python -X importtime`` and turns the raw output into a report, so the
+cost can be tracked and regressions caught by the test suite.
+
+Classes:
+    ImportRecord: Timing of one imported module
+    ImportReport: All imports triggered by importing one module
+
+Functions:
+    parse_importtime(output): Parse ``-X importtime`` output
+    measure_import(module): Import a module in a fresh interpreter and report
+
+Example:
+    report = measure_import("gns3_copilot.app", repeat=3)
+    print(report.format(top=20))
+    assert not report.loaded("netmiko")
+
+The benchmark script scripts/benchmark_import_time.py prints such reports
+from the command line.
+"""
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """
+    Timing of one imported module.
+
+    Attributes:
+        module: Module name
+        self_us: Time spent in the module itself, in microseconds
+        cumulative_us: Time including the modules it imported, in microseconds
+        depth: Nesting level; 0 for imports made by interpreter startup and
+               by the measured import statement
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """
+    All imports triggered by importing one module.
+
+    Attributes:
+        target: Measured module
+        records: Imported modules in the order reported by the interpreter
+    """
+
+    target: str
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Total import time in milliseconds, including interpreter startup."""
+        return sum(r.cumulative_us for r in self.records if r.depth == 0) / 1000
+
+    def module_ms(self, module: str) -> float | None:
+        """
+        Cumulative import time of one module.
+
+        Args:
+            module: Module name.
+
+        Returns:
+            Milliseconds, or None if the module was not imported
+        """
+        for record in self.records:
+            if record.module == module:
+                return record.cumulative_us / 1000
+        return None
+
+    def loaded(self, *packages: str) -> list[str]:
+        """
+        List the imported modules belonging to the given packages.
+
+        Args:
+            *packages: Package or module names.
+
+        Returns:
+            Names of the imported modules that are one of the packages or
+            inside them
+        """
+        return [
+            r.module
+            for r in self.records
+            if any(r.module == p or r.module.startswith(p + ".") for p in packages)
+        ]
+
+    def top(self, count: int = 20) -> list[ImportRecord]:
+        """
+        Get the most expensive imports.
+
+        Args:
+            count: Number of records.
+
+        Returns:
+            Records with the highest cumulative time, most expensive first
+        """
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:count]
+
+    def format(self, top: int = 20) -> str:
+        """
+        Format the report as text.
+
+        Args:
+            top: Number of most expensive imports listed.
+
+        Returns:
+            Multi-line report
+        """
+        lines = [
+            f"import {self.target}: {self.total_ms:.1f} ms, "
+            f"{len(self.records)} modules",
+            f"{'cumulative':>12} {'self':>10}  module",
+        ]
+        for record in self.top(top):
+            lines.append(
+                f"{record.cumulative_us / 1000:>10.1f}ms "
+                f"{record.self_us / 1000:>8.1f}ms  "
+                f"{'  ' * record.depth}{record.module}"
+            )
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    Args:
+        output: stderr of the interpreter; other lines are ignored.
+
+    Returns:
+        One record per imported module, in output order
+    """
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(
+                    module=module,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+    return records
+
+
+def measure_import(
+    module: str,
+    repeat: int = 1,
+    cwd: str | None = None,
+    python: str = sys.executable,
+) -> ImportReport:
+    """
+    Import a module in fresh interpreters and report the fastest run.
+
+    Taking the fastest of several runs filters out noise from other
+    processes and from writing bytecode caches in the first run.
+
+    Args:
+        module: Module to import.
+        repeat: Number of interpreter runs.
+        cwd: Working directory of the interpreter (modules creating files
+             on import write them there).
+        python: Interpreter to run.
+
+    Returns:
+        ImportReport of the fastest run
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    best: ImportReport | None = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+        report = ImportReport(module, parse_importtime(result.stderr))
+        if best is None or report.total_ms < best.total_ms:
+            best = report
+    assert best is not None
+    return best
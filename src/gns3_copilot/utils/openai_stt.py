@@ -1,7 +1,24 @@
+"""
+OpenAI STT Interface Module
+---------------------------
+This module transcribes speech with OpenAI-compatible (Whisper) APIs.
+
+transcribe_chunked() handles long recordings: the audio is split at quiet
+points into overlapping chunks that are transcribed concurrently with a
+shared client. The chunk transcripts are stitched back together in order,
+and partial transcripts are reported as soon as the leading chunks are done.
+"""
+
 import io
 import os
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import IO, Any, BinaryIO, Literal, cast
 
+import numpy as np
+import soundfile as sf
 from openai import OpenAI
 from openai._types import NOT_GIVEN
 
@@ -10,6 +27,24 @@ from gns3_copilot.utils import get_config
 
 logger = setup_logger("openai_stt")
 
+# Recordings longer than this are transcribed in chunks
+DEFAULT_CHUNK_SECONDS = 30.0
+
+# Audio shared by neighbouring chunks, so no word is lost at a cut
+DEFAULT_OVERLAP_SECONDS = 1.0
+
+# Window before the target cut searched for the quietest point
+SILENCE_SEARCH_SECONDS = 5.0
+
+# Length of the frames whose energy is compared to find silence
+SILENCE_FRAME_SECONDS = 0.02
+
+# Concurrent transcription requests of transcribe_chunked()
+DEFAULT_STT_WORKERS = 4
+
+# Longest run of words deduplicated where two chunk transcripts overlap
+MAX_STITCH_WORDS = 12
+
 DEFAULT_GNS3_PROMPT = (
     "GNS3, Cisco, router, switch, OSPF, BGP, EIGRP, ISIS, VLAN, STP, "
     "interface, FastEthernet, GigabitEthernet, loopback, config terminal, "
@@ -31,6 +66,25 @@ def get_stt_config() -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4)
+def get_stt_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Return a shared OpenAI client for the STT API.
+
+    Args:
+        api_key: STT API key (empty for local servers).
+        base_url: STT API base URL.
+
+    Returns:
+        OpenAI client for these credentials
+    """
+    return OpenAI(
+        api_key=api_key if api_key else "local-dummy",
+        base_url=base_url,
+        timeout=60.0,
+    )
+
+
 def speech_to_text(
     audio_data: bytes | BinaryIO,
     model: str | None = None,
@@ -41,10 +95,13 @@ def speech_to_text(
     timestamp_granularities: list[Literal["word", "segment"]] | None = None,
     api_key: str | None = None,
     base_url: str | None = None,
+    client: OpenAI | None = None,
 ) -> str:
     """
     Transcribe audio to text using OpenAI Whisper API.
 
+    A new client is created for the call unless one is passed in.
+
     Returns:
         str: The transcribed text (always in JSON format)
     """
@@ -95,11 +152,12 @@ def speech_to_text(
         raise ValueError(f"Audio file size too large ({size_mb:.2f}MB).")
 
     try:
-        client = OpenAI(
-            api_key=f_api_key if f_api_key else "local-dummy",
-            base_url=f_base_url,
-            timeout=60.0,
-        )
+        if client is None:
+            client = OpenAI(
+                api_key=f_api_key if f_api_key else "local-dummy",
+                base_url=f_base_url,
+                timeout=60.0,
+            )
 
         response = client.audio.transcriptions.create(
             file=cast(tuple[str, IO[bytes]], (file_name, audio_file)),
@@ -137,6 +195,181 @@ def speech_to_text_simple(audio_data: bytes | BinaryIO, **kwargs: Any) -> str:
     return str(result)
 
 
+def split_audio_at_silence(
+    audio_data: bytes,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> list[bytes]:
+    """
+    Split a recording into overlapping WAV chunks cut at quiet points.
+
+    Each cut is placed at the quietest frame in the SILENCE_SEARCH_SECONDS
+    before the target chunk length, and the next chunk starts
+    overlap_seconds before the cut.
+
+    Args:
+        audio_data: Audio in a format readable by soundfile (e.g. WAV).
+        chunk_seconds: Target chunk length.
+        overlap_seconds: Audio shared by neighbouring chunks.
+
+    Returns:
+        WAV encoded chunks; a single chunk with the original audio if it is
+        not longer than chunk_seconds
+    """
+    samples, samplerate = sf.read(io.BytesIO(audio_data), dtype="float32")
+    total = len(samples)
+    chunk_len = int(chunk_seconds * samplerate)
+    if chunk_len <= 0 or total <= chunk_len:
+        return [audio_data]
+
+    mono = samples if samples.ndim == 1 else samples.mean(axis=1)
+    frame = max(1, int(SILENCE_FRAME_SECONDS * samplerate))
+    search = min(int(SILENCE_SEARCH_SECONDS * samplerate), chunk_len // 2)
+    overlap = min(int(overlap_seconds * samplerate), search)
+
+    chunks: list[bytes] = []
+    start = 0
+    while True:
+        target = start + chunk_len
+        if target >= total:
+            end = total
+        else:
+            # Energy of each frame in the search window; cut at the quietest
+            window = mono[target - search : target]
+            frames = len(window) // frame
+            energy = np.square(window[: frames * frame]).reshape(frames, frame)
+            end = target - search + int(energy.mean(axis=1).argmin()) * frame
+            end = max(end + frame // 2, start + overlap + frame)
+        buffer = io.BytesIO()
+        sf.write(buffer, samples[start:end], samplerate, format="WAV")
+        chunks.append(buffer.getvalue())
+        if end >= total:
+            return chunks
+        start = end - overlap
+
+
+def _words(text: str) -> list[str]:
+    return [re.sub(r"\W", "", word).lower() for word in text.split()]
+
+
+def stitch_transcripts(parts: list[str]) -> str:
+    """
+    Join chunk transcripts, dropping words repeated because of the overlap.
+
+    The longest run of up to MAX_STITCH_WORDS words that ends one transcript
+    and starts the next is kept only once (ignoring case and punctuation).
+
+    Args:
+        parts: Transcripts of consecutive chunks.
+
+    Returns:
+        The stitched transcript
+    """
+    text = ""
+    for part in parts:
+        part = part.strip()
+        if not part:
+            continue
+        if not text:
+            text = part
+            continue
+        tail = _words(text)[-MAX_STITCH_WORDS:]
+        head_words = part.split()
+        head = _words(" ".join(head_words[:MAX_STITCH_WORDS]))
+        repeated = 0
+        for size in range(min(len(tail), len(head)), 0, -1):
+            if tail[-size:] == head[:size]:
+                repeated = size
+                break
+        rest = " ".join(head_words[repeated:])
+        if rest:
+            text = f"{text} {rest}"
+    return text
+
+
+def _read_audio_bytes(audio_data: bytes | BinaryIO) -> bytes:
+    if isinstance(audio_data, bytes):
+        return audio_data
+    audio_data.seek(0)
+    data = audio_data.read()
+    audio_data.seek(0)
+    return data
+
+
+def transcribe_chunked(
+    audio_data: bytes | BinaryIO,
+    on_partial: Callable[[str], None] | None = None,
+    chunk_seconds: float | None = None,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    max_workers: int = DEFAULT_STT_WORKERS,
+    **kwargs: Any,
+) -> str:
+    """
+    Transcribe a recording, splitting long audio into parallel requests.
+
+    Recordings up to chunk_seconds (or audio soundfile cannot read) are sent
+    in one request. Longer ones are split with split_audio_at_silence() and
+    the chunks are transcribed concurrently with a shared client.
+
+    Args:
+        audio_data: Recorded audio as bytes or a binary file object.
+        on_partial: Called in the calling thread with the transcript so far,
+                    each time the next chunk in order is transcribed.
+        chunk_seconds: Target chunk length, STT_CHUNK_SECONDS by default;
+                       0 disables chunking.
+        overlap_seconds: Audio shared by neighbouring chunks.
+        max_workers: Concurrent transcription requests.
+        **kwargs: Further speech_to_text() arguments.
+
+    Returns:
+        The transcribed text
+    """
+    if not audio_data:
+        raise ValueError("Audio data cannot be empty")
+    if chunk_seconds is None:
+        try:
+            chunk_seconds = float(
+                get_config("STT_CHUNK_SECONDS", str(DEFAULT_CHUNK_SECONDS))
+            )
+        except ValueError:
+            chunk_seconds = DEFAULT_CHUNK_SECONDS
+
+    audio_bytes = _read_audio_bytes(audio_data)
+    chunks = [audio_bytes]
+    if chunk_seconds > 0:
+        try:
+            chunks = split_audio_at_silence(audio_bytes, chunk_seconds, overlap_seconds)
+        except (sf.LibsndfileError, RuntimeError, ValueError) as e:
+            logger.warning("Audio not split, transcribing in one request: %s", e)
+    if len(chunks) == 1:
+        return speech_to_text(audio_data, **kwargs)
+
+    config = get_stt_config()
+    client = get_stt_client(
+        str(kwargs.get("api_key") or config["api_key"]),
+        str(kwargs.get("base_url") or config["base_url"]),
+    )
+    logger.info("Transcribing %d audio chunks concurrently", len(chunks))
+    parts: list[str] = []
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="stt"
+    ) as executor:
+        futures = [
+            executor.submit(speech_to_text, chunk, client=client, **kwargs)
+            for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                parts.append(future.result())
+                if on_partial is not None:
+                    on_partial(stitch_transcripts(parts))
+        except Exception:
+            for pending in futures:
+                pending.cancel()
+            raise
+    return stitch_transcripts(parts)
+
+
 # Module Test
 if __name__ == "__main__":
     print("Whisper STT module initialized...")
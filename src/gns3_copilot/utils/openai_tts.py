@@ -4,9 +4,25 @@ OpenAI TTS Interface Module
 This module provides a robust interface for converting text to speech using
 OpenAI-compatible APIs, specifically optimized for WAV output and automated
 duration calculation.
+
+cached_text_to_speech_wav() reuses one client per API endpoint and serves
+repeated phrases from the on-disk audio cache (see tts_cache).
+
+SpeechPipeline speaks streamed answer text sentence by sentence: complete
+sentences are synthesized concurrently on a worker pool while the answer is
+still streaming, and the audio is handed out in order, each chunk once the
+previous one has finished playing, so callers never block on playback.
 """
 
 import io
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import soundfile as sf
@@ -16,10 +32,24 @@ from openai import (
 
 from gns3_copilot.log_config import setup_logger
 from gns3_copilot.utils import get_config
+from gns3_copilot.utils.tts_cache import get_tts_cache, tts_cache_key
 
 # Setup logger
 logger = setup_logger("openai_tts")
 
+# Maximum input length accepted by the speech API
+MAX_TTS_CHARS = 4096
+
+# Sentences shorter than this are merged with the next one
+DEFAULT_MIN_SEGMENT_CHARS = 20
+
+# Concurrent synthesis requests of a SpeechPipeline
+DEFAULT_TTS_WORKERS = 3
+
+# End of a sentence: terminal punctuation followed by whitespace, CJK
+# terminal punctuation, or a line break
+_SENTENCE_END = re.compile(r"[.!?;:](?=\s)|[。！？；]|\n")
+
 
 def get_tts_config() -> dict[str, Any]:
     """
@@ -34,6 +64,23 @@ def get_tts_config() -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4)
+def get_tts_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Return a shared OpenAI client for the TTS API.
+
+    Reusing the client keeps its HTTP connection pool across requests.
+
+    Args:
+        api_key: TTS API key.
+        base_url: TTS API base URL.
+
+    Returns:
+        OpenAI client for these credentials
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
 def text_to_speech_wav(
     text: str,
     model: str | None = None,
@@ -42,9 +89,12 @@ def text_to_speech_wav(
     instructions: str | None = None,
     api_key: str | None = None,
     base_url: str | None = None,
+    client: OpenAI | None = None,
 ) -> bytes:
     """
     Convert text to speech audio in WAV format using OpenAI TTS API.
+
+    A new client is created for the call unless one is passed in.
     """
     # Log received input parameters (excluding sensitive data)
     logger.info(
@@ -69,9 +119,9 @@ def text_to_speech_wav(
     if not text or not text.strip():
         raise ValueError("Error: Text content cannot be empty.")
 
-    if len(text) > 4096:
+    if len(text) > MAX_TTS_CHARS:
         raise ValueError(
-            f"Error: Text length ({len(text)}) exceeds 4096 character limit."
+            f"Error: Text length ({len(text)}) exceeds {MAX_TTS_CHARS} character limit."
         )
 
     if not (0.25 <= final_speed <= 4.0):
@@ -83,7 +133,8 @@ def text_to_speech_wav(
         raise ValueError(f"Error: Unsupported model '{final_model}'.")
 
     try:
-        client = OpenAI(api_key=final_api_key, base_url=final_base_url)
+        if client is None:
+            client = OpenAI(api_key=final_api_key, base_url=final_base_url)
         logger.info(f"Generating TTS: model={final_model}, voice={final_voice}")
 
         # Explicit parameter passing, not using dictionary unpacking (**api_params)
@@ -187,6 +238,275 @@ def get_duration(audio_bytes: bytes) -> float:
         return 0.0
 
 
+def split_sentences(
+    text: str, min_chars: int = DEFAULT_MIN_SEGMENT_CHARS
+) -> tuple[list[str], str]:
+    """
+    Split text into speakable segments at sentence boundaries.
+
+    Sentences shorter than min_chars are merged with the following ones, and
+    text without a boundary is cut at whitespace before MAX_TTS_CHARS.
+
+    Args:
+        text: Text to split, possibly ending in an unfinished sentence.
+        min_chars: Minimum length of a segment.
+
+    Returns:
+        Tuple of (complete segments, remaining unfinished text)
+    """
+    segments: list[str] = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end()
+        if len(text[start:end].strip()) >= min_chars:
+            segments.append(text[start:end].strip())
+            start = end
+    rest = text[start:]
+    while len(rest) > MAX_TTS_CHARS:
+        cut = rest.rfind(" ", 0, MAX_TTS_CHARS)
+        if cut <= 0:
+            cut = MAX_TTS_CHARS
+        segments.append(rest[:cut].strip())
+        rest = rest[cut:]
+    return segments, rest
+
+
+def cached_text_to_speech_wav(text: str) -> bytes:
+    """
+    Convert text to speech with the current TTS configuration, reusing audio
+    synthesized before.
+
+    Audio is looked up in the on-disk TTS cache by text, model, voice, speed
+    and base URL; misses are synthesized with the shared client and stored.
+
+    Args:
+        text: Text to speak.
+
+    Returns:
+        WAV audio bytes
+    """
+    return _configured_synthesizer()(text)
+
+
+def _configured_synthesizer() -> Callable[[str], bytes]:
+    """Bind cached synthesis to the TTS configuration read once, up front."""
+    config = get_tts_config()
+    model = str(config["model"])
+    voice = str(config["voice"])
+    speed = float(config["speed"])
+    api_key = str(config["api_key"])
+    base_url = str(config["base_url"])
+    cache = get_tts_cache()
+
+    def synthesize(text: str) -> bytes:
+        key = tts_cache_key(text, model, voice, speed, base_url)
+        audio = cache.get(key)
+        if audio is not None:
+            logger.debug("TTS cache hit for %d characters", len(text))
+            return audio
+        audio = text_to_speech_wav(
+            text,
+            model=model,
+            voice=voice,
+            speed=speed,
+            api_key=api_key,
+            base_url=base_url,
+            client=get_tts_client(api_key, base_url),
+        )
+        cache.put(key, audio)
+        return audio
+
+    return synthesize
+
+
+@dataclass
+class SpeechPipelineStats:
+    """
+    Counters of a SpeechPipeline.
+
+    Attributes:
+        segments: Segments submitted for synthesis
+        played: Audio chunks handed out for playback
+        failures: Segments whose synthesis failed
+        time_to_first_audio: Seconds from the first text to the first audio
+                             chunk, None until audio was handed out
+        audio_seconds: Total duration of the audio handed out
+    """
+
+    segments: int = 0
+    played: int = 0
+    failures: int = 0
+    time_to_first_audio: float | None = None
+    audio_seconds: float = 0.0
+
+
+class SpeechPipeline:
+    """
+    Sentence-pipelined speech synthesis for streamed text.
+
+    feed() collects streamed text and submits each complete sentence to a
+    worker pool; finish() submits the unfinished remainder. next_audio()
+    returns the next chunk in order once it is synthesized and the previous
+    chunk has finished playing, without waiting unless asked to. Polling
+    next_audio() until `done` plays the rest of an answer without blocking.
+
+    Example:
+        pipeline = SpeechPipeline()
+        for chunk in chunks:
+            pipeline.feed(chunk)
+            while (audio := pipeline.next_audio()) is not None:
+                st.audio(audio, autoplay=True)
+        pipeline.finish()
+        while (audio := pipeline.next_audio(wait=True)) is not None:
+            st.audio(audio, autoplay=True)
+        pipeline.close()
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], bytes] | None = None,
+        max_workers: int = DEFAULT_TTS_WORKERS,
+        min_chars: int = DEFAULT_MIN_SEGMENT_CHARS,
+        duration: Callable[[bytes], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            synthesize: Text to audio function, cached synthesis with the
+                        current TTS configuration by default.
+            max_workers: Concurrent synthesis requests.
+            min_chars: Minimum length of a synthesized segment.
+            duration: Audio duration function, get_duration by default.
+            clock: Time source, for tests.
+            sleep: Sleep function used by next_audio(wait=True), for tests.
+        """
+        self._synthesize = synthesize or _configured_synthesizer()
+        self._duration = duration or get_duration
+        self._clock = clock
+        self._sleep = sleep
+        self.min_chars = min_chars
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tts"
+        )
+        self._queue: deque[Future[bytes]] = deque()
+        self._buffer = ""
+        self._started: float | None = None
+        self._playing_until = 0.0
+        self._stats = SpeechPipelineStats()
+        self._lock = threading.Lock()
+
+    def feed(self, text: str) -> None:
+        """
+        Add streamed text and submit the sentences it completes.
+
+        Args:
+            text: Streamed text chunk.
+        """
+        if not text:
+            return
+        if self._started is None:
+            self._started = self._clock()
+        segments, self._buffer = split_sentences(self._buffer + text, self.min_chars)
+        for segment in segments:
+            self._submit(segment)
+
+    def finish(self) -> None:
+        """Submit the unfinished remainder, e.g. when a message ends."""
+        rest, self._buffer = self._buffer.strip(), ""
+        if rest:
+            self._submit(rest)
+
+    def _submit(self, segment: str) -> None:
+        self._queue.append(self._executor.submit(self._synthesize, segment))
+        with self._lock:
+            self._stats.segments += 1
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted segments not yet handed out."""
+        return len(self._queue)
+
+    @property
+    def done(self) -> bool:
+        """Whether every chunk was handed out and has finished playing."""
+        return not self._queue and self._clock() >= self._playing_until
+
+    def next_audio(self, wait: bool = False) -> bytes | None:
+        """
+        Return the next audio chunk in order if it is ready to play.
+
+        A chunk is ready once its synthesis is done and the previous chunk
+        has finished playing. Failed segments are logged and skipped.
+
+        Args:
+            wait: Wait for synthesis and playback of the previous chunk
+                  instead of returning None.
+
+        Returns:
+            WAV audio bytes, or None if no chunk is ready (or, with wait,
+            none is left)
+        """
+        while self._queue:
+            future = self._queue[0]
+            remaining = self._playing_until - self._clock()
+            if not wait and (not future.done() or remaining > 0):
+                return None
+            if remaining > 0:
+                self._sleep(remaining)
+            self._queue.popleft()
+            try:
+                audio = future.result()
+            except Exception as e:
+                logger.error("TTS segment failed: %s", e)
+                with self._lock:
+                    self._stats.failures += 1
+                continue
+            self._hand_out(audio)
+            return audio
+        return None
+
+    def _hand_out(self, audio: bytes) -> None:
+        now = self._clock()
+        duration = self._duration(audio)
+        self._playing_until = now + duration
+        with self._lock:
+            self._stats.played += 1
+            self._stats.audio_seconds += duration
+            if self._stats.time_to_first_audio is None and self._started is not None:
+                self._stats.time_to_first_audio = now - self._started
+                logger.info(
+                    "TTS time to first audio: %.2f seconds",
+                    self._stats.time_to_first_audio,
+                )
+
+    def stats(self) -> SpeechPipelineStats:
+        """
+        Return a snapshot of the counters.
+
+        Returns:
+            Copy of the current SpeechPipelineStats
+        """
+        with self._lock:
+            return SpeechPipelineStats(**vars(self._stats))
+
+    def close(self) -> None:
+        """Cancel segments not yet synthesized and stop the worker pool."""
+        self._queue.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        stats = self.stats()
+        logger.debug(
+            "TTS pipeline closed: %d segments, %d played, %d failed, "
+            "%.2f seconds of audio",
+            stats.segments,
+            stats.played,
+            stats.failures,
+            stats.audio_seconds,
+        )
+
+
 # --- Usage Example ---
 if __name__ == "__main__":
     test_topology = (
@@ -14,11 +14,19 @@ Supported formats:
 - Error message strings
 - Plain text output
 
+ToolResponseCache memoizes format_tool_response for the chat UI, which
+displays the same tool responses again on every Streamlit rerun.
+
 Author: Guobin Yue
 """
 
 import ast
+import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 from gns3_copilot.log_config import setup_tool_logger
@@ -235,6 +243,181 @@ def format_tool_response(
         return result
 
 
+# Tool responses cached per ToolResponseCache
+DEFAULT_CACHE_ENTRIES = 256
+
+# Responses at least this large have their parse time logged
+LARGE_RESPONSE_BYTES = 64 * 1024
+
+
+@dataclass
+class FormattedToolResponse:
+    """
+    A formatted tool response.
+
+    Attributes:
+        text: Formatted JSON string, as returned by format_tool_response
+        data: The JSON string parsed back, ready for st.json
+        parse_seconds: Time spent formatting and parsing
+    """
+
+    text: str
+    data: Any
+    parse_seconds: float
+
+
+@dataclass
+class ToolResponseCacheStats:
+    """
+    Statistics of a ToolResponseCache since it was created.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that formatted the response
+        evictions: Entries dropped to stay within the size limit
+        parse_seconds: Total time spent formatting on misses
+        large_responses: Misses for responses of at least LARGE_RESPONSE_BYTES
+        large_parse_seconds: Time spent formatting those large responses
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    parse_seconds: float = 0.0
+    large_responses: int = 0
+    large_parse_seconds: float = 0.0
+
+
+def content_digest(content: Any) -> tuple[str, int]:
+    """
+    Hash tool message content.
+
+    Args:
+        content: ToolMessage content.
+
+    Returns:
+        tuple: Hex digest and size of the content in bytes.
+    """
+    if isinstance(content, str):
+        data = content.encode("utf-8", errors="surrogatepass")
+    else:
+        data = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), len(data)
+
+
+class ToolResponseCache:
+    """
+    Bounded LRU cache of formatted tool responses.
+
+    Entries are keyed by the ToolMessage ID and a hash of the content, so a
+    message whose content changes is formatted again.
+
+    Example:
+        cache = st.session_state.setdefault("tool_responses", ToolResponseCache())
+        st.json(cache.get(message.content, message.id).data, expanded=2)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str | None, str], FormattedToolResponse] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._stats = ToolResponseCacheStats()
+
+    def get(
+        self,
+        content: str | dict | list | int | float | bool | None,
+        message_id: str | None = None,
+    ) -> FormattedToolResponse:
+        """
+        Get the formatted response, formatting it on a cache miss.
+
+        Args:
+            content: ToolMessage content.
+            message_id: ToolMessage ID.
+
+        Returns:
+            FormattedToolResponse: Formatted text and parsed data.
+        """
+        digest, size = content_digest(content)
+        key = (message_id, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry
+
+        start = time.perf_counter()
+        text = format_tool_response(content)
+        data = json.loads(text)
+        entry = FormattedToolResponse(text, data, time.perf_counter() - start)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            self._stats.misses += 1
+            self._stats.parse_seconds += entry.parse_seconds
+            if size >= LARGE_RESPONSE_BYTES:
+                self._stats.large_responses += 1
+                self._stats.large_parse_seconds += entry.parse_seconds
+        if size >= LARGE_RESPONSE_BYTES:
+            logger.debug(
+                "Formatted %d-byte tool response %s in %.1f ms",
+                size,
+                message_id,
+                entry.parse_seconds * 1000,
+            )
+        return entry
+
+    def lookup(
+        self, message_id: str | None, digest: str
+    ) -> FormattedToolResponse | None:
+        """
+        Get a cached response without the content, e.g. when the content is
+        not held in memory and would have to be loaded first.
+
+        Args:
+            message_id: ToolMessage ID.
+            digest: Content digest from content_digest().
+
+        Returns:
+            FormattedToolResponse or None if not cached.
+        """
+        key = (message_id, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ToolResponseCacheStats:
+        """
+        Get a snapshot of the cache statistics.
+
+        Returns:
+            ToolResponseCacheStats: Counters since the cache was created.
+        """
+        with self._lock:
+            return ToolResponseCacheStats(**vars(self._stats))
+
+
 # Test function to verify the implementation
 def _test_parse_tool_content() -> None:
     """Test function to verify parse_tool_content works correctly with all input types"""
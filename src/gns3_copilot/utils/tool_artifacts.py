@@ -0,0 +1,413 @@
+"""
+Tool Output Artifact Store for GNS3 Copilot.
+
+Tool results such as multi-device command output or topology dictionaries can
+be arbitrarily large. This module keeps the LLM context bounded by applying a
+per-tool output budget: oversized results are stored out of band in a SQLite
+table next to the LangGraph checkpoints, and the model receives a truncated
+head/tail preview plus an artifact handle it can page through with the
+`read_tool_artifact` tool.
+
+Functions:
+    init_artifact_table(conn): Create the tool_artifacts table if needed
+    save_artifact(content, tool_name, thread_id=None): Store a full tool output
+    read_artifact(artifact_id, offset=0, length=...): Read a page of an artifact
+    delete_thread_artifacts(thread_id): Remove all artifacts of a thread
+    iter_thread_artifacts(thread_id): Full artifacts of a thread (archiving)
+    restore_artifact(artifact_id, tool_name, content, thread_id): Store an
+        archived artifact under its original handle
+    get_output_budget(tool_name): Character budget for a tool's output
+    render_tool_output(observation): Tool observation as text
+    apply_output_budget(content, tool_name, thread_id=None): Budget a tool output
+
+Artifacts are stored in the checkpoint database (LANGGRAPH_DB_PATH of
+gns3_copilot.agent.checkpointer) unless a db_path is given.
+
+Constants:
+    TOOL_OUTPUT_BUDGETS: Per-tool character budgets overriding the default
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils.app_config import get_config
+
+logger = setup_logger("tool_artifacts")
+
+# Fallback budget when TOOL_OUTPUT_BUDGET_CHARS is not a valid number
+DEFAULT_OUTPUT_BUDGET_CHARS = 8000
+
+# Per-tool budgets in characters; 0 disables budgeting for that tool
+TOOL_OUTPUT_BUDGETS: dict[str, int] = {
+    # Topology is needed as a whole to plan node and link operations
+    "gns3_topology_reader": 16000,
+    # Pages returned by the artifact reader are already bounded
+    "read_tool_artifact": 0,
+}
+
+# Share of the budget used for the head of a truncated output
+HEAD_RATIO = 0.7
+
+# Default and maximum page size returned by read_artifact
+DEFAULT_PAGE_CHARS = 4000
+MAX_PAGE_CHARS = 8000
+
+# One connection per database file, created with the table on first use.
+# Format: {db_path: connection}
+_connections: dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def _default_db_path() -> str:
+    """Return the checkpoint database path, next to which artifacts are stored."""
+    # Imported here: the checkpointer module imports the retention job, which
+    # imports this module
+    from gns3_copilot.agent.checkpointer import LANGGRAPH_DB_PATH
+
+    return LANGGRAPH_DB_PATH
+
+
+@contextmanager
+def _connection(db_path: str | None = None) -> Iterator[sqlite3.Connection]:
+    """
+    Use the shared connection of a database exclusively.
+
+    The connection is opened and the table created once per database file.
+    """
+    path = db_path or _default_db_path()
+    with _connections_lock:
+        conn = _connections.get(path)
+        if conn is None:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            init_artifact_table(conn)
+            _connections[path] = conn
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def init_artifact_table(conn: sqlite3.Connection) -> None:
+    """
+    Create the tool_artifacts table if it doesn't exist.
+
+    The table structure includes:
+    - artifact_id: Artifact handle given to the model (primary key)
+    - thread_id: Conversation thread that produced the output
+    - tool_name: Name of the tool that produced the output
+    - content: Full tool output
+    - size: Length of the content in characters
+    - created_at: Timestamp of creation
+
+    Args:
+        conn: Connection to the artifact database.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tool_artifacts (
+            artifact_id TEXT PRIMARY KEY,
+            thread_id TEXT,
+            tool_name TEXT NOT NULL,
+            content TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tool_artifacts_thread "
+        "ON tool_artifacts (thread_id)"
+    )
+    conn.commit()
+
+
+def save_artifact(
+    content: str,
+    tool_name: str,
+    thread_id: str | None = None,
+    db_path: str | None = None,
+) -> str:
+    """
+    Store a full tool output and return its artifact handle.
+
+    Args:
+        content: Full tool output.
+        tool_name: Name of the tool that produced the output.
+        thread_id: Optional conversation thread ID.
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Returns:
+        str: The artifact ID.
+    """
+    artifact_id = f"art-{uuid.uuid4().hex[:12]}"
+    with _connection(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO tool_artifacts (artifact_id, thread_id, tool_name, content, size)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (artifact_id, thread_id, tool_name, content, len(content)),
+        )
+        conn.commit()
+
+    logger.info(
+        "Stored artifact %s for tool %s (%d chars, thread_id=%s)",
+        artifact_id,
+        tool_name,
+        len(content),
+        thread_id,
+    )
+    return artifact_id
+
+
+def read_artifact(
+    artifact_id: str,
+    offset: int = 0,
+    length: int = DEFAULT_PAGE_CHARS,
+    db_path: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    Read a page of a stored artifact.
+
+    Only the requested slice is read from SQLite, so paging through a large
+    artifact does not load it into memory as a whole.
+
+    Args:
+        artifact_id: The artifact ID returned by save_artifact.
+        offset: Character offset of the page.
+        length: Page length in characters (capped at MAX_PAGE_CHARS).
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Returns:
+        dict: Page data with artifact_id, tool_name, offset, total_length,
+              next_offset (None on the last page) and content.
+              None if the artifact does not exist.
+    """
+    offset = max(0, int(offset))
+    length = min(max(1, int(length)), MAX_PAGE_CHARS)
+
+    with _connection(db_path) as conn:
+        # SQLite substr() is 1-based
+        row = conn.execute(
+            """
+            SELECT tool_name, size, substr(content, ?, ?) AS page
+            FROM tool_artifacts WHERE artifact_id = ?
+            """,
+            (offset + 1, length, artifact_id),
+        ).fetchone()
+
+    if row is None:
+        logger.warning("Artifact not found: %s", artifact_id)
+        return None
+
+    end = offset + len(row["page"])
+    return {
+        "artifact_id": artifact_id,
+        "tool_name": row["tool_name"],
+        "offset": offset,
+        "total_length": row["size"],
+        "next_offset": end if end < row["size"] else None,
+        "content": row["page"],
+    }
+
+
+def delete_thread_artifacts(thread_id: str, db_path: str | None = None) -> int:
+    """
+    Remove all artifacts produced in a conversation thread.
+
+    Args:
+        thread_id: Conversation thread ID.
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Returns:
+        int: Number of deleted artifacts.
+    """
+    with _connection(db_path) as conn:
+        cursor = conn.execute(
+            "DELETE FROM tool_artifacts WHERE thread_id = ?", (thread_id,)
+        )
+        conn.commit()
+        deleted = cursor.rowcount
+
+    logger.debug("Deleted %d artifacts for thread_id: %s", deleted, thread_id)
+    return deleted
+
+
+def iter_thread_artifacts(
+    thread_id: str, db_path: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over the full artifacts of a conversation thread.
+
+    Artifacts are loaded one at a time, so archiving a thread does not hold
+    all of its outputs in memory.
+
+    Args:
+        thread_id: Conversation thread ID.
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Yields:
+        dict: artifact_id, tool_name and content of each artifact, oldest first.
+    """
+    with _connection(db_path) as conn:
+        artifact_ids = [
+            row["artifact_id"]
+            for row in conn.execute(
+                "SELECT artifact_id FROM tool_artifacts WHERE thread_id = ? "
+                "ORDER BY created_at, rowid",
+                (thread_id,),
+            )
+        ]
+    for artifact_id in artifact_ids:
+        with _connection(db_path) as conn:
+            row = conn.execute(
+                "SELECT tool_name, content FROM tool_artifacts WHERE artifact_id = ?",
+                (artifact_id,),
+            ).fetchone()
+        if row is not None:
+            yield {
+                "artifact_id": artifact_id,
+                "tool_name": row["tool_name"],
+                "content": row["content"],
+            }
+
+
+def restore_artifact(
+    artifact_id: str,
+    tool_name: str,
+    content: str,
+    thread_id: str | None = None,
+    db_path: str | None = None,
+) -> bool:
+    """
+    Store an archived artifact under its original handle.
+
+    The messages of the thread refer to the artifact by its ID, so the ID is
+    kept; an artifact that already exists is left unchanged.
+
+    Args:
+        artifact_id: Artifact ID from the archive.
+        tool_name: Name of the tool that produced the output.
+        content: Full tool output.
+        thread_id: Conversation thread the artifact belongs to.
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Returns:
+        bool: True if the artifact was stored, False if it already existed.
+    """
+    with _connection(db_path) as conn:
+        cursor = conn.execute(
+            """
+            INSERT OR IGNORE INTO tool_artifacts
+                (artifact_id, thread_id, tool_name, content, size)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (artifact_id, thread_id, tool_name, content, len(content)),
+        )
+        conn.commit()
+        return cursor.rowcount == 1
+
+
+def get_output_budget(tool_name: str) -> int:
+    """
+    Get the output budget in characters for a tool.
+
+    Args:
+        tool_name: Name of the tool.
+
+    Returns:
+        int: Character budget, 0 if budgeting is disabled for the tool.
+    """
+    if tool_name in TOOL_OUTPUT_BUDGETS:
+        return TOOL_OUTPUT_BUDGETS[tool_name]
+    try:
+        return max(0, int(get_config("TOOL_OUTPUT_BUDGET_CHARS")))
+    except (TypeError, ValueError):
+        return DEFAULT_OUTPUT_BUDGET_CHARS
+
+
+def render_tool_output(observation: Any) -> str:
+    """
+    Render a tool observation as the text sent to the model.
+
+    Tools return strings, dicts or lists (e.g. per-device results of the
+    multi-device tools). Non-string observations are serialized as JSON, so
+    the output budget applies to them as well.
+
+    Args:
+        observation: Tool observation.
+
+    Returns:
+        str: The observation as text.
+    """
+    if isinstance(observation, str):
+        return observation
+    return json.dumps(observation, default=str, ensure_ascii=False)
+
+
+def apply_output_budget(
+    content: str,
+    tool_name: str,
+    thread_id: str | None = None,
+    budget: int | None = None,
+    db_path: str | None = None,
+) -> str:
+    """
+    Apply the output budget to a tool result.
+
+    Results within the budget are returned unchanged. Oversized results are
+    stored as an artifact and replaced by a head/tail preview with a notice
+    telling the model how to page through the rest.
+
+    Args:
+        content: Tool output as passed to the ToolMessage.
+        tool_name: Name of the tool that produced the output.
+        thread_id: Optional conversation thread ID.
+        budget: Optional budget override in characters.
+        db_path: Optional database path, defaults to the checkpoint database.
+
+    Returns:
+        str: The content to send to the model.
+    """
+    limit = get_output_budget(tool_name) if budget is None else budget
+    if limit <= 0 or len(content) <= limit:
+        return content
+
+    try:
+        artifact_id = save_artifact(content, tool_name, thread_id, db_path)
+    except Exception as e:
+        logger.error(
+            "Failed to store artifact for %s, truncating only: %s", tool_name, e
+        )
+        artifact_id = None
+
+    head_len = int(limit * HEAD_RATIO)
+    tail_len = limit - head_len
+    head = content[:head_len]
+    tail = content[-tail_len:] if tail_len > 0 else ""
+    omitted = len(content) - head_len - tail_len
+
+    if artifact_id:
+        notice = (
+            f"\n\n...[{omitted} characters omitted. Full output ({len(content)} "
+            f"characters) stored as artifact '{artifact_id}'. Call read_tool_artifact "
+            f'with {{"artifact_id": "{artifact_id}", "offset": {head_len}}} '
+            "to read the omitted part only if it is needed.]...\n\n"
+        )
+    else:
+        notice = f"\n\n...[{omitted} characters omitted]...\n\n"
+
+    logger.info(
+        "Budgeted %s output: %d -> %d chars (artifact=%s)",
+        tool_name,
+        len(content),
+        limit,
+        artifact_id,
+    )
+    return head + notice + tail
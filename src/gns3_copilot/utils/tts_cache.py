@@ -0,0 +1,265 @@
+"""
+Persistent TTS Audio Cache for GNS3 Copilot.
+
+The same phrases (status summaries, error explanations, answers replayed
+after a rerun) are often spoken more than once. This module keeps
+synthesized audio on disk, keyed by a hash of everything that determines
+the audio: text, model, voice, speed and the API base URL. Repeated phrases
+are then played without another request to the speech API.
+
+The cache is a directory of WAV files with a size cap. File modification
+times record the last use, so the least recently used files are evicted
+first, also across application restarts.
+
+Classes:
+    TTSAudioCache: Size-capped on-disk LRU cache of synthesized audio
+    TTSCacheStats: Hit, miss and eviction counters
+
+Functions:
+    tts_cache_key(text, model, voice, speed, base_url): Cache key of a request
+    get_tts_cache(): Process-wide cache configured from the app config
+
+Constants:
+    TTS_CACHE_DIR: Directory holding the cached audio files
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from gns3_copilot.log_config import setup_logger
+from gns3_copilot.utils.app_config import get_config
+
+logger = setup_logger("tts_cache")
+
+# Cached audio is stored next to the configuration database
+TTS_CACHE_DIR = os.path.join(os.getcwd(), "data", "tts_cache")
+
+# Fallback size cap when TTS_CACHE_MAX_MB is not a valid number
+DEFAULT_CACHE_MAX_MB = 100.0
+
+_AUDIO_SUFFIX = ".wav"
+
+
+def tts_cache_key(
+    text: str, model: str, voice: str, speed: float, base_url: str
+) -> str:
+    """
+    Build the cache key of a speech request.
+
+    Args:
+        text: Text to speak.
+        model: TTS model name.
+        voice: Voice name.
+        speed: Playback speed.
+        base_url: API base URL (different servers produce different audio).
+
+    Returns:
+        Hexadecimal digest identifying the audio
+    """
+    request = "\x00".join([text, model, voice, f"{speed:g}", base_url])
+    return hashlib.blake2b(request.encode("utf-8"), digest_size=20).hexdigest()
+
+
+@dataclass
+class TTSCacheStats:
+    """
+    Counters of a TTSAudioCache.
+
+    Attributes:
+        hits: Lookups served from disk
+        misses: Lookups that found no audio
+        evictions: Files removed to stay below the size cap
+        entries: Files currently cached
+        size_bytes: Total size of the cached files
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class TTSAudioCache:
+    """
+    Size-capped on-disk LRU cache of synthesized audio.
+
+    The index of cached files is read from the directory on first use and
+    kept in memory; it is safe to use from several threads.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the audio files, created on demand.
+            max_bytes: Size cap; 0 disables the cache.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._stats = TTSCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether audio is cached at all."""
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _AUDIO_SUFFIX)
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Read the cached files, least recently used first."""
+        if self._index is not None:
+            return self._index
+        entries: list[tuple[float, str, int]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_AUDIO_SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        key = entry.name[: -len(_AUDIO_SUFFIX)]
+                        entries.append((stat.st_mtime, key, stat.st_size))
+        except FileNotFoundError:
+            pass
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._size = sum(self._index.values())
+        return self._index
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return cached audio and mark it as recently used.
+
+        Args:
+            key: Key built with tts_cache_key().
+
+        Returns:
+            Audio bytes, or None if not cached
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                self._stats.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    audio = f.read()
+                # The modification time keeps the LRU order across restarts
+                os.utime(path)
+            except OSError as e:
+                logger.warning("Cached TTS audio %s unreadable: %s", key, e)
+                self._size -= index.pop(key)
+                self._stats.misses += 1
+                return None
+            index.move_to_end(key)
+            self._stats.hits += 1
+            return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """
+        Store audio and evict the least recently used files above the cap.
+
+        Args:
+            key: Key built with tts_cache_key().
+            audio: Audio bytes to store.
+        """
+        if not self.enabled or not audio or len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            index = self._load_index()
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so readers never see partial audio
+            tmp_path = os.path.join(self.directory, f".{uuid.uuid4().hex}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(audio)
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                logger.warning("Failed to cache TTS audio: %s", e)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+            self._size += len(audio) - index.pop(key, 0)
+            index[key] = len(audio)
+            self._evict(index)
+
+    def _evict(self, index: OrderedDict[str, int]) -> None:
+        while self._size > self.max_bytes and index:
+            key, size = index.popitem(last=False)
+            self._size -= size
+            self._stats.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            logger.debug("Evicted cached TTS audio %s (%d bytes)", key, size)
+
+    def clear(self) -> None:
+        """Remove all cached audio files."""
+        with self._lock:
+            for key in self._load_index():
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+            self._index = OrderedDict()
+            self._size = 0
+
+    def stats(self) -> TTSCacheStats:
+        """
+        Return a snapshot of the counters.
+
+        Returns:
+            Copy of the current TTSCacheStats
+        """
+        with self._lock:
+            index = self._load_index()
+            return TTSCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(index),
+                size_bytes=self._size,
+            )
+
+
+_cache: TTSAudioCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """
+    Return the process-wide TTS audio cache.
+
+    The size cap is read from TTS_CACHE_MAX_MB (0 disables caching) and
+    updated when the setting changes.
+
+    Returns:
+        The shared TTSAudioCache
+    """
+    global _cache
+    try:
+        max_mb = max(0.0, float(get_config("TTS_CACHE_MAX_MB")))
+    except (TypeError, ValueError):
+        max_mb = DEFAULT_CACHE_MAX_MB
+    max_bytes = int(max_mb * 1024 * 1024)
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTSAudioCache(TTS_CACHE_DIR, max_bytes)
+        elif _cache.max_bytes != max_bytes:
+            with _cache._lock:
+                _cache.max_bytes = max_bytes
+                if _cache.enabled:
+                    _cache._evict(_cache._load_index())
+        return _cache
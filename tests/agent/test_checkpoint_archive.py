@@ -0,0 +1,250 @@
+"""
+Tests for checkpoint_archive module.
+Contains test cases for the streaming NDJSON session archive.
+
+Test Coverage:
+1. TestRoundTrip
+   - Several threads exported and imported, plain and gzip
+   - New thread IDs by default, archived IDs kept on request
+   - Imported sessions indexed for the session list
+   - Tool artifacts restored under their archived IDs
+
+2. TestFilters
+   - Thread ID, title and update time filters
+
+3. TestFormat
+   - One line per record, messages streamed separately
+   - Legacy single-thread export files imported
+   - Malformed archives rejected
+
+4. TestImports
+   - Module import does not load Streamlit
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from gns3_copilot.agent.checkpoint_archive import (
+    ThreadFilter,
+    export_archive,
+    import_archive,
+)
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.checkpoint_utils import export_checkpoint_to_file
+from gns3_copilot.agent.session_index import get_session, list_sessions
+from gns3_copilot.utils.tool_artifacts import (
+    delete_thread_artifacts,
+    read_artifact,
+    save_artifact,
+)
+
+
+def _put_thread(saver, thread_id: str, title: str, turns: int = 2) -> None:
+    checkpoint = empty_checkpoint()
+    messages = []
+    for i in range(turns):
+        messages.append(
+            HumanMessage(content=f"{title} question {i}", id=f"{thread_id}-h{i}")
+        )
+        messages.append(
+            AIMessage(content=f"{title} answer {i}", id=f"{thread_id}-a{i}")
+        )
+    checkpoint["channel_values"] = {
+        "messages": messages,
+        "conversation_title": title,
+        "selected_project": ("lab", "p-1"),
+    }
+    saver.put(
+        {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+        checkpoint,
+        {"source": "loop", "step": 1},
+        {},
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    saver = PooledSqliteSaver(str(tmp_path / "source.db"))
+    _put_thread(saver, "t-ospf", "OSPF lab")
+    _put_thread(saver, "t-bgp", "BGP lab", turns=3)
+    _put_thread(saver, "t-vlan", "VLAN setup")
+    yield saver
+    saver.close()
+
+
+@pytest.fixture
+def target(tmp_path):
+    saver = PooledSqliteSaver(str(tmp_path / "target.db"))
+    yield saver
+    saver.close()
+
+
+def _messages(saver, thread_id: str) -> list:
+    loaded = saver.get_tuple({"configurable": {"thread_id": thread_id}})
+    return loaded.checkpoint["channel_values"]["messages"]
+
+
+class TestRoundTrip:
+    """Test exporting and importing sessions."""
+
+    @pytest.mark.parametrize("name", ["sessions.ndjson", "sessions.ndjson.gz"])
+    def test_all_threads(self, source, target, tmp_path, name):
+        """Test that every thread and message survives the round trip."""
+        path = str(tmp_path / name)
+
+        assert export_archive(source, path) == 3
+        imported = import_archive(target, path)
+
+        assert len(imported) == 3
+        assert not {"t-ospf", "t-bgp", "t-vlan"} & set(imported)
+        titles = sorted(
+            target.get_tuple({"configurable": {"thread_id": t}}).checkpoint[
+                "channel_values"
+            ]["conversation_title"]
+            for t in imported
+        )
+        assert titles == ["BGP lab", "OSPF lab", "VLAN setup"]
+        counts = sorted(len(_messages(target, t)) for t in imported)
+        assert counts == [4, 4, 6]
+
+    def test_keep_ids(self, source, target, tmp_path):
+        """Test that archived IDs are kept and existing threads skipped."""
+        path = str(tmp_path / "sessions.ndjson")
+        export_archive(source, path, ThreadFilter(thread_ids=["t-bgp"]))
+
+        assert import_archive(target, path, keep_ids=True) == ["t-bgp"]
+        assert import_archive(target, path, keep_ids=True) == []
+
+        messages = _messages(target, "t-bgp")
+        assert isinstance(messages[0], HumanMessage)
+        assert messages[-1].content == "BGP lab answer 2"
+
+    def test_imported_sessions_indexed(self, source, target, tmp_path):
+        """Test that imported sessions appear in the session list."""
+        path = str(tmp_path / "sessions.ndjson")
+        export_archive(source, path, ThreadFilter(thread_ids=["t-ospf"]))
+
+        (thread_id,) = import_archive(target, path)
+
+        entry = get_session(target, thread_id)
+        assert entry.title == "OSPF lab"
+        assert entry.message_count == 4
+        assert [e.thread_id for e in list_sessions(target)] == [thread_id]
+
+    def test_artifacts_restored(self, source, target, tmp_path):
+        """Test that tool artifacts of a thread travel with the archive."""
+        artifact_id = save_artifact(
+            "show run\n" * 50,
+            "execute_multiple_device_commands",
+            "t-ospf",
+            db_path=source.db_path,
+        )
+        save_artifact("other", "tool", "t-bgp", db_path=source.db_path)
+        path = str(tmp_path / "sessions.ndjson.gz")
+        export_archive(source, path, ThreadFilter(thread_ids=["t-ospf"]))
+
+        (thread_id,) = import_archive(target, path)
+
+        page = read_artifact(artifact_id, length=10000, db_path=target.db_path)
+        assert page["content"] == "show run\n" * 50
+        assert page["tool_name"] == "execute_multiple_device_commands"
+        assert read_artifact(artifact_id, db_path=source.db_path) is not None
+        # Owned by the imported thread, so deleting it removes the artifact
+        assert delete_thread_artifacts(thread_id, db_path=target.db_path) == 1
+
+
+class TestFilters:
+    """Test thread selection on export."""
+
+    def test_thread_ids(self, source, tmp_path):
+        """Test exporting only the given threads."""
+        path = str(tmp_path / "a.ndjson")
+
+        count = export_archive(
+            source, path, ThreadFilter(thread_ids=["t-ospf", "t-vlan"])
+        )
+
+        assert count == 2
+
+    def test_title(self, source, tmp_path):
+        """Test that the title filter is a case-insensitive substring match."""
+        path = str(tmp_path / "a.ndjson")
+
+        assert export_archive(source, path, ThreadFilter(title="lab")) == 2
+        assert export_archive(source, path, ThreadFilter(title="vlan")) == 1
+
+    def test_since(self, source, tmp_path):
+        """Test that the time filter uses the last update of a session."""
+        source.conn.execute(
+            "UPDATE session_index SET updated_at = ? WHERE thread_id = 't-bgp'",
+            (time.time() - 30 * 86400,),
+        )
+        source.flush()
+        path = str(tmp_path / "a.ndjson")
+
+        assert (
+            export_archive(source, path, ThreadFilter(since=time.time() - 86400)) == 2
+        )
+
+
+class TestFormat:
+    """Test the archive format."""
+
+    def test_lines(self, source, tmp_path):
+        """Test that each record and each message is one JSON line."""
+        path = tmp_path / "a.ndjson"
+        export_archive(source, str(path), ThreadFilter(thread_ids=["t-bgp"]))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+
+        assert [r["type"] for r in records] == (
+            ["header", "thread"] + ["message"] * 6 + ["thread_end", "footer"]
+        )
+        assert records[0]["format"] == "gns3-copilot-archive"
+        assert "messages" not in records[1]["checkpoint"]["channel_values"]
+        assert records[-2]["messages"] == 6
+
+    def test_legacy_export(self, source, target, tmp_path):
+        """Test that single-thread export files can be imported."""
+        path = str(tmp_path / "legacy.json")
+        assert export_checkpoint_to_file(source, "t-vlan", path)
+
+        (thread_id,) = import_archive(target, path)
+
+        assert _messages(target, thread_id)[0].content == "VLAN setup question 0"
+
+    def test_truncated_archive(self, source, target, tmp_path):
+        """Test that an archive ending inside a thread is rejected."""
+        path = tmp_path / "a.ndjson"
+        export_archive(source, str(path), ThreadFilter(thread_ids=["t-bgp"]))
+        lines = path.read_text().splitlines()
+        path.write_text("\n".join(lines[:4]) + "\n")
+
+        with pytest.raises(ValueError):
+            import_archive(target, str(path))
+
+
+class TestImports:
+    """Test the module's dependencies."""
+
+    def test_no_streamlit_import(self):
+        """Test that the archive module does not import Streamlit."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, gns3_copilot.agent.checkpoint_archive; "
+                "print('streamlit' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip().endswith("False")
@@ -0,0 +1,208 @@
+"""
+Tests for checkpoint_retention module.
+Contains test cases for the checkpoint retention job.
+
+Test Coverage:
+1. TestCheckpointIdTime
+   - Timestamp round trip and cutoff ordering
+
+2. TestRetentionRules
+   - Keep latest N checkpoints per thread
+   - Old intermediate writes dropped, latest writes kept
+   - Idle threads archived as NDJSON, removed and importable again
+
+3. TestRunRetention
+   - Report with reclaimed bytes after incremental vacuum
+   - Older databases only converted to incremental vacuum on request
+   - Database without checkpoint tables
+"""
+
+import os
+import sqlite3
+import time
+from unittest.mock import patch
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from gns3_copilot.agent.checkpoint_archive import import_archive
+from gns3_copilot.agent.checkpoint_retention import (
+    RetentionPolicy,
+    checkpoint_id_for_time,
+    checkpoint_id_timestamp,
+    drop_old_writes,
+    find_idle_threads,
+    prune_checkpoints,
+    run_retention,
+)
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.utils.tool_artifacts import read_artifact, save_artifact
+
+
+def _checkpoint_at(timestamp: float) -> dict:
+    """Build an empty checkpoint whose ID encodes the given time."""
+    checkpoint = empty_checkpoint()
+    checkpoint["id"] = checkpoint_id_for_time(timestamp)
+    return checkpoint
+
+
+def _fill(saver, thread_id: str, steps: int, start: float, payload: str = "") -> None:
+    """Store a chain of checkpoints with one write each, 1 minute apart."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    for step in range(steps):
+        checkpoint = _checkpoint_at(start + step * 60)
+        checkpoint["channel_values"] = {"payload": payload}
+        config = saver.put(config, checkpoint, {"step": step}, {})
+        saver.put_writes(config, [("payload", payload)], f"task-{step}")
+    saver.flush()
+
+
+def _count(saver, query: str) -> int:
+    return saver.conn.execute(query).fetchone()[0]
+
+
+class TestCheckpointIdTime:
+    """Test UUIDv6 time helpers."""
+
+    def test_round_trip(self):
+        """Test that cutoff IDs encode the given time."""
+        now = time.time()
+        assert abs(checkpoint_id_timestamp(checkpoint_id_for_time(now)) - now) < 1e-3
+
+    def test_real_ids_ordered_against_cutoff(self):
+        """Test string ordering between real IDs and cutoffs."""
+        real_id = empty_checkpoint()["id"]
+        assert checkpoint_id_for_time(time.time() - 60) < real_id
+        assert checkpoint_id_for_time(time.time() + 60) > real_id
+        assert abs(checkpoint_id_timestamp(real_id) - time.time()) < 5
+
+
+class TestRetentionRules:
+    """Test the individual retention rules."""
+
+    def test_keep_latest(self, tmp_path):
+        """Test that only the latest checkpoints and their writes remain."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _fill(saver, "t1", 10, time.time() - 3600)
+        _fill(saver, "t2", 2, time.time() - 3600)
+
+        checkpoints, writes = prune_checkpoints(saver.conn, 3)
+
+        assert checkpoints == 7
+        assert writes == 7
+        assert (
+            _count(saver, "SELECT COUNT(*) FROM checkpoints WHERE thread_id='t1'") == 3
+        )
+        assert (
+            _count(saver, "SELECT COUNT(*) FROM checkpoints WHERE thread_id='t2'") == 2
+        )
+        latest = saver.get_tuple({"configurable": {"thread_id": "t1"}})
+        assert latest.metadata["step"] == 9
+        saver.close()
+
+    def test_drop_old_writes(self, tmp_path):
+        """Test that old writes go but the latest checkpoint keeps its writes."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _fill(saver, "t1", 5, time.time() - 30 * 86400)
+
+        deleted = drop_old_writes(saver.conn, 7)
+
+        assert deleted == 4
+        latest = saver.get_tuple({"configurable": {"thread_id": "t1"}})
+        assert len(latest.pending_writes) == 1
+        saver.close()
+
+    def test_find_idle_threads(self, tmp_path):
+        """Test idle thread detection by the latest checkpoint."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _fill(saver, "old", 2, time.time() - 100 * 86400)
+        _fill(saver, "new", 2, time.time() - 3600)
+
+        assert find_idle_threads(saver.conn, 30) == ["old"]
+        saver.close()
+
+    def test_archive_idle_threads(self, tmp_path):
+        """Test that idle threads are exported and removed."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _fill(saver, "old", 2, time.time() - 100 * 86400)
+        archive_dir = tmp_path / "archive"
+        policy = RetentionPolicy(
+            keep_latest=0,
+            writes_max_age_days=0,
+            archive_idle_days=30,
+            archive_dir=str(archive_dir),
+        )
+
+        artifact_id = save_artifact("x" * 100, "tool", "old", db_path=saver.db_path)
+
+        report = run_retention(saver, policy)
+
+        assert report["threads_archived"] == 1
+        archive_path = archive_dir / "old.ndjson.gz"
+        assert archive_path.exists()
+        assert saver.get_tuple({"configurable": {"thread_id": "old"}}) is None
+        assert read_artifact(artifact_id, db_path=saver.db_path) is None
+
+        assert import_archive(saver, str(archive_path), keep_ids=True) == ["old"]
+        assert saver.get_tuple({"configurable": {"thread_id": "old"}}) is not None
+        page = read_artifact(artifact_id, db_path=saver.db_path)
+        assert page["content"] == "x" * 100
+        saver.close()
+
+
+class TestRunRetention:
+    """Test complete retention passes."""
+
+    def test_bytes_reclaimed(self, tmp_path):
+        """Test that pruning plus vacuum shrinks the database file."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        _fill(saver, "t1", 60, time.time() - 3600, payload="x" * 20000)
+        saver.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size_before = os.path.getsize(db_path)
+
+        report = run_retention(
+            saver, RetentionPolicy(keep_latest=5, writes_max_age_days=0)
+        )
+
+        assert report["checkpoints_deleted"] == 55
+        assert report["pages_released"] > 0
+        assert report["bytes_reclaimed"] > 0
+        assert os.path.getsize(db_path) < size_before
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        conn.close()
+        saver.close()
+
+    def test_vacuum_conversion_on_request(self, tmp_path):
+        """Test that older databases are only converted when asked to."""
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE filler (x)")
+        conn.close()
+        saver = PooledSqliteSaver(db_path)
+        _fill(saver, "t1", 3, time.time() - 3600)
+        policy = RetentionPolicy(keep_latest=1, writes_max_age_days=0)
+
+        def _auto_vacuum() -> int:
+            check = sqlite3.connect(db_path)
+            try:
+                return check.execute("PRAGMA auto_vacuum").fetchone()[0]
+            finally:
+                check.close()
+
+        report = run_retention(saver, policy)
+        assert report["pages_released"] == 0
+        assert _auto_vacuum() == 0
+
+        run_retention(saver, policy, convert_vacuum=True)
+        assert _auto_vacuum() == 2
+        saver.close()
+
+    def test_empty_database(self, tmp_path):
+        """Test that a database without checkpoints is left alone."""
+        db_path = str(tmp_path / "empty.db")
+        sqlite3.connect(db_path).close()
+
+        report = run_retention(None, RetentionPolicy(), db_path=db_path)
+
+        assert report["checkpoints_deleted"] == 0
@@ -0,0 +1,186 @@
+"""
+Tests for checkpoint_serde module.
+Contains test cases for the compressed checkpoint serializer.
+
+Test Coverage:
+1. TestCompression
+   - Large blobs compressed with the codec in the type
+   - Small and incompressible blobs stored unchanged
+   - zlib fallback codec
+   - Disabled compression
+
+2. TestCompatibility
+   - Old uncompressed rows readable
+   - Compressed rows readable with compression disabled
+   - Round trip through PooledSqliteSaver
+
+3. TestStats
+   - Compression ratio reported
+
+4. TestConfiguration
+   - Serializer built from configuration
+"""
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from gns3_copilot.agent.checkpoint_serde import (
+    CompressedSerializer,
+    create_checkpoint_serializer,
+)
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+
+CLI_OUTPUT = "GigabitEthernet0/1 is up, line protocol is up\n" * 200
+
+
+class TestCompression:
+    """Test compression of serialized blobs."""
+
+    def test_large_blob_compressed(self):
+        """Test that large blobs are compressed and round trip."""
+        serde = CompressedSerializer()
+        message = ToolMessage(content=CLI_OUTPUT, tool_call_id="c1")
+
+        type_, data = serde.dumps_typed(message)
+
+        assert type_.endswith(f"+{serde.codec}")
+        assert len(data) < len(CLI_OUTPUT) / 10
+        assert serde.loads_typed((type_, data)).content == CLI_OUTPUT
+
+    def test_small_blob_unchanged(self):
+        """Test that blobs below the threshold are not compressed."""
+        serde = CompressedSerializer()
+
+        assert serde.dumps_typed("short") == JsonPlusSerializer().dumps_typed("short")
+
+    def test_incompressible_blob_unchanged(self):
+        """Test that blobs that do not shrink are stored as they are."""
+        serde = CompressedSerializer(min_bytes=0)
+        payload = os.urandom(4096)
+
+        type_, data = serde.dumps_typed(payload)
+
+        assert "+" not in type_
+        assert serde.loads_typed((type_, data)) == payload
+
+    def test_zlib_codec(self):
+        """Test the zlib fallback codec."""
+        serde = CompressedSerializer(codec="zlib")
+
+        type_, data = serde.dumps_typed(CLI_OUTPUT)
+
+        assert type_.endswith("+zlib")
+        assert serde.loads_typed((type_, data)) == CLI_OUTPUT
+
+    def test_unknown_codec(self):
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError):
+            CompressedSerializer(codec="lz4")
+
+    def test_disabled(self):
+        """Test that disabled compression stores plain blobs."""
+        serde = CompressedSerializer(enabled=False)
+
+        type_, _ = serde.dumps_typed(CLI_OUTPUT)
+
+        assert "+" not in type_
+
+
+class TestCompatibility:
+    """Test reading rows written with other settings."""
+
+    def test_old_rows_readable(self):
+        """Test that uncompressed rows of the plain serializer load."""
+        plain = JsonPlusSerializer().dumps_typed({"messages": CLI_OUTPUT})
+
+        assert CompressedSerializer().loads_typed(plain) == {"messages": CLI_OUTPUT}
+
+    def test_compressed_rows_readable_when_disabled(self):
+        """Test that turning compression off keeps compressed rows readable."""
+        stored = CompressedSerializer().dumps_typed(CLI_OUTPUT)
+
+        assert CompressedSerializer(enabled=False).loads_typed(stored) == CLI_OUTPUT
+
+    def test_saver_round_trip(self, tmp_path):
+        """Test mixed old and compressed rows in one checkpoint database."""
+        db_path = str(tmp_path / "cp.db")
+        old_saver = PooledSqliteSaver(db_path)
+        old = empty_checkpoint()
+        old["channel_values"] = {"output": CLI_OUTPUT}
+        old_saver.put(
+            {"configurable": {"thread_id": "old", "checkpoint_ns": ""}}, old, {}, {}
+        )
+        old_saver.close()
+
+        saver = PooledSqliteSaver(db_path, serde=CompressedSerializer())
+        config = saver.put(
+            {"configurable": {"thread_id": "new", "checkpoint_ns": ""}}, old, {}, {}
+        )
+        saver.put_writes(config, [("output", CLI_OUTPUT)], "task-1")
+
+        for thread_id in ("old", "new"):
+            loaded = saver.get_tuple({"configurable": {"thread_id": thread_id}})
+            assert loaded.checkpoint["channel_values"]["output"] == CLI_OUTPUT
+        assert loaded.pending_writes[0][2] == CLI_OUTPUT
+        saver.close()
+
+        conn = sqlite3.connect(db_path)
+        types = dict(conn.execute("SELECT thread_id, type FROM checkpoints"))
+        conn.close()
+        assert "+" not in types["old"]
+        assert "+" in types["new"]
+
+
+class TestStats:
+    """Test compression statistics."""
+
+    def test_ratio(self):
+        """Test that the ratio reflects raw and stored sizes."""
+        serde = CompressedSerializer()
+        serde.dumps_typed(CLI_OUTPUT)
+        serde.dumps_typed("short")
+
+        stats = serde.stats()
+
+        assert stats.blobs == 2
+        assert stats.compressed_blobs == 1
+        assert stats.ratio > 10
+        assert stats.raw_bytes > stats.stored_bytes
+
+
+class TestConfiguration:
+    """Test building the serializer from configuration."""
+
+    def test_from_config(self):
+        """Test that configuration controls threshold and enablement."""
+        values = {
+            "CHECKPOINT_COMPRESSION": "False",
+            "CHECKPOINT_COMPRESSION_MIN_BYTES": "4096",
+        }
+        with patch(
+            "gns3_copilot.agent.checkpoint_serde.get_config",
+            side_effect=lambda key, default=None: values.get(key, default),
+        ):
+            serde = create_checkpoint_serializer()
+
+        assert serde.enabled is False
+        assert serde.min_bytes == 4096
+
+    def test_invalid_threshold(self):
+        """Test that an invalid threshold falls back to the default."""
+        with patch(
+            "gns3_copilot.agent.checkpoint_serde.get_config",
+            side_effect=lambda key, default=None: (
+                "abc" if key == "CHECKPOINT_COMPRESSION_MIN_BYTES" else default
+            ),
+        ):
+            serde = create_checkpoint_serializer()
+
+        assert serde.enabled is True
+        assert serde.min_bytes == 1024
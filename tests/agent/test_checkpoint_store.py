@@ -0,0 +1,237 @@
+"""
+Tests for checkpoint_store module.
+Contains test cases for the pooled WAL checkpoint saver.
+
+Test Coverage:
+1. TestConnectionConfiguration
+   - WAL journaling and synchronous=NORMAL
+   - Read-only reader connections
+
+2. TestCommits
+   - Intermediate writes committed before the checkpoint exists
+   - Reads see writes of the current step
+   - list reads pending writes from reader connections only
+   - No transaction left open after a write cursor
+   - Failed put rolled back
+   - delete_thread committed
+
+3. TestConcurrency
+   - Reader pool bounded
+   - Concurrent threads writing and reading checkpoints
+
+4. TestGraphIntegration
+   - Compiled graph persists and resumes state
+"""
+
+import sqlite3
+import threading
+from operator import add
+from typing import Annotated
+from unittest.mock import patch
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _count(db_path, table: str) -> int:
+    """Count committed rows using an independent connection."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestConnectionConfiguration:
+    """Test connection pragmas."""
+
+    def test_wal_and_synchronous(self, tmp_path):
+        """Test that the writer uses WAL with synchronous=NORMAL."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+
+        assert saver.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert saver.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        saver.close()
+
+    def test_readers_are_read_only(self, tmp_path):
+        """Test that reader connections cannot write."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        with saver.cursor(transaction=False) as cur:
+            assert cur.execute("PRAGMA query_only").fetchone()[0] == 1
+        saver.close()
+
+
+class TestCommits:
+    """Test that every write call is committed before it returns."""
+
+    def test_writes_committed_before_checkpoint(self, tmp_path):
+        """Test that intermediate writes are durable before the next checkpoint."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        config = saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        saver.put_writes(config, [("messages", "a")], "task-1")
+        saver.put_writes(config, [("messages", "b")], "task-2")
+        assert _count(db_path, "writes") == 2
+        assert not saver.conn.in_transaction
+
+        saver.put(config, empty_checkpoint(), {}, {})
+        assert _count(db_path, "checkpoints") == 2
+        saver.close()
+
+    def test_write_cursor_does_not_hold_lock(self, tmp_path):
+        """Test that a write cursor is committed when it closes."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        saver.setup()
+
+        with saver.cursor() as cur:
+            cur.execute(
+                "INSERT INTO writes (thread_id, checkpoint_ns, checkpoint_id, "
+                "task_id, idx, channel) VALUES ('t1', '', 'c1', 'task', 0, 'x')"
+            )
+
+        assert not saver.conn.in_transaction
+        other = sqlite3.connect(db_path, timeout=0)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+        finally:
+            other.close()
+        saver.close()
+
+    def test_failed_put_rolled_back(self, tmp_path):
+        """Test that a failing put leaves no partial checkpoint."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        with patch(
+            "gns3_copilot.agent.checkpoint_store.upsert_session",
+            side_effect=RuntimeError("boom"),
+        ):
+            with pytest.raises(RuntimeError):
+                saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        assert not saver.conn.in_transaction
+        assert _count(db_path, "checkpoints") == 1
+        saver.close()
+
+    def test_reads_flush_pending_writes(self, tmp_path):
+        """Test that reads see writes of the current step."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        config = saver.put(_config("t1"), empty_checkpoint(), {}, {})
+        saver.put_writes(config, [("messages", "a")], "task-1")
+
+        result = saver.get_tuple(config)
+
+        assert [w[2] for w in result.pending_writes] == ["a"]
+        saver.close()
+
+    def test_list_ignores_uncommitted_writes(self, tmp_path):
+        """Test that list never reads the writer's open transaction."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        config = saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        with saver._transaction():
+            saver.put_writes(config, [("messages", "a")], "task-1")
+            listed = list(saver.list(_config("t1")))
+            assert [t.pending_writes for t in listed] == [[]]
+
+        listed = list(saver.list(_config("t1"), limit=1))
+        assert [w[2] for w in listed[0].pending_writes] == ["a"]
+        assert (
+            listed[0].config["configurable"]["checkpoint_id"]
+            == (config["configurable"]["checkpoint_id"])
+        )
+        saver.close()
+
+    def test_delete_thread_committed(self, tmp_path):
+        """Test that deleting a thread is committed immediately."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        saver.delete_thread("t1")
+
+        assert _count(db_path, "checkpoints") == 0
+        saver.close()
+
+
+class TestConcurrency:
+    """Test concurrent use of the saver."""
+
+    def test_reader_pool_bounded(self, tmp_path):
+        """Test that sequential reads reuse pooled connections."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"), reader_pool_size=2)
+        saver.put(_config("t1"), empty_checkpoint(), {}, {})
+
+        for _ in range(10):
+            saver.get_tuple({"configurable": {"thread_id": "t1"}})
+
+        assert saver._reader_count == 1
+        saver.close()
+
+    def test_concurrent_threads(self, tmp_path):
+        """Test that concurrent sessions keep their own latest checkpoint."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"), reader_pool_size=2)
+        errors: list[Exception] = []
+
+        def _session(index: int) -> None:
+            try:
+                config = saver.put(_config(f"t{index}"), empty_checkpoint(), {}, {})
+                for step in range(20):
+                    saver.put_writes(config, [("step", step)], f"task-{step}")
+                    checkpoint = empty_checkpoint()
+                    config = saver.put(config, checkpoint, {"step": step}, {})
+                    latest = saver.get_tuple(
+                        {"configurable": {"thread_id": f"t{index}"}}
+                    )
+                    assert latest.checkpoint["id"] == checkpoint["id"]
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=_session, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert saver._reader_count <= 2
+        saver.close()
+
+
+class CounterState(TypedDict):
+    count: Annotated[list[int], add]
+
+
+class TestGraphIntegration:
+    """Test the saver as a LangGraph checkpointer."""
+
+    def test_graph_state_persisted(self, tmp_path):
+        """Test that state survives across invocations and restarts."""
+        db_path = str(tmp_path / "cp.db")
+        builder = StateGraph(CounterState)
+        builder.add_node("step", lambda state: {"count": [len(state["count"])]})
+        builder.add_edge(START, "step")
+        builder.add_edge("step", END)
+        config = {"configurable": {"thread_id": "t1"}}
+
+        saver = PooledSqliteSaver(db_path)
+        graph = builder.compile(checkpointer=saver)
+        graph.invoke({"count": []}, config)
+        graph.invoke({"count": []}, config)
+        saver.close()
+
+        reopened = builder.compile(checkpointer=PooledSqliteSaver(db_path))
+        assert reopened.get_state(config).values["count"] == [0, 1]
@@ -0,0 +1,260 @@
+"""
+Tests for context_compaction module.
+Contains test cases for conversation history compaction.
+
+Test Coverage:
+1. TestTokenEstimation
+   - String and Gemini list content
+   - Tool call arguments counted
+
+2. TestSelectMessagesToCompact
+   - Recent turns kept verbatim
+   - Tool calls never separated from tool responses
+   - Oversized current turn folds completed tool rounds only
+
+3. TestCompactContext
+   - RemoveMessage updates and new summary
+   - Previous summary merged
+   - Summarization failure keeps history and postpones the retry
+   - Tool names resolved for unnamed tool results
+
+4. TestRouteToLlm
+   - Routing below and above the budget
+   - No retry before the history grew after a failure
+"""
+
+from unittest.mock import Mock, patch
+
+from langchain.messages import AIMessage, HumanMessage, RemoveMessage, ToolMessage
+
+from gns3_copilot.agent.context_compaction import (
+    CHARS_PER_TOKEN,
+    MESSAGE_TOKEN_OVERHEAD,
+    compact_context,
+    estimate_message_tokens,
+    estimate_tokens,
+    select_messages_to_compact,
+    route_to_llm,
+)
+
+
+def _turn(index: int, size: int = 400) -> list:
+    """Build one user turn with a tool round and a final answer."""
+    return [
+        HumanMessage(content=f"question {index}", id=f"h{index}"),
+        AIMessage(
+            content="",
+            id=f"a{index}",
+            tool_calls=[{"id": f"c{index}", "name": "tool", "args": {}}],
+        ),
+        ToolMessage(
+            content="x" * size, tool_call_id=f"c{index}", name="tool", id=f"t{index}"
+        ),
+        AIMessage(content=f"answer {index}", id=f"f{index}"),
+    ]
+
+
+class TestTokenEstimation:
+    """Test token estimation helpers."""
+
+    def test_string_content(self):
+        """Test estimation of plain string content."""
+        msg = HumanMessage(content="a" * 40)
+        assert estimate_message_tokens(msg) == 40 // CHARS_PER_TOKEN + (
+            MESSAGE_TOKEN_OVERHEAD
+        )
+
+    def test_gemini_list_content(self):
+        """Test estimation of Gemini list content."""
+        msg = AIMessage(content=[{"type": "text", "text": "b" * 80}])
+        assert estimate_message_tokens(msg) == 80 // CHARS_PER_TOKEN + (
+            MESSAGE_TOKEN_OVERHEAD
+        )
+
+    def test_tool_call_arguments_counted(self):
+        """Test that tool call arguments add to the estimate."""
+        plain = AIMessage(content="")
+        with_call = AIMessage(
+            content="",
+            tool_calls=[{"id": "1", "name": "tool", "args": {"cmd": "c" * 100}}],
+        )
+        assert estimate_message_tokens(with_call) > estimate_message_tokens(plain)
+
+    def test_total_estimate(self):
+        """Test that totals are the sum of message estimates."""
+        messages = _turn(1)
+        assert estimate_tokens(messages) == sum(
+            estimate_message_tokens(m) for m in messages
+        )
+
+
+class TestSelectMessagesToCompact:
+    """Test selection of messages to fold into the summary."""
+
+    def test_no_human_messages(self):
+        """Test that nothing is selected without turn boundaries."""
+        assert select_messages_to_compact([AIMessage(content="hi")], 10) == []
+
+    def test_recent_turns_kept(self):
+        """Test that older turns are folded and recent ones kept."""
+        messages = _turn(1) + _turn(2) + _turn(3)
+        keep = estimate_tokens(_turn(2) + _turn(3))
+
+        result = select_messages_to_compact(messages, keep)
+
+        assert [m.id for m in result] == [m.id for m in _turn(1)]
+
+    def test_everything_fits(self):
+        """Test that nothing is folded when all turns fit."""
+        messages = _turn(1) + _turn(2)
+        assert select_messages_to_compact(messages, 10**6) == []
+
+    def test_boundaries_at_turn_starts(self):
+        """Test that tool calls and responses are never separated."""
+        messages = _turn(1) + _turn(2) + _turn(3)
+        keep = estimate_tokens(_turn(3)) + 5
+
+        result = select_messages_to_compact(messages, keep)
+
+        ids = {m.id for m in result}
+        assert ("a2" in ids) == ("t2" in ids)
+        assert "h3" not in ids
+
+    def test_oversized_current_turn(self):
+        """Test folding completed tool rounds of an oversized current turn."""
+        messages = [
+            HumanMessage(content="build lab", id="h1"),
+            AIMessage(
+                content="",
+                id="a1",
+                tool_calls=[{"id": "c1", "name": "tool", "args": {}}],
+            ),
+            ToolMessage(content="x" * 4000, tool_call_id="c1", name="tool", id="t1"),
+            AIMessage(
+                content="",
+                id="a2",
+                tool_calls=[{"id": "c2", "name": "tool", "args": {}}],
+            ),
+            ToolMessage(content="y" * 4000, tool_call_id="c2", name="tool", id="t2"),
+        ]
+
+        result = select_messages_to_compact(messages, 500)
+
+        # Completed round folded, user message and latest round kept
+        assert [m.id for m in result] == ["a1", "t1"]
+
+
+class TestCompactContext:
+    """Test the compact_context node."""
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    @patch("gns3_copilot.agent.context_compaction.create_summary_model")
+    def test_compaction_removes_and_summarizes(self, mock_factory, mock_budget):
+        """Test that folded messages are removed and the summary stored."""
+        messages = _turn(1) + _turn(2) + _turn(3)
+        mock_budget.return_value = (10, estimate_tokens(_turn(3)))
+        mock_model = Mock()
+        mock_model.invoke.return_value = AIMessage(content=" summary text ")
+        mock_factory.return_value = mock_model
+
+        result = compact_context({"messages": messages})
+
+        assert result["conversation_summary"] == "summary text"
+        removed = result["messages"]
+        assert all(isinstance(m, RemoveMessage) for m in removed)
+        assert [m.id for m in removed] == [m.id for m in _turn(1) + _turn(2)]
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    @patch("gns3_copilot.agent.context_compaction.create_summary_model")
+    def test_previous_summary_merged(self, mock_factory, mock_budget):
+        """Test that the existing summary is passed to the summary model."""
+        messages = _turn(1) + _turn(2)
+        mock_budget.return_value = (10, estimate_tokens(_turn(2)))
+        mock_model = Mock()
+        mock_model.invoke.return_value = AIMessage(content="merged")
+        mock_factory.return_value = mock_model
+
+        compact_context({"messages": messages, "conversation_summary": "old facts"})
+
+        request = mock_model.invoke.call_args[0][0]
+        assert "old facts" in request[1].content
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    @patch("gns3_copilot.agent.context_compaction.create_summary_model")
+    def test_failure_keeps_history(self, mock_factory, mock_budget):
+        """Test that summarization errors keep the history and back off."""
+        messages = _turn(1) + _turn(2)
+        keep_recent = estimate_tokens(_turn(2))
+        mock_budget.return_value = (10, keep_recent)
+        mock_factory.side_effect = RuntimeError("no model")
+
+        result = compact_context({"messages": messages})
+
+        assert result == {
+            "compaction_retry_tokens": estimate_tokens(messages) + keep_recent
+        }
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    @patch("gns3_copilot.agent.context_compaction.create_summary_model")
+    def test_unnamed_tool_result(self, mock_factory, mock_budget):
+        """Test that tool results without a name show their tool call's name."""
+        messages = _turn(1) + _turn(2)
+        messages[1] = AIMessage(
+            content="",
+            id="a1",
+            tool_calls=[{"id": "c1", "name": "get_config", "args": {}}],
+        )
+        messages[2] = ToolMessage(content="R1 up", tool_call_id="c1", id="t1")
+        mock_budget.return_value = (10, estimate_tokens(_turn(2)))
+        mock_model = Mock()
+        mock_model.invoke.return_value = AIMessage(content="summary")
+        mock_factory.return_value = mock_model
+
+        compact_context({"messages": messages})
+
+        request = mock_model.invoke.call_args[0][0]
+        assert "Tool result (get_config): R1 up" in request[1].content
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    def test_nothing_to_compact(self, mock_budget):
+        """Test that a short history is returned unchanged."""
+        mock_budget.return_value = (10**6, 10**5)
+        assert compact_context({"messages": _turn(1)}) == {}
+
+
+class TestRouteToLlm:
+    """Test routing before the LLM call."""
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    def test_below_budget(self, mock_budget):
+        """Test routing straight to the LLM below the budget."""
+        mock_budget.return_value = (10**6, 10**5)
+        assert route_to_llm({"messages": _turn(1)}) == "llm_call"
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    def test_above_budget(self, mock_budget):
+        """Test routing to compaction above the budget."""
+        messages = _turn(1) + _turn(2)
+        mock_budget.return_value = (10, estimate_tokens(_turn(2)))
+        assert route_to_llm({"messages": messages}) == "compact_context"
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    def test_above_budget_nothing_foldable(self, mock_budget):
+        """Test that an unfoldable history does not route to compaction."""
+        mock_budget.return_value = (10, 5)
+        messages = [HumanMessage(content="x" * 400, id="h1")]
+        assert route_to_llm({"messages": messages}) == "llm_call"
+
+    @patch("gns3_copilot.agent.context_compaction.get_compaction_budget")
+    def test_retry_postponed_after_failure(self, mock_budget):
+        """Test that a failed compaction is retried once the history grew."""
+        messages = _turn(1) + _turn(2)
+        mock_budget.return_value = (10, estimate_tokens(_turn(2)))
+        state = {
+            "messages": messages,
+            "compaction_retry_tokens": estimate_tokens(messages) + 1,
+        }
+        assert route_to_llm(state) == "llm_call"
+
+        state["messages"] = messages + _turn(3)
+        assert route_to_llm(state) == "compact_context"
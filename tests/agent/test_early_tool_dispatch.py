@@ -0,0 +1,159 @@
+"""
+Tests for early_tool_dispatch module.
+Contains test cases for dispatching read-only tools from streamed chunks.
+
+Test Coverage:
+1. TestEarlyToolDispatcher
+   - Read-only call dispatched once its arguments are complete
+   - Mutating tools never dispatched early
+   - Calls changed or dropped in the final message discarded
+   - Results of abandoned runs dropped after the maximum age
+
+2. TestStreamWithEarlyDispatch
+   - Chunks merged into the final AIMessage
+   - Early result reused by invoke_tool_call
+   - Fallback to invoke without streamed chunks
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from gns3_copilot.agent import early_tool_dispatch
+from gns3_copilot.agent.early_tool_dispatch import (
+    EarlyToolDispatcher,
+    invoke_tool_call,
+    stream_with_early_dispatch,
+)
+
+
+def _chunk(index, args, call_id=None, name=None):
+    """Build a message chunk with a single tool call chunk."""
+    return AIMessageChunk(
+        content="",
+        tool_call_chunks=[{"index": index, "id": call_id, "name": name, "args": args}],
+    )
+
+
+def _tool(result="ok"):
+    """Build a tool double returning a fixed result."""
+    tool = Mock()
+    tool.invoke.return_value = result
+    return tool
+
+
+class TestEarlyToolDispatcher:
+    """Test dispatching while the model streams."""
+
+    def teardown_method(self):
+        early_tool_dispatch._pending.clear()
+
+    def test_dispatch_when_args_complete(self):
+        """Test that a read-only call starts once its JSON is complete."""
+        tool = _tool()
+        dispatcher = EarlyToolDispatcher({"gns3_topology_reader": tool})
+
+        dispatcher.feed(_chunk(0, '{"project_id": ', "c1", "gns3_topology_reader"))
+        assert "c1" not in early_tool_dispatch._pending
+
+        dispatcher.feed(_chunk(0, '"p1"}'))
+        assert "c1" in early_tool_dispatch._pending
+
+        early_tool_dispatch._pending["c1"][1].result(timeout=5)
+        tool.invoke.assert_called_once_with({"project_id": "p1"})
+
+    def test_mutating_tool_not_dispatched(self):
+        """Test that mutating tools wait for the full message."""
+        tool = _tool()
+        dispatcher = EarlyToolDispatcher({"create_gns3_node": tool})
+
+        dispatcher.feed(_chunk(0, '{"tool_input": "{}"}', "c1", "create_gns3_node"))
+
+        assert "c1" not in early_tool_dispatch._pending
+        tool.invoke.assert_not_called()
+
+    def test_finalize_discards_changed_calls(self):
+        """Test that calls missing from the final message are dropped."""
+        dispatcher = EarlyToolDispatcher({"read_tool_artifact": _tool()})
+        dispatcher.feed(_chunk(0, '{"artifact_id": "a"}', "c1", "read_tool_artifact"))
+
+        dispatcher.finalize(AIMessage(content="", tool_calls=[]))
+
+        assert "c1" not in early_tool_dispatch._pending
+
+    def test_abandoned_results_dropped(self):
+        """Test that results no tool node picked up do not stay forever."""
+        tools_by_name = {"gns3_topology_reader": _tool()}
+        # The run ends after the LLM call, before the tool node
+        EarlyToolDispatcher(tools_by_name).feed(
+            _chunk(0, '{"project_id": "p1"}', "c1", "gns3_topology_reader")
+        )
+        assert "c1" in early_tool_dispatch._pending
+
+        # Every result dispatched earlier counts as expired
+        with patch.object(early_tool_dispatch, "EARLY_RESULT_MAX_AGE_SECONDS", -1.0):
+            EarlyToolDispatcher(tools_by_name).feed(
+                _chunk(0, '{"project_id": "p2"}', "c2", "gns3_topology_reader")
+            )
+
+        assert list(early_tool_dispatch._pending) == ["c2"]
+
+
+class TestStreamWithEarlyDispatch:
+    """Test streaming LLM calls with early dispatch."""
+
+    def teardown_method(self):
+        early_tool_dispatch._pending.clear()
+
+    def test_early_result_reused(self):
+        """Test that the tool node reuses the early result."""
+        started = threading.Event()
+        reader = Mock()
+        reader.invoke.side_effect = lambda args: started.set() or {"nodes": []}
+        creator = _tool()
+        tools_by_name = {"gns3_topology_reader": reader, "create_gns3_node": creator}
+
+        def _stream(messages):
+            yield _chunk(0, '{"project_id": "p1"}', "c1", "gns3_topology_reader")
+            # The first call runs while the second one is still generated
+            assert started.wait(timeout=5)
+            yield _chunk(1, '{"tool_input": ', "c2", "create_gns3_node")
+            yield _chunk(1, '"{}"}')
+
+        model = Mock()
+        model.stream.side_effect = _stream
+
+        message = stream_with_early_dispatch(model, [], tools_by_name)
+
+        assert isinstance(message, AIMessage)
+        assert [c["id"] for c in message.tool_calls] == ["c1", "c2"]
+        for call in message.tool_calls:
+            invoke_tool_call(call, tools_by_name)
+        assert reader.invoke.call_count == 1
+        creator.invoke.assert_called_once_with({"tool_input": "{}"})
+
+    def test_fallback_to_invoke(self):
+        """Test that models yielding no chunks are invoked instead."""
+        model = Mock()
+        model.stream.return_value = iter([])
+        model.invoke.return_value = AIMessage(content="hi")
+
+        assert stream_with_early_dispatch(model, [], {}).content == "hi"
+
+    def test_stream_error_discards_dispatched(self):
+        """Test that early calls are dropped when the stream fails."""
+
+        def _stream(messages):
+            yield _chunk(0, '{"project_id": "p1"}', "c1", "gns3_topology_reader")
+            raise RuntimeError("connection reset")
+
+        model = Mock()
+        model.stream.side_effect = _stream
+
+        try:
+            stream_with_early_dispatch(model, [], {"gns3_topology_reader": _tool()})
+        except RuntimeError:
+            pass
+
+        assert "c1" not in early_tool_dispatch._pending
@@ -0,0 +1,176 @@
+"""
+Tests for the gns3_copilot agent graph nodes.
+Contains test cases for the tool execution nodes.
+
+Test Coverage:
+1. TestToolNode
+   - String outputs within the budget unchanged
+   - List outputs over the budget serialized, truncated and stored
+
+2. TestPlanExecutor
+   - Plan report sent as JSON
+   - Combined report budgeted as a whole
+
+3. TestLlmCallTopology
+   - Topology snapshot stored by reference
+   - Last snapshot used when the GNS3 server cannot be reached
+   - Snapshots of another project ignored
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.gns3_copilot import llm_call, plan_executor, tool_node
+from gns3_copilot.agent.plan_execute import PLAN_TOOL_NAME
+from gns3_copilot.utils.tool_artifacts import read_artifact
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Store artifacts in a temporary database with a 1000 character budget."""
+    path = str(tmp_path / "artifacts.db")
+    with (
+        patch("gns3_copilot.utils.tool_artifacts._default_db_path", return_value=path),
+        patch("gns3_copilot.utils.tool_artifacts.get_config", return_value="1000"),
+    ):
+        yield path
+
+
+def _state(tool_name):
+    tool_call = {"name": tool_name, "args": {}, "id": "call-1"}
+    return {"messages": [AIMessage(content="", tool_calls=[tool_call])]}
+
+
+class TestToolNode:
+    """Test the tool execution node."""
+
+    @patch("gns3_copilot.agent.gns3_copilot.invoke_tool_call")
+    def test_small_string_output(self, mock_invoke, db_path):
+        """Test that outputs within the budget are passed unchanged."""
+        mock_invoke.return_value = "ok"
+
+        result = tool_node(_state("gns3_topology_reader"), {})
+
+        message = result["messages"][0]
+        assert message.content == "ok"
+        assert message.tool_call_id == "call-1"
+        assert message.name == "gns3_topology_reader"
+
+    @patch("gns3_copilot.agent.gns3_copilot.invoke_tool_call")
+    def test_list_output_over_budget(self, mock_invoke, db_path):
+        """Test that list outputs are serialized and budgeted."""
+        observation = [{"device_name": f"R{i}", "output": "x" * 500} for i in range(10)]
+        mock_invoke.return_value = observation
+        config = {"configurable": {"thread_id": "thread-1"}}
+
+        result = tool_node(_state("execute_multiple_device_commands"), config)
+
+        content = result["messages"][0].content
+        assert isinstance(content, str)
+        assert content.startswith('[{"device_name": "R0"')
+        assert "read_tool_artifact" in content
+        artifact_id = content.split("artifact '")[1].split("'")[0]
+        page = read_artifact(artifact_id, length=100000, db_path=db_path)
+        full = json.dumps(observation, ensure_ascii=False)
+        assert page["total_length"] == len(full)
+
+
+class TestPlanExecutor:
+    """Test the plan executor node."""
+
+    @patch("gns3_copilot.agent.gns3_copilot.execute_plan_call")
+    def test_report_as_json(self, mock_execute, db_path):
+        """Test that the plan report is serialized as JSON."""
+        report = {"success": True, "failed_step": None, "steps": [{"id": "s1"}]}
+        mock_execute.return_value = report
+
+        result = plan_executor(_state(PLAN_TOOL_NAME), {})
+
+        message = result["messages"][0]
+        assert json.loads(message.content) == report
+        assert message.name == PLAN_TOOL_NAME
+
+    @patch("gns3_copilot.agent.gns3_copilot.execute_plan_call")
+    def test_report_budgeted(self, mock_execute, db_path):
+        """Test that a report of many steps is budgeted as a whole."""
+        steps = [{"id": f"s{i}", "result": "x" * 900} for i in range(5)]
+        mock_execute.return_value = {"success": True, "steps": steps}
+
+        result = plan_executor(_state(PLAN_TOOL_NAME), {})
+
+        content = result["messages"][0].content
+        assert "read_tool_artifact" in content
+        assert len(content) < 1500
+
+
+@pytest.fixture
+def llm_env(tmp_path):
+    """Run llm_call against a temporary checkpointer and a fake model."""
+    saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+    with (
+        patch("gns3_copilot.agent.gns3_copilot.get_checkpointer", return_value=saver),
+        patch("gns3_copilot.agent.gns3_copilot.load_system_prompt", return_value="p"),
+        patch("gns3_copilot.agent.gns3_copilot.is_planner_enabled", return_value=False),
+        patch("gns3_copilot.agent.gns3_copilot.create_base_model_with_tools"),
+        patch("gns3_copilot.agent.gns3_copilot.stream_with_early_dispatch") as stream,
+        patch("gns3_copilot.agent.gns3_copilot.GNS3TopologyTool") as topology_tool,
+    ):
+        stream.return_value = AIMessage(content="done")
+        yield saver, topology_tool.return_value, stream
+    saver.close()
+
+
+def _llm_state(topology_ref=None):
+    return {
+        "messages": [HumanMessage(content="show the topology")],
+        "selected_project": ("lab", "p-1", 2, 1, "opened"),
+        "topology_ref": topology_ref,
+    }
+
+
+def _context(stream) -> str:
+    messages = stream.call_args.args[1]
+    return "\n".join(str(m.content) for m in messages[1:-1])
+
+
+class TestLlmCallTopology:
+    """Test the topology context of llm_call."""
+
+    def test_snapshot_stored_by_reference(self, llm_env):
+        """Test that the live topology is passed and stored by reference."""
+        _, topology_tool, stream = llm_env
+        topology_tool._run.return_value = {"project_id": "p-1", "nodes": {"R1": {}}}
+
+        result = llm_call(_llm_state())
+
+        assert len(result["topology_ref"]["hash"]) == 64
+        assert "Topology:" in _context(stream)
+
+    def test_last_snapshot_when_offline(self, llm_env):
+        """Test that the stored snapshot is resolved when GNS3 is unreachable."""
+        _, topology_tool, stream = llm_env
+        topology_tool._run.return_value = {"project_id": "p-1", "nodes": {"R1": {}}}
+        ref = llm_call(_llm_state())["topology_ref"]
+        topology_tool._run.return_value = {"error": "connection refused"}
+
+        result = llm_call(_llm_state(ref))
+
+        assert result["topology_ref"] == ref
+        context = _context(stream)
+        assert "Last known topology" in context
+        assert "'R1'" in context
+
+    def test_snapshot_of_other_project_ignored(self, llm_env):
+        """Test that a snapshot of a previously selected project is not used."""
+        _, topology_tool, stream = llm_env
+        topology_tool._run.return_value = {"project_id": "p-0", "nodes": {"R9": {}}}
+        ref = llm_call(_llm_state())["topology_ref"]
+        topology_tool._run.side_effect = ConnectionError("unreachable")
+
+        llm_call(_llm_state(ref))
+
+        assert "Last known topology" not in _context(stream)
@@ -0,0 +1,333 @@
+"""
+Tests for plan_execute module.
+Contains test cases for plan-and-execute mode.
+
+Test Coverage:
+1. TestResolveReferences
+   - Whole-string and embedded references
+   - Embedded values JSON-escaped in JSON strings
+   - Nested paths through JSON string results
+   - Unresolvable references
+
+2. TestParsePlan
+   - Implicit dependencies from references
+   - Unknown tools, unknown dependencies, duplicates and cycles
+
+3. TestPlanWaves
+   - Independent steps grouped, dependent steps ordered
+
+4. TestRunPlan
+   - Results threaded between steps
+   - Stop at first failed wave, later steps skipped
+   - Lists with a failed device fail their step
+   - Independent steps run concurrently
+
+5. TestExecutePlanCall
+   - Invalid plans reported as errors
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gns3_copilot.agent.plan_execute import (
+    ExecutePlanTool,
+    execute_plan_call,
+    find_references,
+    is_failed_result,
+    parse_plan,
+    plan_waves,
+    resolve_references,
+    run_plan,
+)
+
+
+class FakeTool:
+    """Minimal tool double recording its invocations."""
+
+    def __init__(self, result=None, side_effect=None):
+        self.result = result
+        self.side_effect = side_effect
+        self.calls = []
+
+    def invoke(self, args):
+        self.calls.append(args)
+        if self.side_effect is not None:
+            return self.side_effect(args)
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def no_budget():
+    """Keep step results unbudgeted so no artifacts are written."""
+    with patch(
+        "gns3_copilot.agent.plan_execute.apply_output_budget",
+        side_effect=lambda content, *args, **kwargs: content,
+    ):
+        yield
+
+
+class TestResolveReferences:
+    """Test reference resolution in step arguments."""
+
+    def test_whole_string_reference_keeps_type(self):
+        """Test that a lone reference is replaced by the raw value."""
+        results = {"s1": {"nodes": [{"node_id": "n1"}, {"node_id": "n2"}]}}
+        assert resolve_references({"ids": "${s1.nodes}"}, results) == {
+            "ids": [{"node_id": "n1"}, {"node_id": "n2"}]
+        }
+
+    def test_embedded_reference(self):
+        """Test references inside a JSON tool_input string."""
+        results = {"s1": {"nodes": [{"node_id": "n1"}]}}
+        args = {"tool_input": '{"node_ids": ["${s1.nodes.0.node_id}"]}'}
+
+        resolved = resolve_references(args, results)
+
+        assert json.loads(resolved["tool_input"]) == {"node_ids": ["n1"]}
+
+    def test_embedded_non_string_is_json(self):
+        """Test that embedded non-string values are JSON encoded."""
+        results = {"s1": {"ports": [1, 2]}}
+        assert resolve_references("p=${s1.ports}", results) == "p=[1, 2]"
+
+    def test_embedded_value_json_escaped(self):
+        """Test that quotes and newlines in results keep tool_input valid JSON."""
+        results = {"s1": {"output": 'line "1"\nline 2'}}
+        args = {"tool_input": '{"text": "Output: ${s1.output}"}'}
+
+        resolved = resolve_references(args, results)
+
+        assert json.loads(resolved["tool_input"]) == {
+            "text": 'Output: line "1"\nline 2'
+        }
+
+    def test_path_through_string_result(self):
+        """Test that string results holding JSON are parsed for lookups."""
+        results = {"s1": json.dumps({"project_id": "p1"})}
+        assert resolve_references("${s1.project_id}", results) == "p1"
+
+    def test_missing_step(self):
+        """Test that references to steps without results raise KeyError."""
+        with pytest.raises(KeyError):
+            resolve_references("${s9.id}", {})
+
+    def test_missing_path(self):
+        """Test that unknown paths raise KeyError."""
+        with pytest.raises(KeyError):
+            resolve_references("${s1.nodes.5}", {"s1": {"nodes": []}})
+
+    def test_find_references_nested(self):
+        """Test finding references in nested arguments."""
+        args = {"a": ["${s1.x}", {"b": "${s2} and ${s3.y}"}], "c": 1}
+        assert find_references(args) == {"s1", "s2", "s3"}
+
+
+class TestParsePlan:
+    """Test plan parsing and validation."""
+
+    def test_implicit_dependencies(self):
+        """Test that referenced steps become dependencies."""
+        plan = {
+            "steps": [
+                {"id": "s1", "tool": "a", "args": {}},
+                {"id": "s2", "tool": "b", "args": {"x": "${s1.id}"}},
+            ]
+        }
+
+        steps = parse_plan(json.dumps(plan), {"a", "b"})
+
+        assert steps[1]["depends_on"] == ["s1"]
+
+    def test_default_ids(self):
+        """Test that steps without an id are numbered."""
+        steps = parse_plan({"steps": [{"tool": "a"}, {"tool": "a"}]}, {"a"})
+        assert [s["id"] for s in steps] == ["s1", "s2"]
+
+    @pytest.mark.parametrize(
+        "plan, message",
+        [
+            ({"steps": []}, "no steps"),
+            ({"nope": 1}, "'steps' array"),
+            ({"steps": [{"id": "s1", "tool": "x"}]}, "unknown tool"),
+            (
+                {"steps": [{"id": "s1", "tool": "a"}, {"id": "s1", "tool": "a"}]},
+                "Duplicate",
+            ),
+            (
+                {"steps": [{"id": "s1", "tool": "a", "depends_on": ["s7"]}]},
+                "unknown dependency",
+            ),
+            (
+                {
+                    "steps": [
+                        {"id": "s1", "tool": "a", "depends_on": ["s2"]},
+                        {"id": "s2", "tool": "a", "depends_on": ["s1"]},
+                    ]
+                },
+                "cycle",
+            ),
+        ],
+    )
+    def test_invalid_plans(self, plan, message):
+        """Test that malformed plans are rejected."""
+        with pytest.raises(ValueError, match=message):
+            parse_plan(plan, {"a"})
+
+
+class TestPlanWaves:
+    """Test grouping of steps into waves."""
+
+    def test_waves(self):
+        """Test that independent steps share a wave."""
+        steps = [
+            {"id": "s1", "depends_on": []},
+            {"id": "s2", "depends_on": []},
+            {"id": "s3", "depends_on": ["s1", "s2"]},
+            {"id": "s4", "depends_on": ["s3"]},
+        ]
+
+        waves = plan_waves(steps)
+
+        assert [[s["id"] for s in wave] for wave in waves] == [
+            ["s1", "s2"],
+            ["s3"],
+            ["s4"],
+        ]
+
+
+class TestRunPlan:
+    """Test plan execution."""
+
+    def test_results_threaded(self):
+        """Test that results of earlier steps feed later steps."""
+        create = FakeTool(result={"nodes": [{"node_id": "n1"}]})
+        start = FakeTool(result={"started": True})
+        steps = parse_plan(
+            {
+                "steps": [
+                    {"id": "s1", "tool": "create", "args": {"tool_input": "{}"}},
+                    {
+                        "id": "s2",
+                        "tool": "start",
+                        "args": {"tool_input": '{"ids": ["${s1.nodes.0.node_id}"]}'},
+                    },
+                ]
+            },
+            {"create", "start"},
+        )
+
+        report = run_plan(steps, {"create": create, "start": start})
+
+        assert report["status"] == "completed"
+        assert report["failed_step"] is None
+        assert start.calls == [{"tool_input": '{"ids": ["n1"]}'}]
+        assert [s["status"] for s in report["steps"]] == ["success", "success"]
+
+    def test_stops_at_failure(self):
+        """Test that later waves are skipped after a failed step."""
+        ok = FakeTool(result="ok")
+        bad = FakeTool(result={"error": "boom"})
+        later = FakeTool(result="never")
+        steps = parse_plan(
+            {
+                "steps": [
+                    {"id": "s1", "tool": "ok"},
+                    {"id": "s2", "tool": "bad"},
+                    {"id": "s3", "tool": "later", "depends_on": ["s1"]},
+                ]
+            },
+            {"ok", "bad", "later"},
+        )
+
+        report = run_plan(steps, {"ok": ok, "bad": bad, "later": later})
+
+        assert report["status"] == "failed"
+        assert report["failed_step"] == "s2"
+        assert [s["status"] for s in report["steps"]] == [
+            "success",
+            "failed",
+            "skipped",
+        ]
+        assert later.calls == []
+
+    def test_failed_device_in_list_is_failure(self):
+        """Test that a list result with one failed device fails its step."""
+        config = FakeTool(
+            result=[
+                {"device_name": "R1", "status": "success", "output": "ok"},
+                {"device_name": "R2", "status": "failed", "error": "timeout"},
+            ]
+        )
+        later = FakeTool(result="never")
+        steps = parse_plan(
+            {
+                "steps": [
+                    {"id": "s1", "tool": "config"},
+                    {"id": "s2", "tool": "later", "depends_on": ["s1"]},
+                ]
+            },
+            {"config", "later"},
+        )
+
+        report = run_plan(steps, {"config": config, "later": later})
+
+        assert report["failed_step"] == "s1"
+        assert later.calls == []
+
+    def test_successful_list_result(self):
+        """Test that is_failed_result accepts lists without failures."""
+        assert not is_failed_result([{"device_name": "R1", "output": "ok"}])
+        assert is_failed_result([{"error": "Invalid JSON string input"}])
+        assert is_failed_result({"status": "failed"})
+
+    def test_exception_is_failure(self):
+        """Test that a raising tool fails its step."""
+
+        def _raise(args):
+            raise RuntimeError("device unreachable")
+
+        steps = parse_plan({"steps": [{"id": "s1", "tool": "t"}]}, {"t"})
+
+        report = run_plan(steps, {"t": FakeTool(side_effect=_raise)})
+
+        assert report["status"] == "failed"
+        assert "device unreachable" in report["steps"][0]["result"]
+
+    def test_independent_steps_concurrent(self):
+        """Test that steps of one wave run at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _wait(args):
+            barrier.wait()
+            return "done"
+
+        tool = FakeTool(side_effect=_wait)
+        steps = parse_plan(
+            {"steps": [{"id": f"s{i}", "tool": "t"} for i in range(3)]}, {"t"}
+        )
+
+        report = run_plan(steps, {"t": tool}, max_workers=3)
+
+        assert report["status"] == "completed"
+
+
+class TestExecutePlanCall:
+    """Test execution of execute_plan tool calls."""
+
+    def test_invalid_plan(self):
+        """Test that invalid plans are returned as errors."""
+        result = execute_plan_call({"tool_input": "not json"}, {"t": FakeTool()})
+        assert "error" in result
+
+    @patch("gns3_copilot.agent.plan_execute.get_max_workers", return_value=2)
+    def test_tool_runs_plan(self, mock_workers):
+        """Test that the ExecutePlanTool executes a plan directly."""
+        tool = ExecutePlanTool(tools_by_name={"t": FakeTool(result="ok")})
+
+        result = tool._run(json.dumps({"steps": [{"id": "s1", "tool": "t"}]}))
+
+        assert result["status"] == "completed"
+        assert result["steps"][0]["result"] == "ok"
@@ -0,0 +1,175 @@
+"""
+Tests for session_cli module.
+Contains test cases for the `gns3-copilot sessions` command.
+
+Test Coverage:
+1. TestCommands
+   - list, inspect, search and prune output
+   - prune --vacuum requests the vacuum conversion
+   - export and import round trip
+   - Errors reported with an exit code
+
+2. TestEntryPoint
+   - gns3-copilot dispatches the sessions subcommand
+   - The command does not load Streamlit, the graph or model providers
+"""
+
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.session_cli import main
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "cp.db")
+    saver = PooledSqliteSaver(path)
+    for thread_id, title in (("t-ospf", "OSPF lab"), ("t-bgp", "BGP lab")):
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {
+            "messages": [
+                HumanMessage(content=f"check {title} neighbors", id=f"{thread_id}-h"),
+                AIMessage(
+                    content="",
+                    id=f"{thread_id}-a",
+                    tool_calls=[{"name": "show", "args": {}, "id": "c1"}],
+                ),
+                ToolMessage(
+                    content="Full",
+                    name="show",
+                    tool_call_id="c1",
+                    id=f"{thread_id}-t",
+                ),
+            ],
+            "conversation_title": title,
+        }
+        saver.put(
+            {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+            checkpoint,
+            {"source": "import", "step": 3},
+            {},
+        )
+    saver.close()
+    return path
+
+
+class TestCommands:
+    """Test the subcommands."""
+
+    def test_list(self, db_path, capsys):
+        """Test listing sessions as text and JSON."""
+        assert main(["--db", db_path, "list"]) == 0
+        output = capsys.readouterr().out
+        assert "OSPF lab" in output
+        assert "2 of 2 sessions" in output
+
+        assert main(["--db", db_path, "list", "--limit", "1", "--json"]) == 0
+        entries = json.loads(capsys.readouterr().out)
+        assert len(entries) == 1
+        assert entries[0]["message_count"] == 3
+
+    def test_inspect(self, db_path, capsys):
+        """Test inspecting a session from its checkpoint."""
+        assert main(["--db", db_path, "inspect", "t-bgp", "--json"]) == 0
+
+        info = json.loads(capsys.readouterr().out)
+        assert info["conversation_title"] == "BGP lab"
+        assert info["message_types"] == {"human": 1, "ai": 1, "tool": 1, "unknown": 0}
+        assert info["step"] == 3
+        assert info["ui_compatible"] is True
+
+    def test_inspect_missing_thread(self, db_path, capsys):
+        """Test that unknown threads fail."""
+        assert main(["--db", db_path, "inspect", "nope"]) == 1
+        assert "Error" in capsys.readouterr().out
+
+    def test_search(self, db_path, capsys):
+        """Test full-text search."""
+        assert main(["--db", db_path, "search", "ospf", "--json"]) == 0
+
+        hits = json.loads(capsys.readouterr().out)
+        assert [hit["thread_id"] for hit in hits] == ["t-ospf"]
+
+    def test_prune(self, db_path, capsys):
+        """Test that prune prints the retention report."""
+        with patch(
+            "gns3_copilot.agent.checkpoint_retention.get_config", return_value=None
+        ):
+            assert main(["--db", db_path, "prune", "--keep-latest", "1"]) == 0
+
+        assert "checkpoints_deleted: 0" in capsys.readouterr().out
+
+    def test_prune_vacuum(self, db_path, capsys):
+        """Test that prune --vacuum converts the database to incremental vacuum."""
+        with (
+            patch(
+                "gns3_copilot.agent.checkpoint_retention.get_config", return_value=None
+            ),
+            patch("gns3_copilot.agent.session_cli.run_retention") as mock_run,
+        ):
+            mock_run.return_value = {}
+            assert main(["--db", db_path, "prune", "--vacuum"]) == 0
+
+        assert mock_run.call_args.kwargs["convert_vacuum"] is True
+
+    def test_export_import(self, db_path, tmp_path, capsys):
+        """Test exporting and importing through the command."""
+        path = str(tmp_path / "cli.ndjson.gz")
+        target_db = str(tmp_path / "target.db")
+
+        assert main(["--db", db_path, "export", path, "--title", "ospf"]) == 0
+        assert main(["--db", target_db, "import", path]) == 0
+
+        output = capsys.readouterr().out
+        assert "Exported 1 sessions" in output
+        assert "Imported 1 sessions" in output
+
+    def test_missing_file(self, tmp_path, capsys):
+        """Test that a missing archive is reported with an exit code."""
+        code = main(
+            ["--db", str(tmp_path / "x.db"), "import", str(tmp_path / "no.ndjson")]
+        )
+
+        assert code == 1
+        assert "Error" in capsys.readouterr().out
+
+
+class TestEntryPoint:
+    """Test running the command from gns3-copilot."""
+
+    def test_dispatch(self, db_path, capsys):
+        """Test that gns3-copilot passes the sessions arguments through."""
+        from gns3_copilot import main as entry_point
+
+        with patch.object(
+            sys, "argv", ["gns3-copilot", "sessions", "--db", db_path, "list"]
+        ):
+            assert entry_point.main() == 0
+
+        assert "2 of 2 sessions" in capsys.readouterr().out
+
+    def test_lightweight_imports(self, db_path):
+        """Test that the command does not load the app, graph or providers."""
+        script = (
+            "import sys\n"
+            "from gns3_copilot.agent.session_cli import main\n"
+            f"main(['--db', {db_path!r}, 'list'])\n"
+            "heavy = ['streamlit', 'openai', 'langgraph.pregel',\n"
+            "         'gns3_copilot.agent.gns3_copilot', 'gns3_copilot.tools_v2']\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,162 @@
+"""
+Tests for session_index module.
+Contains test cases for the session metadata index.
+
+Test Coverage:
+1. TestIndexMaintenance
+   - Row created and updated with root checkpoints
+   - Fields missing from a checkpoint keep their value
+   - Subgraph checkpoints ignored
+   - Row removed with the thread
+
+2. TestListing
+   - Paging ordered by last update
+   - Missing table handled
+
+3. TestBackfill
+   - Threads stored before the index are indexed once
+"""
+
+import sqlite3
+import time
+
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from gns3_copilot.agent.checkpoint_retention import checkpoint_id_for_time
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.session_index import (
+    backfill_session_index,
+    count_sessions,
+    list_sessions,
+)
+
+
+def _config(thread_id: str, checkpoint_ns: str = "") -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns}}
+
+
+def _checkpoint(**channel_values) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = channel_values
+    return checkpoint
+
+
+class TestIndexMaintenance:
+    """Test index updates from stored checkpoints."""
+
+    def test_row_follows_checkpoints(self, tmp_path):
+        """Test that title, message count and project are indexed."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        config = saver.put(_config("t1"), _checkpoint(messages=["a"]), {}, {})
+        saver.put(
+            config,
+            _checkpoint(
+                messages=["a", "b", "c"],
+                conversation_title="OSPF lab",
+                selected_project=("lab", "p-1", 0, 0, "opened"),
+            ),
+            {},
+            {},
+        )
+
+        [entry] = list_sessions(saver)
+
+        assert entry.thread_id == "t1"
+        assert entry.title == "OSPF lab"
+        assert entry.message_count == 3
+        assert (entry.project_name, entry.project_id) == ("lab", "p-1")
+        assert entry.created_at <= entry.updated_at
+        saver.close()
+
+    def test_missing_fields_kept(self, tmp_path):
+        """Test that an input checkpoint does not clear indexed values."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        config = saver.put(
+            _config("t1"),
+            _checkpoint(messages=["a", "b"], conversation_title="Title"),
+            {},
+            {},
+        )
+        saver.put(config, _checkpoint(__start__={"messages": ["c"]}), {}, {})
+
+        [entry] = list_sessions(saver)
+
+        assert entry.title == "Title"
+        assert entry.message_count == 2
+        saver.close()
+
+    def test_subgraph_checkpoints_ignored(self, tmp_path):
+        """Test that only root checkpoints are indexed."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        saver.put(_config("t1", "child:1"), _checkpoint(messages=["a"]), {}, {})
+
+        assert count_sessions(saver) == 0
+        saver.close()
+
+    def test_row_deleted_with_thread(self, tmp_path):
+        """Test that deleting a thread removes its row."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        saver.put(_config("t1"), _checkpoint(messages=["a"]), {}, {})
+
+        saver.delete_thread("t1")
+
+        assert count_sessions(saver) == 0
+        saver.close()
+
+
+class TestListing:
+    """Test paging through the index."""
+
+    def test_paging_by_last_update(self, tmp_path):
+        """Test that pages are ordered by the latest checkpoint time."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        for index in range(5):
+            saver.put(_config(f"t{index}"), _checkpoint(messages=[]), {}, {})
+            time.sleep(0.002)
+        # Touching t0 moves it to the front
+        saver.put(_config("t0"), _checkpoint(messages=["a"]), {}, {})
+
+        first = list_sessions(saver, limit=2)
+        second = list_sessions(saver, limit=2, offset=2)
+
+        assert [e.thread_id for e in first] == ["t0", "t4"]
+        assert [e.thread_id for e in second] == ["t3", "t2"]
+        assert count_sessions(saver) == 5
+        saver.close()
+
+    def test_missing_table(self, tmp_path):
+        """Test that a checkpointer without the index returns nothing."""
+        saver = SqliteSaver(
+            sqlite3.connect(str(tmp_path / "cp.db"), check_same_thread=False)
+        )
+
+        assert list_sessions(saver) == []
+        assert count_sessions(saver) == 0
+
+
+class TestBackfill:
+    """Test indexing of pre-existing threads."""
+
+    def test_backfill(self, tmp_path):
+        """Test that old threads are indexed from their latest checkpoint."""
+        db_path = str(tmp_path / "cp.db")
+        legacy = SqliteSaver(sqlite3.connect(db_path, check_same_thread=False))
+        created = time.time() - 86400
+        first = empty_checkpoint()
+        first["id"] = checkpoint_id_for_time(created)
+        config = legacy.put(_config("old"), first, {}, {})
+        legacy.put(
+            config, _checkpoint(messages=["a", "b"], conversation_title="Old"), {}, {}
+        )
+        legacy.conn.close()
+
+        saver = PooledSqliteSaver(db_path)
+        assert backfill_session_index(saver) == 1
+        assert backfill_session_index(saver) == 0
+
+        [entry] = list_sessions(saver)
+        assert entry.title == "Old"
+        assert entry.message_count == 2
+        assert abs(entry.created_at - created) < 1
+        saver.close()
@@ -0,0 +1,225 @@
+"""
+Tests for session_search module.
+Contains test cases for the full-text session search.
+
+Test Coverage:
+1. TestBuildMatchQuery
+   - Terms quoted as prefixes, FTS5 syntax neutralized
+
+2. TestIncrementalIndex
+   - Messages indexed from checkpoint writes, once
+   - Tool names searchable, tool outputs not
+   - Imported sessions indexed from the checkpoint
+   - Thread removed from the index on delete
+
+3. TestSearch
+   - Ranked thread IDs with titles and snippets
+   - Empty and invalid queries
+
+4. TestBackfill
+   - Threads stored before the index are indexed
+   - Backfill script reads compressed checkpoints
+"""
+
+import runpy
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from gns3_copilot.agent.checkpoint_serde import CompressedSerializer
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.session_search import (
+    backfill_session_search,
+    build_match_query,
+    search_sessions,
+)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _store(saver, thread_id: str, messages: list, title: str | None = None) -> None:
+    """Store one super-step writing the given messages."""
+    config = saver.put(_config(thread_id), empty_checkpoint(), {}, {})
+    saver.put_writes(config, [("messages", messages)], "task-1")
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        "messages": messages,
+        "conversation_title": title,
+    }
+    saver.put(config, checkpoint, {}, {})
+
+
+class TestBuildMatchQuery:
+    """Test user input conversion."""
+
+    def test_terms_quoted_as_prefixes(self):
+        """Test that each term becomes a quoted prefix query."""
+        assert build_match_query("ospf  area") == '"ospf"* "area"*'
+
+    def test_fts_syntax_neutralized(self):
+        """Test that quotes and operators are matched literally."""
+        assert build_match_query('say "hi" OR') == '"say"* """hi"""* "OR"*'
+        assert build_match_query("   ") == ""
+
+
+class TestIncrementalIndex:
+    """Test index maintenance by the checkpoint saver."""
+
+    def test_messages_indexed_once(self, tmp_path):
+        """Test that repeated writes of a message are indexed once."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        message = HumanMessage(content="configure ospf on R1", id="m1")
+        config = saver.put(_config("t1"), empty_checkpoint(), {}, {})
+        saver.put_writes(config, [("messages", [message])], "task-1")
+        saver.put_writes(config, [("messages", message)], "task-1")
+        saver.flush()
+
+        count = saver.conn.execute("SELECT COUNT(*) FROM session_search").fetchone()
+        assert count[0] == 1
+        assert [hit.thread_id for hit in search_sessions(saver, "ospf")] == ["t1"]
+        saver.close()
+
+    def test_tool_names_searchable(self, tmp_path):
+        """Test that called tool names match but tool output does not."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _store(
+            saver,
+            "t1",
+            [
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "gns3_topology_reader", "args": {}, "id": "c1"}
+                    ],
+                ),
+                ToolMessage(content="secret-output", tool_call_id="c1"),
+            ],
+        )
+
+        assert len(search_sessions(saver, "gns3_topology_reader")) == 1
+        assert search_sessions(saver, "secret") == []
+        saver.close()
+
+    def test_import_indexed(self, tmp_path):
+        """Test that imported sessions are indexed from their checkpoint."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": [HumanMessage(content="bgp")]}
+
+        saver.put(_config("imported"), checkpoint, {"source": "import"}, {})
+
+        assert [hit.thread_id for hit in search_sessions(saver, "bgp")] == ["imported"]
+        saver.close()
+
+    def test_delete_thread(self, tmp_path):
+        """Test that deleting a thread removes it from the index."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _store(saver, "t1", [HumanMessage(content="vlan 10")])
+
+        saver.delete_thread("t1")
+
+        assert search_sessions(saver, "vlan") == []
+        saver.close()
+
+
+class TestSearch:
+    """Test ranked search results."""
+
+    def test_ranked_hits(self, tmp_path):
+        """Test that threads are ranked and carry titles and snippets."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _store(
+            saver,
+            "strong",
+            [
+                HumanMessage(content="ospf ospf ospf neighbors"),
+                AIMessage(content="ospf is up"),
+            ],
+            title="OSPF lab",
+        )
+        _store(
+            saver,
+            "weak",
+            [HumanMessage(content="show interfaces then check ospf later on R2")],
+        )
+        _store(saver, "other", [HumanMessage(content="rip")])
+
+        hits = search_sessions(saver, "ospf")
+
+        assert [hit.thread_id for hit in hits] == ["strong", "weak"]
+        assert hits[0].title == "OSPF lab"
+        assert "**ospf**" in hits[0].snippet
+        saver.close()
+
+    def test_ip_address_phrase(self, tmp_path):
+        """Test that IP addresses match as a phrase."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _store(saver, "t1", [HumanMessage(content="ping 10.0.0.1 from R1")])
+        _store(saver, "t2", [HumanMessage(content="ping 10.1.0.0 from R1")])
+
+        assert [hit.thread_id for hit in search_sessions(saver, "10.0.0.1")] == ["t1"]
+        saver.close()
+
+    def test_empty_and_invalid_queries(self, tmp_path):
+        """Test that empty or unparsable queries return no hits."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        _store(saver, "t1", [HumanMessage(content="hello")])
+
+        assert search_sessions(saver, "") == []
+        assert search_sessions(saver, "-") == []
+        saver.close()
+
+
+class TestBackfill:
+    """Test indexing of pre-existing threads."""
+
+    def test_backfill(self, tmp_path):
+        """Test that existing threads are indexed once."""
+        db_path = str(tmp_path / "cp.db")
+        legacy = SqliteSaver(sqlite3.connect(db_path, check_same_thread=False))
+        for index in range(3):
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {
+                "messages": [HumanMessage(content=f"legacy thread {index}")]
+            }
+            legacy.put(_config(f"t{index}"), checkpoint, {}, {})
+        legacy.conn.close()
+
+        saver = PooledSqliteSaver(db_path)
+        assert search_sessions(saver, "legacy") == []
+
+        assert backfill_session_search(saver) == 3
+        assert backfill_session_search(saver) == 0
+        assert len(search_sessions(saver, "legacy")) == 3
+        saver.close()
+
+    def test_backfill_script_compressed(self, tmp_path, capsys):
+        """Test that the backfill script reads compressed checkpoints."""
+        db_path = str(tmp_path / "cp.db")
+        legacy = SqliteSaver(
+            sqlite3.connect(db_path, check_same_thread=False),
+            serde=CompressedSerializer(min_bytes=0),
+        )
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {
+            "messages": [HumanMessage(content="compressed ospf thread")]
+        }
+        legacy.put(_config("t1"), checkpoint, {}, {})
+        legacy.conn.close()
+        script = Path(__file__).parents[2] / "scripts" / "backfill_session_search.py"
+
+        backfill = runpy.run_path(str(script), run_name="backfill")
+        with patch.object(sys, "argv", ["backfill", "--db", db_path]):
+            backfill["main"]()
+
+        assert "Indexed 1 messages" in capsys.readouterr().out
+        saver = PooledSqliteSaver(db_path, serde=CompressedSerializer())
+        assert [hit.thread_id for hit in search_sessions(saver, "ospf")] == ["t1"]
+        saver.close()
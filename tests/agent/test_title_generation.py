@@ -0,0 +1,133 @@
+"""
+Tests for title_generation module.
+Contains test cases for background conversation title generation.
+
+Test Coverage:
+1. TestHeuristicTitle
+   - First sentence used, IP addresses kept intact
+   - Long and empty messages
+
+2. TestGenerateTitleText
+   - Model title cleaned
+   - Heuristic fallback on model failure and in heuristic mode
+
+3. TestScheduleTitleGeneration
+   - Title written into the checkpoint in the background
+   - Threads with a title are left untouched
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from langchain.messages import AIMessage, HumanMessage
+
+from gns3_copilot.agent.title_generation import (
+    MAX_TITLE_LENGTH,
+    generate_title_text,
+    heuristic_title,
+    needs_title,
+    schedule_title_generation,
+    wait_for_title,
+)
+
+MESSAGES = [
+    HumanMessage(content="Ping 10.1.1.1 from R1. Then check OSPF."),
+    AIMessage(content="R1 can reach 10.1.1.1."),
+]
+
+
+class TestHeuristicTitle:
+    """Test the local title heuristic."""
+
+    def test_first_sentence(self):
+        """Test that only the first sentence is used."""
+        assert heuristic_title("Ping 10.1.1.1 from R1. Then check OSPF.") == (
+            "Ping 10.1.1.1 from R1"
+        )
+
+    def test_chinese_sentence(self):
+        """Test splitting at Chinese sentence punctuation."""
+        assert heuristic_title("配置OSPF。然后检查邻居") == "配置OSPF"
+
+    def test_long_message_truncated(self):
+        """Test that long titles are truncated."""
+        title = heuristic_title("x" * 100)
+        assert len(title) == MAX_TITLE_LENGTH + 1
+        assert title.endswith("...")
+
+    def test_empty_message(self):
+        """Test the placeholder for empty messages."""
+        assert heuristic_title("   ") == "GNS3 Session"
+
+
+class TestGenerateTitleText:
+    """Test title generation with the title model."""
+
+    @patch("gns3_copilot.agent.title_generation.get_config", return_value="llm")
+    @patch("gns3_copilot.agent.title_generation.create_title_model")
+    def test_model_title_cleaned(self, mock_factory, mock_config):
+        """Test that quotes and line breaks are removed."""
+        mock_model = Mock()
+        mock_model.invoke.return_value = AIMessage(content='"R1 OSPF\nCheck"')
+        mock_factory.return_value = mock_model
+
+        assert generate_title_text(MESSAGES) == "R1 OSPF Check"
+
+    @patch("gns3_copilot.agent.title_generation.get_config", return_value="llm")
+    @patch("gns3_copilot.agent.title_generation.create_title_model")
+    def test_model_failure_uses_heuristic(self, mock_factory, mock_config):
+        """Test the heuristic fallback when the model fails."""
+        mock_factory.side_effect = RuntimeError("no api key")
+
+        assert generate_title_text(MESSAGES) == "Ping 10.1.1.1 from R1"
+
+    @patch("gns3_copilot.agent.title_generation.get_config", return_value="heuristic")
+    @patch("gns3_copilot.agent.title_generation.create_title_model")
+    def test_heuristic_mode(self, mock_factory, mock_config):
+        """Test that heuristic mode never calls the model."""
+        assert generate_title_text(MESSAGES) == "Ping 10.1.1.1 from R1"
+        mock_factory.assert_not_called()
+
+
+class TestScheduleTitleGeneration:
+    """Test background title generation."""
+
+    def test_needs_title(self):
+        """Test detection of threads without a title."""
+        assert needs_title({"messages": MESSAGES, "conversation_title": None})
+        assert not needs_title({"messages": MESSAGES, "conversation_title": "T"})
+        assert not needs_title({"messages": MESSAGES[:1]})
+
+    @patch(
+        "gns3_copilot.agent.title_generation.generate_title_text",
+        return_value="R1 reachability",
+    )
+    def test_title_written(self, mock_generate):
+        """Test that the title is stored in the checkpoint."""
+        agent = Mock()
+        agent.get_state.return_value = SimpleNamespace(values={"messages": MESSAGES})
+        config = {"configurable": {"thread_id": "thread-1"}}
+
+        future = schedule_title_generation(agent, config)
+
+        assert future.result(timeout=5) == "R1 reachability"
+        agent.update_state.assert_called_once_with(
+            config, {"conversation_title": "R1 reachability"}
+        )
+        wait_for_title("thread-1", timeout=5)
+
+    @patch("gns3_copilot.agent.title_generation.generate_title_text")
+    def test_existing_title_kept(self, mock_generate):
+        """Test that threads with a title are not updated."""
+        agent = Mock()
+        agent.get_state.return_value = SimpleNamespace(
+            values={"messages": MESSAGES, "conversation_title": "Existing"}
+        )
+
+        future = schedule_title_generation(
+            agent, {"configurable": {"thread_id": "thread-2"}}
+        )
+
+        assert future.result(timeout=5) is None
+        mock_generate.assert_not_called()
+        agent.update_state.assert_not_called()
@@ -0,0 +1,148 @@
+"""
+Tests for topology_store module.
+Contains test cases for content-addressed topology snapshots.
+
+Test Coverage:
+1. TestStoreAndLoad
+   - Identical topologies stored once
+   - Recently stored snapshots not written again, no transaction left open
+   - References resolved lazily, from the database or the cache
+   - Missing references
+
+2. TestCheckpointSize
+   - Checkpoints carry the reference, not the topology
+
+3. TestPrune
+   - Snapshots not stored recently deleted
+"""
+
+import time
+from unittest.mock import patch
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from gns3_copilot.agent import topology_store
+from gns3_copilot.agent.checkpoint_store import PooledSqliteSaver
+from gns3_copilot.agent.topology_store import (
+    load_topology,
+    prune_topology_blobs,
+    store_topology,
+)
+
+
+def _topology(nodes: int) -> dict:
+    return {
+        "project_id": "p-1",
+        "nodes": {
+            f"R{i}": {"node_id": f"n{i}", "ports": [{"name": "e0/0"}]}
+            for i in range(nodes)
+        },
+        "links": [],
+    }
+
+
+def _clear_cache() -> None:
+    with topology_store._cache_lock:
+        topology_store._cache.clear()
+        topology_store._written.clear()
+
+
+class TestStoreAndLoad:
+    """Test storing and resolving snapshots."""
+
+    def test_identical_topology_stored_once(self, tmp_path):
+        """Test that equal topologies share one blob regardless of key order."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        first = store_topology(saver, {"a": 1, "b": [1, 2]})
+        second = store_topology(saver, {"b": [1, 2], "a": 1})
+        saver.flush()
+
+        assert first["hash"] == second["hash"]
+        assert second["captured_at"] >= first["captured_at"]
+        count = saver.conn.execute("SELECT COUNT(*) FROM topology_blobs").fetchone()
+        assert count[0] == 1
+        saver.close()
+
+    def test_recent_snapshot_not_written_again(self, tmp_path):
+        """Test that storing a known snapshot skips the write."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        store_topology(saver, _topology(2))
+        assert not saver.conn.in_transaction
+        saver.conn.execute("UPDATE topology_blobs SET last_seen = 0")
+        saver.conn.commit()
+
+        store_topology(saver, _topology(2))
+        last_seen = saver.conn.execute("SELECT last_seen FROM topology_blobs")
+        assert last_seen.fetchone()[0] == 0
+
+        with patch.object(topology_store, "TOPOLOGY_TOUCH_INTERVAL_SECONDS", 0):
+            store_topology(saver, _topology(2))
+        last_seen = saver.conn.execute("SELECT last_seen FROM topology_blobs")
+        assert last_seen.fetchone()[0] > 0
+        saver.close()
+
+    def test_load_from_database(self, tmp_path):
+        """Test that references resolve after a restart."""
+        db_path = str(tmp_path / "cp.db")
+        saver = PooledSqliteSaver(db_path)
+        ref = store_topology(saver, _topology(3))
+        saver.close()
+        _clear_cache()
+
+        reopened = PooledSqliteSaver(db_path)
+        assert load_topology(reopened, ref) == _topology(3)
+        # Second resolution is served from the cache
+        reopened.conn.execute("DELETE FROM topology_blobs")
+        reopened.flush()
+        assert load_topology(reopened, ref) == _topology(3)
+        reopened.close()
+
+    def test_missing_reference(self, tmp_path):
+        """Test that unknown or empty references resolve to None."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+
+        assert load_topology(saver, None) is None
+        assert load_topology(saver, {"hash": "0" * 64, "captured_at": 0.0}) is None
+        saver.close()
+
+
+class TestCheckpointSize:
+    """Test the effect on stored checkpoints."""
+
+    def test_checkpoint_carries_reference_only(self, tmp_path):
+        """Test that checkpoints shrink to the size of the reference."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        topology = _topology(200)
+
+        inline = empty_checkpoint()
+        inline["channel_values"] = {"topology_info": topology}
+        by_ref = empty_checkpoint()
+        by_ref["channel_values"] = {"topology_ref": store_topology(saver, topology)}
+
+        inline_size = len(saver.serde.dumps_typed(inline)[1])
+        ref_size = len(saver.serde.dumps_typed(by_ref)[1])
+
+        assert ref_size * 10 < inline_size
+        saver.close()
+
+
+class TestPrune:
+    """Test pruning of old snapshots."""
+
+    def test_prune_old_blobs(self, tmp_path):
+        """Test that only snapshots not stored recently are deleted."""
+        saver = PooledSqliteSaver(str(tmp_path / "cp.db"))
+        old = store_topology(saver, _topology(1))
+        store_topology(saver, _topology(2))
+        saver.flush()
+        saver.conn.execute(
+            "UPDATE topology_blobs SET last_seen = ? WHERE hash = ?",
+            (time.time() - 30 * 86400, old["hash"]),
+        )
+        saver.flush()
+
+        assert prune_topology_blobs(saver.conn, 7) == 1
+        saver.flush()
+        remaining = saver.conn.execute("SELECT COUNT(*) FROM topology_blobs")
+        assert remaining.fetchone()[0] == 1
+        saver.close()
@@ -112,6 +112,11 @@ Test Coverage:
      * No response object
      * JSON parsing exception
 
+7. TestSharedTokenExtended
+   - V3 token obtained once and reused by other connectors
+   - Token not shared with other users
+   - Token dropped after a 401 response
+
 Total Test Cases: 70+
 """
 
@@ -127,6 +132,7 @@ import requests
 import jwt
 
 # Import modules to test
+from gns3_copilot.gns3_client import custom_gns3fy
 from gns3_copilot.gns3_client.custom_gns3fy import (
     Gns3Connector,
     Node,
@@ -1907,3 +1913,69 @@ class TestErrorHandlingExtended:
         error_str = str(enhanced_error)
         assert "Original Error:" in error_str
         assert "Invalid JSON response" in error_str
+
+
+class TestSharedTokenExtended:
+    """Tests for the v3 JWT token shared by all connectors"""
+
+    @pytest.fixture(autouse=True)
+    def token_cache(self):
+        """Start every test with an empty token cache"""
+        with patch.dict(custom_gns3fy._TOKEN_CACHE, clear=True):
+            yield custom_gns3fy._TOKEN_CACHE
+
+    @staticmethod
+    def _token():
+        return jwt.encode({"exp": time.time() + 3600}, "k" * 32, algorithm="HS256")
+
+    @staticmethod
+    def _connector(user="admin"):
+        return Gns3Connector(
+            url="http://localhost:3080", user=user, cred="pw", api_version=3
+        )
+
+    @patch("requests.Session.post")
+    def test_token_reused(self, mock_post):
+        """Test that a second connector reuses the token without a login"""
+        token = self._token()
+        mock_post.return_value = Mock(status_code=200)
+        mock_post.return_value.json.return_value = {"access_token": token}
+
+        self._connector().authenticate()
+        second = self._connector()
+        second.authenticate()
+
+        assert mock_post.call_count == 1
+        assert second.access_token == token
+        assert second.session.headers["Authorization"] == f"Bearer {token}"
+
+    @patch("requests.Session.post")
+    def test_token_per_user(self, mock_post):
+        """Test that connectors of another user authenticate themselves"""
+        mock_post.return_value = Mock(status_code=200)
+        mock_post.return_value.json.return_value = {"access_token": self._token()}
+
+        self._connector().authenticate()
+        self._connector(user="other").authenticate()
+
+        assert mock_post.call_count == 2
+
+    def test_token_dropped_on_unauthorized(self, token_cache):
+        """Test that a token rejected by the server is not reused"""
+        from requests import HTTPError
+
+        connector = self._connector()
+        token = self._token()
+        token_cache[connector._token_key()] = token
+        response = Mock(status_code=401, headers={})
+        response.raise_for_status.side_effect = HTTPError(
+            "401 Unauthorized", response=response
+        )
+        connector.session = Mock(headers={})
+        connector.session.get.return_value = response
+
+        with pytest.raises(HTTPError):
+            connector.get_version()
+
+        assert connector.access_token == token
+        assert token_cache == {}
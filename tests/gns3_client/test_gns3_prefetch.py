@@ -0,0 +1,148 @@
+"""
+Tests for gns3_prefetch module.
+Contains test cases for results prefetched by the startup warm-up.
+
+Test Coverage:
+1. TestPrefetch
+   - Prefetched result handed out once
+   - Old results dropped
+   - Results kept per server and user
+   - Dropped results not used
+   - Results fetched before a drop not stored
+
+2. TestPrefetchConsumers
+   - Template tool and project list use a prefetched result once
+   - Project changes drop the prefetched project list
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gns3_copilot.gns3_client import gns3_prefetch
+from gns3_copilot.gns3_client.gns3_prefetch import (
+    drop_prefetched,
+    store_prefetched,
+    take_prefetched,
+)
+from gns3_copilot.gns3_client.gns3_project_create import GNS3ProjectCreate
+from gns3_copilot.gns3_client.gns3_projects_list import GNS3ProjectList
+from gns3_copilot.tools_v2.gns3_get_node_temp import GNS3TemplateTool
+
+
+def _connector(url: str = "http://gns3:3080/v2", user: str | None = None) -> Mock:
+    return Mock(base_url=url, user=user)
+
+
+@pytest.fixture(autouse=True)
+def prefetched():
+    """Start every test without prefetched results."""
+    with (
+        patch.dict(gns3_prefetch._prefetched, clear=True),
+        patch.dict(gns3_prefetch._dropped, clear=True),
+    ):
+        yield
+
+
+class TestPrefetch:
+    """Tests for store_prefetched and take_prefetched."""
+
+    def test_taken_once(self):
+        """Test that a prefetched result is used by one caller only."""
+        store_prefetched(_connector(), "templates", ["qemu"], now=10.0)
+
+        assert take_prefetched(_connector(), "templates", now=11.0) == ["qemu"]
+        assert take_prefetched(_connector(), "templates", now=11.0) is None
+
+    def test_old_result_dropped(self):
+        """Test that results older than max_age are not used."""
+        store_prefetched(_connector(), "projects", [], now=10.0)
+
+        assert take_prefetched(_connector(), "projects", max_age=5, now=16.0) is None
+
+    def test_per_server_and_user(self):
+        """Test that results of another server or user are not used."""
+        store_prefetched(_connector(user="admin"), "projects", ["lab"], now=10.0)
+
+        assert take_prefetched(_connector(), "projects", now=10.0) is None
+        other_server = _connector("http://other:3080/v2", "admin")
+        assert take_prefetched(other_server, "projects", now=10.0) is None
+        assert take_prefetched(_connector(user="admin"), "projects", now=10.0) == [
+            "lab"
+        ]
+
+    def test_dropped(self):
+        """Test that a dropped result is not used."""
+        store_prefetched(_connector(), "projects", ["lab"], now=10.0)
+        drop_prefetched(_connector(), "projects", now=11.0)
+
+        assert take_prefetched(_connector(), "projects", now=12.0) is None
+
+    def test_fetched_before_drop_not_stored(self):
+        """Test that a list requested before a project change is not kept."""
+        drop_prefetched(_connector(), "projects", now=11.0)
+
+        store_prefetched(_connector(), "projects", ["old"], fetched_at=10.0, now=12.0)
+        assert take_prefetched(_connector(), "projects", now=12.0) is None
+
+        store_prefetched(_connector(), "projects", ["new"], fetched_at=12.0, now=13.0)
+        assert take_prefetched(_connector(), "projects", now=13.0) == ["new"]
+
+
+class TestPrefetchConsumers:
+    """Tests for tools using prefetched results."""
+
+    def test_templates_tool(self):
+        """Test that the template tool asks the server after the first call."""
+        connector = _connector()
+        connector.get_templates.return_value = [{"name": "live"}]
+        store_prefetched(connector, "templates", [{"name": "prefetched"}])
+
+        with patch(
+            "gns3_copilot.tools_v2.gns3_get_node_temp.get_gns3_connector",
+            return_value=connector,
+        ):
+            first = GNS3TemplateTool()._run()
+            second = GNS3TemplateTool()._run()
+
+        assert first["templates"][0]["name"] == "prefetched"
+        assert second["templates"][0]["name"] == "live"
+        connector.get_templates.assert_called_once()
+
+    def test_project_list(self):
+        """Test that the project list asks the server after the first call."""
+        connector = _connector()
+        connector.projects_summary.return_value = [("live",)]
+        store_prefetched(connector, "projects", [("prefetched",)])
+
+        with patch(
+            "gns3_copilot.gns3_client.gns3_projects_list.get_gns3_connector",
+            return_value=connector,
+        ):
+            first = GNS3ProjectList()._run()
+            second = GNS3ProjectList()._run()
+
+        assert first == {"projects": [("prefetched",)]}
+        assert second == {"projects": [("live",)]}
+
+    def test_project_create_drops_list(self):
+        """Test that creating a project drops the prefetched project list."""
+        connector = _connector()
+        connector.projects_summary.return_value = [("live",), ("new",)]
+        store_prefetched(connector, "projects", [("prefetched",)])
+
+        with (
+            patch(
+                "gns3_copilot.gns3_client.gns3_project_create.get_gns3_connector",
+                return_value=connector,
+            ),
+            patch("gns3_copilot.gns3_client.gns3_project_create.Project"),
+            patch(
+                "gns3_copilot.gns3_client.gns3_projects_list.get_gns3_connector",
+                return_value=connector,
+            ),
+        ):
+            GNS3ProjectCreate()._run({"name": "new"})
+            result = GNS3ProjectList()._run()
+
+        assert result == {"projects": [("live",), ("new",)]}
@@ -0,0 +1,138 @@
+"""
+Tests for chunked transcription in openai_stt module.
+Contains test cases for splitting, stitching and parallel transcription.
+
+Test Coverage:
+1. TestSplitAudioAtSilence
+   - Short recordings kept whole
+   - Cuts placed at silence, neighbouring chunks overlapping
+
+2. TestStitchTranscripts
+   - Words repeated by the overlap dropped once
+   - Transcripts without overlap joined
+
+3. TestTranscribeChunked
+   - Chunks transcribed with one shared client, stitched in order
+   - Partial transcripts reported in order
+   - Short or unreadable audio sent in one request
+"""
+
+import io
+from unittest.mock import Mock, patch
+
+import numpy as np
+import soundfile as sf
+
+from gns3_copilot.utils import openai_stt
+from gns3_copilot.utils.openai_stt import (
+    split_audio_at_silence,
+    stitch_transcripts,
+    transcribe_chunked,
+)
+
+SAMPLERATE = 8000
+
+
+def _wav(*segments: tuple[float, bool]) -> bytes:
+    """Build a WAV recording from (seconds, is_speech) segments."""
+    parts = []
+    for seconds, speech in segments:
+        n = int(seconds * SAMPLERATE)
+        t = np.arange(n) / SAMPLERATE
+        parts.append(0.5 * np.sin(2 * np.pi * 440 * t) if speech else np.zeros(n))
+    buffer = io.BytesIO()
+    sf.write(buffer, np.concatenate(parts), SAMPLERATE, format="WAV")
+    return buffer.getvalue()
+
+
+def _seconds(chunk: bytes) -> float:
+    return sf.info(io.BytesIO(chunk)).duration
+
+
+class TestSplitAudioAtSilence:
+    """Test splitting recordings at quiet points."""
+
+    def test_short_recording_kept(self):
+        """Test that audio up to the chunk length is returned unchanged."""
+        audio = _wav((2.0, True))
+
+        assert split_audio_at_silence(audio, chunk_seconds=5) == [audio]
+
+    def test_cut_at_silence(self):
+        """Test that the cut lands in the pause, with overlap."""
+        audio = _wav((3.0, True), (0.5, False), (3.5, True), (0.4, False), (2, True))
+
+        chunks = split_audio_at_silence(audio, chunk_seconds=5, overlap_seconds=0.2)
+
+        assert len(chunks) == 3
+        # First cut inside the pause between 3.0 and 3.5 seconds
+        assert 3.0 < _seconds(chunks[0]) < 3.5
+        total = sum(_seconds(chunk) for chunk in chunks)
+        assert abs(total - (9.4 + 2 * 0.2)) < 0.05
+
+
+class TestStitchTranscripts:
+    """Test joining chunk transcripts."""
+
+    def test_overlap_removed(self):
+        """Test that words repeated at a boundary are kept once."""
+        text = stitch_transcripts(
+            ["Configure OSPF on router R1.", "router r1, then enable BGP", ""]
+        )
+
+        assert text == "Configure OSPF on router R1. then enable BGP"
+
+    def test_no_overlap(self):
+        """Test that transcripts without common words are joined."""
+        assert stitch_transcripts(["show ip route", "on R2"]) == "show ip route on R2"
+
+
+class TestTranscribeChunked:
+    """Tests for transcribe_chunked."""
+
+    def test_parallel_chunks(self):
+        """Test that chunks share one client and are stitched in order."""
+        audio = _wav((3.0, True), (0.5, False), (3.0, True))
+        transcripts = iter(["Configure OSPF", "OSPF area zero"])
+        client = Mock()
+        partials = []
+        openai_stt.get_stt_client.cache_clear()
+
+        def fake_speech_to_text(chunk, client=None, **kwargs):
+            assert isinstance(chunk, bytes)
+            assert client is not None
+            return next(transcripts)
+
+        with (
+            patch.object(openai_stt, "OpenAI", return_value=client) as mock_openai,
+            patch.object(openai_stt, "speech_to_text", fake_speech_to_text),
+        ):
+            text = transcribe_chunked(
+                audio, on_partial=partials.append, chunk_seconds=5, max_workers=1
+            )
+        openai_stt.get_stt_client.cache_clear()
+
+        assert text == "Configure OSPF area zero"
+        assert partials == ["Configure OSPF", "Configure OSPF area zero"]
+        assert mock_openai.call_count == 1
+
+    def test_short_audio_single_request(self):
+        """Test that short recordings are sent as they are."""
+        audio = io.BytesIO(_wav((1.0, True)))
+
+        with patch.object(
+            openai_stt, "speech_to_text", return_value="show version"
+        ) as mock_stt:
+            text = transcribe_chunked(audio, chunk_seconds=30)
+
+        assert text == "show version"
+        mock_stt.assert_called_once_with(audio)
+
+    def test_unreadable_audio_single_request(self):
+        """Test that audio soundfile cannot decode is sent in one request."""
+        with patch.object(
+            openai_stt, "speech_to_text", return_value="hello"
+        ) as mock_stt:
+            assert transcribe_chunked(b"not audio", chunk_seconds=1) == "hello"
+
+        mock_stt.assert_called_once_with(b"not audio")
@@ -0,0 +1,103 @@
+"""
+Tests for import_time module and the import time budget of the application.
+Contains test cases for parsing -X importtime output and import regressions.
+
+Test Coverage:
+1. TestParseImporttime
+   - Records parsed with times and nesting depth
+   - Report totals, most expensive imports and loaded packages
+
+2. TestImportBudget
+   - App entry point loads no graph, tools, drivers, providers or audio
+     libraries, and stays within its time budget
+   - Agent graph loads no device drivers or audio libraries
+"""
+
+import pytest
+
+from gns3_copilot.utils.import_time import (
+    ImportReport,
+    measure_import,
+    parse_importtime,
+)
+
+# Fastest of REPEAT runs; the budgets leave room for slow machines, importing
+# the graph or the device drivers with the app exceeds them
+REPEAT = 2
+APP_IMPORT_BUDGET_MS = 1500
+GRAPH_IMPORT_BUDGET_MS = 4000
+
+DRIVER_PACKAGES = ("netmiko", "paramiko", "telnetlib3", "nornir_netmiko")
+AUDIO_PACKAGES = ("numpy", "soundfile", "openai")
+PROVIDER_PACKAGES = (
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_aws",
+    "langchain_google_genai",
+    "langchain_ollama",
+    "langchain_deepseek",
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | zipimport
+import time:       300 |        300 |     _abc
+import time:       500 |        800 |   abc
+import time:      1000 |       1800 | site
+Traceback lines and other output are ignored
+import time:       700 |        700 |   netmiko.exceptions
+import time:       200 |        900 | gns3_copilot.tools_v2
+"""
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime and ImportReport."""
+
+    def test_records(self):
+        """Test that times and nesting depth are parsed."""
+        records = parse_importtime(SAMPLE)
+
+        assert [(r.module, r.depth) for r in records] == [
+            ("zipimport", 0),
+            ("_abc", 2),
+            ("abc", 1),
+            ("site", 0),
+            ("netmiko.exceptions", 1),
+            ("gns3_copilot.tools_v2", 0),
+        ]
+        assert (records[2].self_us, records[2].cumulative_us) == (500, 800)
+
+    def test_report(self):
+        """Test totals, the most expensive imports and package lookup."""
+        report = ImportReport("gns3_copilot.tools_v2", parse_importtime(SAMPLE))
+
+        assert report.total_ms == pytest.approx(2.82)
+        assert [r.module for r in report.top(2)] == ["site", "gns3_copilot.tools_v2"]
+        assert report.loaded("netmiko") == ["netmiko.exceptions"]
+        assert report.loaded("abc") == ["abc"]
+        assert report.module_ms("abc") == 0.8
+        assert report.module_ms("numpy") is None
+        assert "gns3_copilot.tools_v2" in report.format(top=3)
+
+
+class TestImportBudget:
+    """Import the entry points in fresh interpreters."""
+
+    def test_app_import(self, tmp_path):
+        """Test that the app imports quickly without heavy modules."""
+        report = measure_import("gns3_copilot.app", repeat=REPEAT, cwd=str(tmp_path))
+
+        assert report.loaded("gns3_copilot.agent.gns3_copilot") == []
+        assert report.loaded("gns3_copilot.tools_v2") == []
+        assert report.loaded(*DRIVER_PACKAGES, *AUDIO_PACKAGES) == []
+        assert report.loaded(*PROVIDER_PACKAGES) == []
+        assert report.total_ms < APP_IMPORT_BUDGET_MS, report.format()
+
+    def test_graph_import(self, tmp_path):
+        """Test that building the graph does not load device drivers."""
+        report = measure_import(
+            "gns3_copilot.agent.gns3_copilot", repeat=REPEAT, cwd=str(tmp_path)
+        )
+
+        assert report.loaded(*DRIVER_PACKAGES, *AUDIO_PACKAGES) == []
+        assert report.total_ms < GRAPH_IMPORT_BUDGET_MS, report.format()
@@ -0,0 +1,192 @@
+"""
+Tests for SpeechPipeline in openai_tts module.
+Contains test cases for sentence-pipelined speech synthesis.
+
+Test Coverage:
+1. TestSplitSentences
+   - Splitting at sentence ends, CJK punctuation and line breaks
+   - Short sentences merged, unfinished text kept
+   - Text without boundaries cut below the API limit
+
+2. TestSpeechPipeline
+   - Sentences synthesized while text is still streaming
+   - Audio handed out in order, after the previous chunk finished playing
+   - Waiting for the remaining audio at the end
+   - Done once the last chunk finished playing
+   - Failed segments skipped and counted
+   - Time to first audio measured
+"""
+
+import threading
+
+from gns3_copilot.utils.openai_tts import (
+    MAX_TTS_CHARS,
+    SpeechPipeline,
+    split_sentences,
+)
+
+
+class FakeClock:
+    """Manually advanced time source; sleeping advances it."""
+
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _pipeline(clock: FakeClock, synthesize, **kwargs) -> SpeechPipeline:
+    return SpeechPipeline(
+        synthesize=synthesize,
+        min_chars=1,
+        duration=lambda audio: 2.0,
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+class TestSplitSentences:
+    """Test splitting text into speakable segments."""
+
+    def test_sentence_boundaries(self):
+        """Test splitting at sentence ends, CJK punctuation and line breaks."""
+        segments, rest = split_sentences(
+            "R1 is up. Is R2 up? 路由器正常。\nConfig: done", min_chars=1
+        )
+
+        assert segments == ["R1 is up.", "Is R2 up?", "路由器正常。", "Config:"]
+        assert rest == " done"
+
+    def test_decimal_not_split(self):
+        """Test that a period without following whitespace is not a boundary."""
+        segments, rest = split_sentences("Version 2.5 is installed", min_chars=1)
+
+        assert segments == []
+        assert rest == "Version 2.5 is installed"
+
+    def test_short_sentences_merged(self):
+        """Test that sentences shorter than min_chars are merged."""
+        segments, rest = split_sentences("Ok. Yes. The topology is ready. ", 10)
+
+        assert segments == ["Ok. Yes. The topology is ready."]
+        assert rest == " "
+
+    def test_long_text_cut(self):
+        """Test that text without boundaries is cut below the API limit."""
+        segments, rest = split_sentences("word " * 1000)
+
+        assert len(segments) == 1
+        assert len(segments[0]) <= MAX_TTS_CHARS
+        assert len(rest) <= MAX_TTS_CHARS
+
+
+class TestSpeechPipeline:
+    """Tests for SpeechPipeline."""
+
+    def test_synthesized_while_streaming(self):
+        """Test that complete sentences are submitted before the text ends."""
+        synthesized = threading.Event()
+
+        def synthesize(text: str) -> bytes:
+            synthesized.set()
+            return text.encode()
+
+        pipeline = _pipeline(FakeClock(), synthesize)
+        pipeline.feed("First sentence. Sec")
+
+        assert synthesized.wait(timeout=5)
+        assert pipeline.pending == 1
+        pipeline.close()
+
+    def test_ordered_playback(self):
+        """Test that chunks are handed out in order, one playback at a time."""
+        clock = FakeClock()
+        release_first = threading.Event()
+
+        def synthesize(text: str) -> bytes:
+            if text == "One.":
+                release_first.wait(timeout=5)
+            return text.encode()
+
+        pipeline = _pipeline(clock, synthesize)
+        pipeline.feed("One. Two. ")
+        pipeline._queue[1].result(timeout=5)
+
+        # The second chunk is ready, but the first one is not
+        assert pipeline.next_audio() is None
+        release_first.set()
+        pipeline._queue[0].result(timeout=5)
+        assert pipeline.next_audio() == b"One."
+        # The first chunk is still playing
+        assert pipeline.next_audio() is None
+        clock.now += 2.0
+        assert pipeline.next_audio() == b"Two."
+        pipeline.close()
+
+    def test_wait_for_remaining(self):
+        """Test that waiting hands out everything, including the remainder."""
+        clock = FakeClock()
+        pipeline = _pipeline(clock, lambda text: text.encode())
+        pipeline.feed("One. Two")
+        pipeline.finish()
+
+        assert pipeline.next_audio(wait=True) == b"One."
+        assert pipeline.next_audio(wait=True) == b"Two"
+        assert pipeline.next_audio(wait=True) is None
+        assert clock.now == 12.0
+        assert pipeline.stats().audio_seconds == 4.0
+        pipeline.close()
+
+    def test_done_after_last_playback(self):
+        """Test that the pipeline is done once the last chunk finished playing."""
+        clock = FakeClock()
+        pipeline = _pipeline(clock, lambda text: text.encode())
+        pipeline.feed("One.")
+        pipeline.finish()
+        assert not pipeline.done
+
+        pipeline._queue[0].result(timeout=5)
+        assert pipeline.next_audio() == b"One."
+        assert not pipeline.done
+        clock.now += 2.0
+        assert pipeline.done
+        pipeline.close()
+
+    def test_failed_segment_skipped(self):
+        """Test that a failed segment is skipped and counted."""
+
+        def synthesize(text: str) -> bytes:
+            if text == "Bad.":
+                raise RuntimeError("TTS Error: unavailable")
+            return text.encode()
+
+        pipeline = _pipeline(FakeClock(), synthesize)
+        pipeline.feed("Bad. Good.")
+        pipeline.finish()
+
+        assert pipeline.next_audio(wait=True) == b"Good."
+        stats = pipeline.stats()
+        assert stats.segments == 2
+        assert stats.failures == 1
+        assert stats.played == 1
+        pipeline.close()
+
+    def test_time_to_first_audio(self):
+        """Test that the time from the first text to the first audio is kept."""
+        clock = FakeClock()
+        pipeline = _pipeline(clock, lambda text: text.encode())
+
+        assert pipeline.stats().time_to_first_audio is None
+        pipeline.feed("Hello")
+        clock.now += 1.5
+        pipeline.feed(" world. ")
+        pipeline._queue[0].result(timeout=5)
+        pipeline.next_audio()
+
+        assert pipeline.stats().time_to_first_audio == 1.5
+        pipeline.close()
@@ -0,0 +1,149 @@
+"""
+Tests for tool_artifacts module.
+Contains test cases for tool output budgeting and artifact storage.
+
+Test Coverage:
+1. TestArtifactStore
+   - Save and read pages
+   - Last page next_offset
+   - Missing artifact
+   - Page length cap
+   - Delete artifacts of a thread
+
+2. TestApplyOutputBudget
+   - Output within budget unchanged
+   - Oversized output truncated with artifact handle
+   - Budget disabled for exempt tools
+   - Storage failure falls back to plain truncation
+
+3. TestRenderToolOutput
+   - Text outputs unchanged, lists serialized as JSON
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from gns3_copilot.utils.tool_artifacts import (
+    MAX_PAGE_CHARS,
+    apply_output_budget,
+    delete_thread_artifacts,
+    get_output_budget,
+    read_artifact,
+    render_tool_output,
+    save_artifact,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary artifact database path."""
+    return str(tmp_path / "artifacts.db")
+
+
+class TestArtifactStore:
+    """Test artifact persistence functions."""
+
+    def test_save_and_read_page(self, db_path):
+        """Test reading a page of a saved artifact."""
+        content = "".join(str(i % 10) for i in range(100))
+        artifact_id = save_artifact(content, "tool", "thread-1", db_path=db_path)
+
+        page = read_artifact(artifact_id, offset=10, length=20, db_path=db_path)
+
+        assert page["content"] == content[10:30]
+        assert page["total_length"] == 100
+        assert page["next_offset"] == 30
+        assert page["tool_name"] == "tool"
+
+    def test_last_page(self, db_path):
+        """Test that next_offset is None on the last page."""
+        artifact_id = save_artifact("abcdef", "tool", db_path=db_path)
+
+        page = read_artifact(artifact_id, offset=3, length=100, db_path=db_path)
+
+        assert page["content"] == "def"
+        assert page["next_offset"] is None
+
+    def test_missing_artifact(self, db_path):
+        """Test reading an unknown artifact."""
+        assert read_artifact("art-missing", db_path=db_path) is None
+
+    def test_page_length_capped(self, db_path):
+        """Test that page length is capped at MAX_PAGE_CHARS."""
+        artifact_id = save_artifact("x" * (MAX_PAGE_CHARS * 2), "tool", db_path=db_path)
+
+        page = read_artifact(artifact_id, length=MAX_PAGE_CHARS * 3, db_path=db_path)
+
+        assert len(page["content"]) == MAX_PAGE_CHARS
+
+    def test_delete_thread_artifacts(self, db_path):
+        """Test deleting all artifacts of a thread."""
+        first = save_artifact("a", "tool", "thread-1", db_path=db_path)
+        second = save_artifact("b", "tool", "thread-2", db_path=db_path)
+
+        assert delete_thread_artifacts("thread-1", db_path=db_path) == 1
+        assert read_artifact(first, db_path=db_path) is None
+        assert read_artifact(second, db_path=db_path) is not None
+
+
+class TestApplyOutputBudget:
+    """Test apply_output_budget function."""
+
+    def test_within_budget(self, db_path):
+        """Test that small outputs are returned unchanged."""
+        assert apply_output_budget("short", "tool", budget=100, db_path=db_path) == (
+            "short"
+        )
+
+    def test_oversized_output(self, db_path):
+        """Test that large outputs are truncated and stored."""
+        content = "H" * 500 + "M" * 5000 + "T" * 500
+
+        result = apply_output_budget(
+            content, "tool", "thread-1", budget=1000, db_path=db_path
+        )
+
+        assert result.startswith("H" * 500)
+        assert result.endswith("T" * 300)
+        assert "read_tool_artifact" in result
+        artifact_id = result.split("artifact '")[1].split("'")[0]
+        page = read_artifact(artifact_id, db_path=db_path)
+        assert page["total_length"] == len(content)
+
+    def test_exempt_tool(self):
+        """Test that the artifact reader output is never budgeted."""
+        assert get_output_budget("read_tool_artifact") == 0
+        content = "x" * 100000
+        assert apply_output_budget(content, "read_tool_artifact") == content
+
+    @patch("gns3_copilot.utils.tool_artifacts.get_config")
+    def test_default_budget_from_config(self, mock_get_config):
+        """Test reading the default budget from configuration."""
+        mock_get_config.return_value = "1234"
+        assert get_output_budget("execute_multiple_device_commands") == 1234
+
+    @patch("gns3_copilot.utils.tool_artifacts.save_artifact")
+    def test_storage_failure(self, mock_save):
+        """Test plain truncation when the artifact cannot be stored."""
+        mock_save.side_effect = Exception("disk full")
+
+        result = apply_output_budget("x" * 5000, "tool", budget=100)
+
+        assert "characters omitted" in result
+        assert "read_tool_artifact" not in result
+
+
+class TestRenderToolOutput:
+    """Test render_tool_output function."""
+
+    def test_string_unchanged(self):
+        """Test that text outputs are returned as they are."""
+        assert render_tool_output("output") == "output"
+
+    def test_list_serialized(self):
+        """Test that per-device result lists are serialized as JSON."""
+        observation = [{"device_name": "R1", "output": "ü"}]
+        assert render_tool_output(observation) == (
+            '[{"device_name": "R1", "output": "ü"}]'
+        )
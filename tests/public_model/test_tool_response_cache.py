@@ -0,0 +1,109 @@
+"""
+Tests for ToolResponseCache in parse_tool_content module.
+Contains test cases for memoized tool response formatting.
+
+Test Coverage:
+1. TestToolResponseCache
+   - Responses formatted once per message ID and content
+   - Changed content formatted again
+   - Least recently used entries evicted
+   - Statistics, including large responses
+   - Lookup by message ID and digest, without the content
+"""
+
+import json
+from unittest.mock import patch
+
+from gns3_copilot.utils.parse_tool_content import (
+    LARGE_RESPONSE_BYTES,
+    ToolResponseCache,
+    content_digest,
+    format_tool_response,
+)
+
+
+class TestToolResponseCache:
+    """Tests for ToolResponseCache."""
+
+    def test_formatted_once(self):
+        """Test that repeated lookups are served from the cache."""
+        cache = ToolResponseCache()
+        content = "{'device': 'R1', 'status': 'ok'}"
+
+        with patch(
+            "gns3_copilot.utils.parse_tool_content.format_tool_response",
+            wraps=format_tool_response,
+        ) as mock_format:
+            first = cache.get(content, "m1")
+            second = cache.get(content, "m1")
+
+        assert mock_format.call_count == 1
+        assert second is first
+        assert first.text == format_tool_response(content)
+        assert first.data == {"device": "R1", "status": "ok"}
+
+    def test_changed_content(self):
+        """Test that the key includes the content, not only the message ID."""
+        cache = ToolResponseCache()
+
+        assert cache.get('{"a": 1}', "m1").data == {"a": 1}
+        assert cache.get('{"a": 2}', "m1").data == {"a": 2}
+        assert cache.stats().misses == 2
+
+    def test_non_string_content(self):
+        """Test caching of list content (e.g. multimodal tool output)."""
+        cache = ToolResponseCache()
+        content = [{"type": "text", "text": "ok"}]
+
+        assert cache.get(content, "m1").data == content
+        assert cache.get(list(content), "m1").data == content
+        assert cache.stats().hits == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ToolResponseCache(max_entries=2)
+        cache.get("1", "a")
+        cache.get("2", "b")
+        cache.get("1", "a")
+        cache.get("3", "c")
+
+        cache.get("1", "a")
+        cache.get("2", "b")
+
+        stats = cache.stats()
+        assert stats.evictions == 2
+        assert stats.hits == 2
+        assert stats.misses == 4
+
+    def test_large_response_stats(self):
+        """Test that parse time of large responses is recorded."""
+        cache = ToolResponseCache()
+        content = json.dumps({"output": "x" * LARGE_RESPONSE_BYTES})
+
+        cache.get(content, "big")
+        cache.get("{}", "small")
+
+        stats = cache.stats()
+        assert stats.large_responses == 1
+        assert 0 < stats.large_parse_seconds <= stats.parse_seconds
+
+    def test_clear(self):
+        """Test that clearing drops all entries."""
+        cache = ToolResponseCache()
+        cache.get("{}", "m1")
+        cache.clear()
+        cache.get("{}", "m1")
+
+        assert cache.stats().misses == 2
+
+    def test_lookup_by_digest(self):
+        """Test that a cached response is found without its content."""
+        cache = ToolResponseCache()
+        content = '{"a": 1}'
+
+        assert cache.lookup("m1", content_digest(content)[0]) is None
+        formatted = cache.get(content, "m1")
+
+        assert cache.lookup("m1", content_digest(content)[0]) is formatted
+        assert cache.lookup("m1", content_digest('{"a": 2}')[0]) is None
+        assert cache.stats().hits == 1
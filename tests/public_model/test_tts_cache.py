@@ -0,0 +1,121 @@
+"""
+Tests for tts_cache module and cached synthesis in openai_tts.
+Contains test cases for the persistent TTS audio cache.
+
+Test Coverage:
+1. TestTtsCacheKey
+   - Key depends on text, model, voice, speed and base URL
+
+2. TestTTSAudioCache
+   - Stored audio read back, also by a new cache instance
+   - Least recently used files evicted above the size cap
+   - Recency kept across instances
+   - Disabled cache stores nothing
+
+3. TestCachedTextToSpeech
+   - Repeated phrases synthesized once with a shared client
+"""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+from gns3_copilot.utils import openai_tts
+from gns3_copilot.utils.tts_cache import TTSAudioCache, tts_cache_key
+
+
+class TestTtsCacheKey:
+    """Test cache key construction."""
+
+    def test_key_covers_request(self):
+        """Test that every request parameter changes the key."""
+        base = ("Hello", "tts-1", "alloy", 1.0, "http://tts/v1")
+        variants = [
+            ("Hello!", "tts-1", "alloy", 1.0, "http://tts/v1"),
+            ("Hello", "tts-1-hd", "alloy", 1.0, "http://tts/v1"),
+            ("Hello", "tts-1", "echo", 1.0, "http://tts/v1"),
+            ("Hello", "tts-1", "alloy", 1.25, "http://tts/v1"),
+            ("Hello", "tts-1", "alloy", 1.0, "http://other/v1"),
+        ]
+
+        keys = {tts_cache_key(*request) for request in [base, *variants]}
+
+        assert len(keys) == 6
+        assert tts_cache_key(*base) == tts_cache_key(*base)
+
+
+class TestTTSAudioCache:
+    """Tests for TTSAudioCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that audio is read back, also after a restart."""
+        cache = TTSAudioCache(str(tmp_path), max_bytes=1000)
+
+        assert cache.get("a") is None
+        cache.put("a", b"audio")
+
+        assert cache.get("a") == b"audio"
+        assert TTSAudioCache(str(tmp_path), max_bytes=1000).get("a") == b"audio"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.size_bytes == 5
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used files are evicted."""
+        cache = TTSAudioCache(str(tmp_path), max_bytes=25)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        cache.get("a")
+        cache.put("c", b"x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert sorted(os.listdir(tmp_path)) == ["a.wav", "c.wav"]
+        assert cache.stats().evictions == 1
+
+    def test_recency_across_instances(self, tmp_path):
+        """Test that the LRU order is restored from modification times."""
+        cache = TTSAudioCache(str(tmp_path), max_bytes=25)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        past = time.time() - 60
+        os.utime(tmp_path / "b.wav", (past, past))
+
+        restarted = TTSAudioCache(str(tmp_path), max_bytes=25)
+        restarted.put("c", b"x" * 10)
+
+        assert sorted(os.listdir(tmp_path)) == ["a.wav", "c.wav"]
+
+    def test_disabled(self, tmp_path):
+        """Test that a zero size cap disables the cache."""
+        cache = TTSAudioCache(str(tmp_path / "cache"), max_bytes=0)
+        cache.put("a", b"audio")
+
+        assert cache.get("a") is None
+        assert not os.path.exists(tmp_path / "cache")
+
+
+class TestCachedTextToSpeech:
+    """Tests for cached_text_to_speech_wav."""
+
+    def test_repeated_phrase_synthesized_once(self, tmp_path):
+        """Test that a repeated phrase is served from the cache."""
+        cache = TTSAudioCache(str(tmp_path), max_bytes=1000)
+        client = Mock()
+        client.audio.speech.create.return_value.content = b"wav audio"
+        openai_tts.get_tts_client.cache_clear()
+
+        with (
+            patch.object(openai_tts, "get_tts_cache", return_value=cache),
+            patch.object(openai_tts, "OpenAI", return_value=client) as mock_openai,
+        ):
+            first = openai_tts.cached_text_to_speech_wav("R1 is up.")
+            second = openai_tts.cached_text_to_speech_wav("R1 is up.")
+            openai_tts.cached_text_to_speech_wav("R2 is down.")
+        openai_tts.get_tts_client.cache_clear()
+
+        assert first == second == b"wav audio"
+        assert client.audio.speech.create.call_count == 2
+        assert mock_openai.call_count == 1
+        assert cache.stats().hits == 1
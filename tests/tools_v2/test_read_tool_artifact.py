@@ -0,0 +1,65 @@
+"""
+Tests for ReadToolArtifactTool.
+
+Test Coverage:
+1. TestReadToolArtifactTool
+   - Tool metadata
+   - Successful page read
+   - Missing artifact_id
+   - Unknown artifact
+   - Invalid JSON input
+"""
+
+import json
+from unittest.mock import patch
+
+from gns3_copilot.tools_v2 import ReadToolArtifactTool
+
+
+class TestReadToolArtifactTool:
+    """Test ReadToolArtifactTool."""
+
+    def test_tool_metadata(self):
+        """Test tool name and description."""
+        tool = ReadToolArtifactTool()
+        assert tool.name == "read_tool_artifact"
+        assert "artifact_id" in tool.description
+
+    @patch("gns3_copilot.tools_v2.read_tool_artifact.read_artifact")
+    def test_read_page(self, mock_read):
+        """Test reading a page of an artifact."""
+        page = {
+            "artifact_id": "art-1",
+            "tool_name": "tool",
+            "offset": 10,
+            "total_length": 100,
+            "next_offset": 20,
+            "content": "0123456789",
+        }
+        mock_read.return_value = page
+
+        result = ReadToolArtifactTool()._run(
+            json.dumps({"artifact_id": "art-1", "offset": 10, "length": 10})
+        )
+
+        assert result == page
+        mock_read.assert_called_once_with("art-1", offset=10, length=10)
+
+    def test_missing_artifact_id(self):
+        """Test input without artifact_id."""
+        result = ReadToolArtifactTool()._run(json.dumps({"offset": 0}))
+        assert "error" in result
+
+    @patch("gns3_copilot.tools_v2.read_tool_artifact.read_artifact")
+    def test_unknown_artifact(self, mock_read):
+        """Test reading an artifact that does not exist."""
+        mock_read.return_value = None
+
+        result = ReadToolArtifactTool()._run(json.dumps({"artifact_id": "art-x"}))
+
+        assert result == {"error": "Artifact not found: art-x"}
+
+    def test_invalid_json(self):
+        """Test invalid JSON input."""
+        result = ReadToolArtifactTool()._run("not json")
+        assert "Invalid JSON input" in result["error"]
@@ -0,0 +1,136 @@
+"""
+Tests for chat_history module.
+Contains test cases for paginated chat history rendering.
+
+Test Coverage:
+1. TestSplitTurns
+   - Turns start at user messages
+   - Leading non-user messages
+
+2. TestGroupMessageBlocks
+   - Consecutive AI and tool messages share one block
+
+3. TestRenderChatHistory
+   - Only the latest turns rendered, earlier pages loaded on demand
+   - Tool payloads only rendered in open expanders
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from streamlit.testing.v1 import AppTest
+
+from gns3_copilot.ui_model.utils.chat_history import (
+    group_message_blocks,
+    split_turns,
+)
+
+
+def _history_app(turns: int) -> None:
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+    from gns3_copilot.ui_model.utils.chat_history import render_chat_history
+
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"question {i}", id=f"h{i}"))
+        messages.append(
+            AIMessage(
+                content="",
+                id=f"a{i}",
+                tool_calls=[
+                    {"name": "show", "args": {"tool_input": "x"}, "id": f"c{i}"}
+                ],
+            )
+        )
+        messages.append(
+            ToolMessage(content='{"ok": true}', tool_call_id=f"c{i}", id=f"t{i}")
+        )
+        messages.append(AIMessage(content=f"answer {i}", id=f"b{i}"))
+    render_chat_history(messages, "thread-1")
+
+
+def _run(turns: int) -> AppTest:
+    app = AppTest.from_function(_history_app, kwargs={"turns": turns})
+    return app.run()
+
+
+class TestSplitTurns:
+    """Test splitting messages into turns."""
+
+    def test_turns_start_at_user_messages(self):
+        """Test that each user message starts a new turn."""
+        messages = [
+            HumanMessage(content="a"),
+            AIMessage(content="b"),
+            HumanMessage(content="c"),
+            AIMessage(content="d"),
+            ToolMessage(content="e", tool_call_id="1"),
+        ]
+
+        turns = split_turns(messages)
+
+        assert [len(turn) for turn in turns] == [2, 3]
+
+    def test_leading_messages(self):
+        """Test that messages before the first user message form a turn."""
+        turns = split_turns([AIMessage(content="hi"), HumanMessage(content="q")])
+
+        assert [len(turn) for turn in turns] == [1, 1]
+        assert split_turns([]) == []
+
+
+class TestGroupMessageBlocks:
+    """Test grouping messages into chat message blocks."""
+
+    def test_assistant_messages_grouped(self):
+        """Test that AI and tool messages share one assistant block."""
+        blocks = group_message_blocks(
+            [
+                HumanMessage(content="q"),
+                AIMessage(content=""),
+                ToolMessage(content="r", tool_call_id="1"),
+                AIMessage(content="a"),
+                SystemMessage(content="skipped"),
+            ]
+        )
+
+        assert [(role, len(block)) for role, block in blocks] == [
+            ("user", 1),
+            ("assistant", 3),
+        ]
+
+
+class TestRenderChatHistory:
+    """Test rendering with Streamlit's app testing framework."""
+
+    def test_short_history_fully_rendered(self):
+        """Test that short sessions render all turns without a button."""
+        app = _run(turns=3)
+
+        assert not app.exception
+        assert len(app.chat_message) == 6
+        assert len(app.button) == 0
+
+    def test_only_latest_turns_rendered(self):
+        """Test that long sessions render one page and load earlier pages."""
+        app = _run(turns=25)
+
+        assert len(app.chat_message) == 20
+        assert app.button[0].label == "Load earlier messages (15 earlier turns)"
+        assert app.chat_message[0].markdown[0].value == "question 15"
+
+        app.button[0].click().run()
+
+        assert len(app.chat_message) == 40
+        assert app.button[0].label == "Load earlier messages (5 earlier turns)"
+
+        app.button[0].click().run()
+
+        assert len(app.chat_message) == 50
+        assert len(app.button) == 0
+
+    def test_tool_payloads_lazy(self):
+        """Test that tool payloads are not rendered while expanders are closed."""
+        app = _run(turns=3)
+
+        assert len(app.expander) == 6
+        assert len(app.json) == 0
@@ -0,0 +1,190 @@
+"""
+Tests for history_view module.
+Contains test cases for the compact per-session chat history.
+
+Test Coverage:
+1. TestMessageView
+   - Tool responses reduced to preview, digest and size
+   - Tool call metadata of assistant messages
+   - Messages not shown in the chat skipped
+
+2. TestHistoryView
+   - View built from checkpoint state values
+   - Much smaller than the messages it describes
+
+3. TestStreamedHistory
+   - Streamed chunks merged into one message
+   - Stale while running, reloaded after history rewrites
+
+4. TestGetHistoryView
+   - View kept across reruns, reloaded for another thread or when stale
+   - Tool payloads loaded from the checkpoint by message ID
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from gns3_copilot.ui_model.utils import history_view
+from gns3_copilot.ui_model.utils.history_view import (
+    PREVIEW_CHARS,
+    HistoryView,
+    StreamedHistory,
+    estimate_size,
+    get_history_view,
+    load_message_content,
+    message_view,
+)
+from gns3_copilot.utils import content_digest
+
+PAYLOAD = '{"output": "' + "interface up " * 2000 + '"}'
+
+
+def _state(summary: str | None = None) -> dict:
+    return {
+        "messages": [
+            SystemMessage(content="system prompt", id="s1"),
+            HumanMessage(content="show interfaces", id="h1"),
+            AIMessage(
+                content="",
+                id="a1",
+                tool_calls=[{"name": "show", "args": {"tool_input": "R1"}, "id": "c1"}],
+            ),
+            ToolMessage(content=PAYLOAD, tool_call_id="c1", id="t1", name="show"),
+            AIMessage(content="All interfaces are up.", id="a2"),
+        ],
+        "conversation_summary": summary,
+        "selected_project": ("lab", "p1", 2, 1, "opened"),
+    }
+
+
+def _graph(values: dict) -> Mock:
+    graph = Mock()
+    graph.get_state.return_value = SimpleNamespace(values=values)
+    return graph
+
+
+class TestMessageView:
+    """Test building message views."""
+
+    def test_tool_response(self):
+        """Test that a tool response keeps only a preview and a digest."""
+        view = message_view(ToolMessage(content=PAYLOAD, tool_call_id="c1", id="t1"))
+
+        assert view.role == "tool"
+        assert view.text == PAYLOAD[:PREVIEW_CHARS]
+        assert (view.payload_digest, view.payload_size) == content_digest(PAYLOAD)
+
+    def test_tool_calls(self):
+        """Test that tool call names and inputs are kept."""
+        view = message_view(_state()["messages"][2])
+
+        assert view.role == "assistant"
+        assert view.tool_calls[0].name == "show"
+        assert view.tool_calls[0].tool_input == "R1"
+
+    def test_gemini_content(self):
+        """Test that list content is reduced to its text."""
+        view = message_view(AIMessage(content=[{"type": "text", "text": "hi"}]))
+
+        assert view.text == "hi"
+
+    def test_system_message_skipped(self):
+        """Test that messages not shown in the chat have no view."""
+        assert message_view(SystemMessage(content="prompt")) is None
+
+
+class TestHistoryView:
+    """Tests for HistoryView."""
+
+    def test_from_state(self):
+        """Test that the view mirrors the state values."""
+        view = HistoryView.from_state("t", _state(summary="Earlier turns"))
+
+        assert [m.id for m in view.messages] == ["h1", "a1", "t1", "a2"]
+        assert view.conversation_summary == "Earlier turns"
+        assert view.selected_project[1] == "p1"
+        assert view.payload_bytes() == len(PAYLOAD)
+
+    def test_smaller_than_messages(self):
+        """Test that the view does not hold the tool payloads."""
+        values = _state()
+        view = HistoryView.from_state("t", values)
+
+        assert estimate_size(view) < estimate_size(values["messages"]) / 5
+
+
+class TestStreamedHistory:
+    """Tests for StreamedHistory."""
+
+    def test_chunks_merged(self):
+        """Test that chunks of one message become one view."""
+        view = HistoryView("t", selected_project=("lab",))
+        streamed = StreamedHistory(view)
+        metadata = {"langgraph_node": "llm_call"}
+
+        assert view.stale
+        streamed.add(AIMessageChunk(content="All ", id="a1"), metadata)
+        streamed.add(AIMessageChunk(content="up.", id="a1"), metadata)
+        streamed.add(
+            ToolMessage(content="{}", tool_call_id="c1", id="t1"),
+            {"langgraph_node": "tool_node"},
+        )
+        streamed.add(AIMessageChunk(content="Done", id="a2"), metadata)
+        streamed.finish()
+
+        assert [(m.id, m.text) for m in view.messages] == [
+            ("a1", "All up."),
+            ("t1", "{}"),
+            ("a2", "Done"),
+        ]
+        assert not view.stale
+
+    def test_rewrite_marks_stale(self):
+        """Test that a compacted history is reloaded after the run."""
+        view = HistoryView("t", selected_project=("lab",))
+        streamed = StreamedHistory(view)
+
+        streamed.add(
+            AIMessageChunk(content="summary", id="x"),
+            {"langgraph_node": "compact_context"},
+        )
+        streamed.finish()
+
+        assert view.messages == []
+        assert view.stale
+
+
+class TestGetHistoryView:
+    """Tests for get_history_view and load_message_content."""
+
+    def test_cached_per_thread(self):
+        """Test that the checkpoint is only read when needed."""
+        graph = _graph(_state())
+
+        with patch.object(history_view, "st", SimpleNamespace(session_state={})):
+            first = get_history_view(graph, "t1")
+            assert get_history_view(graph, "t1") is first
+            assert graph.get_state.call_count == 1
+
+            get_history_view(graph, "t2")
+            assert graph.get_state.call_count == 2
+
+            second = get_history_view(graph, "t2")
+            second.stale = True
+            assert get_history_view(graph, "t2") is not second
+
+    def test_load_message_content(self):
+        """Test that payloads are loaded by message ID."""
+        graph = _graph(_state())
+
+        assert load_message_content(graph, "t1", "t1") == PAYLOAD
+        assert load_message_content(graph, "t1", "gone") is None
+        assert load_message_content(graph, "t1", None) is None
@@ -0,0 +1,273 @@
+"""
+Tests for notes_store module.
+Contains test cases for the indexed, write-behind notes store.
+
+Test Coverage:
+1. TestWriteAtomic
+   - File replaced without leaving temporary files
+
+2. TestDirectoryIndex
+   - Note list cached until the directory changes
+   - Notes added or removed outside the store picked up
+   - Hidden and non-Markdown files ignored
+
+3. TestAutosave
+   - Consecutive edits coalesced into one write
+   - Edits written in the background after the delay
+   - Pending edits returned by load, replaced by save, dropped by delete
+
+4. TestJournal
+   - Only the latest edit of a note journaled, journal removed after writing
+   - Journal writes throttled and kept out of the notes directory index
+   - Unwritten edits restored when the store is opened again
+   - Edits older than the note kept in a separate file, never replacing
+     an earlier recovered version
+   - Torn journals and journals naming another note ignored
+
+5. TestGetNotesStore
+   - One store per notes directory
+"""
+
+import json
+import os
+import time
+
+from gns3_copilot.ui_model.utils import notes_store
+from gns3_copilot.ui_model.utils.notes_store import (
+    JOURNAL_DIR,
+    JOURNAL_SUFFIX,
+    NotesStore,
+    get_notes_store,
+    write_atomic,
+)
+
+
+def _age_directory(path, seconds: float = 10) -> None:
+    """Move the directory mtime into the past, as after a quiet period."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _journal(directory, name: str = "note.md"):
+    (directory / JOURNAL_DIR).mkdir(exist_ok=True)
+    return directory / JOURNAL_DIR / f"{name}{JOURNAL_SUFFIX}"
+
+
+def _read(path) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic."""
+
+    def test_replace(self, tmp_path):
+        """Test that the file is replaced and no temporary file is left."""
+        path = tmp_path / "note.md"
+        path.write_text("old", encoding="utf-8")
+
+        write_atomic(str(path), "new ✓")
+
+        assert _read(path) == "new ✓"
+        assert os.listdir(tmp_path) == ["note.md"]
+
+
+class TestDirectoryIndex:
+    """Tests for NotesStore.list_notes."""
+
+    def test_cached_until_changed(self, tmp_path):
+        """Test that the directory is only rescanned after a change."""
+        (tmp_path / "b.md").write_text("")
+        (tmp_path / "a.md").write_text("")
+        _age_directory(tmp_path)
+        store = NotesStore(str(tmp_path))
+
+        assert store.list_notes() == ["a.md", "b.md"]
+        assert store.list_notes() == ["a.md", "b.md"]
+        assert store.stats().scans == 1
+
+        (tmp_path / "c.md").write_text("")
+        assert store.list_notes() == ["a.md", "b.md", "c.md"]
+        os.remove(tmp_path / "a.md")
+        assert store.list_notes() == ["b.md", "c.md"]
+
+    def test_recent_directory_rescanned(self, tmp_path):
+        """Test that a directory changed around the last scan is rescanned."""
+        store = NotesStore(str(tmp_path))
+        store.list_notes()
+        store.list_notes()
+
+        assert store.stats().scans == 2
+
+    def test_ignored_files(self, tmp_path):
+        """Test that hidden, temporary and other files are not listed."""
+        (tmp_path / "note.md").write_text("")
+        (tmp_path / ".note.md.1234.tmp").write_text("")
+        (tmp_path / ".hidden.md").write_text("")
+        (tmp_path / "image.png").write_text("")
+        (tmp_path / "folder.md").mkdir()
+
+        assert NotesStore(str(tmp_path)).list_notes() == ["note.md"]
+
+
+class TestAutosave:
+    """Tests for the write-behind autosave."""
+
+    def test_edits_coalesced(self, tmp_path):
+        """Test that edits made before the delay cost one write."""
+        store = NotesStore(str(tmp_path), delay=60)
+        for text in ("a", "ab", "abc"):
+            store.submit("note.md", text)
+
+        assert not (tmp_path / "note.md").exists()
+        assert store.load("note.md") == "abc"
+        store.flush()
+
+        assert _read(tmp_path / "note.md") == "abc"
+        stats = store.stats()
+        assert (stats.writes, stats.coalesced) == (1, 2)
+        assert not _journal(tmp_path).exists()
+
+    def test_written_in_background(self, tmp_path):
+        """Test that the autosave thread writes the edit after the delay."""
+        store = NotesStore(str(tmp_path), delay=0.05)
+        store.submit("note.md", "hello")
+
+        deadline = time.monotonic() + 5
+        while store.stats().writes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _read(tmp_path / "note.md") == "hello"
+        store.close()
+
+    def test_save_replaces_pending(self, tmp_path):
+        """Test that an explicit save wins over an older pending edit."""
+        store = NotesStore(str(tmp_path), delay=60)
+        store.submit("note.md", "draft")
+        store.save("note.md", "organized")
+        store.flush()
+
+        assert _read(tmp_path / "note.md") == "organized"
+        assert store.stats().writes == 1
+
+    def test_delete_drops_pending(self, tmp_path):
+        """Test that deleting a note discards its pending edits."""
+        store = NotesStore(str(tmp_path), delay=60)
+        assert store.create("note.md", "# note")
+        assert not store.create("note.md", "# again")
+        store.submit("note.md", "edit")
+        store.delete("note.md")
+        store.flush()
+
+        assert not (tmp_path / "note.md").exists()
+        assert store.list_notes() == []
+
+
+class TestJournal:
+    """Tests for recovering journaled edits."""
+
+    def test_latest_edit_journaled(self, tmp_path):
+        """Test that the journal holds only the latest edit of each note."""
+        store = NotesStore(str(tmp_path), delay=60, journal_interval=0)
+        for text in ("a", "ab", "abc"):
+            store.submit("note.md", text)
+        store.submit("other.md", "x")
+
+        record = json.loads(_read(_journal(tmp_path)))
+        assert record["content"] == "abc"
+        assert json.loads(_read(_journal(tmp_path, "other.md")))["content"] == "x"
+
+        store.flush("note.md")
+
+        assert not _journal(tmp_path).exists()
+        assert _journal(tmp_path, "other.md").exists()
+        assert store.list_notes() == ["note.md"]
+
+    def test_journal_throttled(self, tmp_path):
+        """Test that edits within the journal interval are not journaled."""
+        store = NotesStore(str(tmp_path), delay=60, journal_interval=60)
+        for text in ("a", "ab", "abc"):
+            store.submit("note.md", text)
+
+        assert json.loads(_read(_journal(tmp_path)))["content"] == "a"
+
+        store.flush()
+        store.submit("note.md", "abcd")
+
+        assert json.loads(_read(_journal(tmp_path)))["content"] == "abcd"
+
+    def test_journal_keeps_index(self, tmp_path):
+        """Test that journaling an edit does not trigger a rescan."""
+        store = NotesStore(str(tmp_path), delay=60, journal_interval=0)
+        store.submit("note.md", "# note")
+        store.flush()
+        _age_directory(tmp_path)
+        store.list_notes()
+        scans = store.stats().scans
+
+        store.submit("note.md", "edit")
+        store.list_notes()
+
+        assert store.stats().scans == scans
+        assert _journal(tmp_path).exists()
+
+    def test_recovered_on_open(self, tmp_path):
+        """Test that edits not written before a crash are restored."""
+        (tmp_path / "note.md").write_text("saved", encoding="utf-8")
+        os.utime(tmp_path / "note.md", (time.time() - 60, time.time() - 60))
+        crashed = NotesStore(str(tmp_path), delay=60, journal_interval=0)
+        crashed.submit("note.md", "first edit")
+        crashed.submit("note.md", "second edit")
+
+        reopened = NotesStore(str(tmp_path))
+
+        assert _read(tmp_path / "note.md") == "second edit"
+        assert reopened.stats().recovered == 1
+        assert not _journal(tmp_path).exists()
+
+    def test_newer_note_kept(self, tmp_path):
+        """Test that an edit older than the note is restored separately."""
+        (tmp_path / "note.recovered.md").write_text("earlier", encoding="utf-8")
+        record = {"name": "note.md", "content": "journaled", "time": 1.0}
+        _journal(tmp_path).write_text(json.dumps(record), encoding="utf-8")
+        (tmp_path / "note.md").write_text("edited later", encoding="utf-8")
+
+        NotesStore(str(tmp_path))
+
+        assert _read(tmp_path / "note.md") == "edited later"
+        assert _read(tmp_path / "note.recovered.md") == "earlier"
+        assert _read(tmp_path / "note.recovered-1.md") == "journaled"
+        assert not _journal(tmp_path).exists()
+
+    def test_torn_journal_ignored(self, tmp_path):
+        """Test that an unreadable journal does not stop the store."""
+        _journal(tmp_path).write_text('{"name": "note.md", "cont', encoding="utf-8")
+
+        store = NotesStore(str(tmp_path))
+
+        assert store.stats().recovered == 0
+        assert store.list_notes() == []
+
+    def test_journal_path_traversal_ignored(self, tmp_path):
+        """Test that journal records never write outside the directory."""
+        notes_dir = tmp_path / "notes"
+        notes_dir.mkdir()
+        record = {"name": "../outside.md", "content": "x", "time": time.time()}
+        _journal(notes_dir, "outside.md").write_text(json.dumps(record))
+
+        NotesStore(str(notes_dir))
+
+        assert not (tmp_path / "outside.md").exists()
+
+
+class TestGetNotesStore:
+    """Tests for get_notes_store."""
+
+    def test_shared_per_directory(self, tmp_path, monkeypatch):
+        """Test that sessions editing the same directory share one store."""
+        monkeypatch.setattr(notes_store, "_stores", {})
+
+        store = get_notes_store(str(tmp_path / "notes"))
+
+        assert get_notes_store(str(tmp_path / "x" / ".." / "notes")) is store
+        assert get_notes_store(str(tmp_path / "other")) is not store
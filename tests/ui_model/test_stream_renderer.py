@@ -0,0 +1,98 @@
+"""
+Tests for stream_renderer module.
+Contains test cases for the rate-limited streaming markdown renderer.
+
+Test Coverage:
+1. TestStreamingMarkdown
+   - Chunks within the flush interval coalesced into one render
+   - Paragraph boundaries and explicit flushes render immediately
+   - Disabled rendering only collects text
+   - Restart continues in a new placeholder with counters kept
+"""
+
+from unittest.mock import Mock
+
+from gns3_copilot.ui_model.utils.stream_renderer import StreamingMarkdown
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _renderer(clock: FakeClock, **kwargs) -> tuple[StreamingMarkdown, Mock]:
+    placeholder = Mock()
+    return StreamingMarkdown(placeholder, flush_interval=0.1, clock=clock, **kwargs), (
+        placeholder
+    )
+
+
+class TestStreamingMarkdown:
+    """Tests for StreamingMarkdown."""
+
+    def test_chunks_coalesced(self):
+        """Test that chunks inside the interval are rendered together."""
+        clock = FakeClock()
+        stream, placeholder = _renderer(clock)
+
+        stream.append("Hello")
+        for word in [" wor", "ld", ","]:
+            clock.now += 0.01
+            stream.append(word)
+        clock.now += 0.2
+        stream.append(" again")
+
+        assert [c.args[0] for c in placeholder.markdown.call_args_list] == [
+            "Hello",
+            "Hello world, again",
+        ]
+        assert stream.stats.chunks == 5
+        assert stream.stats.renders == 2
+
+    def test_paragraph_and_final_flush(self):
+        """Test that paragraph ends and flush() render pending text."""
+        clock = FakeClock()
+        stream, placeholder = _renderer(clock)
+        stream.append("a")
+        stream.append("b\n\n")
+        stream.append("c")
+
+        assert placeholder.markdown.call_count == 2
+        stream.flush()
+        stream.flush()
+
+        assert placeholder.markdown.call_count == 3
+        assert placeholder.markdown.call_args.args[0] == "ab\n\nc"
+
+    def test_disabled(self):
+        """Test that voice mode collects text without rendering."""
+        stream, placeholder = _renderer(FakeClock(), enabled=False)
+        stream.append("spoken")
+        stream.flush()
+
+        assert stream.text == "spoken"
+        assert placeholder.markdown.call_count == 0
+
+    def test_restart(self):
+        """Test that restart flushes and continues in a new placeholder."""
+        clock = FakeClock()
+        stream, first = _renderer(clock)
+        stream.append("before")
+        clock.now += 0.01
+        stream.append(" tool")
+        second = Mock()
+
+        stream.restart(second)
+        stream.append("after")
+        stream.flush()
+
+        assert first.markdown.call_args.args[0] == "before tool"
+        assert second.markdown.call_args.args[0] == "after"
+        assert stream.text == "after"
+        assert stream.stats.chunks == 3
+        assert stream.stats.renders == 3
@@ -0,0 +1,123 @@
+"""
+Tests for the background update check in updater module.
+Contains test cases for the cached, non-blocking startup check.
+
+Test Coverage:
+1. TestUpdateCheckCache
+   - Results read back until their TTL expires
+   - Failed checks expire sooner
+   - Results for another installed version ignored
+   - Missing or corrupt cache files ignored
+   - Result kept in memory when the cache file cannot be written
+
+2. TestStartUpdateCheck
+   - Check runs in the background without blocking the caller
+   - No check while a fresh result is cached
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from gns3_copilot.ui_model.utils import updater
+from gns3_copilot.ui_model.utils.updater import (
+    UPDATE_CHECK_ERROR_TTL_SECONDS,
+    UPDATE_CHECK_TTL_SECONDS,
+    is_update_check_running,
+    load_update_check,
+    save_update_check,
+    start_update_check,
+)
+
+RESULT = {"status": "available", "current": "1.0.0", "latest": "1.1.0"}
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path):
+    """Store the check result in a temporary file, installed version 1.0.0."""
+    path = tmp_path / "update_check.json"
+    with (
+        patch.object(updater, "UPDATE_CHECK_FILE", path),
+        patch.object(updater, "get_installed_version", return_value="1.0.0"),
+        patch.object(updater, "_last_check", None),
+    ):
+        yield path
+
+
+class TestUpdateCheckCache:
+    """Tests for load_update_check and save_update_check."""
+
+    def test_round_trip_with_ttl(self):
+        """Test that a result is used until it expires."""
+        save_update_check(RESULT, now=1000.0)
+
+        assert load_update_check(now=1000.0 + 60) == RESULT
+        assert load_update_check(now=1000.0 + UPDATE_CHECK_TTL_SECONDS) is None
+
+    def test_error_expires_sooner(self):
+        """Test that failed checks are retried after the shorter TTL."""
+        save_update_check({"status": "error", "error": "offline"}, now=1000.0)
+
+        assert load_update_check(now=1000.0 + 60)["status"] == "error"
+        assert load_update_check(now=1000.0 + UPDATE_CHECK_ERROR_TTL_SECONDS) is None
+
+    def test_other_installed_version(self):
+        """Test that a result is ignored after the application was updated."""
+        save_update_check({**RESULT, "current": "0.9.0"}, now=1000.0)
+
+        assert load_update_check(now=1001.0) is None
+
+    def test_missing_or_corrupt_file(self, cache_file):
+        """Test that unreadable cache files count as no result."""
+        assert load_update_check() is None
+        cache_file.write_text("{not json")
+        assert load_update_check() is None
+
+    def test_unwritable_cache_file(self, tmp_path):
+        """Test that the result is kept in memory if it cannot be stored."""
+        read_only = tmp_path / "read-only"
+        read_only.write_text("")
+        with patch.object(updater, "UPDATE_CHECK_FILE", read_only / "check.json"):
+            save_update_check(RESULT)
+
+            assert load_update_check() == RESULT
+            with patch.object(updater, "perform_update_check") as mock_check:
+                assert not start_update_check()
+            mock_check.assert_not_called()
+
+
+class TestStartUpdateCheck:
+    """Tests for start_update_check."""
+
+    def test_runs_in_background(self):
+        """Test that a slow PyPI request does not block the caller."""
+        release = threading.Event()
+
+        def slow_check() -> dict[str, str]:
+            release.wait(timeout=5)
+            return RESULT
+
+        with patch.object(updater, "perform_update_check", slow_check):
+            started = time.perf_counter()
+            assert start_update_check()
+            assert time.perf_counter() - started < 1
+            assert is_update_check_running()
+            # A second session does not start another check
+            assert not start_update_check()
+
+            release.set()
+            updater._check_thread.join(timeout=5)
+
+        assert not is_update_check_running()
+        assert load_update_check() == RESULT
+
+    def test_cached_result_used(self):
+        """Test that no check is started while a result is fresh."""
+        save_update_check(RESULT)
+
+        with patch.object(updater, "perform_update_check") as mock_check:
+            assert not start_update_check()
+
+        mock_check.assert_not_called()
@@ -0,0 +1,160 @@
+"""
+Tests for the startup warm-up in warmup module.
+Contains test cases for running warm-up chains and recording timings.
+
+Test Coverage:
+1. TestWarmup
+   - Chains run in parallel, steps of a chain in order, with timings
+   - Failed step skips the rest of its chain only
+   - Steps that do not apply are skipped without stopping the chain
+
+2. TestStartWarmup
+   - Warm-up started once per process, again on request
+   - No warm-up when disabled
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gns3_copilot.ui_model.utils import warmup
+from gns3_copilot.ui_model.utils.warmup import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_SKIPPED,
+    Warmup,
+    WarmupSkipped,
+    get_warmup,
+    start_warmup,
+)
+
+
+class FakeClock:
+    """Time source advanced by the steps."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _statuses(run: Warmup) -> dict[str, tuple[str, str]]:
+    return {step.name: (step.status, step.detail) for step in run.steps()}
+
+
+class TestWarmup:
+    """Tests for Warmup."""
+
+    def test_chains_and_timings(self):
+        """Test that chains run in parallel and each step is timed."""
+        clock = FakeClock()
+        order = []
+        second_chain_done = threading.Event()
+
+        def slow_step() -> str:
+            # Only finishes once the other chain ran, i.e. in parallel
+            assert second_chain_done.wait(timeout=5)
+            clock.now += 1.5
+            order.append("connect")
+            return "connected"
+
+        def other_step() -> None:
+            order.append("compile")
+            second_chain_done.set()
+
+        run = Warmup(
+            [
+                [
+                    ("connect", "Connect", slow_step),
+                    ("list", "List", lambda: order.append("list") and None),
+                ],
+                [("compile", "Compile", other_step)],
+            ],
+            clock=clock,
+        )
+        run.start()
+
+        assert run.wait(timeout=5)
+        assert order == ["compile", "connect", "list"]
+        steps = {step.name: step for step in run.steps()}
+        assert steps["connect"].status == STATUS_DONE
+        assert steps["connect"].detail == "connected"
+        assert steps["connect"].seconds == 1.5
+        assert steps["compile"].seconds == 0.0
+        assert run.elapsed == 1.5
+        assert not run.is_running()
+
+    def test_failure_skips_rest_of_chain(self):
+        """Test that a failed step skips later steps of its chain only."""
+
+        def fail() -> str:
+            raise ConnectionError("connection refused")
+
+        run = Warmup(
+            [
+                [("ping", "Ping", fail), ("list", "List", lambda: "listed")],
+                [("compile", "Compile", lambda: "compiled")],
+            ]
+        )
+        run.start()
+
+        assert run.wait(timeout=5)
+        assert _statuses(run) == {
+            "ping": (STATUS_FAILED, "connection refused"),
+            "list": (STATUS_SKIPPED, "Previous step failed"),
+            "compile": (STATUS_DONE, "compiled"),
+        }
+
+    def test_skipped_step_continues_chain(self):
+        """Test that a step that does not apply does not stop its chain."""
+
+        def not_needed() -> str:
+            raise WarmupSkipped("Not required for API v2")
+
+        run = Warmup([[("auth", "Auth", not_needed), ("list", "List", lambda: "")]])
+        run.start()
+
+        assert run.wait(timeout=5)
+        assert _statuses(run) == {
+            "auth": (STATUS_SKIPPED, "Not required for API v2"),
+            "list": (STATUS_DONE, ""),
+        }
+
+
+class TestStartWarmup:
+    """Tests for start_warmup."""
+
+    @pytest.fixture(autouse=True)
+    def no_warmup(self):
+        """Start without a warm-up and with a single fast chain."""
+        calls = []
+        chains = [[("step", "Step", lambda: calls.append(1) and None)]]
+        with (
+            patch.object(warmup, "_warmup", None),
+            patch.object(warmup, "default_warmup_chains", return_value=chains),
+        ):
+            yield calls
+
+    def test_started_once(self, no_warmup):
+        """Test that the warm-up runs once unless forced."""
+        with patch.object(warmup, "is_warmup_enabled", return_value=True):
+            first = start_warmup()
+            assert first is not None
+            first.wait(timeout=5)
+            assert start_warmup() is first
+            again = start_warmup(force=True)
+            assert again is not None and again is not first
+            again.wait(timeout=5)
+
+        assert get_warmup() is again
+        assert no_warmup == [1, 1]
+
+    def test_disabled(self, no_warmup):
+        """Test that nothing runs when the warm-up is disabled."""
+        with patch.object(warmup, "is_warmup_enabled", return_value=False):
+            assert start_warmup() is None
+
+        assert get_warmup() is None
+        assert no_warmup == []